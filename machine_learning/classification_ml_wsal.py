@@ -5,6 +5,12 @@ import xgboost as xgb
 import pathlib
 import logging
 import numpy as np 
+import os
+import concurrent.futures
+
+from threadpoolctl import threadpool_limits
+from sklearn.base import clone
+from sklearn.preprocessing import MinMaxScaler
 
 from sklearn.metrics import accuracy_score, f1_score, recall_score, precision_score, classification_report
 from sklearn.ensemble import RandomForestClassifier , BaggingClassifier
@@ -15,7 +21,7 @@ from sklearn.neural_network import MLPClassifier
 
 
 NAME = "WSAL CLASSIFICATION MACHINE LEARNING MODELS SCRIPT"
-VERSION = "1.4"
+VERSION = "1.7"
 CMD_MODE_ENABLED = True
 
 SUPERVISED_MODELS = {
@@ -26,6 +32,76 @@ SUPERVISED_MODELS = {
                     'MLP':  MLPClassifier(alpha=0.0001, random_state=42, early_stopping=True),
                     'XGBoost': xgb.XGBClassifier(n_jobs=1),
                     }
+# every worker holds its own train & test data -> evaluate sequentially unless more workers are requested explicitly
+DEFAULT_NUMBER_OF_MODEL_EVALUATION_WORKERS = 1
+# number of rows copied at once while writing or scaling the shared feature matrix
+SHARED_FEATURE_MATRIX_BLOCK_SIZE = 65536
+
+def store_shared_feature_matrix(data_sets: list, feature_columns: list, system_path_feature_matrix: pathlib.Path, block_size: int = SHARED_FEATURE_MATRIX_BLOCK_SIZE):
+    """store the features of several encoded data sets once as memory-mapped float matrix (.npy file), rows of the data sets are appended in the given order
+
+    Args:
+        data_sets (list): encoded data sets (pd.DataFrame)
+        feature_columns (list): columns of the feature matrix, columns missing in a data set are filled with 0
+        system_path_feature_matrix (pathlib.Path): system path of the .npy file
+        block_size (int): number of rows converted at once. Defaults to SHARED_FEATURE_MATRIX_BLOCK_SIZE.
+
+    Returns:
+        np.memmap: read-only memory-mapped feature matrix
+    """
+    number_of_rows = sum(len(data_set.index) for data_set in data_sets)
+    feature_matrix = np.lib.format.open_memmap(system_path_feature_matrix, mode = "w+", dtype = np.float64, shape = (number_of_rows, len(feature_columns)))
+    first_row = 0
+    for data_set in data_sets:
+        for block_start in range(0, len(data_set.index), block_size):
+            block = data_set.iloc[block_start:(block_start + block_size)].reindex(columns = feature_columns)
+            feature_matrix[(first_row + block_start):(first_row + block_start + len(block.index))] = block.to_numpy(dtype = np.float64, na_value = 0)
+        first_row += len(data_set.index)
+    feature_matrix.flush()
+    del feature_matrix
+
+    return np.load(system_path_feature_matrix, mmap_mode = "r")
+
+def fit_min_max_scaler_on_shared_feature_matrix(feature_matrix: np.ndarray, row_range: tuple, columns: np.ndarray, block_size: int = SHARED_FEATURE_MATRIX_BLOCK_SIZE):
+    """fit min-max scaler on rows & columns of the shared feature matrix block by block (same scaling as MinMaxScaler.fit_transform on the selected data)
+
+    Args:
+        feature_matrix (np.ndarray): shared feature matrix (see store_shared_feature_matrix)
+        row_range (tuple): (first row, last row exclusive) to fit the scaler on
+        columns (np.ndarray): columns to fit the scaler on
+        block_size (int): number of rows copied at once. Defaults to SHARED_FEATURE_MATRIX_BLOCK_SIZE.
+
+    Returns:
+        MinMaxScaler: fitted scaler (scales in place)
+    """
+    scaler_min_max = MinMaxScaler(copy = False)
+    for block_start in range(row_range[0], row_range[1], block_size):
+        scaler_min_max.partial_fit(feature_matrix[block_start:min(block_start + block_size, row_range[1]), :][:, columns])
+
+    return scaler_min_max
+
+def load_model_evaluation_data(model_evaluation_configuration: dict):
+    """load train & test data of a data set configuration which references the shared feature matrix (only the referenced rows & columns are copied into memory, scaling is applied afterwards)
+    -> every call holds its own train & test copy, memory stays at about one copy of the data only if the models are evaluated by a single worker
+
+    Args:
+        model_evaluation_configuration (dict): dict with keys feature_matrix_path, columns, train_rows, test_rows, scaler (None -> no scaling), y_train, y_test, encoding_name & data_set_name.
+                                               Configurations with train & test data (keys X_train, X_test, y_train, y_test, encoding_name & data_set_name) are returned unchanged.
+
+    Returns:
+        dict: arguments of evaluate_model (X_train, X_test, y_train, y_test, encoding_name & data_set_name)
+    """
+    if("X_train" in model_evaluation_configuration):
+        return model_evaluation_configuration
+    feature_matrix = np.load(model_evaluation_configuration["feature_matrix_path"], mmap_mode = "r")
+    X_train = feature_matrix[np.ix_(model_evaluation_configuration["train_rows"], model_evaluation_configuration["columns"])]
+    X_test = feature_matrix[np.ix_(model_evaluation_configuration["test_rows"], model_evaluation_configuration["columns"])]
+    if(model_evaluation_configuration["scaler"] is not None):
+        X_train = model_evaluation_configuration["scaler"].transform(X_train)
+        X_test = model_evaluation_configuration["scaler"].transform(X_test)
+
+    return {"X_train": X_train, "X_test": X_test, "y_train": model_evaluation_configuration["y_train"], "y_test": model_evaluation_configuration["y_test"],
+            "encoding_name": model_evaluation_configuration["encoding_name"], "data_set_name": model_evaluation_configuration["data_set_name"]}
 
 def evaluate_model(X_train: np.array, X_test: np.array, y_train: np.array, y_test: np.array, encoding_name: str, data_set_name: str, path_to_store_results: pathlib.Path, models: dict = SUPERVISED_MODELS):
     """evaluate machine learning models based on predefined data split strategy
@@ -39,29 +115,95 @@ def evaluate_model(X_train: np.array, X_test: np.array, y_train: np.array, y_tes
         path_to_store_results (pathlib.Path): system path to store ml model performance evaluation
         models (dict): machine learning models used . Defaults to SUPERVISED_MODELS.
     """
-    logging.basicConfig(filename = pathlib.Path(__file__).with_name('machine_learning.log'), level = logging.DEBUG, format = '%(asctime)s - %(levelname)s - %(message)s', datefmt = "%d/%m/%Y %H:%M:%S")
     for clf_name, clf in models.items():
-        logging.debug('| %s | %s | %s',  clf_name, encoding_name , data_set_name)
+        evaluate_single_model(clf_name, clf, X_train, X_test, y_train, y_test, encoding_name, data_set_name, path_to_store_results)
+
+def evaluate_single_model(clf_name: str, clf, X_train: np.array, X_test: np.array, y_train: np.array, y_test: np.array, encoding_name: str, data_set_name: str, path_to_store_results: pathlib.Path, number_of_threads: int = None):
+    """fit & evaluate a single machine learning model and store its performance evaluation (same result files as evaluate_model)
+    Args:
+        clf_name (str): name of the machine learning model (key of SUPERVISED_MODELS)
+        clf: machine learning model (unfitted copy of the model is used)
+        X_train (np.array): Windows 10 security audit logs encoded training data
+        X_test (np.array): Windows 10 security audit logs encoded test data
+        y_train (np.array): Windows 10 security audit logs encoded training labels
+        y_test (np.array): Windows 10 security audit logs encoded testing labels
+        encoding_name (str): name of data encoding
+        data_set_name (str): name of data set
+        path_to_store_results (pathlib.Path): system path to store ml model performance evaluation
+        number_of_threads (int, optional): max. number of threads used by the model (n_jobs & BLAS/OpenMP thread pools). Defaults to None (thread settings of the model are kept).
+
+    Returns:
+        tuple: (clf_name, data_set_name) of the evaluated model
+    """
+    logging.basicConfig(filename = pathlib.Path(__file__).with_name('machine_learning.log'), level = logging.DEBUG, format = '%(asctime)s - %(levelname)s - %(message)s', datefmt = "%d/%m/%Y %H:%M:%S")
+    logging.debug('| %s | %s | %s',  clf_name, encoding_name , data_set_name)
+    clf = clone(clf)
+    if((number_of_threads is not None) and ("n_jobs" in clf.get_params())):
+        clf.set_params(n_jobs = number_of_threads)
+    # native thread pools (BLAS, OpenMP) limited as well -> no oversubscription if several models are evaluated at once
+    with threadpool_limits(limits = number_of_threads):
         clf.fit(X_train, y_train)
         y_pred = clf.predict(X_test)
-        scores = {
-                'evaluate_model_acc' : accuracy_score(y_test, y_pred),
-                'evaluate_model_precision-weighted' : precision_score(y_test, y_pred, average='weighted'),
-                'evaluate_model_recall-weighted' : recall_score(y_test, y_pred, average='weighted'),
-                'evaluate_model_f1-weighted' : f1_score(y_test, y_pred, average='weighted')
-                }
-        
-        scores = pd.DataFrame([scores])
-        scores['model'] = clf_name
-        scores['dataset'] = data_set_name
-        scores['dataset_count_rows_train_data'] = X_train.shape[0]
-        scores['dataset_count_rows_test_data'] = X_test.shape[0]
-        scores['encoding'] = encoding_name
-        scores.to_csv(pathlib.Path.joinpath(path_to_store_results, "train_test_split_" + encoding_name + '_' + data_set_name + '_' + clf_name + '.csv'))
-        # classification report for detailed information about class specific performance info
-        report = classification_report(y_true = y_test, y_pred = y_pred, zero_division = 0, output_dict = True)
-        report = pd.DataFrame([report])
-        report.to_csv(pathlib.Path.joinpath(path_to_store_results, "train_test_split" + "_" + "classification_report" + "_" + encoding_name + '_' + data_set_name + '_' + clf_name + '.csv'))
+    scores = {
+            'evaluate_model_acc' : accuracy_score(y_test, y_pred),
+            'evaluate_model_precision-weighted' : precision_score(y_test, y_pred, average='weighted'),
+            'evaluate_model_recall-weighted' : recall_score(y_test, y_pred, average='weighted'),
+            'evaluate_model_f1-weighted' : f1_score(y_test, y_pred, average='weighted')
+            }
+    
+    scores = pd.DataFrame([scores])
+    scores['model'] = clf_name
+    scores['dataset'] = data_set_name
+    scores['dataset_count_rows_train_data'] = X_train.shape[0]
+    scores['dataset_count_rows_test_data'] = X_test.shape[0]
+    scores['encoding'] = encoding_name
+    scores.to_csv(pathlib.Path.joinpath(path_to_store_results, "train_test_split_" + encoding_name + '_' + data_set_name + '_' + clf_name + '.csv'))
+    # classification report for detailed information about class specific performance info
+    report = classification_report(y_true = y_test, y_pred = y_pred, zero_division = 0, output_dict = True)
+    report = pd.DataFrame([report])
+    report.to_csv(pathlib.Path.joinpath(path_to_store_results, "train_test_split" + "_" + "classification_report" + "_" + encoding_name + '_' + data_set_name + '_' + clf_name + '.csv'))
+
+    return clf_name, data_set_name
+
+def evaluate_single_model_of_configuration(clf_name: str, clf, model_evaluation_configuration: dict, path_to_store_results: pathlib.Path, number_of_threads: int = None):
+    """load train & test data of a data set configuration and evaluate a single machine learning model on it (job of evaluate_models_concurrently)
+
+    Args:
+        clf_name (str): name of the machine learning model (key of SUPERVISED_MODELS)
+        clf: machine learning model (unfitted copy of the model is used)
+        model_evaluation_configuration (dict): data set configuration (see load_model_evaluation_data)
+        path_to_store_results (pathlib.Path): system path to store ml model performance evaluation
+        number_of_threads (int, optional): max. number of threads used by the model. Defaults to None (thread settings of the model are kept).
+
+    Returns:
+        tuple: (clf_name, data_set_name) of the evaluated model
+    """
+    return evaluate_single_model(clf_name, clf, path_to_store_results = path_to_store_results, number_of_threads = number_of_threads, **load_model_evaluation_data(model_evaluation_configuration))
+
+def evaluate_models_concurrently(model_evaluation_configurations: list, path_to_store_results: pathlib.Path, models: dict = SUPERVISED_MODELS, number_of_workers: int = DEFAULT_NUMBER_OF_MODEL_EVALUATION_WORKERS):
+    """evaluate all machine learning models on all data set configurations (model x data set grid) with a process pool, same result files as evaluate_model
+    Args:
+        model_evaluation_configurations (list): data set configurations, dicts with train & test data or references to the shared feature matrix (see load_model_evaluation_data) -> only references are sent to the workers
+        path_to_store_results (pathlib.Path): system path to store ml model performance evaluation
+        models (dict): machine learning models used. Defaults to SUPERVISED_MODELS.
+        number_of_workers (int): number of models evaluated at once, 1 evaluates all models sequentially in this process.
+                                 Every worker copies the train & test data of its data set configuration -> memory grows with the number of workers. Defaults to DEFAULT_NUMBER_OF_MODEL_EVALUATION_WORKERS.
+    """
+    evaluation_jobs = [(clf_name, clf, configuration) for configuration in model_evaluation_configurations for clf_name, clf in models.items()]
+    number_of_workers = max(1, min(number_of_workers, len(evaluation_jobs)))
+    # cores are split between the workers -> workers x threads per model <= cores
+    number_of_threads = max(1, (os.cpu_count() or 1) // number_of_workers)
+
+    if(number_of_workers == 1):
+        for clf_name, clf, configuration in evaluation_jobs:
+            evaluate_single_model_of_configuration(clf_name, clf, configuration, path_to_store_results, number_of_threads)
+        return
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers = number_of_workers) as executor:
+        futures = [executor.submit(evaluate_single_model_of_configuration, clf_name, clf, configuration, path_to_store_results, number_of_threads) for clf_name, clf, configuration in evaluation_jobs]
+        for future in concurrent.futures.as_completed(futures):
+            clf_name, data_set_name = future.result()
+            print("evaluated model " + clf_name + " -> data set: " + data_set_name)
 
 def main():
     return 0
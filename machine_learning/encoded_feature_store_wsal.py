@@ -0,0 +1,146 @@
+import argparse
+import textwrap
+import pathlib
+import os
+import json
+import hashlib
+import pandas as pd
+
+NAME = "WSAL ENCODED FEATURE STORE SCRIPT"
+VERSION = "1.0"
+CMD_MODE_ENABLED = False
+
+ENCODED_FEATURE_STORE_FILE_SUFFIX = ".parquet"
+ENCODED_FEATURE_STORE_METADATA_FILE_SUFFIX = ".json"
+# increase if the layout of stored entries changes -> all existing entries become stale
+ENCODED_FEATURE_STORE_FORMAT_VERSION = "1"
+
+def build_encoded_feature_store_entry_name(simulation_type: str, sim_user_of_interest: str, encoding_name: str):
+    """build name of a feature store entry (key: simulation type, simulation user, time window size & label mode)
+
+    Args:
+        simulation_type (str): hardware_simulation or software_simulation
+        sim_user_of_interest (str): simulation user (e.g., SimUser001)
+        encoding_name (str): name of the encoding (e.g., 1s_time_windows_size_general_label_mode)
+
+    Returns:
+        str: entry name (e.g., software_simulation_SimUser001_1s_time_windows_size_general_label_mode)
+    """
+    return simulation_type + "_" + sim_user_of_interest + "_" + encoding_name
+
+def compute_source_data_set_fingerprint(source_data_set_file_paths: list, code_versions: list = None):
+    """compute fingerprint of the source data sets an encoding is based on (file names, sizes & modification times), changed, added or removed source files change the fingerprint
+
+    Args:
+        source_data_set_file_paths (list): system paths of the source data sets (gzip compressed CSV files or partitions of the data store)
+        code_versions (list, optional): versions of the code producing the encoding (e.g., encoding script version), changed versions change the fingerprint. Defaults to None.
+
+    Returns:
+        str: fingerprint (sha256 hex digest)
+    """
+    fingerprint = hashlib.sha256()
+    fingerprint.update(("format_version=" + ENCODED_FEATURE_STORE_FORMAT_VERSION + "\n").encode("utf-8"))
+    for code_version in (code_versions if(code_versions is not None) else []):
+        fingerprint.update(("code_version=" + str(code_version) + "\n").encode("utf-8"))
+    for source_data_set_file_path in sorted(pathlib.Path(file_path) for file_path in source_data_set_file_paths):
+        file_stat = source_data_set_file_path.stat()
+        fingerprint.update((str(source_data_set_file_path.resolve()) + "|" + str(file_stat.st_size) + "|" + str(file_stat.st_mtime_ns) + "\n").encode("utf-8"))
+
+    return fingerprint.hexdigest()
+
+def get_encoded_feature_store_entry_paths(encoded_feature_store_folder: pathlib.Path, entry_name: str):
+    """get system paths of the encoded data & metadata of a feature store entry
+
+    Args:
+        encoded_feature_store_folder (pathlib.Path): root folder of the feature store
+        entry_name (str): name of the entry (see build_encoded_feature_store_entry_name)
+
+    Returns:
+        tuple: (encoded data path, metadata path)
+    """
+    return (pathlib.Path(encoded_feature_store_folder, entry_name + ENCODED_FEATURE_STORE_FILE_SUFFIX),
+            pathlib.Path(encoded_feature_store_folder, entry_name + ENCODED_FEATURE_STORE_METADATA_FILE_SUFFIX))
+
+def remove_encoded_feature_store_entry(encoded_feature_store_folder: pathlib.Path, entry_name: str):
+    """remove a (stale) feature store entry
+
+    Args:
+        encoded_feature_store_folder (pathlib.Path): root folder of the feature store
+        entry_name (str): name of the entry
+    """
+    for entry_path in get_encoded_feature_store_entry_paths(encoded_feature_store_folder, entry_name):
+        if(entry_path.is_file()):
+            entry_path.unlink()
+
+def load_encoded_feature_store_entry(encoded_feature_store_folder: pathlib.Path, entry_name: str, fingerprint: str):
+    """load encoded data of a feature store entry, entries with another fingerprint (stale source data sets or code) are removed
+
+    Args:
+        encoded_feature_store_folder (pathlib.Path): root folder of the feature store
+        entry_name (str): name of the entry
+        fingerprint (str): fingerprint of the current source data sets (see compute_source_data_set_fingerprint)
+
+    Returns:
+        tuple: (encoded data (pd.DataFrame), metadata (dict)) or None if no valid entry exists
+    """
+    encoded_data_path, metadata_path = get_encoded_feature_store_entry_paths(encoded_feature_store_folder, entry_name)
+    if((not encoded_data_path.is_file()) or (not metadata_path.is_file())):
+        return None
+    try:
+        metadata = json.loads(metadata_path.read_text())
+    except ValueError:
+        metadata = {}
+    if(metadata.get("fingerprint") != fingerprint):
+        remove_encoded_feature_store_entry(encoded_feature_store_folder, entry_name)
+        return None
+
+    return pd.read_parquet(encoded_data_path), metadata
+
+def store_encoded_feature_store_entry(encoded_feature_store_folder: pathlib.Path, entry_name: str, fingerprint: str, encoded_data: pd.DataFrame, metadata: dict = None):
+    """store encoded data as feature store entry (columnar parquet format), an existing entry is replaced
+
+    Args:
+        encoded_feature_store_folder (pathlib.Path): root folder of the feature store
+        entry_name (str): name of the entry
+        fingerprint (str): fingerprint of the source data sets the encoded data is based on
+        encoded_data (pd.DataFrame): encoded data
+        metadata (dict, optional): additional information stored with the entry (must be JSON serializable, e.g., label encoding). Defaults to None.
+
+    Returns:
+        pathlib.Path: system path of the stored encoded data
+    """
+    pathlib.Path(encoded_feature_store_folder).mkdir(parents = True, exist_ok = True)
+    encoded_data_path, metadata_path = get_encoded_feature_store_entry_paths(encoded_feature_store_folder, entry_name)
+    entry_metadata = dict(metadata if(metadata is not None) else {})
+    entry_metadata["fingerprint"] = fingerprint
+    entry_metadata["format_version"] = ENCODED_FEATURE_STORE_FORMAT_VERSION
+
+    # metadata is removed first & written last -> readers never use partially written entries
+    remove_encoded_feature_store_entry(encoded_feature_store_folder, entry_name)
+    temporary_encoded_data_path = encoded_data_path.with_name(encoded_data_path.name + "." + str(os.getpid()) + ".tmp")
+    encoded_data.to_parquet(temporary_encoded_data_path, index = False)
+    os.replace(temporary_encoded_data_path, encoded_data_path)
+    temporary_metadata_path = metadata_path.with_name(metadata_path.name + "." + str(os.getpid()) + ".tmp")
+    temporary_metadata_path.write_text(json.dumps(entry_metadata, indent = 2))
+    os.replace(temporary_metadata_path, metadata_path)
+
+    return encoded_data_path
+
+def main():
+    return 0
+
+if __name__ == "__main__":
+    if(CMD_MODE_ENABLED):
+        parser = argparse.ArgumentParser(prog = NAME, formatter_class = argparse.RawDescriptionHelpFormatter, description = textwrap.dedent(('''
+        This script is called by main experiment script (wsal_machine_learning_script.py) on highest hierachy of this repository structure.
+        ---------------------------------------------------------------
+        Name: %s
+        Version: %s
+        ---------------------------------------------------------------
+        Usage:
+        ''')%(NAME, VERSION)))
+
+        return_code = main()
+        quit(return_code)
+    else:
+        main()
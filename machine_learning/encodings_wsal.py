@@ -2,13 +2,89 @@ import argparse
 import textwrap
 import pandas as pd
 import numpy as np
+import scipy.sparse
 
 from sklearn.feature_extraction.text import CountVectorizer
 
 NAME = "WSAL MACHINE LEARNING ENCODING SCRIPT"
-VERSION = 1.0
+VERSION = 1.2
 CMD_MODE_ENABLED = False
 
+def encode_wsal_data_container_time_window_based_event_ids_only_sparse(data: pd.DataFrame, frequence: str = "s"):
+    """sparse encoding of Windows 10 security audit logs for machine learning classification -> event id counts per fixed time window, empty time windows are never materialized
+
+    Args:
+        data (pd.DataFrame): data to encode (columns SYSTEM_TimeCreated, SYSTEM_EventID & Labels)
+        frequence (str): size of fixed time window used to implement event frequency count (fixed frequency, e.g., "s", "10s", "min"). Defaults to "s".
+
+    Returns:
+        tuple: (event id counts (scipy.sparse.csr_matrix, row per non-empty time window, column per event id), event ids of the columns (np.ndarray, ascending),
+                start of the time windows (pd.Series), labels included in the time windows (list of tuples, distinct labels in order of occurrence), index of the time windows counted from the first time window (np.ndarray))
+    """
+    data = data[data['SYSTEM_TimeCreated'].notna()]
+    window_length = pd.Timedelta(pd.tseries.frequencies.to_offset(frequence)).value
+    # time windows start at midnight of the first day (same bins as pd.Grouper)
+    time_window_origin = data['SYSTEM_TimeCreated'].dt.normalize().min()
+    time_window_indices = (data['SYSTEM_TimeCreated'] - time_window_origin).to_numpy(dtype = "timedelta64[ns]").view(np.int64) // window_length
+    # only non-empty time windows get a row
+    non_empty_time_window_indices, row_indices = np.unique(time_window_indices, return_inverse = True)
+    event_ids, column_indices = np.unique(data['SYSTEM_EventID'].to_numpy(), return_inverse = True)
+    # duplicate (time window, event id) pairs are summed up -> event id counts
+    event_id_counts = scipy.sparse.coo_matrix((np.ones(len(row_indices), dtype = np.int64), (row_indices, column_indices)), shape = (len(non_empty_time_window_indices), len(event_ids))).tocsr()
+
+    # stable sort keeps the order of the labels inside of a time window -> set of the distinct labels equals the set of all labels of the time window (same iteration order as well)
+    row_order = np.argsort(row_indices, kind = "stable")
+    labels_per_time_window = np.split(data['Labels'].to_numpy()[row_order], np.flatnonzero(np.diff(row_indices[row_order])) + 1)
+    time_window_labels = [tuple(dict.fromkeys(labels)) for labels in labels_per_time_window] if len(row_indices) else []
+    time_window_starts = time_window_origin + pd.to_timedelta(non_empty_time_window_indices * window_length, unit = "ns")
+
+    return event_id_counts, event_ids, pd.Series(time_window_starts), time_window_labels, non_empty_time_window_indices - (non_empty_time_window_indices[0] if len(non_empty_time_window_indices) else 0)
+
+def aggregate_time_window_encoding(event_id_counts: scipy.sparse.csr_matrix, time_window_starts: pd.Series, time_window_labels: list, frequence: str):
+    """aggregate sparse time window encoding into coarser time windows (no reloading & re-encoding of the raw data)
+
+    Args:
+        event_id_counts (scipy.sparse.csr_matrix): event id counts of the fine time windows (see encode_wsal_data_container_time_window_based_event_ids_only_sparse)
+        time_window_starts (pd.Series): start of the fine time windows
+        time_window_labels (list): labels included in the fine time windows (tuples, distinct labels in order of occurrence)
+        frequence (str): size of the coarse time windows, has to be a multiple of the size of the fine time windows (e.g., "15s" for "s")
+
+    Returns:
+        tuple: (event id counts (scipy.sparse.csr_matrix), start of the time windows (pd.Series), labels included in the time windows (list of tuples), index of the time windows counted from the first time window (np.ndarray))
+    """
+    window_length = pd.Timedelta(pd.tseries.frequencies.to_offset(frequence)).value
+    time_window_origin = time_window_starts.dt.normalize().min()
+    time_window_offsets = (time_window_starts - time_window_origin).to_numpy(dtype = "timedelta64[ns]").view(np.int64)
+    coarse_time_window_indices, row_indices = np.unique(time_window_offsets // window_length, return_inverse = True)
+    # aggregation matrix: coarse time window x fine time window
+    aggregation_matrix = scipy.sparse.csr_matrix((np.ones(len(row_indices), dtype = event_id_counts.dtype), (row_indices, np.arange(len(row_indices)))), shape = (len(coarse_time_window_indices), len(row_indices)))
+    coarse_time_window_labels = [()] * len(coarse_time_window_indices)
+    for row_index, labels in zip(row_indices, time_window_labels):
+        coarse_time_window_labels[row_index] = coarse_time_window_labels[row_index] + labels
+    coarse_time_window_labels = [tuple(dict.fromkeys(labels)) for labels in coarse_time_window_labels]
+    coarse_time_window_starts = time_window_origin + pd.to_timedelta(coarse_time_window_indices * window_length, unit = "ns")
+
+    return (aggregation_matrix @ event_id_counts).tocsr(), pd.Series(coarse_time_window_starts), coarse_time_window_labels, coarse_time_window_indices - (coarse_time_window_indices[0] if len(coarse_time_window_indices) else 0)
+
+def build_time_window_encoding_dataframe(event_id_counts: scipy.sparse.csr_matrix, event_ids: np.ndarray, time_window_starts: pd.Series, time_window_labels: list, time_window_indices: np.ndarray):
+    """build dense dataframe of a sparse time window encoding (columns: SYSTEM_EventID_<event id>, SYSTEM_TimeCreated, Labels)
+
+    Args:
+        event_id_counts (scipy.sparse.csr_matrix): event id counts per time window
+        event_ids (np.ndarray): event ids of the columns
+        time_window_starts (pd.Series): start of the time windows
+        time_window_labels (list): labels included in the time windows (tuples, distinct labels in order of occurrence)
+        time_window_indices (np.ndarray): index of the time windows counted from the first time window
+
+    Returns:
+        pd.DataFrame: encoded Windows 10 security audit log data
+    """
+    final_data = pd.DataFrame(event_id_counts.toarray(), columns = ["SYSTEM_EventID_" + str(event_id) for event_id in event_ids], index = time_window_indices)
+    final_data['SYSTEM_TimeCreated'] = time_window_starts.values
+    final_data['Labels'] = [str(set(labels)) for labels in time_window_labels]
+
+    return final_data
+
 def encode_wsal_data_container_time_window_based_event_ids_only(data:pd.DataFrame, frequence : str = "s"):
     """encoding Windows 10 security audit logs for machine learning classification 
 
@@ -20,29 +96,37 @@ def encode_wsal_data_container_time_window_based_event_ids_only(data:pd.DataFram
         data (pd.DataFrame): encoded Windows 10 security audit log data
     """
     # idea from https://www.sciencedirect.com/science/article/pii/S2666827023000233
-    data_without_labels = data[['SYSTEM_TimeCreated', 'SYSTEM_EventID']].copy()
-    # one-hot-encoding for included eventIDs
-    data_without_labels = pd.get_dummies(data_without_labels, columns=['SYSTEM_EventID'], dtype=int)
-    # count one hot encoded data feature values of SYSTEM_EventID by time range grouping
-    data_without_labels = data_without_labels.groupby(pd.Grouper(key="SYSTEM_TimeCreated", freq=frequence, axis=0)).sum()
-    data_without_labels['SYSTEM_TimeCreated'] = data_without_labels.index
-    final_data = data_without_labels.reset_index(drop=True)
-    
-    data_without_event_ids = data[['SYSTEM_TimeCreated', 'Labels']].copy()
-    data_without_event_ids = data_without_event_ids.groupby(pd.Grouper(key="SYSTEM_TimeCreated", freq=frequence, axis=0))['Labels'].apply(set)
-    data_without_event_ids = data_without_event_ids.astype(str)
-    data_without_event_ids = data_without_event_ids.reset_index(drop=True)
-
-    final_data['Labels'] = data_without_event_ids.values
-
-    # get indices of all columns which include event ids
-    col_event_id_indices = [index for index, value in enumerate(final_data.columns.values.tolist()) if "SYSTEM_EventID" in value]
-    
-    # remove zero value rows | axis: 1 / ‘columns’ : reduce the columns, return a Series whose index is the original index.
-    # based on time window implementation also non-event time slots are generated with no events and empty labels -> those need to be removed
-    final_data = final_data.loc[(final_data[final_data.iloc[:, col_event_id_indices] != 0]).any(axis=1)]
+    # count event ids per time window (one column per event id) -> time windows without events are not included
+    event_id_counts, event_ids, time_window_starts, time_window_labels, time_window_indices = encode_wsal_data_container_time_window_based_event_ids_only_sparse(data, frequence)
 
-    return final_data
+    return build_time_window_encoding_dataframe(event_id_counts, event_ids, time_window_starts, time_window_labels, time_window_indices)
+
+def encode_wsal_data_container_time_window_based_event_ids_only_multi_resolution(data: pd.DataFrame, frequences: list):
+    """encoding Windows 10 security audit logs for several time window sizes in one pass -> finest time windows are encoded once, coarser time windows are aggregated from the finest event id counts
+
+    Args:
+        data (pd.DataFrame): data to encode
+        frequences (list): sizes of fixed time windows (e.g., ["s", "15s", "30s"]), every size has to be a multiple of the smallest size
+
+    Returns:
+        dict: time window size -> encoded Windows 10 security audit log data (pd.DataFrame, same as encode_wsal_data_container_time_window_based_event_ids_only)
+    """
+    window_lengths = {frequence: pd.Timedelta(pd.tseries.frequencies.to_offset(frequence)).value for frequence in frequences}
+    finest_frequence = min(frequences, key = lambda frequence: window_lengths[frequence])
+    for frequence in frequences:
+        if((window_lengths[frequence] % window_lengths[finest_frequence]) != 0):
+            raise ValueError("time window size " + frequence + " is not a multiple of the smallest time window size " + finest_frequence)
+    event_id_counts, event_ids, time_window_starts, time_window_labels, time_window_indices = encode_wsal_data_container_time_window_based_event_ids_only_sparse(data, finest_frequence)
+
+    encoded_data = {}
+    for frequence in frequences:
+        if(window_lengths[frequence] == window_lengths[finest_frequence]):
+            encoded_data[frequence] = build_time_window_encoding_dataframe(event_id_counts, event_ids, time_window_starts, time_window_labels, time_window_indices)
+        else:
+            coarse_event_id_counts, coarse_time_window_starts, coarse_time_window_labels, coarse_time_window_indices = aggregate_time_window_encoding(event_id_counts, time_window_starts, time_window_labels, frequence)
+            encoded_data[frequence] = build_time_window_encoding_dataframe(coarse_event_id_counts, event_ids, coarse_time_window_starts, coarse_time_window_labels, coarse_time_window_indices)
+
+    return encoded_data
 
 def main():
     return 0
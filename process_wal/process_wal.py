@@ -1,186 +1,703 @@
-import argparse
-import textwrap
-import pathlib
-import pandas as pd
-import xml.etree.ElementTree as ET
-import progressbar
-import os
-
-NAME = "Process Windows Audit Logs Script"
-VERSION = "1.5"
-CMD_MODE_ENABLED = True
-
-WAL_DEFAULT_TAG_APPENDIX = "{http://schemas.microsoft.com/win/2004/08/events/event}"
-WAL_SYSTEM_EVENT_DATA_TEMPLATE = {"SYSTEM_Provider_NAME": None, "SYSTEM_Provider_Guid": None, "SYSTEM_EventID": None,"SYSTEM_Version": None, "SYSTEM_Level": None, "SYSTEM_Task": None,
-                                    "SYSTEM_Opcode": None, "SYSTEM_Keywords": None, "SYSTEM_TimeCreated": None, "SYSTEM_EventRecordID": None, "SYSTEM_Correlation": None,
-                                    "SYSTEM_Execution_ProcessID": None,"SYSTEM_Execution_ThreadID": None, "SYSTEM_Channel": None, "SYSTEM_Computer": None,"SYSTEM_Security": None}
-
-def parse_xml_converted_windows_audit_logs(file_path: pathlib.Path, default_windows_audit_logs_system_event_data_template: dict = WAL_SYSTEM_EVENT_DATA_TEMPLATE, timezone: str = "CET",
-                                           quality_check_fast_mode_enabled: bool = False):
-    """parse Windows 10 securtiy audit logs from XMLf format in dataframe
-
-    Args:
-        file_path (pathlib.Path): system path to Windows 10 audit log file in xml format
-        default_windows_audit_logs_system_event_data_template (dict): template for event system data. Defaults to WAL_SYSTEM_EVENT_DATA_TEMPLATE.
-        timezone (str): timezone to convert parsed Windows 10 security file to (UTC -> timezone). Defaults to "CET".
-        quality_check_fast_mode_enabled (bool): apply fast mode by only using 4663 events with corresponding features for parsed dataframe. Defaults to False.
-
-    Raises:
-        TypeError: raises error file given path does not refer to a file
-
-    Returns:
-        pd.DataFrame: dataframe which contains parsed Windows 10 security audit log data
-    """
-    try:
-        if(file_path.is_file()):
-            xml_tree = ET.parse(file_path)
-            xml_tree_root = xml_tree.getroot()
-            windows_audit_logs_system_data_rows = []
-            windows_audit_logs_event_data_rows = []
-            for windows_audit_logs__security_event in xml_tree_root:
-                if(windows_audit_logs__security_event[0][0].attrib['Name'] == 'Microsoft-Windows-Security-Auditing'):
-                    for system_or_event_data in windows_audit_logs__security_event:
-                        if(system_or_event_data.tag.replace(WAL_DEFAULT_TAG_APPENDIX, "") == "System"):
-                            system_event_data_template = default_windows_audit_logs_system_event_data_template.copy()
-                            for element in system_or_event_data:
-                                if(element.tag == (WAL_DEFAULT_TAG_APPENDIX + "Provider")):
-                                    system_event_data_template['SYSTEM_Provider_NAME'] = element.attrib['Name']
-                                    system_event_data_template['SYSTEM_Provider_Guid'] = element.attrib['Guid']
-                                elif(element.tag == (WAL_DEFAULT_TAG_APPENDIX + "TimeCreated")):
-                                    system_event_data_template['SYSTEM_TimeCreated'] = element.attrib['SystemTime']
-                                elif(element.tag == (WAL_DEFAULT_TAG_APPENDIX + "Execution")):
-                                    system_event_data_template['SYSTEM_ProcessID'] = system_or_event_data.find(element.tag).attrib['ProcessID']
-                                    system_event_data_template['SYSTEM_ThreadID'] = element.attrib['ThreadID']
-                                else:
-                                    dict_key = 'SYSTEM_' + (element.tag.replace(WAL_DEFAULT_TAG_APPENDIX, ""))
-                                    system_event_data_template[dict_key] = element.text
-                            windows_audit_logs_system_data_rows.append(system_event_data_template)
-
-                        elif(system_or_event_data.tag.replace(WAL_DEFAULT_TAG_APPENDIX, "") == "EventData"):
-                            audit_log_eventdata_dict_template = {}
-                            for element in system_or_event_data:
-                                feature_string = 'EVENTDATA' + '_' + element.attrib['Name']
-                                audit_log_eventdata_dict_template[feature_string] = element.text
-                            windows_audit_logs_event_data_rows.append(audit_log_eventdata_dict_template)
-
-            dataframe_system_audit_logs = pd.DataFrame(windows_audit_logs_system_data_rows)
-            dataframe_eventdata_audit_logs = pd.DataFrame(windows_audit_logs_event_data_rows)
-            # parse to datetime format and remove time zone information & convert from UTC to CET or CEST time format
-            dataframe_system_audit_logs["SYSTEM_TimeCreated"] = pd.to_datetime(dataframe_system_audit_logs["SYSTEM_TimeCreated"]).dt.tz_localize(None)
-            if(timezone == "CET"):
-                # convert time zone from UTC to CET
-                dataframe_system_audit_logs['SYSTEM_TimeCreated'] = dataframe_system_audit_logs['SYSTEM_TimeCreated'] + pd.Timedelta(hours=1)
-            elif(timezone == "CEST"):
-                # convert time zone from UTC to CEST
-                dataframe_system_audit_logs['SYSTEM_TimeCreated'] = dataframe_system_audit_logs['SYSTEM_TimeCreated'] + pd.Timedelta(hours=2)
-            
-        else:
-            raise TypeError
-    except TypeError:
-        print("TypeError: method parameter is not a file")
-    
-    return_dataframe = pd.concat([dataframe_system_audit_logs,dataframe_eventdata_audit_logs], axis=1).sort_values(by="SYSTEM_TimeCreated", ignore_index=True)
-    # only 4663 events for quality checks needed
-    if(quality_check_fast_mode_enabled):
-        return return_dataframe.loc[return_dataframe['SYSTEM_EventID'] == "4663"]
-    else:
-        return return_dataframe
-
-def load_windows_audit_logs_from_system_folder(folder_path: pathlib.Path, timestamp_col_name_windows_audit_logs: str = "SYSTEM_TimeCreated", remove_linux_wal_converter_artefacts: bool = False,
-                                               timezone_of_simulation_run: str = "CET", quality_check_fast_mode_enabled: bool = False):
-    """load windows audit logs from system folder into dataframe container
-
-    Args:
-        folder_path (pathlib.Path): path to system folder which contains Windows 10 security audit logs in XML format
-        timestamp_col_name_windows_audit_logs (str, optional): column name of Windows 10 security audit log timestamps. Defaults to "SYSTEM_TimeCreated".
-        remove_linux_wal_converter_artefacts (bool, optional): needs to be removed.
-        timezone_of_simulation_run (str): timezone which should be used for simulation run. Defaults to "CET".
-        quality_check_fast_mode_enabled (bool): apply fast mode by only using 4663 events with corresponding features for parsed dataframe. Defaults to False.
-
-    Returns:
-        pd.DataFrame: dataframe that contains xml parsed Windows 10 security audit logs data
-    """
-    concat_audit_logs_df = pd.DataFrame()
-    folder_content = os.listdir(folder_path)
-    length = len([file_name for file_name in folder_content if ("Archive-Security" in file_name)])
-    counter = 0
-    with progressbar.ProgressBar(max_value=length) as bar:
-        bar.update(counter)
-        for sub_path in folder_path.iterdir():
-            if((sub_path.is_file()) & ("Archive-Security" in str(sub_path))):
-                parsed_audit_logs = parse_xml_converted_windows_audit_logs(file_path = sub_path, timezone = timezone_of_simulation_run, quality_check_fast_mode_enabled = quality_check_fast_mode_enabled)
-                frames = [concat_audit_logs_df, parsed_audit_logs]
-                concat_audit_logs_df = pd.concat(frames, copy = False, ignore_index = True, axis = 0)
-                concat_audit_logs_df = concat_audit_logs_df.sort_values(by = timestamp_col_name_windows_audit_logs, ignore_index = True)
-                counter = counter + 1
-            bar.update(counter)
-    
-    return concat_audit_logs_df
-
-def load_windows_audit_logs_from_system_file(file_path: pathlib.Path, timestamp_col_name_windows_audit_logs: str = "SYSTEM_TimeCreated", remove_linux_wal_converter_artefacts: bool = False,
-                                             timezone_of_simulation_run: str = "CET", quality_check_fast_mode_enabled: bool = False):
-    """load Windows 10 security audit logs from file into dataframe container
-
-    Args:
-        file_path (pathlib.Path): path to file which contains Windows 10 security audit logs in XML format
-        timestamp_col_name_windows_audit_logs (str, optional): column name of Windows 10 security audit log timestamps. Defaults to "SYSTEM_TimeCreated".
-        remove_linux_wal_converter_artefacts (bool, optional): needs to be removed.
-        timezone_of_simulation_run (str, optional): timezone which should be used for simulation run. Defaults to "CET".
-        quality_check_fast_mode_enabled (bool): apply fast mode by only using 4663 events with corresponding features for parsed dataframe. Defaults to False.
-
-    Returns:
-        pd.DataFrame: dataframe which contains xml parsed windows audit logs file
-    """
-    counter = 0
-    with progressbar.ProgressBar(max_value=1) as bar:
-        bar.update(counter)
-        if((os.path.isfile(file_path)) & ("Archive-Security" in str(file_path))):
-            parsed_audit_logs = parse_xml_converted_windows_audit_logs(file_path=file_path, timezone=timezone_of_simulation_run, quality_check_fast_mode_enabled=quality_check_fast_mode_enabled).sort_values(by=timestamp_col_name_windows_audit_logs, ignore_index=True)
-            counter = counter + 1
-            bar.update(counter)
-    
-    return parsed_audit_logs
-
-
-def attach_sim_23_logs_labels_col_windows_audit_logs(audit_logs_df: pd.DataFrame, sim23_logs: list,
-                                                     timestamp_col_name_windows_audit_logs: str = "SYSTEM_TimeCreated", labeling_col_name: str = "Labels"):
-    """label converted Windows 10 security audit logs based on sim23.log bot behavior (programming, mailing, encrypt attack(copy, encrypt, decrypt, delete), mutillidae, chatting, copyfiles, peertube)
-
-    Args:
-        audit_logs_df (pd.DataFrame): Windows 10 security audit logs dataframe to label
-        sim23_logs (list): list of converted sim23.log entries
-        timestamp_col_name_windows_audit_logs (str, optional): column name of Windows 10 security audit log timestamps. Defaults to "SYSTEM_TimeCreated".
-        labeling_col_name (str, optional): Windows 10 security audit logs dataframe column name to label rows. Defaults to "Labels".
-
-    Returns:
-        pd.DataFrame: Windows 10 security audit logs dataframe containing labeled simulation user behavior
-    """
-    copy = audit_logs_df.copy()
-    copy[labeling_col_name] = 'no_label'
-    for row_entry in sim23_logs:
-        # pre-defined indices from method: self.parse_cidds_local_instance_logs()
-        local_instance_logs_start_time = row_entry[0]
-        local_instance_logs_end_time = row_entry[1]
-        local_instance_logs_behavior_label = row_entry[2]
-        copy.loc[((copy[timestamp_col_name_windows_audit_logs] >= local_instance_logs_start_time) & (copy[timestamp_col_name_windows_audit_logs] <= local_instance_logs_end_time)), labeling_col_name]= local_instance_logs_behavior_label
-    
-    return copy
-
-def main():
-    return 0
-
-if __name__ == "__main__":
-    if(CMD_MODE_ENABLED):
-        parser = argparse.ArgumentParser(prog = NAME, formatter_class = argparse.RawDescriptionHelpFormatter, description = textwrap.dedent(('''
-        This script is called by main experiment scripts (starting with 'wsal_') on highest hierachy of this repository structure.
-        ---------------------------------------------------------------
-        Name: %s
-        Version: %s
-        ---------------------------------------------------------------
-        Usage:
-        ''')%(NAME, VERSION)))
-        
-        return_code = main()
-        quit(return_code)
-    else:
+import argparse
+import textwrap
+import pathlib
+import pandas as pd
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+import xml.etree.ElementTree as ET
+import progressbar
+import os
+import sys
+import concurrent.futures
+import hashlib
+import json
+
+NAME = "Process Windows Audit Logs Script"
+VERSION = "2.2"
+CMD_MODE_ENABLED = True
+
+WAL_DEFAULT_TAG_APPENDIX = "{http://schemas.microsoft.com/win/2004/08/events/event}"
+WAL_SYSTEM_EVENT_DATA_TEMPLATE = {"SYSTEM_Provider_NAME": None, "SYSTEM_Provider_Guid": None, "SYSTEM_EventID": None,"SYSTEM_Version": None, "SYSTEM_Level": None, "SYSTEM_Task": None,
+                                    "SYSTEM_Opcode": None, "SYSTEM_Keywords": None, "SYSTEM_TimeCreated": None, "SYSTEM_EventRecordID": None, "SYSTEM_Correlation": None,
+                                    "SYSTEM_Execution_ProcessID": None,"SYSTEM_Execution_ThreadID": None, "SYSTEM_Channel": None, "SYSTEM_Computer": None,"SYSTEM_Security": None}
+# projection used by the quality checks (fast mode), SYSTEM_EventRecordID keeps otherwise identical events distinguishable for drop_duplicates
+WAL_QUALITY_CHECK_EVENT_IDS = frozenset(["4663"])
+WAL_QUALITY_CHECK_COLUMNS = ["SYSTEM_TimeCreated", "SYSTEM_EventID", "SYSTEM_EventRecordID", "EVENTDATA_SubjectUserName", "EVENTDATA_ObjectName", "EVENTDATA_AccessList", "EVENTDATA_ProcessName"]
+PARSED_ARCHIVE_CACHE_FILE_SUFFIX = ".parquet"
+PARSED_ARCHIVE_CACHE_DEFAULT_MAX_SIZE_BYTES = 53687091200
+# max. number of security events parsed into python objects at once while an archive is written into the parsed archive cache
+PARSED_ARCHIVE_CACHE_CHUNK_SIZE = 100000
+
+def iterate_xml_converted_windows_audit_log_event_elements(file_path: pathlib.Path, windows_audit_logs_provider_name: str = 'Microsoft-Windows-Security-Auditing'):
+    """iterate over Windows 10 security audit log events in XML format by using incremental parsing (element tree of complete file is never built in memory)
+
+    Args:
+        file_path (pathlib.Path): system path to Windows 10 audit log file in xml format
+        windows_audit_logs_provider_name (str): provider name of security events to yield. Defaults to 'Microsoft-Windows-Security-Auditing'.
+
+    Yields:
+        xml.etree.ElementTree.Element: single Windows 10 security audit log event element (element gets cleared after it is processed by the caller)
+    """
+    xml_tree_root = None
+    xml_tree_depth = 0
+    for event, element in ET.iterparse(file_path, events=("start", "end")):
+        if(event == "start"):
+            if(xml_tree_root is None):
+                xml_tree_root = element
+            xml_tree_depth = xml_tree_depth + 1
+        else:
+            xml_tree_depth = xml_tree_depth - 1
+            # every direct child of the xml root element is a single Windows 10 security audit log event
+            if(xml_tree_depth == 1):
+                if(element[0][0].attrib['Name'] == windows_audit_logs_provider_name):
+                    yield element
+                # free memory of already processed events -> peak memory stays flat independent of the file size
+                element.clear()
+                xml_tree_root.clear()
+
+def append_value_to_audit_log_column(columns: dict, column_key: str, row_index: int, value, missing_value = None):
+    """append value of a single event to its column list, rows of events without this column are padded with missing values
+
+    Args:
+        columns (dict): column name -> list of column values
+        column_key (str): column name
+        row_index (int): index of the event (row) the value belongs to
+        value (str): value to append
+        missing_value (optional): value used for padding of sparse columns. Defaults to None.
+    """
+    column = columns.get(column_key)
+    if(column is None):
+        column = []
+        columns[column_key] = column
+    if(len(column) < row_index):
+        column.extend([missing_value] * (row_index - len(column)))
+    if(len(column) > row_index):
+        # same key occurs twice in a single event -> last value wins (like dict based parsing)
+        column[row_index] = value
+    else:
+        column.append(value)
+
+def resolve_windows_audit_logs_pushdown(quality_check_fast_mode_enabled: bool = False, event_ids_of_interest: set = None, columns_of_interest: list = None):
+    """resolve event id and column projection which is pushed down into the XML parser
+
+    Args:
+        quality_check_fast_mode_enabled (bool): fast mode -> WAL_QUALITY_CHECK_EVENT_IDS and WAL_QUALITY_CHECK_COLUMNS are used if no explicit projection is given. Defaults to False.
+        event_ids_of_interest (set, optional): event ids (e.g., {"4663"}) of events to parse. Defaults to None (all events).
+        columns_of_interest (list, optional): columns (e.g., ["SYSTEM_EventID"]) to parse, SYSTEM_TimeCreated is always parsed. Defaults to None (all columns).
+
+    Returns:
+        tuple: (event ids of interest (frozenset) or None, columns of interest (list) or None)
+    """
+    if(quality_check_fast_mode_enabled):
+        if(event_ids_of_interest is None):
+            event_ids_of_interest = WAL_QUALITY_CHECK_EVENT_IDS
+        if(columns_of_interest is None):
+            columns_of_interest = WAL_QUALITY_CHECK_COLUMNS
+    if(event_ids_of_interest is not None):
+        event_ids_of_interest = frozenset(str(event_id) for event_id in event_ids_of_interest)
+    if(columns_of_interest is not None):
+        columns_of_interest = list(dict.fromkeys(["SYSTEM_TimeCreated"] + list(columns_of_interest)))
+
+    return event_ids_of_interest, columns_of_interest
+
+def accumulate_windows_audit_log_events_in_columns(windows_audit_logs_security_events, default_windows_audit_logs_system_event_data_template: dict = WAL_SYSTEM_EVENT_DATA_TEMPLATE, max_number_of_events: int = None,
+                                                   event_ids_of_interest: set = None, columns_of_interest: list = None):
+    """columnar fast path: append parsed event values straight into per column lists instead of creating dicts per event
+
+    Args:
+        windows_audit_logs_security_events (iterator): Windows 10 security audit log event elements (e.g., iterate_xml_converted_windows_audit_log_event_elements)
+        default_windows_audit_logs_system_event_data_template (dict): template for event system data. Defaults to WAL_SYSTEM_EVENT_DATA_TEMPLATE.
+        max_number_of_events (int, optional): stop after this number of events (used for bounded chunks). Defaults to None (consume all events).
+        event_ids_of_interest (set, optional): only events with these event ids are accumulated, all other events are skipped before any value is read. Defaults to None (all events).
+        columns_of_interest (list, optional): only these columns are accumulated, all other System and Data elements are skipped. Defaults to None (all columns).
+
+    Returns:
+        tuple: (event system data columns (dict), event data columns (dict), number of accumulated events)
+    """
+    system_tag = WAL_DEFAULT_TAG_APPENDIX + "System"
+    event_data_tag = WAL_DEFAULT_TAG_APPENDIX + "EventData"
+    provider_tag = WAL_DEFAULT_TAG_APPENDIX + "Provider"
+    time_created_tag = WAL_DEFAULT_TAG_APPENDIX + "TimeCreated"
+    execution_tag = WAL_DEFAULT_TAG_APPENDIX + "Execution"
+    event_id_tag = WAL_DEFAULT_TAG_APPENDIX + "EventID"
+    if(columns_of_interest is None):
+        system_columns = {column_key: [] for column_key in default_windows_audit_logs_system_event_data_template}
+        event_data_columns = {}
+        column_is_of_interest = lambda column_key: True
+    else:
+        # every projected column is part of the result (even if no parsed event contains it)
+        system_columns = {column_key: [] for column_key in default_windows_audit_logs_system_event_data_template if column_key in columns_of_interest}
+        system_columns.update({column_key: [] for column_key in columns_of_interest if not column_key.startswith("EVENTDATA_")})
+        event_data_columns = {column_key: [] for column_key in columns_of_interest if column_key.startswith("EVENTDATA_")}
+        columns_of_interest = frozenset(columns_of_interest)
+        column_is_of_interest = columns_of_interest.__contains__
+    provider_name_is_of_interest = column_is_of_interest('SYSTEM_Provider_NAME')
+    provider_guid_is_of_interest = column_is_of_interest('SYSTEM_Provider_Guid')
+    time_created_is_of_interest = column_is_of_interest('SYSTEM_TimeCreated')
+    process_id_is_of_interest = column_is_of_interest('SYSTEM_ProcessID')
+    thread_id_is_of_interest = column_is_of_interest('SYSTEM_ThreadID')
+    # one interned column key (or None if column is not of interest) per xml tag or EventData 'Name' attribute instead of building the same string for every event
+    system_column_keys = {}
+    event_data_column_keys = {}
+    number_of_events = 0
+
+    if((max_number_of_events is not None) and (max_number_of_events <= 0)):
+        return system_columns, event_data_columns, number_of_events
+
+    for windows_audit_logs__security_event in windows_audit_logs_security_events:
+        if(event_ids_of_interest is not None):
+            # skip events which are not of interest before any other value of the event is read
+            event_id_element = windows_audit_logs__security_event.find(system_tag + "/" + event_id_tag)
+            if((event_id_element is None) or (event_id_element.text not in event_ids_of_interest)):
+                continue
+        for system_or_event_data in windows_audit_logs__security_event:
+            if(system_or_event_data.tag == system_tag):
+                for element in system_or_event_data:
+                    if(element.tag == provider_tag):
+                        if(provider_name_is_of_interest):
+                            append_value_to_audit_log_column(system_columns, 'SYSTEM_Provider_NAME', number_of_events, element.attrib['Name'])
+                        if(provider_guid_is_of_interest):
+                            append_value_to_audit_log_column(system_columns, 'SYSTEM_Provider_Guid', number_of_events, element.attrib['Guid'])
+                    elif(element.tag == time_created_tag):
+                        if(time_created_is_of_interest):
+                            append_value_to_audit_log_column(system_columns, 'SYSTEM_TimeCreated', number_of_events, element.attrib['SystemTime'])
+                    elif(element.tag == execution_tag):
+                        if(process_id_is_of_interest):
+                            append_value_to_audit_log_column(system_columns, 'SYSTEM_ProcessID', number_of_events, element.attrib['ProcessID'])
+                        if(thread_id_is_of_interest):
+                            append_value_to_audit_log_column(system_columns, 'SYSTEM_ThreadID', number_of_events, element.attrib['ThreadID'])
+                    else:
+                        if(element.tag in system_column_keys):
+                            column_key = system_column_keys[element.tag]
+                        else:
+                            column_key = sys.intern('SYSTEM_' + (element.tag.replace(WAL_DEFAULT_TAG_APPENDIX, "")))
+                            if(not column_is_of_interest(column_key)):
+                                column_key = None
+                            system_column_keys[element.tag] = column_key
+                        if(column_key is not None):
+                            append_value_to_audit_log_column(system_columns, column_key, number_of_events, element.text)
+
+            elif(system_or_event_data.tag == event_data_tag):
+                for element in system_or_event_data:
+                    event_data_name = element.attrib['Name']
+                    if(event_data_name in event_data_column_keys):
+                        column_key = event_data_column_keys[event_data_name]
+                    else:
+                        column_key = sys.intern('EVENTDATA' + '_' + event_data_name)
+                        if(not column_is_of_interest(column_key)):
+                            column_key = None
+                        event_data_column_keys[event_data_name] = column_key
+                    if(column_key is not None):
+                        append_value_to_audit_log_column(event_data_columns, column_key, number_of_events, element.text, missing_value = np.nan)
+        number_of_events = number_of_events + 1
+        if((max_number_of_events is not None) and (number_of_events >= max_number_of_events)):
+            break
+
+    # pad sparse columns up to the number of accumulated events
+    for column in system_columns.values():
+        column.extend([None] * (number_of_events - len(column)))
+    for column in event_data_columns.values():
+        column.extend([np.nan] * (number_of_events - len(column)))
+
+    return system_columns, event_data_columns, number_of_events
+
+def build_windows_audit_logs_dataframe(windows_audit_logs_system_data_columns: dict, windows_audit_logs_event_data_columns: dict, timezone: str = "CET"):
+    """build dataframe once out of parsed Windows 10 security audit log columns
+
+    Args:
+        windows_audit_logs_system_data_columns (dict): parsed event system data columns
+        windows_audit_logs_event_data_columns (dict): parsed event data columns
+        timezone (str): timezone to convert parsed Windows 10 security file to (UTC -> timezone). Defaults to "CET".
+
+    Returns:
+        pd.DataFrame: dataframe which contains parsed Windows 10 security audit log data sorted by timestamps
+    """
+    return_dataframe = pd.DataFrame({**windows_audit_logs_system_data_columns, **windows_audit_logs_event_data_columns})
+    # parse to datetime format and remove time zone information & convert from UTC to CET or CEST time format
+    return_dataframe["SYSTEM_TimeCreated"] = pd.to_datetime(return_dataframe["SYSTEM_TimeCreated"]).dt.tz_localize(None)
+    if(timezone == "CET"):
+        # convert time zone from UTC to CET
+        return_dataframe['SYSTEM_TimeCreated'] = return_dataframe['SYSTEM_TimeCreated'] + pd.Timedelta(hours=1)
+    elif(timezone == "CEST"):
+        # convert time zone from UTC to CEST
+        return_dataframe['SYSTEM_TimeCreated'] = return_dataframe['SYSTEM_TimeCreated'] + pd.Timedelta(hours=2)
+
+    return return_dataframe.sort_values(by="SYSTEM_TimeCreated", ignore_index=True)
+
+def parse_xml_converted_windows_audit_logs(file_path: pathlib.Path, default_windows_audit_logs_system_event_data_template: dict = WAL_SYSTEM_EVENT_DATA_TEMPLATE, timezone: str = "CET",
+                                           quality_check_fast_mode_enabled: bool = False, event_ids_of_interest: set = None, columns_of_interest: list = None):
+    """parse Windows 10 securtiy audit logs from XMLf format in dataframe
+
+    Args:
+        file_path (pathlib.Path): system path to Windows 10 audit log file in xml format
+        default_windows_audit_logs_system_event_data_template (dict): template for event system data. Defaults to WAL_SYSTEM_EVENT_DATA_TEMPLATE.
+        timezone (str): timezone to convert parsed Windows 10 security file to (UTC -> timezone). Defaults to "CET".
+        quality_check_fast_mode_enabled (bool): apply fast mode by only using 4663 events with corresponding features for parsed dataframe. Defaults to False.
+        event_ids_of_interest (set, optional): only parse events with these event ids (e.g., {"4663"}). Defaults to None (all events).
+        columns_of_interest (list, optional): only parse these columns (e.g., ["SYSTEM_EventID"]), SYSTEM_TimeCreated is always parsed. Defaults to None (all columns).
+
+    Raises:
+        TypeError: raises error if given path does not refer to a file
+
+    Returns:
+        pd.DataFrame: dataframe which contains parsed Windows 10 security audit log data
+    """
+    if(not pathlib.Path(file_path).is_file()):
+        raise TypeError("method parameter is not a file: %s"%(str(file_path)))
+
+    event_ids_of_interest, columns_of_interest = resolve_windows_audit_logs_pushdown(quality_check_fast_mode_enabled, event_ids_of_interest, columns_of_interest)
+    windows_audit_logs_system_data_columns, windows_audit_logs_event_data_columns, _ = accumulate_windows_audit_log_events_in_columns(iterate_xml_converted_windows_audit_log_event_elements(file_path),
+                                                                                                                                     default_windows_audit_logs_system_event_data_template,
+                                                                                                                                     event_ids_of_interest = event_ids_of_interest, columns_of_interest = columns_of_interest)
+
+    return build_windows_audit_logs_dataframe(windows_audit_logs_system_data_columns, windows_audit_logs_event_data_columns, timezone = timezone)
+
+def parse_xml_converted_windows_audit_logs_in_chunks(file_path: pathlib.Path, chunk_size: int = PARSED_ARCHIVE_CACHE_CHUNK_SIZE, default_windows_audit_logs_system_event_data_template: dict = WAL_SYSTEM_EVENT_DATA_TEMPLATE,
+                                                     timezone: str = "CET", quality_check_fast_mode_enabled: bool = False, event_ids_of_interest: set = None, columns_of_interest: list = None):
+    """streaming mode: parse Windows 10 security audit logs from XML format in bounded chunks (peak memory of parsing depends on chunk size, not on file size)
+
+    Args:
+        file_path (pathlib.Path): system path to Windows 10 audit log file in xml format
+        chunk_size (int): max. number of security events included in a single yielded dataframe. Defaults to PARSED_ARCHIVE_CACHE_CHUNK_SIZE.
+        default_windows_audit_logs_system_event_data_template (dict): template for event system data. Defaults to WAL_SYSTEM_EVENT_DATA_TEMPLATE.
+        timezone (str): timezone to convert parsed Windows 10 security file to (UTC -> timezone). Defaults to "CET".
+        quality_check_fast_mode_enabled (bool): apply fast mode by only using 4663 events with corresponding features for parsed dataframe. Defaults to False.
+        event_ids_of_interest (set, optional): only parse events with these event ids (e.g., {"4663"}). Defaults to None (all events).
+        columns_of_interest (list, optional): only parse these columns (e.g., ["SYSTEM_EventID"]), SYSTEM_TimeCreated is always parsed. Defaults to None (all columns).
+
+    Raises:
+        TypeError: raises error if given path does not refer to a file
+
+    Yields:
+        pd.DataFrame: dataframe which contains parsed Windows 10 security audit log data of a single chunk (each chunk is sorted by timestamps, a file without events of interest yields a single empty chunk)
+    """
+    if(not pathlib.Path(file_path).is_file()):
+        raise TypeError("method parameter is not a file: %s"%(str(file_path)))
+
+    event_ids_of_interest, columns_of_interest = resolve_windows_audit_logs_pushdown(quality_check_fast_mode_enabled, event_ids_of_interest, columns_of_interest)
+    windows_audit_logs_security_events = iterate_xml_converted_windows_audit_log_event_elements(file_path)
+    number_of_chunks = 0
+    while(True):
+        windows_audit_logs_system_data_columns, windows_audit_logs_event_data_columns, number_of_events = accumulate_windows_audit_log_events_in_columns(windows_audit_logs_security_events, default_windows_audit_logs_system_event_data_template,
+                                                                                                                                                         max_number_of_events = chunk_size, event_ids_of_interest = event_ids_of_interest,
+                                                                                                                                                         columns_of_interest = columns_of_interest)
+        if((number_of_events == 0) and (number_of_chunks > 0)):
+            break
+        yield build_windows_audit_logs_dataframe(windows_audit_logs_system_data_columns, windows_audit_logs_event_data_columns, timezone = timezone)
+        number_of_chunks = number_of_chunks + 1
+        if(number_of_events < chunk_size):
+            break
+
+def compute_windows_audit_log_file_fingerprint(file_path: pathlib.Path, hash_block_size: int = 1048576, former_file_fingerprint: dict = None):
+    """compute fingerprint of a Windows 10 security audit log XML file (path, size, modification time and content hash)
+
+    Args:
+        file_path (pathlib.Path): path to file which contains Windows 10 security audit logs in XML format
+        hash_block_size (int): number of bytes read at once while hashing the file content. Defaults to 1048576.
+        former_file_fingerprint (dict, optional): former fingerprint of the file, returned without reading the file if path, size and modification time are unchanged. Defaults to None (always hash the content).
+
+    Returns:
+        dict: fingerprint of the file
+    """
+    file_stats = os.stat(file_path)
+    resolved_file_path = str(pathlib.Path(file_path).resolve())
+    if((former_file_fingerprint is not None) and (former_file_fingerprint.get("path") == resolved_file_path) and (former_file_fingerprint.get("size") == file_stats.st_size)
+       and (former_file_fingerprint.get("mtime") == file_stats.st_mtime_ns) and ("content_hash" in former_file_fingerprint)):
+        return former_file_fingerprint
+    content_hash = hashlib.sha256()
+    with open(file_path, 'rb') as xml_file:
+        for block in iter(lambda: xml_file.read(hash_block_size), b''):
+            content_hash.update(block)
+
+    return {"path": resolved_file_path, "size": file_stats.st_size, "mtime": file_stats.st_mtime_ns, "content_hash": content_hash.hexdigest()}
+
+def build_parsed_archive_cache_key(file_fingerprint: dict, **parsing_parameters):
+    """build cache key of a parsed Windows 10 security audit log file based on its fingerprint and the parameters used for parsing
+
+    Args:
+        file_fingerprint (dict): fingerprint of the parsed file (see compute_windows_audit_log_file_fingerprint)
+        parsing_parameters: parameters which change the parsed dataframe (e.g., timezone)
+
+    Returns:
+        str: cache key
+    """
+    cache_key_content = json.dumps({"file_fingerprint": file_fingerprint, "parsing_parameters": parsing_parameters, "parser_version": VERSION}, sort_keys = True, default = str)
+
+    return hashlib.sha256(cache_key_content.encode("utf-8")).hexdigest()
+
+def load_parsed_archive_from_cache(parsed_archive_cache_folder: pathlib.Path, cache_key: str):
+    """load parsed Windows 10 security audit log file from on-disk cache (columnar parquet format)
+
+    Args:
+        parsed_archive_cache_folder (pathlib.Path): folder of the parsed archive cache
+        cache_key (str): cache key of the parsed file (see build_parsed_archive_cache_key)
+
+    Returns:
+        pd.DataFrame: cached dataframe or None if the cache does not contain the key
+    """
+    cache_entry_path = pathlib.Path.joinpath(pathlib.Path(parsed_archive_cache_folder), cache_key + PARSED_ARCHIVE_CACHE_FILE_SUFFIX)
+    if(not cache_entry_path.is_file()):
+        return None
+    try:
+        parsed_audit_logs = pd.read_parquet(cache_entry_path)
+    except (OSError, ValueError):
+        # broken cache entry (e.g., interrupted write) -> parse the file again
+        return None
+    # refresh modification time of entry -> least recently used entries are evicted first
+    os.utime(cache_entry_path)
+
+    return parsed_audit_logs
+
+def evict_parsed_archive_cache_entries(parsed_archive_cache_folder: pathlib.Path, parsed_archive_cache_max_size_bytes: int):
+    """remove least recently used entries from the parsed archive cache until its size is below the given limit
+
+    Args:
+        parsed_archive_cache_folder (pathlib.Path): folder of the parsed archive cache
+        parsed_archive_cache_max_size_bytes (int): max. size of the parsed archive cache in bytes
+    """
+    cache_entries = []
+    for cache_entry_path in pathlib.Path(parsed_archive_cache_folder).glob("*" + PARSED_ARCHIVE_CACHE_FILE_SUFFIX):
+        try:
+            cache_entry_stats = cache_entry_path.stat()
+        except FileNotFoundError:
+            # entry already evicted by a concurrent process
+            continue
+        cache_entries.append((cache_entry_stats.st_mtime_ns, cache_entry_stats.st_size, cache_entry_path))
+
+    cache_size = sum(entry[1] for entry in cache_entries)
+    for _, cache_entry_size, cache_entry_path in sorted(cache_entries):
+        if(cache_size <= parsed_archive_cache_max_size_bytes):
+            break
+        cache_entry_path.unlink(missing_ok = True)
+        cache_size = cache_size - cache_entry_size
+
+def store_parsed_archive_in_cache(parsed_archive_cache_folder: pathlib.Path, cache_key: str, parsed_audit_logs: pa.Table, parsed_archive_cache_max_size_bytes: int = PARSED_ARCHIVE_CACHE_DEFAULT_MAX_SIZE_BYTES):
+    """store parsed Windows 10 security audit log file in on-disk cache (columnar parquet format) and evict least recently used entries if the cache is too large
+
+    Args:
+        parsed_archive_cache_folder (pathlib.Path): folder of the parsed archive cache
+        cache_key (str): cache key of the parsed file (see build_parsed_archive_cache_key)
+        parsed_audit_logs (pa.Table): parsed Windows 10 security audit logs (see parse_xml_converted_windows_audit_logs_into_cache)
+        parsed_archive_cache_max_size_bytes (int): max. size of the parsed archive cache in bytes. Defaults to PARSED_ARCHIVE_CACHE_DEFAULT_MAX_SIZE_BYTES.
+    """
+    parsed_archive_cache_folder = pathlib.Path(parsed_archive_cache_folder)
+    parsed_archive_cache_folder.mkdir(parents = True, exist_ok = True)
+    cache_entry_path = pathlib.Path.joinpath(parsed_archive_cache_folder, cache_key + PARSED_ARCHIVE_CACHE_FILE_SUFFIX)
+    # write to temporary file first -> concurrent readers never see partially written entries
+    temporary_cache_entry_path = pathlib.Path.joinpath(parsed_archive_cache_folder, cache_key + "." + str(os.getpid()) + ".tmp")
+    pq.write_table(parsed_audit_logs, temporary_cache_entry_path)
+    os.replace(temporary_cache_entry_path, cache_entry_path)
+    evict_parsed_archive_cache_entries(parsed_archive_cache_folder, parsed_archive_cache_max_size_bytes)
+
+def parse_xml_converted_windows_audit_logs_into_cache(file_path: pathlib.Path, parsed_archive_cache_folder: pathlib.Path, cache_key: str, timezone: str = "CET", event_ids_of_interest: set = None, columns_of_interest: list = None,
+                                                      parsed_archive_cache_max_size_bytes: int = PARSED_ARCHIVE_CACHE_DEFAULT_MAX_SIZE_BYTES, chunk_size: int = PARSED_ARCHIVE_CACHE_CHUNK_SIZE):
+    """parse Windows 10 security audit logs chunk by chunk into the parsed archive cache, at most chunk_size events are held as python objects at once (parsed chunks are kept in columnar arrow format)
+
+    Args:
+        file_path (pathlib.Path): system path to Windows 10 audit log file in xml format
+        parsed_archive_cache_folder (pathlib.Path): folder of the parsed archive cache
+        cache_key (str): cache key of the parsed file (see build_parsed_archive_cache_key)
+        timezone (str): timezone to convert parsed Windows 10 security file to (UTC -> timezone). Defaults to "CET".
+        event_ids_of_interest (set, optional): only parse events with these event ids (e.g., {"4663"}). Defaults to None (all events).
+        columns_of_interest (list, optional): only parse these columns (e.g., ["SYSTEM_EventID"]), SYSTEM_TimeCreated is always parsed. Defaults to None (all columns).
+        parsed_archive_cache_max_size_bytes (int): max. size of the parsed archive cache in bytes. Defaults to PARSED_ARCHIVE_CACHE_DEFAULT_MAX_SIZE_BYTES.
+        chunk_size (int): max. number of security events parsed at once. Defaults to PARSED_ARCHIVE_CACHE_CHUNK_SIZE.
+
+    Returns:
+        pd.DataFrame: dataframe which contains parsed Windows 10 security audit log data (same content as read from the cache)
+    """
+    parsed_audit_logs_chunks = []
+    for parsed_audit_logs_chunk in parse_xml_converted_windows_audit_logs_in_chunks(file_path, chunk_size = chunk_size, timezone = timezone, event_ids_of_interest = event_ids_of_interest, columns_of_interest = columns_of_interest):
+        # without pandas metadata -> chunks with different (sparse) columns can be combined
+        parsed_audit_logs_chunks.append(pa.Table.from_pandas(parsed_audit_logs_chunk, preserve_index = False).replace_schema_metadata(None))
+    # columns missing in a chunk are filled with nulls, chunks are sorted on their own -> stable sort of the whole file
+    parsed_audit_logs = pa.concat_tables(parsed_audit_logs_chunks, promote_options = "default").sort_by("SYSTEM_TimeCreated")
+    del parsed_audit_logs_chunks
+    store_parsed_archive_in_cache(parsed_archive_cache_folder, cache_key, parsed_audit_logs, parsed_archive_cache_max_size_bytes = parsed_archive_cache_max_size_bytes)
+
+    return parsed_audit_logs.to_pandas()
+
+def parse_xml_converted_windows_audit_logs_cached(file_path: pathlib.Path, timezone: str = "CET", quality_check_fast_mode_enabled: bool = False, parsed_archive_cache_folder: pathlib.Path = None,
+                                                  parsed_archive_cache_max_size_bytes: int = PARSED_ARCHIVE_CACHE_DEFAULT_MAX_SIZE_BYTES, event_ids_of_interest: set = None, columns_of_interest: list = None):
+    """parse Windows 10 security audit logs from XML format and reuse already parsed files from the on-disk parsed archive cache
+
+    Args:
+        file_path (pathlib.Path): system path to Windows 10 audit log file in xml format
+        timezone (str): timezone to convert parsed Windows 10 security file to (UTC -> timezone). Defaults to "CET".
+        quality_check_fast_mode_enabled (bool): apply fast mode by only using 4663 events with corresponding features for parsed dataframe. Defaults to False.
+        event_ids_of_interest (set, optional): only parse events with these event ids (e.g., {"4663"}). Defaults to None (all events).
+        columns_of_interest (list, optional): only parse these columns (e.g., ["SYSTEM_EventID"]), SYSTEM_TimeCreated is always parsed. Defaults to None (all columns).
+        parsed_archive_cache_folder (pathlib.Path, optional): folder of the parsed archive cache. Defaults to None (no caching).
+        parsed_archive_cache_max_size_bytes (int): max. size of the parsed archive cache in bytes. Defaults to PARSED_ARCHIVE_CACHE_DEFAULT_MAX_SIZE_BYTES.
+
+    Returns:
+        pd.DataFrame: dataframe which contains parsed Windows 10 security audit log data
+    """
+    event_ids_of_interest, columns_of_interest = resolve_windows_audit_logs_pushdown(quality_check_fast_mode_enabled, event_ids_of_interest, columns_of_interest)
+    if(parsed_archive_cache_folder is None):
+        return parse_xml_converted_windows_audit_logs(file_path = file_path, timezone = timezone, event_ids_of_interest = event_ids_of_interest, columns_of_interest = columns_of_interest)
+
+    cache_key = build_parsed_archive_cache_key(compute_windows_audit_log_file_fingerprint(file_path), timezone = timezone,
+                                               event_ids_of_interest = None if event_ids_of_interest is None else sorted(event_ids_of_interest), columns_of_interest = columns_of_interest)
+    parsed_audit_logs = load_parsed_archive_from_cache(parsed_archive_cache_folder, cache_key)
+    if(parsed_audit_logs is None):
+        parsed_audit_logs = parse_xml_converted_windows_audit_logs_into_cache(file_path, parsed_archive_cache_folder, cache_key, timezone = timezone, event_ids_of_interest = event_ids_of_interest,
+                                                                              columns_of_interest = columns_of_interest, parsed_archive_cache_max_size_bytes = parsed_archive_cache_max_size_bytes)
+
+    return parsed_audit_logs
+
+def merge_sorted_windows_audit_logs(sorted_audit_logs_frames: list, timestamp_col_name_windows_audit_logs: str = "SYSTEM_TimeCreated"):
+    """merge already sorted Windows 10 security audit log dataframes (e.g., one per parsed file) with a single concat and a single merge by timestamps
+
+    Args:
+        sorted_audit_logs_frames (list): dataframes which are sorted by timestamps each
+        timestamp_col_name_windows_audit_logs (str, optional): column name of Windows 10 security audit log timestamps. Defaults to "SYSTEM_TimeCreated".
+
+    Returns:
+        pd.DataFrame: merged dataframe sorted by timestamps
+    """
+    sorted_audit_logs_frames = [frame for frame in sorted_audit_logs_frames if(not frame.empty)]
+    if(not sorted_audit_logs_frames):
+        return pd.DataFrame()
+
+    concat_audit_logs_df = pd.concat(sorted_audit_logs_frames, copy = False, ignore_index = True, axis = 0)
+    # stable sort (timsort) detects the pre-sorted runs of every frame and merges them (k-way merge) instead of re-sorting everything
+    return concat_audit_logs_df.sort_values(by = timestamp_col_name_windows_audit_logs, kind = "stable", ignore_index = True)
+
+def list_archived_windows_audit_log_files(folder_path: pathlib.Path, archived_wal_substring: str = "Archive-Security"):
+    """list Windows 10 security audit log files of a system folder sorted by file name (file names contain the export timestamps)
+
+    Args:
+        folder_path (pathlib.Path): path to system folder which contains Windows 10 security audit logs in XML format
+        archived_wal_substring (str, optional): substring included in every Windows security audit log file. Defaults to "Archive-Security".
+
+    Returns:
+        list: sorted system paths of the Windows 10 security audit log files
+    """
+    return sorted([sub_path for sub_path in pathlib.Path(folder_path).iterdir() if((sub_path.is_file()) & (archived_wal_substring in str(sub_path)))])
+
+def parse_windows_audit_log_files(file_paths: list, timezone_of_simulation_run: str = "CET", quality_check_fast_mode_enabled: bool = False, number_of_workers: int = 1,
+                                  parsed_archive_cache_folder: pathlib.Path = None, parsed_archive_cache_max_size_bytes: int = PARSED_ARCHIVE_CACHE_DEFAULT_MAX_SIZE_BYTES,
+                                  event_ids_of_interest: set = None, columns_of_interest: list = None):
+    """parse Windows 10 security audit log files (sequentially or with a pool of processes)
+
+    Args:
+        file_paths (list): system paths of Windows 10 security audit log files in XML format
+        timezone_of_simulation_run (str): timezone which should be used for simulation run. Defaults to "CET".
+        quality_check_fast_mode_enabled (bool): apply fast mode by only using 4663 events with corresponding features for parsed dataframe. Defaults to False.
+        number_of_workers (int): number of processes parsing the XML files concurrently (1 -> sequential parsing). Defaults to 1.
+        parsed_archive_cache_folder (pathlib.Path, optional): folder of the on-disk parsed archive cache to reuse already parsed files. Defaults to None (no caching).
+        parsed_archive_cache_max_size_bytes (int): max. size of the parsed archive cache in bytes. Defaults to PARSED_ARCHIVE_CACHE_DEFAULT_MAX_SIZE_BYTES.
+        event_ids_of_interest (set, optional): only parse events with these event ids (e.g., {"4663"}). Defaults to None (all events).
+        columns_of_interest (list, optional): only parse these columns (e.g., ["SYSTEM_EventID"]), SYSTEM_TimeCreated is always parsed. Defaults to None (all columns).
+
+    Returns:
+        list: parsed dataframes (sorted by timestamps each) in the order of file_paths
+    """
+    archived_wal_file_paths = list(file_paths)
+    parsed_audit_logs_frames = [None] * len(archived_wal_file_paths)
+    counter = 0
+    with progressbar.ProgressBar(max_value=len(archived_wal_file_paths)) as bar:
+        bar.update(counter)
+        if(number_of_workers > 1):
+            with concurrent.futures.ProcessPoolExecutor(max_workers = number_of_workers) as executor:
+                futures = {executor.submit(parse_xml_converted_windows_audit_logs_cached, file_path = sub_path, timezone = timezone_of_simulation_run, quality_check_fast_mode_enabled = quality_check_fast_mode_enabled,
+                                           parsed_archive_cache_folder = parsed_archive_cache_folder, parsed_archive_cache_max_size_bytes = parsed_archive_cache_max_size_bytes,
+                                           event_ids_of_interest = event_ids_of_interest, columns_of_interest = columns_of_interest): idx
+                           for idx, sub_path in enumerate(archived_wal_file_paths)}
+                for future in concurrent.futures.as_completed(futures):
+                    parsed_audit_logs_frames[futures[future]] = future.result()
+                    counter = counter + 1
+                    bar.update(counter)
+        else:
+            for idx, sub_path in enumerate(archived_wal_file_paths):
+                parsed_audit_logs_frames[idx] = parse_xml_converted_windows_audit_logs_cached(file_path = sub_path, timezone = timezone_of_simulation_run, quality_check_fast_mode_enabled = quality_check_fast_mode_enabled,
+                                                                                              parsed_archive_cache_folder = parsed_archive_cache_folder, parsed_archive_cache_max_size_bytes = parsed_archive_cache_max_size_bytes,
+                                                                                              event_ids_of_interest = event_ids_of_interest, columns_of_interest = columns_of_interest)
+                counter = counter + 1
+                bar.update(counter)
+
+    return parsed_audit_logs_frames
+
+def iterate_windows_audit_logs_of_consecutive_iterations(iteration_folder_paths: list, next_run_first_iteration_folder_path: pathlib.Path = None, iteration_indices: list = None, archived_wal_substring: str = "Archive-Security",
+                                                         timestamp_col_name_windows_audit_logs: str = "SYSTEM_TimeCreated", timezone_of_simulation_run: str = "CET", quality_check_fast_mode_enabled: bool = False,
+                                                         number_of_workers: int = 1, parsed_archive_cache_folder: pathlib.Path = None, parsed_archive_cache_max_size_bytes: int = PARSED_ARCHIVE_CACHE_DEFAULT_MAX_SIZE_BYTES,
+                                                         event_ids_of_interest: set = None, columns_of_interest: list = None):
+    """iterate through consecutive iterations of a simulation run and parse every archive only once per traversal
+
+    the first archive of the next iteration (or of the first iteration of the next run) contains the spill-over of the current iteration,
+    it is parsed once and reused as first archive of the next iteration instead of being parsed a second time
+
+    Args:
+        iteration_folder_paths (list): system folders containing Windows 10 security audit logs of the iterations in chronological order
+        next_run_first_iteration_folder_path (pathlib.Path, optional): system folder of the first iteration of the next simulation run (spill-over of the last iteration). Defaults to None.
+        iteration_indices (list, optional): ascending indices of the iterations to load. Defaults to None (all iterations).
+        archived_wal_substring (str, optional): substring included in every Windows security audit log file. Defaults to "Archive-Security".
+        timestamp_col_name_windows_audit_logs (str, optional): column name of Windows 10 security audit log timestamps. Defaults to "SYSTEM_TimeCreated".
+        timezone_of_simulation_run (str): timezone which should be used for simulation run. Defaults to "CET".
+        quality_check_fast_mode_enabled (bool): apply fast mode by only using 4663 events with corresponding features for parsed dataframe. Defaults to False.
+        number_of_workers (int): number of processes parsing the XML files of an iteration folder concurrently (1 -> sequential parsing). Defaults to 1.
+        parsed_archive_cache_folder (pathlib.Path, optional): folder of the on-disk parsed archive cache to reuse already parsed files. Defaults to None (no caching).
+        parsed_archive_cache_max_size_bytes (int): max. size of the parsed archive cache in bytes. Defaults to PARSED_ARCHIVE_CACHE_DEFAULT_MAX_SIZE_BYTES.
+        event_ids_of_interest (set, optional): only parse events with these event ids (e.g., {"4663"}). Defaults to None (all events).
+        columns_of_interest (list, optional): only parse these columns (e.g., ["SYSTEM_EventID"]), SYSTEM_TimeCreated is always parsed. Defaults to None (all columns).
+
+    Yields:
+        tuple: (iteration index, audit logs of the iteration folder (pd.DataFrame), audit logs of the first archive of the next iteration (pd.DataFrame, empty if not available))
+    """
+    parsing_parameters = {"timezone_of_simulation_run": timezone_of_simulation_run, "quality_check_fast_mode_enabled": quality_check_fast_mode_enabled, "parsed_archive_cache_folder": parsed_archive_cache_folder,
+                          "parsed_archive_cache_max_size_bytes": parsed_archive_cache_max_size_bytes, "event_ids_of_interest": event_ids_of_interest, "columns_of_interest": columns_of_interest}
+    if(iteration_indices is None):
+        iteration_indices = range(len(iteration_folder_paths))
+    # (system path, parsed dataframe) of the last parsed first archive of the next iteration
+    parsed_next_iteration_archive = (None, None)
+    for iteration_index in iteration_indices:
+        archived_wal_file_paths = list_archived_windows_audit_log_files(iteration_folder_paths[iteration_index], archived_wal_substring)
+        files_to_parse = [file_path for file_path in archived_wal_file_paths if(file_path != parsed_next_iteration_archive[0])]
+        parsed_frames = dict(zip(files_to_parse, parse_windows_audit_log_files(files_to_parse, number_of_workers = number_of_workers, **parsing_parameters)))
+        if(parsed_next_iteration_archive[0] in archived_wal_file_paths):
+            parsed_frames[parsed_next_iteration_archive[0]] = parsed_next_iteration_archive[1]
+        iteration_audit_logs = merge_sorted_windows_audit_logs([parsed_frames[file_path] for file_path in archived_wal_file_paths], timestamp_col_name_windows_audit_logs = timestamp_col_name_windows_audit_logs)
+        parsed_frames = None
+
+        # last iteration -> first iteration of the next run, otherwise next iteration of the same run
+        if(iteration_index == (len(iteration_folder_paths)-1)):
+            next_iteration_folder_path = next_run_first_iteration_folder_path
+        else:
+            next_iteration_folder_path = iteration_folder_paths[iteration_index+1]
+        next_iteration_archived_wal_file_paths = [] if next_iteration_folder_path is None else list_archived_windows_audit_log_files(next_iteration_folder_path, archived_wal_substring)
+        next_iteration_audit_logs = pd.DataFrame()
+        parsed_next_iteration_archive = (None, None)
+        if(next_iteration_archived_wal_file_paths):
+            parsed_next_iteration_archive = (next_iteration_archived_wal_file_paths[0], parse_windows_audit_log_files(next_iteration_archived_wal_file_paths[:1], **parsing_parameters)[0])
+            next_iteration_audit_logs = parsed_next_iteration_archive[1].sort_values(by = timestamp_col_name_windows_audit_logs, ignore_index = True)
+
+        yield iteration_index, iteration_audit_logs, next_iteration_audit_logs
+
+def load_windows_audit_logs_from_system_folder(folder_path: pathlib.Path, timestamp_col_name_windows_audit_logs: str = "SYSTEM_TimeCreated", remove_linux_wal_converter_artefacts: bool = False,
+                                               timezone_of_simulation_run: str = "CET", quality_check_fast_mode_enabled: bool = False, number_of_workers: int = 1,
+                                               parsed_archive_cache_folder: pathlib.Path = None, parsed_archive_cache_max_size_bytes: int = PARSED_ARCHIVE_CACHE_DEFAULT_MAX_SIZE_BYTES,
+                                               event_ids_of_interest: set = None, columns_of_interest: list = None):
+    """load windows audit logs from system folder into dataframe container
+
+    Args:
+        folder_path (pathlib.Path): path to system folder which contains Windows 10 security audit logs in XML format
+        timestamp_col_name_windows_audit_logs (str, optional): column name of Windows 10 security audit log timestamps. Defaults to "SYSTEM_TimeCreated".
+        remove_linux_wal_converter_artefacts (bool, optional): needs to be removed.
+        timezone_of_simulation_run (str): timezone which should be used for simulation run. Defaults to "CET".
+        quality_check_fast_mode_enabled (bool): apply fast mode by only using 4663 events with corresponding features for parsed dataframe. Defaults to False.
+        event_ids_of_interest (set, optional): only parse events with these event ids (e.g., {"4663"}). Defaults to None (all events).
+        columns_of_interest (list, optional): only parse these columns (e.g., ["SYSTEM_EventID"]), SYSTEM_TimeCreated is always parsed. Defaults to None (all columns).
+        number_of_workers (int): number of processes parsing the XML files of the folder concurrently (1 -> sequential parsing). Defaults to 1.
+        parsed_archive_cache_folder (pathlib.Path, optional): folder of the on-disk parsed archive cache to reuse already parsed files. Defaults to None (no caching).
+        parsed_archive_cache_max_size_bytes (int): max. size of the parsed archive cache in bytes. Defaults to PARSED_ARCHIVE_CACHE_DEFAULT_MAX_SIZE_BYTES.
+
+    Returns:
+        pd.DataFrame: dataframe that contains xml parsed Windows 10 security audit logs data
+    """
+    archived_wal_file_paths = list_archived_windows_audit_log_files(folder_path)
+    parsed_audit_logs_frames = parse_windows_audit_log_files(archived_wal_file_paths, timezone_of_simulation_run = timezone_of_simulation_run, quality_check_fast_mode_enabled = quality_check_fast_mode_enabled,
+                                                             number_of_workers = number_of_workers, parsed_archive_cache_folder = parsed_archive_cache_folder,
+                                                             parsed_archive_cache_max_size_bytes = parsed_archive_cache_max_size_bytes, event_ids_of_interest = event_ids_of_interest, columns_of_interest = columns_of_interest)
+
+    return merge_sorted_windows_audit_logs(parsed_audit_logs_frames, timestamp_col_name_windows_audit_logs = timestamp_col_name_windows_audit_logs)
+
+def load_windows_audit_logs_from_system_file(file_path: pathlib.Path, timestamp_col_name_windows_audit_logs: str = "SYSTEM_TimeCreated", remove_linux_wal_converter_artefacts: bool = False,
+                                             timezone_of_simulation_run: str = "CET", quality_check_fast_mode_enabled: bool = False, parsed_archive_cache_folder: pathlib.Path = None,
+                                             parsed_archive_cache_max_size_bytes: int = PARSED_ARCHIVE_CACHE_DEFAULT_MAX_SIZE_BYTES, event_ids_of_interest: set = None, columns_of_interest: list = None):
+    """load Windows 10 security audit logs from file into dataframe container
+
+    Args:
+        file_path (pathlib.Path): path to file which contains Windows 10 security audit logs in XML format
+        timestamp_col_name_windows_audit_logs (str, optional): column name of Windows 10 security audit log timestamps. Defaults to "SYSTEM_TimeCreated".
+        remove_linux_wal_converter_artefacts (bool, optional): needs to be removed.
+        timezone_of_simulation_run (str, optional): timezone which should be used for simulation run. Defaults to "CET".
+        quality_check_fast_mode_enabled (bool): apply fast mode by only using 4663 events with corresponding features for parsed dataframe. Defaults to False.
+        event_ids_of_interest (set, optional): only parse events with these event ids (e.g., {"4663"}). Defaults to None (all events).
+        columns_of_interest (list, optional): only parse these columns (e.g., ["SYSTEM_EventID"]), SYSTEM_TimeCreated is always parsed. Defaults to None (all columns).
+        parsed_archive_cache_folder (pathlib.Path, optional): folder of the on-disk parsed archive cache to reuse already parsed files. Defaults to None (no caching).
+        parsed_archive_cache_max_size_bytes (int): max. size of the parsed archive cache in bytes. Defaults to PARSED_ARCHIVE_CACHE_DEFAULT_MAX_SIZE_BYTES.
+
+    Returns:
+        pd.DataFrame: dataframe which contains xml parsed windows audit logs file
+    """
+    counter = 0
+    with progressbar.ProgressBar(max_value=1) as bar:
+        bar.update(counter)
+        if((os.path.isfile(file_path)) & ("Archive-Security" in str(file_path))):
+            parsed_audit_logs = parse_xml_converted_windows_audit_logs_cached(file_path=file_path, timezone=timezone_of_simulation_run, quality_check_fast_mode_enabled=quality_check_fast_mode_enabled,
+                                                                              parsed_archive_cache_folder=parsed_archive_cache_folder, parsed_archive_cache_max_size_bytes=parsed_archive_cache_max_size_bytes,
+                                                                              event_ids_of_interest=event_ids_of_interest, columns_of_interest=columns_of_interest).sort_values(by=timestamp_col_name_windows_audit_logs, ignore_index=True)
+            counter = counter + 1
+            bar.update(counter)
+    
+    return parsed_audit_logs
+
+
+def attach_sim_23_logs_labels_col_windows_audit_logs(audit_logs_df: pd.DataFrame, sim23_logs: list,
+                                                     timestamp_col_name_windows_audit_logs: str = "SYSTEM_TimeCreated", labeling_col_name: str = "Labels"):
+    """label converted Windows 10 security audit logs based on sim23.log bot behavior (programming, mailing, encrypt attack(copy, encrypt, decrypt, delete), mutillidae, chatting, copyfiles, peertube)
+
+    every behavior interval [start, end] is located by binary search on the sorted timestamps, overlapping intervals are labeled in sim23.log order (later behaviors overwrite earlier ones)
+
+    Args:
+        audit_logs_df (pd.DataFrame): Windows 10 security audit logs dataframe to label
+        sim23_logs (list): list of converted sim23.log entries
+        timestamp_col_name_windows_audit_logs (str, optional): column name of Windows 10 security audit log timestamps. Defaults to "SYSTEM_TimeCreated".
+        labeling_col_name (str, optional): Windows 10 security audit logs dataframe column name to label rows. Defaults to "Labels".
+
+    Returns:
+        pd.DataFrame: Windows 10 security audit logs dataframe containing labeled simulation user behavior
+    """
+    copy = audit_logs_df.copy()
+    timestamps = copy[timestamp_col_name_windows_audit_logs]
+    # positions of rows in timestamp order (only needed if the dataframe is not sorted by timestamps)
+    sorted_row_positions = None
+    if(not timestamps.is_monotonic_increasing):
+        sorted_row_positions = np.argsort(timestamps.to_numpy(), kind="stable")
+        timestamps = timestamps.iloc[sorted_row_positions]
+
+    behavior_labels = ['no_label']
+    behavior_label_codes = {}
+    sorted_label_codes = np.zeros(len(timestamps.index), dtype=np.int32)
+    for row_entry in sim23_logs:
+        # pre-defined indices from method: self.parse_cidds_local_instance_logs()
+        local_instance_logs_start_time = row_entry[0]
+        local_instance_logs_end_time = row_entry[1]
+        local_instance_logs_behavior_label = row_entry[2]
+        if(local_instance_logs_behavior_label not in behavior_label_codes):
+            behavior_label_codes[local_instance_logs_behavior_label] = len(behavior_labels)
+            behavior_labels.append(local_instance_logs_behavior_label)
+        # first row >= start time and first row > end time
+        first_row_of_behavior = timestamps.searchsorted(local_instance_logs_start_time, side="left")
+        last_row_of_behavior = timestamps.searchsorted(local_instance_logs_end_time, side="right")
+        sorted_label_codes[first_row_of_behavior:last_row_of_behavior] = behavior_label_codes[local_instance_logs_behavior_label]
+
+    if(sorted_row_positions is None):
+        label_codes = sorted_label_codes
+    else:
+        label_codes = np.empty_like(sorted_label_codes)
+        label_codes[sorted_row_positions] = sorted_label_codes
+    copy[labeling_col_name] = np.array(behavior_labels, dtype=object)[label_codes]
+
+    return copy
+
+def main():
+    return 0
+
+if __name__ == "__main__":
+    if(CMD_MODE_ENABLED):
+        parser = argparse.ArgumentParser(prog = NAME, formatter_class = argparse.RawDescriptionHelpFormatter, description = textwrap.dedent(('''
+        This script is called by main experiment scripts (starting with 'wsal_') on highest hierachy of this repository structure.
+        ---------------------------------------------------------------
+        Name: %s
+        Version: %s
+        ---------------------------------------------------------------
+        Usage:
+        ''')%(NAME, VERSION)))
+        
+        return_code = main()
+        quit(return_code)
+    else:
         main()
\ No newline at end of file
@@ -2,15 +2,21 @@ import textwrap
 import argparse
 import datetime
 import pandas as pd
+import numpy as np
 import logging
 import pathlib
 import configparser
+import time
 
 NAME = "Windows Audit Logs Quality Evaluation Script"
-VERSION = "1.11"
+VERSION = "1.16"
 CMD_MODE_ENABLED = False
 
 SIM_USER_DUMMY_TAG = "SIM_USER_DUMMY"
+QUALITY_CHECK_LOGGING_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+QUALITY_CHECK_LOGGING_DATE_FORMAT = "%d/%m/%Y %H:%M:%S"
+QUALITY_CHECK_RECORD_COLUMNS = ["quality_check", "sim23_log_behavior_label", "start_time_behavior", "end_time_behavior", "order_check", "count_check", "expected_security_events", "observed_security_events",
+                                "quality_check_duration_seconds"]
 LABEL_WAL_FEATURE_MAPPING = {
     # process name & count of files included in general encrypt attack
     'encrypt_copy_200KB_10_files' : ['C:\\Windows\\System32\\xcopy.exe', 10],
@@ -72,6 +78,180 @@ def load_config_asset(config_section: str, config_key: str, config_system_path:
 
     return config_key_value
 
+def get_quality_check_logger(logging_file_path: pathlib.Path = None):
+    """get logger writing into a specific quality check report -> every report has its own logger, several reports can be written in the same process (no process-global logging.basicConfig)
+
+    Args:
+        logging_file_path (pathlib.Path, optional): path of the quality check report. Defaults to None (take path out of config file in same folder).
+
+    Returns:
+        logging.Logger: logger of the quality check report (records are appended to the report)
+    """
+    if(logging_file_path == None):
+        logging_file_path = pathlib.Path(load_config_asset("LOGGING", "system_path_to_write_logs"))
+    quality_check_logger = logging.getLogger("wal_quality_evaluation_report|" + str(pathlib.Path(logging_file_path).absolute()))
+    if(not quality_check_logger.handlers):
+        file_handler = logging.FileHandler(logging_file_path)
+        file_handler.setFormatter(logging.Formatter(fmt = QUALITY_CHECK_LOGGING_FORMAT, datefmt = QUALITY_CHECK_LOGGING_DATE_FORMAT))
+        quality_check_logger.addHandler(file_handler)
+        quality_check_logger.setLevel(logging.DEBUG)
+        quality_check_logger.propagate = False
+
+    return quality_check_logger
+
+def close_quality_check_logger(logging_file_path: pathlib.Path = None):
+    """close quality check report (file handle) of a logger created by get_quality_check_logger
+
+    Args:
+        logging_file_path (pathlib.Path, optional): path of the quality check report. Defaults to None (take path out of config file in same folder).
+    """
+    if(logging_file_path == None):
+        logging_file_path = pathlib.Path(load_config_asset("LOGGING", "system_path_to_write_logs"))
+    quality_check_logger = logging.getLogger("wal_quality_evaluation_report|" + str(pathlib.Path(logging_file_path).absolute()))
+    for handler in list(quality_check_logger.handlers):
+        quality_check_logger.removeHandler(handler)
+        handler.close()
+
+def build_quality_check_rule(process_name: str, event_id: str, object_name: str, access_type: str, object_name_match: str = "equals"):
+    """build declarative rule (conditions on ProcessName, EventID, ObjectName & AccessList) matching the security events of a single sub behavior
+
+    Args:
+        process_name (str): program executable that accessed the object
+        event_id (str): windows security event id of interest
+        object_name (str): name of the object being accessed
+        access_type (str): access type included in the access list of the windows security event
+        object_name_match (str): "equals" (object name is equal) or "contains_dat_file" (object name contains object_name and '.dat', e.g. files in folder). Defaults to "equals".
+
+    Returns:
+        tuple: conditions (column name, match type, value) of the rule -> match types: "equals", "contains" (plain substring) and "matches" (regular expression like pd.Series.str.contains)
+    """
+    if(object_name_match == "contains_dat_file"):
+        object_name_conditions = (("EVENTDATA_ObjectName", "contains", object_name), ("EVENTDATA_ObjectName", "matches", ".dat"))
+    else:
+        object_name_conditions = (("EVENTDATA_ObjectName", "equals", object_name),)
+
+    return (("EVENTDATA_ProcessName", "equals", process_name), ("SYSTEM_EventID", "equals", event_id)) + object_name_conditions + (("EVENTDATA_AccessList", "matches", access_type),)
+
+def match_quality_check_rules(wal_dataframe: pd.DataFrame, quality_check_rules: list):
+    """match all rules of a rule table in one vectorized pass over the window -> every column is factorized once and every condition is evaluated once on the unique values only
+
+    Args:
+        wal_dataframe (pd.DataFrame): dataframe which contains windows security events (e.g., window of a sim23 behavior)
+        quality_check_rules (list): rules (see build_quality_check_rule)
+
+    Returns:
+        list: boolean row mask (np.ndarray) per rule
+    """
+    factorized_columns = {}
+    condition_masks = {}
+    rule_masks = []
+    for quality_check_rule in quality_check_rules:
+        rule_mask = np.ones(len(wal_dataframe.index), dtype=bool)
+        for condition in quality_check_rule:
+            if(condition not in condition_masks):
+                column_name, match_type, value = condition
+                if(column_name not in factorized_columns):
+                    # missing values get code -1 and never match
+                    factorized_columns[column_name] = pd.factorize(wal_dataframe[column_name])
+                codes, unique_values = factorized_columns[column_name]
+                unique_values = pd.Series(unique_values)
+                if(match_type == "equals"):
+                    unique_value_matches = (unique_values == value)
+                elif(match_type == "contains"):
+                    unique_value_matches = unique_values.str.contains(value, regex=False)
+                else:
+                    unique_value_matches = unique_values.str.contains(value)
+                unique_value_matches = np.append(unique_value_matches.to_numpy(dtype=bool, na_value=False), False)
+                condition_masks[condition] = unique_value_matches[codes]
+            rule_mask &= condition_masks[condition]
+        rule_masks.append(rule_mask)
+
+    return rule_masks
+
+def evaluate_quality_check_rules(wal_dataframe: pd.DataFrame, quality_check_rules: list, drop_duplicates: bool = False, timestamp_col_name_windows_audit_logs: str = "SYSTEM_TimeCreated"):
+    """evaluate rule table of a quality check and build the security event pattern to check
+
+    Args:
+        wal_dataframe (pd.DataFrame): dataframe which contains windows security events (e.g., window of a sim23 behavior)
+        quality_check_rules (list): rules (see build_quality_check_rule)
+        drop_duplicates (bool): security events matched by more than one rule are part of the pattern once (otherwise once per matching rule). Defaults to False.
+        timestamp_col_name_windows_audit_logs (str, optional): column name of Windows 10 security audit log timestamps. Defaults to "SYSTEM_TimeCreated".
+
+    Returns:
+        tuple: (number of matched security events per rule (list), matched security events sorted by timestamps (pd.DataFrame))
+    """
+    rule_masks = match_quality_check_rules(wal_dataframe, quality_check_rules)
+    rule_match_counts = [int(rule_mask.sum()) for rule_mask in rule_masks]
+    if(drop_duplicates):
+        wal_pattern = wal_dataframe[np.logical_or.reduce(rule_masks)].sort_values(by=timestamp_col_name_windows_audit_logs, kind="stable").drop_duplicates(ignore_index=True)
+    else:
+        wal_pattern = wal_dataframe.iloc[np.concatenate([np.flatnonzero(rule_mask) for rule_mask in rule_masks])].sort_values(by=timestamp_col_name_windows_audit_logs, kind="stable", ignore_index=True)
+
+    return rule_match_counts, wal_pattern
+
+def check_quality_check_event_sequence(wal_pattern: pd.DataFrame, expected_event_sequence: list, expected_access_type_sequence: list, object_name_match: str = "equals", search_sequence_start: bool = False):
+    """check order and count of the matched security events against the expected security event sequence
+
+    Args:
+        wal_pattern (pd.DataFrame): matched security events sorted by timestamps (see evaluate_quality_check_rules)
+        expected_event_sequence (list): expected [process name, event id, object name] per security event
+        expected_access_type_sequence (list): expected access type per security event (security event can contain more than one specific access type in access list)
+        object_name_match (str): "equals" (object name is equal), "contains" (expected object name is part of the object name) or "contains_dat_file" (additionally a .dat file). Defaults to "equals".
+        search_sequence_start (bool): sequence starts at the first security event equal to the first expected security event (buffering unexpected simulation behavior at the start and end of the sequence), otherwise the count has to match exactly. Defaults to False.
+
+    Returns:
+        list: returns list with two bool values -> first value is true if windows security events occur in pre-defined order and second value is true if windows security events occur in pre-defined count, otherwise return false for specific values
+    """
+    security_event_sequence_to_check = wal_pattern[['EVENTDATA_ProcessName', 'SYSTEM_EventID', 'EVENTDATA_ObjectName']].values.tolist()
+    security_access_type_sequence_to_check = wal_pattern['EVENTDATA_AccessList'].tolist()
+    start_index_quality_check = 0
+    if(search_sequence_start):
+        for idx, element in enumerate(security_event_sequence_to_check):
+            if(element == expected_event_sequence[0]):
+                start_index_quality_check = idx
+                # stop when start index is found
+                break
+        if(((len(security_event_sequence_to_check) - start_index_quality_check) < len(expected_event_sequence)) or ((len(security_access_type_sequence_to_check) - start_index_quality_check) < len(expected_access_type_sequence))):
+            return [False, False]
+    elif((len(security_event_sequence_to_check) != len(expected_event_sequence)) or (len(security_access_type_sequence_to_check) != len(expected_access_type_sequence))):
+        return [False, False]
+
+    quality_evaluation_results = [True, True]
+    for expected_event, event in zip(expected_event_sequence, security_event_sequence_to_check[start_index_quality_check:]):
+        if(object_name_match == "equals"):
+            event_matches = (expected_event == event)
+        else:
+            # explicitly check every element because object file names vary while copying different files
+            event_matches = ((expected_event[0] == event[0]) and (expected_event[1] == event[1]) and (expected_event[2] in event[2]) and ((object_name_match != "contains_dat_file") or ('.dat' in event[2])))
+        if(not event_matches):
+            quality_evaluation_results[0] = False
+    for expected_access_type, access_list in zip(expected_access_type_sequence, security_access_type_sequence_to_check[start_index_quality_check:]):
+        if(not(expected_access_type in access_list)):
+            quality_evaluation_results[0] = False
+
+    return quality_evaluation_results
+
+def build_quality_check_record(quality_check_name: str, sim23_log_behavior_label: str, start_time_behavior: datetime.datetime, end_time_behavior: datetime.datetime, quality_evaluation_results: list,
+                               expected_security_events: int, observed_security_events: int, quality_check_start_time: float):
+    """build structured result record of a single quality check (machine-readable alternative to the quality check report)
+
+    Args:
+        quality_check_name (str): name of the quality check function
+        sim23_log_behavior_label (str): behavior label of sim23 log entry
+        start_time_behavior (datetime.datetime): start of the behavior window
+        end_time_behavior (datetime.datetime): end of the behavior window
+        quality_evaluation_results (list): [order check, count check] returned by the quality check
+        expected_security_events (int): number of expected windows security events
+        observed_security_events (int): number of windows security events of the behavior window matched by the rules of the quality check
+        quality_check_start_time (float): time.perf_counter() value at the start of the quality check
+
+    Returns:
+        dict: result record -> keys are the columns of QUALITY_CHECK_RECORD_COLUMNS
+    """
+    return {"quality_check": quality_check_name, "sim23_log_behavior_label": sim23_log_behavior_label, "start_time_behavior": start_time_behavior, "end_time_behavior": end_time_behavior,
+            "order_check": bool(quality_evaluation_results[0]), "count_check": bool(quality_evaluation_results[1]), "expected_security_events": expected_security_events,
+            "observed_security_events": observed_security_events, "quality_check_duration_seconds": time.perf_counter() - quality_check_start_time}
+
 def quality_check_programming_behavior_java(wal_dataframe: pd.DataFrame, start_timestamp_programming_behavior: datetime.datetime, end_timestamp_programming_behavior: datetime.datetime,
                                             delete_file_initially_process_name: str = 'C:\\Users\\'+SIM_USER_DUMMY_TAG+'\\scoop\\apps\\python\\3.11.3\\python.exe', delete_file_initially_event_id: str = '4663', delete_file_initially_object_name: str = 'C:\\workspace\\Unmanaged\\JavaSim23\\Sim23.java', delete_file_initially_access_type: str = '%%1537',
                                             create_java_template_file_process_name: str = 'C:\\Users\\'+SIM_USER_DUMMY_TAG+'\\scoop\\apps\\python\\3.11.3\\python.exe', create_java_template_file_event_id: str = '4663', create_java_template_file_object_name: str = 'C:\\workspace\\Unmanaged\\JavaSim23\\Sim23.java', create_java_template_file_access_type: str = '%%4417',
@@ -79,11 +259,11 @@ def quality_check_programming_behavior_java(wal_dataframe: pd.DataFrame, start_t
                                             compile_delete_class_file_process_name: str = 'C:\\Users\\'+SIM_USER_DUMMY_TAG+'\\scoop\\apps\\python\\3.11.3\\python.exe', compile_delete_class_file_event_id: str = '4663', compile_delete_class_file_object_name: str = 'C:\\workspace\\Unmanaged\\JavaSim23\\Sim23.class', compile_delete_class_file_access_type: str = '%%1537',
                                             compile_create_class_file_process_name: str = 'C:\\Users\\'+SIM_USER_DUMMY_TAG+'\\scoop\\apps\\openjdk\\21.0.1-12\\bin\\javac.exe', compile_create_class_file_event_id: str = '4663', compile_create_class_file_object_name: str = 'C:\\workspace\\Unmanaged\\JavaSim23\\Sim23.class', compile_create_class_file_access_type: str = '%%4417',
                                             execute_sim23_class_file_process_name: str = 'C:\\Users\\'+SIM_USER_DUMMY_TAG+'\\scoop\\apps\\openjdk\\21.0.1-12\\bin\\java.exe', execute_sim23_class_file_event_id: str = '4663', execute_sim23_class_file_object_name: str = 'C:\\Users\\'+SIM_USER_DUMMY_TAG+'\\scoop\\apps\\openjdk\\21.0.1-12\\bin\\server\\jvm.dll', execute_sim23_class_file_access_type: str = '%%4421',
-                                            log_wal_quality_evaluation: bool = True, sim23_log_behavior_label: str = "UNDEFINED", logging_file_path: pathlib.Path = None, sim_user_of_interest: str = None):
+                                            log_wal_quality_evaluation: bool = True, sim23_log_behavior_label: str = "UNDEFINED", logging_file_path: pathlib.Path = None, quality_check_records: list = None, sim_user_of_interest: str = None):
     """check if windows security events occur in specific security event order (based on implemented simulation behavior) & the count of specific events machtes the sim23 log timestamps => for java programming behavior sim23
 
     Args:
-        wal_dataframe (pd.DataFrame): dataframe which contains windows security events
+        wal_dataframe (pd.DataFrame): windows security events of the behavior window (only events between start & end time of the behavior, see wal_general_quality_check_handler_sim23_log_based)
         start_timestamp_programming_behavior (datetime.datetime): start timestamp of sim23 behavior of interest
         end_timestamp_programming_behavior (datetime.datetime): end timestamp of sim23 behavior of interest
         delete_file_initially_process_name (str): program executable that accessed the object during initial file (.java-file) delete step of java programming behavior
@@ -113,17 +293,16 @@ def quality_check_programming_behavior_java(wal_dataframe: pd.DataFrame, start_t
         log_wal_quality_evaluation (bool): log quality check results in log file if True, else no logging will be applied
         sim23_log_behavior_label (str): name of the sim23 log behavior which is quality checked
         logging_file_path (pathlib.Path): path to log the quality evaluation results. Defaults to None (take path out of config file in same folder)
+        quality_check_records (list, optional): structured result record of the quality check is appended (see build_quality_check_record). Defaults to None (no record).
         sim_user_of_interest (str): name of simulation user which is focused in quality check
 
     Returns:
         list: returns list with two bool values -> first value is true if windows security events occur in pre-defined order and second value is true if windows security events occur in pre-defined count, otherwise return false for specific values
     """   
+    quality_check_start_time = time.perf_counter()
     if(log_wal_quality_evaluation):
-        if(logging_file_path == None):
-            logging.basicConfig(filename=pathlib.Path(load_config_asset("LOGGING", "system_path_to_write_logs")), level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s', datefmt="%d/%m/%Y %H:%M:%S")
-        else:
-            logging.basicConfig(filename=logging_file_path, level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s', datefmt="%d/%m/%Y %H:%M:%S")
-        logging.info('|%s|%s', sim23_log_behavior_label, 'method wal_quality_evaluation.quality_check_programming_behavior_java started')
+        quality_check_logger = get_quality_check_logger(logging_file_path)
+        quality_check_logger.info('|%s|%s', sim23_log_behavior_label, 'method wal_quality_evaluation.quality_check_programming_behavior_java started')
 
     # configure path based on given SimUser tag first (001 - 004)
     delete_file_initially_process_name = delete_file_initially_process_name.replace(SIM_USER_DUMMY_TAG, sim_user_of_interest)
@@ -148,78 +327,18 @@ def quality_check_programming_behavior_java(wal_dataframe: pd.DataFrame, start_t
     
     # check if wal_dataframe is empty, if yes skip the quality check part
     if(not wal_dataframe.empty):
-        dataframe_copy = wal_dataframe[(wal_dataframe['SYSTEM_TimeCreated'] >= start_timestamp_programming_behavior) & (wal_dataframe['SYSTEM_TimeCreated'] <= end_timestamp_programming_behavior)].copy()
-
-        delete_sim23_java_file_sub_dataframe = dataframe_copy[(dataframe_copy['EVENTDATA_ProcessName'] == delete_file_initially_process_name) & \
-                                                (dataframe_copy['SYSTEM_EventID'] == delete_file_initially_event_id) & \
-                                                (dataframe_copy['EVENTDATA_ObjectName'] == delete_file_initially_object_name) & \
-                                                (dataframe_copy['EVENTDATA_AccessList'].str.contains(delete_file_initially_access_type))]
-        
-        create_sim23_java_template_file_sub_dataframe = dataframe_copy[(dataframe_copy['EVENTDATA_ProcessName'] == create_java_template_file_process_name) & \
-                                                (dataframe_copy['SYSTEM_EventID'] == create_java_template_file_event_id) & \
-                                                (dataframe_copy['EVENTDATA_ObjectName'] == create_java_template_file_object_name) & \
-                                                (dataframe_copy['EVENTDATA_AccessList'].str.contains(create_java_template_file_access_type))]
-        
-        wal_pattern_programming_java = pd.concat([delete_sim23_java_file_sub_dataframe, create_sim23_java_template_file_sub_dataframe], axis=0).sort_values(by='SYSTEM_TimeCreated', ignore_index=True)
-        create_sim23_java_file_loc_content_sub_dataframe = dataframe_copy[(dataframe_copy['EVENTDATA_ProcessName'] == create_java_file_loc_process_name) & \
-                                                (dataframe_copy['SYSTEM_EventID'] == create_java_file_loc_event_id) & \
-                                                (dataframe_copy['EVENTDATA_ObjectName'] == create_java_file_loc_object_name) & \
-                                                (dataframe_copy['EVENTDATA_AccessList'].str.contains(create_java_file_loc_access_type))]
-        
-        wal_pattern_programming_java = pd.concat([wal_pattern_programming_java, create_sim23_java_file_loc_content_sub_dataframe], axis=0).sort_values(by='SYSTEM_TimeCreated', ignore_index=True)
-        
-        delete_sim23_class_file_sub_dataframe = dataframe_copy[(dataframe_copy['EVENTDATA_ProcessName'] == compile_delete_class_file_process_name) & \
-                                                (dataframe_copy['SYSTEM_EventID'] == compile_delete_class_file_event_id) & \
-                                                (dataframe_copy['EVENTDATA_ObjectName'] == compile_delete_class_file_object_name) & \
-                                                (dataframe_copy['EVENTDATA_AccessList'].str.contains(compile_delete_class_file_access_type))]
-        
-        wal_pattern_programming_java = pd.concat([wal_pattern_programming_java, delete_sim23_class_file_sub_dataframe], axis=0).sort_values(by='SYSTEM_TimeCreated', ignore_index=True)
-
-        create_sim23_class_file_sub_dataframe = dataframe_copy[(dataframe_copy['EVENTDATA_ProcessName'] == compile_create_class_file_process_name) & \
-                                                (dataframe_copy['SYSTEM_EventID'] == compile_create_class_file_event_id) & \
-                                                (dataframe_copy['EVENTDATA_ObjectName'] == compile_create_class_file_object_name) & \
-                                                (dataframe_copy['EVENTDATA_AccessList'].str.contains(compile_create_class_file_access_type))]
-        
-        wal_pattern_programming_java = pd.concat([wal_pattern_programming_java, create_sim23_class_file_sub_dataframe], axis=0, ignore_index= True).sort_values(by='SYSTEM_TimeCreated', ignore_index=True)
-
-        # java -version (calls jvm.dll)
-        # java sim23.behvaior (calls jvm.dll) 
-        # will return two entries for this filter criteria based on two java commands: java -version & java sim23.class execution
-        execute_sim23_class_file_sub_dataframe = dataframe_copy[(dataframe_copy['EVENTDATA_ProcessName'] == execute_sim23_class_file_process_name) & \
-                                                (dataframe_copy['SYSTEM_EventID'] == execute_sim23_class_file_event_id) & \
-                                                (dataframe_copy['EVENTDATA_ObjectName'] == execute_sim23_class_file_object_name) & \
-                                                (dataframe_copy['EVENTDATA_AccessList'].str.contains(execute_sim23_class_file_access_type))]
-
-        wal_pattern_programming_java = pd.concat([wal_pattern_programming_java, execute_sim23_class_file_sub_dataframe], axis=0, ignore_index= True).sort_values(by='SYSTEM_TimeCreated', ignore_index=True)
-
-        #bot subbehavior: create java template & fill java template with loc, have same event data features -> due to this both queries aboth included the events of the other behavior as well -> drop duplicates
-        # granularity based on timestamp feature values: 2023-12-26 20:02:20.906489800 -> the same timestamps do not occur in this order
-        wal_pattern_programming_java_without_duplicates = wal_pattern_programming_java.drop_duplicates(ignore_index=True)
-        
-        security_event_seuqence_to_check = wal_pattern_programming_java_without_duplicates[['EVENTDATA_ProcessName', 'SYSTEM_EventID', 'EVENTDATA_ObjectName']].values.tolist()
-        security_access_type_sequence_to_check = wal_pattern_programming_java_without_duplicates[['EVENTDATA_AccessList']].values.flatten().tolist()
-
-        # get start index of sequence to check buffering unexpected simulation behavior at the start and end of the sequences to check
-        first_element_of_security_event_sequence_to_expect = windows_security_log_event_sequence_to_expect[0]
-        start_index_quality_check= 0
-        # iterate over security event sequence to check
-        for idx, element in enumerate(security_event_seuqence_to_check):
-            if(element == first_element_of_security_event_sequence_to_expect):
-                start_index_quality_check = idx
-                # stop when start index is found
-                break
-        
-        if((len(security_event_seuqence_to_check[start_index_quality_check:]) >= len(windows_security_log_event_sequence_to_expect)) and (len(security_access_type_sequence_to_check[start_index_quality_check:]) >= len(security_access_type_sequence_to_expect))):
-            # security event sequence order and count of event is check at the same type for this behvaior
-            for idx, event_row in enumerate(windows_security_log_event_sequence_to_expect):
-                if(windows_security_log_event_sequence_to_expect[idx] != security_event_seuqence_to_check[start_index_quality_check + idx]):
-                    quality_evaluation_results[0] = False
-            # explicitly check for access type because security event can contain more than one specific access type in access list
-            for idx, access_list_elemet in enumerate(security_access_type_sequence_to_expect):
-                if(not(security_access_type_sequence_to_expect[idx] in security_access_type_sequence_to_check[start_index_quality_check + idx])):
-                    quality_evaluation_results[0] = False
-        else:
-            quality_evaluation_results = [False, False]
+        # rule table: initial delete java file, create java template file, create java file loc, delete class file, create class file, execute class file
+        # java -version & java sim23.behvaior (both call jvm.dll) -> execute class file rule will return two entries
+        quality_check_rules = [build_quality_check_rule(delete_file_initially_process_name, delete_file_initially_event_id, delete_file_initially_object_name, delete_file_initially_access_type),
+                               build_quality_check_rule(create_java_template_file_process_name, create_java_template_file_event_id, create_java_template_file_object_name, create_java_template_file_access_type),
+                               build_quality_check_rule(create_java_file_loc_process_name, create_java_file_loc_event_id, create_java_file_loc_object_name, create_java_file_loc_access_type),
+                               build_quality_check_rule(compile_delete_class_file_process_name, compile_delete_class_file_event_id, compile_delete_class_file_object_name, compile_delete_class_file_access_type),
+                               build_quality_check_rule(compile_create_class_file_process_name, compile_create_class_file_event_id, compile_create_class_file_object_name, compile_create_class_file_access_type),
+                               build_quality_check_rule(execute_sim23_class_file_process_name, execute_sim23_class_file_event_id, execute_sim23_class_file_object_name, execute_sim23_class_file_access_type)]
+        #bot subbehavior: create java template & fill java template with loc, have same event data features -> due to this both rules match the events of the other behavior as well -> drop duplicates
+        rule_match_counts, wal_pattern_programming_java_without_duplicates = evaluate_quality_check_rules(wal_dataframe, quality_check_rules, drop_duplicates = True)
+        # security event sequence order and count of event is check at the same type for this behvaior
+        quality_evaluation_results = check_quality_check_event_sequence(wal_pattern_programming_java_without_duplicates, windows_security_log_event_sequence_to_expect, security_access_type_sequence_to_expect, search_sequence_start = True)
     else:
         # if wal_dataframe is empty
         wal_pattern_programming_java_without_duplicates = wal_dataframe
@@ -228,53 +347,38 @@ def quality_check_programming_behavior_java(wal_dataframe: pd.DataFrame, start_t
     if(log_wal_quality_evaluation):
         if(not wal_pattern_programming_java_without_duplicates.empty):
             # first step initial delete java file
-            if(delete_sim23_java_file_sub_dataframe.empty):
-                logging.debug('|%s|%s|%s %s',  'detailed quality check info', 'initial delete java file count of filtered row entries' , 0 , "out of 1 entry/entries expected")
-            else:
-                logging.debug('|%s|%s|%s %s',  'detailed quality check info', 'initial delete java file count of filtered row entries' , delete_sim23_java_file_sub_dataframe.shape[0], "out of 1 entry/entries expected")
+            quality_check_logger.debug('|%s|%s|%s %s',  'detailed quality check info', 'initial delete java file count of filtered row entries' , rule_match_counts[0], "out of 1 entry/entries expected")
             # second step create java template file
-            if(create_sim23_java_template_file_sub_dataframe.empty):
-                logging.debug('|%s|%s|%s %s',  'detailed quality check info', 'create java template file count of filtered row entries' , 0, "out of 2 entry/entries expected")
-            else:
-                # create java template & fill java template with loc, have same event data features -> due to this both queries aboth included the events of the other behavior as well
-                logging.debug('|%s|%s|%s %s',  'detailed quality check info', 'create java template file count of filtered row entries' , create_sim23_java_template_file_sub_dataframe.shape[0], "out of 2 entry/entries expected")
+            # create java template & fill java template with loc, have same event data features -> due to this both queries aboth included the events of the other behavior as well
+            quality_check_logger.debug('|%s|%s|%s %s',  'detailed quality check info', 'create java template file count of filtered row entries' , rule_match_counts[1], "out of 2 entry/entries expected")
             # thrid step create java file content with loc
-            if(create_sim23_java_file_loc_content_sub_dataframe.empty):
-                logging.debug('|%s|%s|%s %s',  'detailed quality check info', 'create java loc file content count of filtered row entries' , 0, "out of 2 entry/entries expected")
-            else:
-                # create java template & fill java template with loc, have same event data features -> due to this both queries aboth included the events of the other behavior as well
-                logging.debug('|%s|%s|%s %s',  'detailed quality check info', 'create java loc file content count of filtered row entries' , create_sim23_java_file_loc_content_sub_dataframe.shape[0], "out of 2 entry/entries expected")
+            # create java template & fill java template with loc, have same event data features -> due to this both queries aboth included the events of the other behavior as well
+            quality_check_logger.debug('|%s|%s|%s %s',  'detailed quality check info', 'create java loc file content count of filtered row entries' , rule_match_counts[2], "out of 2 entry/entries expected")
             # fourth step delete java class file
-            if(delete_sim23_class_file_sub_dataframe.empty):
-                logging.debug('|%s|%s|%s %s',  'detailed quality check info', 'delete java class file count of filtered row entries' , 0, "out of 1 entry/entries expected")
-            else:
-                logging.debug('|%s|%s|%s %s',  'detailed quality check info', 'delete java class file count of filtered row entries' , delete_sim23_class_file_sub_dataframe.shape[0], "out of 1 entry/entries expected")
+            quality_check_logger.debug('|%s|%s|%s %s',  'detailed quality check info', 'delete java class file count of filtered row entries' , rule_match_counts[3], "out of 1 entry/entries expected")
             # fifth step create java class file
-            if(create_sim23_class_file_sub_dataframe.empty):
-                logging.debug('|%s|%s|%s %s',  'detailed quality check info', 'create java class file count of filtered row entries' , 0, "out of 1 entry/entries expected")
-            else:
-                logging.debug('|%s|%s|%s %s',  'detailed quality check info', 'create java class file count of filtered row entries' , create_sim23_class_file_sub_dataframe.shape[0], "out of 1 entry/entries expected")
+            quality_check_logger.debug('|%s|%s|%s %s',  'detailed quality check info', 'create java class file count of filtered row entries' , rule_match_counts[4], "out of 1 entry/entries expected")
             # sixth step execute java class file
-            if(execute_sim23_class_file_sub_dataframe.empty):
-                logging.debug('|%s|%s|%s %s',  'detailed quality check info', 'execute java class file count of filtered row entries' , 0, "out of 2 entry/entries expected")
-            else:
-                # will log two entries for this filter criteria based on two java commands: java -version & java sim23.class execution
-                logging.debug('|%s|%s|%s %s',  'detailed quality check info', 'execute java class file count of filtered row entries' , execute_sim23_class_file_sub_dataframe.shape[0], "out of 2 entry/entries expected")
+            # will log two entries for this filter criteria based on two java commands: java -version & java sim23.class execution
+            quality_check_logger.debug('|%s|%s|%s %s',  'detailed quality check info', 'execute java class file count of filtered row entries' , rule_match_counts[5], "out of 2 entry/entries expected")
             
             # final log entry to sum up results -> difference is in logging tag (info & error)
             if((quality_evaluation_results[0] == True) and (quality_evaluation_results[1] == True)):
-                logging.info('|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s', 'security event sequence order check was successful', str(quality_evaluation_results[0]), 'security event sequence occured in pre-defined count', str(quality_evaluation_results[1]), 'first event timestamp of complete wal sequence' , str(wal_pattern_programming_java_without_duplicates['SYSTEM_TimeCreated'].iloc[0]), 'last event timestamp of complete wal sequence' , str(wal_pattern_programming_java_without_duplicates['SYSTEM_TimeCreated'].iloc[-1]), 'sim23 log start time', start_timestamp_programming_behavior.strftime("%d/%m/%Y %H:%M:%S:%f"), 'sim23 log end time', end_timestamp_programming_behavior.strftime("%d/%m/%Y %H:%M:%S:%f"))
+                quality_check_logger.info('|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s', 'security event sequence order check was successful', str(quality_evaluation_results[0]), 'security event sequence occured in pre-defined count', str(quality_evaluation_results[1]), 'first event timestamp of complete wal sequence' , str(wal_pattern_programming_java_without_duplicates['SYSTEM_TimeCreated'].iloc[0]), 'last event timestamp of complete wal sequence' , str(wal_pattern_programming_java_without_duplicates['SYSTEM_TimeCreated'].iloc[-1]), 'sim23 log start time', start_timestamp_programming_behavior.strftime("%d/%m/%Y %H:%M:%S:%f"), 'sim23 log end time', end_timestamp_programming_behavior.strftime("%d/%m/%Y %H:%M:%S:%f"))
             else:
-                logging.error('|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s', 'security event sequence order check was successful', str(quality_evaluation_results[0]), 'security event sequence occured in pre-defined count', str(quality_evaluation_results[1]), 'first event timestamp of complete wal sequence' , str(wal_pattern_programming_java_without_duplicates['SYSTEM_TimeCreated'].iloc[0]), 'last event timestamp of complete wal sequence' , str(wal_pattern_programming_java_without_duplicates['SYSTEM_TimeCreated'].iloc[-1]), 'sim23 log start time', start_timestamp_programming_behavior.strftime("%d/%m/%Y %H:%M:%S:%f"), 'sim23 log end time', end_timestamp_programming_behavior.strftime("%d/%m/%Y %H:%M:%S:%f"))
+                quality_check_logger.error('|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s', 'security event sequence order check was successful', str(quality_evaluation_results[0]), 'security event sequence occured in pre-defined count', str(quality_evaluation_results[1]), 'first event timestamp of complete wal sequence' , str(wal_pattern_programming_java_without_duplicates['SYSTEM_TimeCreated'].iloc[0]), 'last event timestamp of complete wal sequence' , str(wal_pattern_programming_java_without_duplicates['SYSTEM_TimeCreated'].iloc[-1]), 'sim23 log start time', start_timestamp_programming_behavior.strftime("%d/%m/%Y %H:%M:%S:%f"), 'sim23 log end time', end_timestamp_programming_behavior.strftime("%d/%m/%Y %H:%M:%S:%f"))
         else:
-            logging.debug('|%s|%s|%s %s',  'detailed quality check info', 'initial delete java file count of filtered row entries' , 0 , "out of 1 entry/entries expected")
-            logging.debug('|%s|%s|%s %s',  'detailed quality check info', 'create java template file count of filtered row entries' , 0, "out of 2 entry/entries expected")
-            logging.debug('|%s|%s|%s %s',  'detailed quality check info', 'create java loc file content count of filtered row entries' , 0, "out of 2 entry/entries expected")
-            logging.debug('|%s|%s|%s %s',  'detailed quality check info', 'delete java class file count of filtered row entries' , 0, "out of 1 entry/entries expected")
-            logging.debug('|%s|%s|%s %s',  'detailed quality check info', 'create java class file count of filtered row entries' , 0, "out of 1 entry/entries expected")
-            logging.debug('|%s|%s|%s %s',  'detailed quality check info', 'execute java class file count of filtered row entries' , 0, "out of 2 entry/entries expected")
+            quality_check_logger.debug('|%s|%s|%s %s',  'detailed quality check info', 'initial delete java file count of filtered row entries' , 0 , "out of 1 entry/entries expected")
+            quality_check_logger.debug('|%s|%s|%s %s',  'detailed quality check info', 'create java template file count of filtered row entries' , 0, "out of 2 entry/entries expected")
+            quality_check_logger.debug('|%s|%s|%s %s',  'detailed quality check info', 'create java loc file content count of filtered row entries' , 0, "out of 2 entry/entries expected")
+            quality_check_logger.debug('|%s|%s|%s %s',  'detailed quality check info', 'delete java class file count of filtered row entries' , 0, "out of 1 entry/entries expected")
+            quality_check_logger.debug('|%s|%s|%s %s',  'detailed quality check info', 'create java class file count of filtered row entries' , 0, "out of 1 entry/entries expected")
+            quality_check_logger.debug('|%s|%s|%s %s',  'detailed quality check info', 'execute java class file count of filtered row entries' , 0, "out of 2 entry/entries expected")
             # final log entry to sum up results
-            logging.error('|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s', 'security event sequence order check was successful', str(quality_evaluation_results[0]), 'security event sequence occured in pre-defined count', str(quality_evaluation_results[1]), 'first event timestamp of complete wal sequence' , "emtpy dataframe", 'last event timestamp of complete wal sequence' , "empty dataframe", 'sim23 log start time', start_timestamp_programming_behavior.strftime("%d/%m/%Y %H:%M:%S:%f"), 'sim23 log end time', end_timestamp_programming_behavior.strftime("%d/%m/%Y %H:%M:%S:%f"))
+            quality_check_logger.error('|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s', 'security event sequence order check was successful', str(quality_evaluation_results[0]), 'security event sequence occured in pre-defined count', str(quality_evaluation_results[1]), 'first event timestamp of complete wal sequence' , "emtpy dataframe", 'last event timestamp of complete wal sequence' , "empty dataframe", 'sim23 log start time', start_timestamp_programming_behavior.strftime("%d/%m/%Y %H:%M:%S:%f"), 'sim23 log end time', end_timestamp_programming_behavior.strftime("%d/%m/%Y %H:%M:%S:%f"))
+
+    if(quality_check_records is not None):
+        quality_check_records.append(build_quality_check_record("quality_check_programming_behavior_java", sim23_log_behavior_label, start_timestamp_programming_behavior, end_timestamp_programming_behavior, quality_evaluation_results, len(windows_security_log_event_sequence_to_expect), len(wal_pattern_programming_java_without_duplicates.index), quality_check_start_time))
 
     return quality_evaluation_results
     
@@ -283,11 +387,11 @@ def quality_check_programming_behavior_python(wal_dataframe: pd.DataFrame, start
                                               create_python_template_file_process_name: str = 'C:\\Users\\'+SIM_USER_DUMMY_TAG+'\\scoop\\apps\\python\\3.11.3\\python.exe', create_python_template_file_event_id: str = '4663', create_python_template_file_object_name: str = 'C:\\workspace\\Unmanaged\\PythonSim23\\sim23.py', create_python_template_file_access_type: str = '%%4417',
                                               create_python_file_loc_content_process_name: str = 'C:\\Users\\'+SIM_USER_DUMMY_TAG+'\\scoop\\apps\\python\\3.11.3\\python.exe', create_python_file_loc_content_event_id: str = '4663', create_python_file_loc_content_object_name: str = 'C:\\workspace\\Unmanaged\\PythonSim23\\sim23.py', create_python_file_loc_content_access_type: str = '%%4417',  
                                               execute_python_file_process_name: str = 'C:\\Users\\'+SIM_USER_DUMMY_TAG+'\\scoop\\apps\\python\\3.11.3\\python.exe', execute_python_file_event_id: str = '4663', execute_python_file_object_name: str = 'C:\\Users\\'+SIM_USER_DUMMY_TAG+'\\scoop\\apps\\python\\3.11.3\\python311.dll', execute_python_file_access_type: str = '%%4421',
-                                              log_wal_quality_evaluation: bool = True, sim23_log_behavior_label: str = "UNDEFINED", logging_file_path: pathlib.Path = None, sim_user_of_interest: str = None):
+                                              log_wal_quality_evaluation: bool = True, sim23_log_behavior_label: str = "UNDEFINED", logging_file_path: pathlib.Path = None, quality_check_records: list = None, sim_user_of_interest: str = None):
     """check if windows security events occur in specific security event order (based on implemented simulation behavior) & the count of specific events machtes the sim23 log timestamps => for python programming behavior sim23
 
     Args:
-        wal_dataframe (pd.DataFrame): dataframe which contains windows security events
+        wal_dataframe (pd.DataFrame): windows security events of the behavior window (only events between start & end time of the behavior, see wal_general_quality_check_handler_sim23_log_based)
         start_timestamp_programming_behavior (datetime.datetime): start timestamp of sim23 behavior of interest
         end_timestamp_programming_behavior (datetime.datetime): end timestamp of sim23 behavior of interest
         delete_file_initially_process_name (str): program executable that accessed the object during initial file (.py-file) delete step of python programming behavior
@@ -309,18 +413,17 @@ def quality_check_programming_behavior_python(wal_dataframe: pd.DataFrame, start
         log_wal_quality_evaluation (bool): log quality check results in log file if True, else no logging will be applied
         sim23_log_behavior_label (str): name of the sim23 log behavior which is quality checked
         logging_file_path (pathlib.Path): path to log the quality evaluation results. Defaults to None (take path out of config file in same folder)
+        quality_check_records (list, optional): structured result record of the quality check is appended (see build_quality_check_record). Defaults to None (no record).
         sim_user_of_interest (str): name of simulation user which is focused in quality check
 
     Returns:
         list: returns list with two bool values -> first value is true if windows security events occur in pre-defined order and second value is true if windows security events occur in pre-defined count, otherwise return false for specific values
     """
 
+    quality_check_start_time = time.perf_counter()
     if(log_wal_quality_evaluation):
-        if(logging_file_path == None):
-            logging.basicConfig(filename=pathlib.Path(load_config_asset("LOGGING", "system_path_to_write_logs")), level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s', datefmt="%d/%m/%Y %H:%M:%S")
-        else:
-            logging.basicConfig(filename=logging_file_path, level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s', datefmt="%d/%m/%Y %H:%M:%S")
-        logging.info('|%s|%s', sim23_log_behavior_label, 'method wal_quality_evaluation.quality_check_programming_behavior_python started')
+        quality_check_logger = get_quality_check_logger(logging_file_path)
+        quality_check_logger.info('|%s|%s', sim23_log_behavior_label, 'method wal_quality_evaluation.quality_check_programming_behavior_python started')
 
     
     # configure path based on given SimUser tag first (001 - 004)
@@ -342,63 +445,16 @@ def quality_check_programming_behavior_python(wal_dataframe: pd.DataFrame, start
 
     # check if wal_dataframe is empty, if yes skip the quality check part
     if(not wal_dataframe.empty):
-
-        dataframe_copy = wal_dataframe[(wal_dataframe['SYSTEM_TimeCreated'] >= start_timestamp_programming_behavior) & (wal_dataframe['SYSTEM_TimeCreated'] <= end_timestamp_programming_behavior)].copy()
-
-        delete_sim23_python_file_sub_dataframe = dataframe_copy[(dataframe_copy['EVENTDATA_ProcessName'] == delete_file_initially_process_name) & \
-                                                (dataframe_copy['SYSTEM_EventID'] == delete_file_initially_event_id) & \
-                                                (dataframe_copy['EVENTDATA_ObjectName'] == delete_file_initially_object_name) & \
-                                                (dataframe_copy['EVENTDATA_AccessList'].str.contains(delete_file_initially_access_type))]
-
-        create_sim23_python_template_file_sub_dataframe = dataframe_copy[(dataframe_copy['EVENTDATA_ProcessName'] == create_python_template_file_process_name) & \
-                                                (dataframe_copy['SYSTEM_EventID'] == create_python_template_file_event_id) & \
-                                                (dataframe_copy['EVENTDATA_ObjectName'] == create_python_template_file_object_name) & \
-                                                (dataframe_copy['EVENTDATA_AccessList'].str.contains(create_python_template_file_access_type))]
-        
-        wal_pattern_programming_python = pd.concat([delete_sim23_python_file_sub_dataframe, create_sim23_python_template_file_sub_dataframe], axis=0).sort_values(by='SYSTEM_TimeCreated', ignore_index=True)
-
-        create_sim23_python_file_loc_content = dataframe_copy[(dataframe_copy['EVENTDATA_ProcessName'] == create_python_file_loc_content_process_name) & \
-                                                (dataframe_copy['SYSTEM_EventID'] == create_python_file_loc_content_event_id) & \
-                                                (dataframe_copy['EVENTDATA_ObjectName'] == create_python_file_loc_content_object_name) & \
-                                                (dataframe_copy['EVENTDATA_AccessList'].str.contains(create_python_file_loc_content_access_type))]
-        
-        wal_pattern_programming_python = pd.concat([wal_pattern_programming_python, create_sim23_python_file_loc_content], axis=0).sort_values(by='SYSTEM_TimeCreated', ignore_index=True)
-
-        # this filtered event will occur twice based on the inital python behavior script called by the CIDDS-framework & the executed python behavior script executed during this programming behavior
-        execute_python_file = dataframe_copy[(dataframe_copy['EVENTDATA_ProcessName'] == execute_python_file_process_name) & \
-                                                (dataframe_copy['SYSTEM_EventID'] == execute_python_file_event_id) & \
-                                                (dataframe_copy['EVENTDATA_ObjectName'] == execute_python_file_object_name) & \
-                                                (dataframe_copy['EVENTDATA_AccessList'].str.contains(execute_python_file_access_type))]
-
-        wal_pattern_programming_python = pd.concat([wal_pattern_programming_python, execute_python_file], axis=0).sort_values(by='SYSTEM_TimeCreated', ignore_index=True)
-
-        #bot subbehavior: create python template & fill python template with loc, have same event data features -> due to this both queries aboth included the events of the other behavior as well -> drop duplicates
-        wal_pattern_programming_python_without_duplicates = wal_pattern_programming_python.drop_duplicates(ignore_index=True)
-        
-        security_event_seuqence_to_check = wal_pattern_programming_python_without_duplicates[['EVENTDATA_ProcessName', 'SYSTEM_EventID', 'EVENTDATA_ObjectName']].values.tolist()
-        security_access_type_sequence_to_check = wal_pattern_programming_python_without_duplicates[['EVENTDATA_AccessList']].values.flatten().tolist()
-        
-        # get start index of sequence to check buffering unexpected simulation behavior at the start and end of the sequences to check
-        first_element_of_security_event_sequence_to_expect = windows_security_log_event_sequence_to_expect[0]
-        start_index_quality_check= 0
-        # iterate over security event sequence to check
-        for idx, element in enumerate(security_event_seuqence_to_check):
-            if(element == first_element_of_security_event_sequence_to_expect):
-                start_index_quality_check = idx
-                # stop when start index is found
-                break
-        
-        if((len(security_event_seuqence_to_check[start_index_quality_check:]) >= len(windows_security_log_event_sequence_to_expect)) and (len(security_access_type_sequence_to_check[start_index_quality_check:]) >= len(security_access_type_sequence_to_expect))):
-            # security event sequence order and count of event is check at the same type for this behvaior
-            for idx, event_row in enumerate(windows_security_log_event_sequence_to_expect):
-                if(windows_security_log_event_sequence_to_expect[idx] != security_event_seuqence_to_check[start_index_quality_check + idx]):
-                    quality_evaluation_results[0] = False
-            # explicitly check for access type because security event can contain more than one specific access type in access list
-            for idx, access_list_elemet in enumerate(security_access_type_sequence_to_expect):
-                if(not(security_access_type_sequence_to_expect[idx] in security_access_type_sequence_to_check[start_index_quality_check + idx])):
-                    quality_evaluation_results[0] = False
-        else:
-            quality_evaluation_results = [False, False]
+        # rule table: delete python file, create python template file, create python file loc content, execute python file
+        # execute python file will occur twice based on the inital python behavior script called by the CIDDS-framework & the executed python behavior script executed during this programming behavior
+        quality_check_rules = [build_quality_check_rule(delete_file_initially_process_name, delete_file_initially_event_id, delete_file_initially_object_name, delete_file_initially_access_type),
+                               build_quality_check_rule(create_python_template_file_process_name, create_python_template_file_event_id, create_python_template_file_object_name, create_python_template_file_access_type),
+                               build_quality_check_rule(create_python_file_loc_content_process_name, create_python_file_loc_content_event_id, create_python_file_loc_content_object_name, create_python_file_loc_content_access_type),
+                               build_quality_check_rule(execute_python_file_process_name, execute_python_file_event_id, execute_python_file_object_name, execute_python_file_access_type)]
+        #bot subbehavior: create python template & fill python template with loc, have same event data features -> due to this both rules match the events of the other behavior as well -> drop duplicates
+        rule_match_counts, wal_pattern_programming_python_without_duplicates = evaluate_quality_check_rules(wal_dataframe, quality_check_rules, drop_duplicates = True)
+        # security event sequence order and count of event is check at the same type for this behvaior
+        quality_evaluation_results = check_quality_check_event_sequence(wal_pattern_programming_python_without_duplicates, windows_security_log_event_sequence_to_expect, security_access_type_sequence_to_expect, search_sequence_start = True)
     else:
         # if wal_dataframe is empty
         wal_pattern_programming_python_without_duplicates = wal_dataframe
@@ -407,54 +463,45 @@ def quality_check_programming_behavior_python(wal_dataframe: pd.DataFrame, start
     if(log_wal_quality_evaluation):
         if(not wal_pattern_programming_python_without_duplicates.empty):
             # first step delete python file
-            if(delete_sim23_python_file_sub_dataframe.empty):
-                logging.debug('|%s|%s|%s %s',  'detailed quality check info', 'delete python file count of filtered row entries' , 0, "out of 1 entry/entries expected")
-            else:
-                logging.debug('|%s|%s|%s %s',  'detailed quality check info', 'delete python file count of filtered row entries' , delete_sim23_python_file_sub_dataframe.shape[0], "out of 1 entry/entries expected")
+            quality_check_logger.debug('|%s|%s|%s %s',  'detailed quality check info', 'delete python file count of filtered row entries' , rule_match_counts[0], "out of 1 entry/entries expected")
             # second step create python template file
-            if(create_sim23_python_template_file_sub_dataframe.empty):
-                logging.debug('|%s|%s|%s %s',  'detailed quality check info', 'create python template file count of filtered row entries' , 0, "out of 2 entry/entries expected")
-            else:
-                # create python template & fill python template with loc, have same event data features -> due to this both queries aboth included the events of the other behavior as well
-                logging.debug('|%s|%s|%s %s',  'detailed quality check info', 'create python template file count of filtered row entries' , create_sim23_python_template_file_sub_dataframe.shape[0], "out of 2 entry/entries expected")
+            # create python template & fill python template with loc, have same event data features -> due to this both queries aboth included the events of the other behavior as well
+            quality_check_logger.debug('|%s|%s|%s %s',  'detailed quality check info', 'create python template file count of filtered row entries' , rule_match_counts[1], "out of 2 entry/entries expected")
             # third step create python file loc content
-            if(create_sim23_python_file_loc_content.empty):
-                logging.debug('|%s|%s|%s %s',  'detailed quality check info', 'create python loc file content count of filtered row entries' , 0, "out of 2 entry/entries expected")
-            else:
-                # create python template & fill python template with loc, have same event data features -> due to this both queries aboth included the events of the other behavior as well
-                logging.debug('|%s|%s|%s %s',  'detailed quality check info', 'create python loc file content count of filtered row entries' , create_sim23_python_file_loc_content.shape[0], "out of 2 entry/entries expected")
+            # create python template & fill python template with loc, have same event data features -> due to this both queries aboth included the events of the other behavior as well
+            quality_check_logger.debug('|%s|%s|%s %s',  'detailed quality check info', 'create python loc file content count of filtered row entries' , rule_match_counts[2], "out of 2 entry/entries expected")
             # fourth step execute python file
-            if(execute_python_file.empty):
-                logging.debug('|%s|%s|%s %s',  'detailed quality check info', 'execute python file count of filtered row entries' , 0, "out of 2 entry/entries expected")
-            else:
-                # this filtered event will occur twice based on the inital python behavior script called by the CIDDS-framework & the executed python behavior script executed during this programming behavior
-                logging.debug('|%s|%s|%s %s',  'detailed quality check info', 'execute python file count of filtered row entries' , execute_python_file.shape[0], "out of 2 entry/entries expected")
+            # this filtered event will occur twice based on the inital python behavior script called by the CIDDS-framework & the executed python behavior script executed during this programming behavior
+            quality_check_logger.debug('|%s|%s|%s %s',  'detailed quality check info', 'execute python file count of filtered row entries' , rule_match_counts[3], "out of 2 entry/entries expected")
             
             # final log entry to sum up results
             if((quality_evaluation_results[0] == True) and (quality_evaluation_results[1] == True)):
-                logging.info('|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s', 'security event sequence order check was successful', str(quality_evaluation_results[0]), 'security event sequence occured in pre-defined count', str(quality_evaluation_results[1]), 'first event timestamp of complete wal sequence' , str(wal_pattern_programming_python_without_duplicates['SYSTEM_TimeCreated'].iloc[0]), 'last event timestamp of complete wal sequence' , str(wal_pattern_programming_python_without_duplicates['SYSTEM_TimeCreated'].iloc[-1]), 'sim23 log start time', start_timestamp_programming_behavior.strftime("%d/%m/%Y %H:%M:%S:%f"), 'sim23 log end time', end_timestamp_programming_behavior.strftime("%d/%m/%Y %H:%M:%S:%f"))
+                quality_check_logger.info('|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s', 'security event sequence order check was successful', str(quality_evaluation_results[0]), 'security event sequence occured in pre-defined count', str(quality_evaluation_results[1]), 'first event timestamp of complete wal sequence' , str(wal_pattern_programming_python_without_duplicates['SYSTEM_TimeCreated'].iloc[0]), 'last event timestamp of complete wal sequence' , str(wal_pattern_programming_python_without_duplicates['SYSTEM_TimeCreated'].iloc[-1]), 'sim23 log start time', start_timestamp_programming_behavior.strftime("%d/%m/%Y %H:%M:%S:%f"), 'sim23 log end time', end_timestamp_programming_behavior.strftime("%d/%m/%Y %H:%M:%S:%f"))
             else:
-                logging.error('|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s', 'security event sequence order check was successful', str(quality_evaluation_results[0]), 'security event sequence occured in pre-defined count', str(quality_evaluation_results[1]), 'first event timestamp of complete wal sequence' , str(wal_pattern_programming_python_without_duplicates['SYSTEM_TimeCreated'].iloc[0]), 'last event timestamp of complete wal sequence' , str(wal_pattern_programming_python_without_duplicates['SYSTEM_TimeCreated'].iloc[-1]), 'sim23 log start time', start_timestamp_programming_behavior.strftime("%d/%m/%Y %H:%M:%S:%f"), 'sim23 log end time', end_timestamp_programming_behavior.strftime("%d/%m/%Y %H:%M:%S:%f"))
+                quality_check_logger.error('|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s', 'security event sequence order check was successful', str(quality_evaluation_results[0]), 'security event sequence occured in pre-defined count', str(quality_evaluation_results[1]), 'first event timestamp of complete wal sequence' , str(wal_pattern_programming_python_without_duplicates['SYSTEM_TimeCreated'].iloc[0]), 'last event timestamp of complete wal sequence' , str(wal_pattern_programming_python_without_duplicates['SYSTEM_TimeCreated'].iloc[-1]), 'sim23 log start time', start_timestamp_programming_behavior.strftime("%d/%m/%Y %H:%M:%S:%f"), 'sim23 log end time', end_timestamp_programming_behavior.strftime("%d/%m/%Y %H:%M:%S:%f"))
         else:
-             logging.debug('|%s|%s|%s %s',  'detailed quality check info', 'delete python file count of filtered row entries' , 0, "out of 1 entry/entries expected")
-             logging.debug('|%s|%s|%s %s',  'detailed quality check info', 'create python template file count of filtered row entries' , 0, "out of 2 entry/entries expected")
-             logging.debug('|%s|%s|%s %s',  'detailed quality check info', 'create python loc file content count of filtered row entries' , 0, "out of 2 entry/entries expected")
-             logging.debug('|%s|%s|%s %s',  'detailed quality check info', 'execute python file count of filtered row entries' , 0, "out of 2 entry/entries expected")
+             quality_check_logger.debug('|%s|%s|%s %s',  'detailed quality check info', 'delete python file count of filtered row entries' , 0, "out of 1 entry/entries expected")
+             quality_check_logger.debug('|%s|%s|%s %s',  'detailed quality check info', 'create python template file count of filtered row entries' , 0, "out of 2 entry/entries expected")
+             quality_check_logger.debug('|%s|%s|%s %s',  'detailed quality check info', 'create python loc file content count of filtered row entries' , 0, "out of 2 entry/entries expected")
+             quality_check_logger.debug('|%s|%s|%s %s',  'detailed quality check info', 'execute python file count of filtered row entries' , 0, "out of 2 entry/entries expected")
              # final log entry to sum up results
-             logging.error('|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s', 'security event sequence order check was successful', str(quality_evaluation_results[0]), 'security event sequence occured in pre-defined count', str(quality_evaluation_results[1]), 'first event timestamp of complete wal sequence' , "empty dataframe", 'last event timestamp of complete wal sequence' , "empty dataframe", 'sim23 log start time', start_timestamp_programming_behavior.strftime("%d/%m/%Y %H:%M:%S:%f"), 'sim23 log end time', end_timestamp_programming_behavior.strftime("%d/%m/%Y %H:%M:%S:%f"))
+             quality_check_logger.error('|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s', 'security event sequence order check was successful', str(quality_evaluation_results[0]), 'security event sequence occured in pre-defined count', str(quality_evaluation_results[1]), 'first event timestamp of complete wal sequence' , "empty dataframe", 'last event timestamp of complete wal sequence' , "empty dataframe", 'sim23 log start time', start_timestamp_programming_behavior.strftime("%d/%m/%Y %H:%M:%S:%f"), 'sim23 log end time', end_timestamp_programming_behavior.strftime("%d/%m/%Y %H:%M:%S:%f"))
+
+    if(quality_check_records is not None):
+        quality_check_records.append(build_quality_check_record("quality_check_programming_behavior_python", sim23_log_behavior_label, start_timestamp_programming_behavior, end_timestamp_programming_behavior, quality_evaluation_results, len(windows_security_log_event_sequence_to_expect), len(wal_pattern_programming_python_without_duplicates.index), quality_check_start_time))
 
     return quality_evaluation_results
     
 def quality_check_copy_local_to_local_and_net_to_local(complete_copy_behavior_object_name: str, number_of_files_to_copy: int, wal_dataframe: pd.DataFrame, start_time_copy_behavior: datetime.datetime, end_time_copy_behavior: datetime.datetime,
                                                        complete_copy_behavior_process_name: str = 'C:\\Users\\'+SIM_USER_DUMMY_TAG+'\\scoop\\apps\\python\\3.11.3\\python.exe', complete_copy_behavior_event_id: str = '4663',
                                                        create_file_while_copy_to_target_dir_access_type: str = '%%4417', delete_files_when_copy_to_target_dir_done_access_type: str = '%%1537',
-                                                       log_wal_quality_evaluation: bool = True, sim23_log_behavior_label: str = "UNDEFINED", logging_file_path: pathlib.Path = None, sim_user_of_interest: str = None):
+                                                       log_wal_quality_evaluation: bool = True, sim23_log_behavior_label: str = "UNDEFINED", logging_file_path: pathlib.Path = None, quality_check_records: list = None, sim_user_of_interest: str = None):
     """check if windows security events occur in specific security event order (based on implemented simulation behavior) & the count of specific events machtes the sim23 log timestamps => for copy file (local & net) behavior sim23
 
     Args:
         complete_copy_behavior_object_name (str): name of object being accessed during initial file (.dat-file) creation step of copy behavior (net & local)
         number_of_files_to_copy (int): pre-defined amount of file to copy based on configured sim23 behavior
-        wal_dataframe (pd.DataFrame): dataframe which contains windows security events
+        wal_dataframe (pd.DataFrame): windows security events of the behavior window (only events between start & end time of the behavior, see wal_general_quality_check_handler_sim23_log_based)
         start_time_copy_behavior (datetime.datetime): start timestamp of sim23 behavior of interest
         end_time_copy_behavior (datetime.datetime): end timestamp of sim23 behavior of interest
         complete_copy_behavior_process_name (str): program executable that accessed the object during create & delete (.dat-file) steps of copy behavior
@@ -464,17 +511,16 @@ def quality_check_copy_local_to_local_and_net_to_local(complete_copy_behavior_ob
         log_wal_quality_evaluation (bool): log quality check results in log file if True, else no logging will be applied
         sim23_log_behavior_label (str): name of the sim23 log behavior which is quality checked
         logging_file_path (pathlib.Path): path to log the quality evaluation results. Defaults to None (take path out of config file in same folder)
+        quality_check_records (list, optional): structured result record of the quality check is appended (see build_quality_check_record). Defaults to None (no record).
         sim_user_of_interest (str): name of simulation user which is focused in quality check
 
     Returns:
         list: returns list with two bool values -> first value is true if windows security events occur in pre-defined order and second value is true if windows security events occur in pre-defined count, otherwise return false for specific values
     """
+    quality_check_start_time = time.perf_counter()
     if(log_wal_quality_evaluation):
-        if(logging_file_path == None):
-            logging.basicConfig(filename=pathlib.Path(load_config_asset("LOGGING", "system_path_to_write_logs")), level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s', datefmt="%d/%m/%Y %H:%M:%S")
-        else:
-            logging.basicConfig(filename=logging_file_path, level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s', datefmt="%d/%m/%Y %H:%M:%S")
-        logging.info('|%s|%s', sim23_log_behavior_label, 'method wal_quality_evaluation.quality_check_copy_local_to_local_and_net_to_local started')
+        quality_check_logger = get_quality_check_logger(logging_file_path)
+        quality_check_logger.info('|%s|%s', sim23_log_behavior_label, 'method wal_quality_evaluation.quality_check_copy_local_to_local_and_net_to_local started')
 
     complete_copy_behavior_process_name = complete_copy_behavior_process_name.replace(SIM_USER_DUMMY_TAG, sim_user_of_interest)
 
@@ -486,87 +532,52 @@ def quality_check_copy_local_to_local_and_net_to_local(complete_copy_behavior_ob
     
     # if wal_dataframe is empty skip this quality check part
     if(not wal_dataframe.empty):
-        dataframe_copy = wal_dataframe[(wal_dataframe['SYSTEM_TimeCreated'] >= start_time_copy_behavior) & (wal_dataframe['SYSTEM_TimeCreated'] <= end_time_copy_behavior)].copy()
+        # rule table: files created (copied) & files deleted in destination folder
+        quality_check_rules = [build_quality_check_rule(complete_copy_behavior_process_name, complete_copy_behavior_event_id, complete_copy_behavior_object_name, create_file_while_copy_to_target_dir_access_type, object_name_match = "contains_dat_file"),
+                               build_quality_check_rule(complete_copy_behavior_process_name, complete_copy_behavior_event_id, complete_copy_behavior_object_name, delete_files_when_copy_to_target_dir_done_access_type, object_name_match = "contains_dat_file")]
+        rule_match_counts, wal_pattern_copy_behavior = evaluate_quality_check_rules(wal_dataframe, quality_check_rules)
+
+        # execution order: copy all n file then delete all n files (not copy then delete than copy than delete ....)
+        complete_windows_security_log_event_sequence_to_expect = ([single_windows_security_log_event_sequence_to_expect[0]] * number_of_files_to_copy) + ([single_windows_security_log_event_sequence_to_expect[1]] * number_of_files_to_copy)
+        complete_security_access_type_sequence_to_expect = ([single_security_access_type_sequence_to_expect[0]] * number_of_files_to_copy) + ([single_security_access_type_sequence_to_expect[1]] * number_of_files_to_copy)
         # first value refers to pre-defined security event order, second value referes to the expected amount of specific security events (this value can be true even if the first value is false)
-    
-        file_created_sub_dataframe = dataframe_copy[(dataframe_copy['EVENTDATA_ProcessName'] == complete_copy_behavior_process_name) & \
-                                                (dataframe_copy['SYSTEM_EventID'] == complete_copy_behavior_event_id) & \
-                                                ((dataframe_copy['EVENTDATA_ObjectName'].str.contains(complete_copy_behavior_object_name, regex=False)) & (dataframe_copy['EVENTDATA_ObjectName'].str.contains('.dat'))) & \
-                                                (dataframe_copy['EVENTDATA_AccessList'].str.contains(create_file_while_copy_to_target_dir_access_type))]
-
-        file_deleted_sub_dataframe = dataframe_copy[(dataframe_copy['EVENTDATA_ProcessName'] == complete_copy_behavior_process_name) & \
-                                                (dataframe_copy['SYSTEM_EventID'] == complete_copy_behavior_event_id) & \
-                                                ((dataframe_copy['EVENTDATA_ObjectName'].str.contains(complete_copy_behavior_object_name, regex=False)) & (dataframe_copy['EVENTDATA_ObjectName'].str.contains('.dat')))& \
-                                                (dataframe_copy['EVENTDATA_AccessList'].str.contains(delete_files_when_copy_to_target_dir_done_access_type))]
-        
-        wal_pattern_copy_behavior = pd.concat([file_created_sub_dataframe, file_deleted_sub_dataframe], axis=0).sort_values(by='SYSTEM_TimeCreated', ignore_index=True)
-        
-        security_event_seuqence_to_check = wal_pattern_copy_behavior[['EVENTDATA_ProcessName', 'SYSTEM_EventID', 'EVENTDATA_ObjectName']].values.tolist()
-        security_access_type_sequence_to_check = wal_pattern_copy_behavior[['EVENTDATA_AccessList']].values.flatten().tolist()
-        
-        complete_windows_security_log_event_sequence_to_expect = []
-        complete_security_access_type_sequence_to_expect = []
-
-        for itr in range(number_of_files_to_copy):
-            # update windows security log events sequence
-            # execution order: copy all n file then delete all n files (not copy then delete than copy than delete ....)
-            complete_windows_security_log_event_sequence_to_expect = complete_windows_security_log_event_sequence_to_expect + [single_windows_security_log_event_sequence_to_expect[1]]
-            complete_windows_security_log_event_sequence_to_expect = [single_windows_security_log_event_sequence_to_expect[0]] + complete_windows_security_log_event_sequence_to_expect
-            # update windows security access type seuqence
-            # execution order: copy all n file then delete all n files (not copy then delete than copy than delete ....)
-            complete_security_access_type_sequence_to_expect = complete_security_access_type_sequence_to_expect + [single_security_access_type_sequence_to_expect[1]]
-            complete_security_access_type_sequence_to_expect = [single_security_access_type_sequence_to_expect[0]] + complete_security_access_type_sequence_to_expect 
-
-        if((len(security_event_seuqence_to_check) == len(complete_windows_security_log_event_sequence_to_expect)) and (len(security_access_type_sequence_to_check) == len(complete_security_access_type_sequence_to_expect))):
-            for idx, event_row in enumerate(complete_windows_security_log_event_sequence_to_expect):
-                # explicitly check every element because object file names vary while copying different files
-                if((complete_windows_security_log_event_sequence_to_expect[idx][0] != security_event_seuqence_to_check[idx][0]) or (complete_windows_security_log_event_sequence_to_expect[idx][1] != security_event_seuqence_to_check[idx][1]) or (not(complete_windows_security_log_event_sequence_to_expect[idx][2] in security_event_seuqence_to_check[idx][2])) or (not('.dat' in security_event_seuqence_to_check[idx][2]))):
-                    quality_evaluation_results[0] = False
-            # explicitly check because security event can contain more than one specific access type in access list
-            for idx, access_list_elemet in enumerate(complete_security_access_type_sequence_to_expect):
-                if(not(complete_security_access_type_sequence_to_expect[idx] in security_access_type_sequence_to_check[idx])):
-                    quality_evaluation_results[0] = False
-        else:
-            quality_evaluation_results = [False, False]
+        quality_evaluation_results = check_quality_check_event_sequence(wal_pattern_copy_behavior, complete_windows_security_log_event_sequence_to_expect, complete_security_access_type_sequence_to_expect, object_name_match = "contains_dat_file")
     else:
         wal_pattern_copy_behavior = wal_dataframe
         quality_evaluation_results = [False, False]
 
     if(log_wal_quality_evaluation):
+        description_expected_entries = "out of " + str(number_of_files_to_copy) + " entry/entries expected"
         if(not wal_pattern_copy_behavior.empty):
-            description_expected_entries = "out of " + str(number_of_files_to_copy) + " entry/entries expected"
             # first step create files in destination folder
-            if(file_created_sub_dataframe.empty):
-                logging.debug('|%s|%s|%s %s',  'detailed quality check info', 'files created count of filtered row entries' , 0, description_expected_entries)
-            else:
-                logging.debug('|%s|%s|%s %s',  'detailed quality check info', 'files created count of filtered row entries' , file_created_sub_dataframe.shape[0], description_expected_entries)
+            quality_check_logger.debug('|%s|%s|%s %s',  'detailed quality check info', 'files created count of filtered row entries' , rule_match_counts[0], description_expected_entries)
             # second step delete files in destination folder
-            if(file_deleted_sub_dataframe.empty):
-                logging.debug('|%s|%s|%s %s',  'detailed quality check info', 'files deleted count of filtered row entries' , 0, description_expected_entries)
-            else:
-                logging.debug('|%s|%s|%s %s',  'detailed quality check info', 'files deleted count of filtered row entries' , file_deleted_sub_dataframe.shape[0], description_expected_entries)
+            quality_check_logger.debug('|%s|%s|%s %s',  'detailed quality check info', 'files deleted count of filtered row entries' , rule_match_counts[1], description_expected_entries)
             
             # final log entry to sum up results
             if((quality_evaluation_results[0] == True) and (quality_evaluation_results[1] == True)):
-                logging.info('|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s', 'security event sequence order check was successful', str(quality_evaluation_results[0]), 'security event sequence occured in pre-defined count', str(quality_evaluation_results[1]), 'first event timestamp of complete wal sequence' , str(wal_pattern_copy_behavior['SYSTEM_TimeCreated'].iloc[0]), 'last event timestamp of complete wal sequence' , str(wal_pattern_copy_behavior['SYSTEM_TimeCreated'].iloc[-1]), 'sim23 log start time', start_time_copy_behavior.strftime("%d/%m/%Y %H:%M:%S:%f"), 'sim23 log end time', end_time_copy_behavior.strftime("%d/%m/%Y %H:%M:%S:%f"))
+                quality_check_logger.info('|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s', 'security event sequence order check was successful', str(quality_evaluation_results[0]), 'security event sequence occured in pre-defined count', str(quality_evaluation_results[1]), 'first event timestamp of complete wal sequence' , str(wal_pattern_copy_behavior['SYSTEM_TimeCreated'].iloc[0]), 'last event timestamp of complete wal sequence' , str(wal_pattern_copy_behavior['SYSTEM_TimeCreated'].iloc[-1]), 'sim23 log start time', start_time_copy_behavior.strftime("%d/%m/%Y %H:%M:%S:%f"), 'sim23 log end time', end_time_copy_behavior.strftime("%d/%m/%Y %H:%M:%S:%f"))
             else:
-                logging.error('|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s', 'security event sequence order check was successful', str(quality_evaluation_results[0]), 'security event sequence occured in pre-defined count', str(quality_evaluation_results[1]), 'first event timestamp of complete wal sequence' , str(wal_pattern_copy_behavior['SYSTEM_TimeCreated'].iloc[0]), 'last event timestamp of complete wal sequence' , str(wal_pattern_copy_behavior['SYSTEM_TimeCreated'].iloc[-1]), 'sim23 log start time', start_time_copy_behavior.strftime("%d/%m/%Y %H:%M:%S:%f"), 'sim23 log end time', end_time_copy_behavior.strftime("%d/%m/%Y %H:%M:%S:%f"))
+                quality_check_logger.error('|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s', 'security event sequence order check was successful', str(quality_evaluation_results[0]), 'security event sequence occured in pre-defined count', str(quality_evaluation_results[1]), 'first event timestamp of complete wal sequence' , str(wal_pattern_copy_behavior['SYSTEM_TimeCreated'].iloc[0]), 'last event timestamp of complete wal sequence' , str(wal_pattern_copy_behavior['SYSTEM_TimeCreated'].iloc[-1]), 'sim23 log start time', start_time_copy_behavior.strftime("%d/%m/%Y %H:%M:%S:%f"), 'sim23 log end time', end_time_copy_behavior.strftime("%d/%m/%Y %H:%M:%S:%f"))
         else:
-             logging.debug('|%s|%s|%s %s',  'detailed quality check info', 'files created count of filtered row entries' , 0, description_expected_entries)
-             logging.debug('|%s|%s|%s %s',  'detailed quality check info', 'files deleted count of filtered row entries' , 0, description_expected_entries)
+             quality_check_logger.debug('|%s|%s|%s %s',  'detailed quality check info', 'files created count of filtered row entries' , 0, description_expected_entries)
+             quality_check_logger.debug('|%s|%s|%s %s',  'detailed quality check info', 'files deleted count of filtered row entries' , 0, description_expected_entries)
              # final log entry to sum up results
-             logging.error('|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s', 'security event sequence order check was successful', str(quality_evaluation_results[0]), 'security event sequence occured in pre-defined count', str(quality_evaluation_results[1]), 'first event timestamp of complete wal sequence' , "empty dataframe", 'last event timestamp of complete wal sequence' , "empty dataframe", 'sim23 log start time', start_time_copy_behavior.strftime("%d/%m/%Y %H:%M:%S:%f"), 'sim23 log end time', end_time_copy_behavior.strftime("%d/%m/%Y %H:%M:%S:%f"))
+             quality_check_logger.error('|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s', 'security event sequence order check was successful', str(quality_evaluation_results[0]), 'security event sequence occured in pre-defined count', str(quality_evaluation_results[1]), 'first event timestamp of complete wal sequence' , "empty dataframe", 'last event timestamp of complete wal sequence' , "empty dataframe", 'sim23 log start time', start_time_copy_behavior.strftime("%d/%m/%Y %H:%M:%S:%f"), 'sim23 log end time', end_time_copy_behavior.strftime("%d/%m/%Y %H:%M:%S:%f"))
+
+    if(quality_check_records is not None):
+        quality_check_records.append(build_quality_check_record("quality_check_copy_local_to_local_and_net_to_local", sim23_log_behavior_label, start_time_copy_behavior, end_time_copy_behavior, quality_evaluation_results, (2 * number_of_files_to_copy), len(wal_pattern_copy_behavior.index), quality_check_start_time))
 
     return quality_evaluation_results
 
 def quality_check_encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt(number_of_files_to_copy_or_encrypt_or_decrypt: int, wal_dataframe: pd.DataFrame, start_time_quality_check_encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt: datetime.datetime, end_time_quality_check_encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt: datetime.datetime,
                                                                      encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt_object_name: str, encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt_access_type: str, encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt_process_name: str= 'C:\\Windows\\System32\\xcopy.exe', encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt_event_id: str = '4663',
-                                                                     log_wal_quality_evaluation: bool = True, sim23_log_behavior_label: str = "UNDEFINED", logging_file_path: pathlib.Path = None, sim_user_of_interest: str = None):
+                                                                     log_wal_quality_evaluation: bool = True, sim23_log_behavior_label: str = "UNDEFINED", logging_file_path: pathlib.Path = None, quality_check_records: list = None, sim_user_of_interest: str = None):
     """check if windows security events occur in specific security event order (based on implemented simulation behavior) & the count of specific events machtes the sim23 log timestamps => for encrypt copy, encrypt, decrypt behavior sim23
 
     Args:
         number_of_files_to_copy_or_encrypt_or_decrypt (int): pre-defined amount of files to copy, encrypt or decrypt based on encrypt attack
-        wal_dataframe (pd.DataFrame): dataframe which contains windows security events
+        wal_dataframe (pd.DataFrame): windows security events of the behavior window (only events between start & end time of the behavior, see wal_general_quality_check_handler_sim23_log_based)
         start_time_quality_check_encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt (datetime.datetime):  start timestamp of sim23 behavior of interest
         end_time_quality_check_encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt (datetime.datetime):  end timestamp of sim23 behavior of interest
         encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt_object_name (str): name of object being accessed during encrypt copy, encrypt or decrypt of files (.dat-file) while encrypt attack
@@ -576,18 +587,17 @@ def quality_check_encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt(number_of_f
         log_wal_quality_evaluation (bool): log quality check results in log file if True, else no logging will be applied
         sim23_log_behavior_label (str): name of the sim23 log behavior which is quality checked
         logging_file_path (pathlib.Path): path to log the quality evaluation results. Defaults to None (take path out of config file in same folder)
+        quality_check_records (list, optional): structured result record of the quality check is appended (see build_quality_check_record). Defaults to None (no record).
         sim_user_of_interest (str): name of simulation user which is focused in quality check
 
     Returns:
         list: returns list with two bool values -> first value is true if windows security events occur in pre-defined order and second value is true if windows security events occur in pre-defined count, otherwise return false for specific values
     """
     
+    quality_check_start_time = time.perf_counter()
     if(log_wal_quality_evaluation):
-        if(logging_file_path == None):
-            logging.basicConfig(filename=pathlib.Path(load_config_asset("LOGGING", "system_path_to_write_logs")), level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s', datefmt="%d/%m/%Y %H:%M:%S")
-        else:
-            logging.basicConfig(filename=logging_file_path, level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s', datefmt="%d/%m/%Y %H:%M:%S")
-        logging.info('|%s|%s', sim23_log_behavior_label, 'method wal_quality_evaluation.quality_check_encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt started')
+        quality_check_logger = get_quality_check_logger(logging_file_path)
+        quality_check_logger.info('|%s|%s', sim23_log_behavior_label, 'method wal_quality_evaluation.quality_check_encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt started')
 
     if(not 'encrypt_copy' in sim23_log_behavior_label):
         encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt_process_name = encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt_process_name.replace(SIM_USER_DUMMY_TAG, sim_user_of_interest)
@@ -599,41 +609,14 @@ def quality_check_encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt(number_of_f
 
     # if wal_dataframe is empty skip the quality evaluation part
     if(not wal_dataframe.empty):
+        quality_check_rules = [build_quality_check_rule(encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt_process_name, encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt_event_id, encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt_object_name,
+                                                        encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt_access_type, object_name_match = "contains_dat_file")]
+        rule_match_counts, wal_pattern_encrypt_attack_sub_behavior = evaluate_quality_check_rules(wal_dataframe, quality_check_rules)
 
-        dataframe_copy = wal_dataframe[(wal_dataframe['SYSTEM_TimeCreated'] >= start_time_quality_check_encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt) & (wal_dataframe['SYSTEM_TimeCreated'] <= end_time_quality_check_encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt)].copy()
+        complete_windows_security_log_event_sequence_to_expect = [single_windows_security_log_event_sequence_to_expect[0]] * number_of_files_to_copy_or_encrypt_or_decrypt
+        complete_security_access_type_sequence_to_expect = [single_security_access_type_sequence_to_expect[0]] * number_of_files_to_copy_or_encrypt_or_decrypt
         # first value refers to pre-defined security event order, second value referes to the expected amount of specific security events (this value can be true even if the first value is false)
-
-        encrypt_copy_or_encrypt_decrpyt_or_encrpyt_encrpyt_sub_dataframe = dataframe_copy[(dataframe_copy['EVENTDATA_ProcessName'] == encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt_process_name) & \
-                                                (dataframe_copy['SYSTEM_EventID'] == encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt_event_id) & \
-                                                ((dataframe_copy['EVENTDATA_ObjectName'].str.contains(encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt_object_name, regex=False)) & (dataframe_copy['EVENTDATA_ObjectName'].str.contains('.dat'))) & \
-                                                (dataframe_copy['EVENTDATA_AccessList'].str.contains(encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt_access_type))]
-        
-        wal_pattern_encrypt_attack_sub_behavior = encrypt_copy_or_encrypt_decrpyt_or_encrpyt_encrpyt_sub_dataframe.sort_values(by='SYSTEM_TimeCreated', ignore_index=True)
-        #wal_pattern_encrypt_attack_sub_behavior_without_duplicates = wal_pattern_encrypt_attack_sub_behavior.drop_duplicates(ignore_index=True)
-
-        security_event_seuqence_to_check = wal_pattern_encrypt_attack_sub_behavior[['EVENTDATA_ProcessName', 'SYSTEM_EventID', 'EVENTDATA_ObjectName']].values.tolist()
-        security_access_type_sequence_to_check = wal_pattern_encrypt_attack_sub_behavior[['EVENTDATA_AccessList']].values.flatten().tolist()
-
-        complete_windows_security_log_event_sequence_to_expect = []
-        complete_security_access_type_sequence_to_expect = []
-
-        for itr in range(number_of_files_to_copy_or_encrypt_or_decrypt):
-            # update windows security log events sequence
-            complete_windows_security_log_event_sequence_to_expect = complete_windows_security_log_event_sequence_to_expect + [single_windows_security_log_event_sequence_to_expect[0]]
-            # update windows security access type seuqence
-            complete_security_access_type_sequence_to_expect = complete_security_access_type_sequence_to_expect + [single_security_access_type_sequence_to_expect[0]]
-        
-        if((len(security_event_seuqence_to_check) == len(complete_windows_security_log_event_sequence_to_expect)) and (len(security_access_type_sequence_to_check) == len(complete_security_access_type_sequence_to_expect))):
-            for idx, event_row in enumerate(complete_windows_security_log_event_sequence_to_expect):
-                # explicitly check every element because object file names vary while copying different files
-                if((complete_windows_security_log_event_sequence_to_expect[idx][0] != security_event_seuqence_to_check[idx][0]) or (complete_windows_security_log_event_sequence_to_expect[idx][1] != security_event_seuqence_to_check[idx][1]) or (not(complete_windows_security_log_event_sequence_to_expect[idx][2] in security_event_seuqence_to_check[idx][2])) or (not('.dat' in security_event_seuqence_to_check[idx][2]))):
-                    quality_evaluation_results[0] = False
-            # explicitly check because security event can contain more than one specific access type in access list
-            for idx, access_list_elemet in enumerate(complete_security_access_type_sequence_to_expect):
-                if(not(complete_security_access_type_sequence_to_expect[idx] in security_access_type_sequence_to_check[idx])):
-                    quality_evaluation_results[0] = False
-        else:
-            quality_evaluation_results = [False, False]
+        quality_evaluation_results = check_quality_check_event_sequence(wal_pattern_encrypt_attack_sub_behavior, complete_windows_security_log_event_sequence_to_expect, complete_security_access_type_sequence_to_expect, object_name_match = "contains_dat_file")
     else:
         # if wal_dataframe is empty 
         wal_pattern_encrypt_attack_sub_behavior = wal_dataframe
@@ -642,27 +625,30 @@ def quality_check_encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt(number_of_f
     if(log_wal_quality_evaluation):
         description_expected_entries = "out of " + str(number_of_files_to_copy_or_encrypt_or_decrypt) + " entry/entries expected"
         if(wal_pattern_encrypt_attack_sub_behavior.empty):
-            logging.debug('|%s|%s|%s %s',  'detailed quality check info', 'encrypt subattack - count of filtered row entries' , 0, description_expected_entries)
+            quality_check_logger.debug('|%s|%s|%s %s',  'detailed quality check info', 'encrypt subattack - count of filtered row entries' , 0, description_expected_entries)
             # final log entry to sum up results
-            logging.error('|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s', 'security event sequence order check was successful', str(quality_evaluation_results[0]), 'security event sequence occured in pre-defined count', str(quality_evaluation_results[1]), 'first event timestamp of complete wal sequence' , "empty dataframe", 'last event timestamp of complete wal sequence' , "empty dataframe", 'sim23 log start time', start_time_quality_check_encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt.strftime("%d/%m/%Y %H:%M:%S:%f"), 'sim23 log end time:', end_time_quality_check_encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt.strftime("%d/%m/%Y %H:%M:%S:%f"))
+            quality_check_logger.error('|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s', 'security event sequence order check was successful', str(quality_evaluation_results[0]), 'security event sequence occured in pre-defined count', str(quality_evaluation_results[1]), 'first event timestamp of complete wal sequence' , "empty dataframe", 'last event timestamp of complete wal sequence' , "empty dataframe", 'sim23 log start time', start_time_quality_check_encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt.strftime("%d/%m/%Y %H:%M:%S:%f"), 'sim23 log end time:', end_time_quality_check_encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt.strftime("%d/%m/%Y %H:%M:%S:%f"))
         else:
-            logging.debug('|%s|%s|%s %s',  'detailed quality check info', 'encrypt subattack - count of filtered row entries' , encrypt_copy_or_encrypt_decrpyt_or_encrpyt_encrpyt_sub_dataframe.shape[0], description_expected_entries)
+            quality_check_logger.debug('|%s|%s|%s %s',  'detailed quality check info', 'encrypt subattack - count of filtered row entries' , rule_match_counts[0], description_expected_entries)
             
             # final log entry to sum up results
             if((quality_evaluation_results[0] == True) and (quality_evaluation_results[1] == True)):
-                logging.info('|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s', 'security event sequence order check was successful', str(quality_evaluation_results[0]), 'security event sequence occured in pre-defined count', str(quality_evaluation_results[1]), 'first event timestamp of complete wal sequence' , str(wal_pattern_encrypt_attack_sub_behavior['SYSTEM_TimeCreated'].iloc[0]), 'last event timestamp of complete wal sequence' , str(wal_pattern_encrypt_attack_sub_behavior['SYSTEM_TimeCreated'].iloc[-1]), 'sim23 log start time', start_time_quality_check_encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt.strftime("%d/%m/%Y %H:%M:%S:%f"), 'sim23 log end time', end_time_quality_check_encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt.strftime("%d/%m/%Y %H:%M:%S:%f"))
+                quality_check_logger.info('|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s', 'security event sequence order check was successful', str(quality_evaluation_results[0]), 'security event sequence occured in pre-defined count', str(quality_evaluation_results[1]), 'first event timestamp of complete wal sequence' , str(wal_pattern_encrypt_attack_sub_behavior['SYSTEM_TimeCreated'].iloc[0]), 'last event timestamp of complete wal sequence' , str(wal_pattern_encrypt_attack_sub_behavior['SYSTEM_TimeCreated'].iloc[-1]), 'sim23 log start time', start_time_quality_check_encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt.strftime("%d/%m/%Y %H:%M:%S:%f"), 'sim23 log end time', end_time_quality_check_encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt.strftime("%d/%m/%Y %H:%M:%S:%f"))
             else:
-                logging.error('|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s', 'security event sequence order check was successful', str(quality_evaluation_results[0]), 'security event sequence occured in pre-defined count', str(quality_evaluation_results[1]), 'first event timestamp of complete wal sequence' , str(wal_pattern_encrypt_attack_sub_behavior['SYSTEM_TimeCreated'].iloc[0]), 'last event timestamp of complete wal sequence' , str(wal_pattern_encrypt_attack_sub_behavior['SYSTEM_TimeCreated'].iloc[-1]), 'sim23 log start time', start_time_quality_check_encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt.strftime("%d/%m/%Y %H:%M:%S:%f"), 'sim23 log end time', end_time_quality_check_encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt.strftime("%d/%m/%Y %H:%M:%S:%f"))
+                quality_check_logger.error('|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s', 'security event sequence order check was successful', str(quality_evaluation_results[0]), 'security event sequence occured in pre-defined count', str(quality_evaluation_results[1]), 'first event timestamp of complete wal sequence' , str(wal_pattern_encrypt_attack_sub_behavior['SYSTEM_TimeCreated'].iloc[0]), 'last event timestamp of complete wal sequence' , str(wal_pattern_encrypt_attack_sub_behavior['SYSTEM_TimeCreated'].iloc[-1]), 'sim23 log start time', start_time_quality_check_encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt.strftime("%d/%m/%Y %H:%M:%S:%f"), 'sim23 log end time', end_time_quality_check_encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt.strftime("%d/%m/%Y %H:%M:%S:%f"))
           
+    if(quality_check_records is not None):
+        quality_check_records.append(build_quality_check_record("quality_check_encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt", sim23_log_behavior_label, start_time_quality_check_encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt, end_time_quality_check_encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt, quality_evaluation_results, number_of_files_to_copy_or_encrypt_or_decrypt, len(wal_pattern_encrypt_attack_sub_behavior.index), quality_check_start_time))
+
     return quality_evaluation_results
 
 def quality_check_encrypt_delete(wal_dataframe: pd.DataFrame, start_time_encrypt_delete: datetime.datetime, end_time_encrypt_delete: datetime.datetime, 
                                  encrypt_delete_object_name: str = 'C:\\localstorage\\sim23_encrypt_dest', encrypt_delete_access_type: str = '%%1537', encrypt_delete_process_name: str = 'C:\\Windows\\System32\\cmd.exe', encrypt_delete_event_id: str = '4663',
-                                 log_wal_quality_evaluation: bool = True, sim23_log_behavior_label: str = "UNDEFINED", logging_file_path: pathlib.Path = None):
+                                 log_wal_quality_evaluation: bool = True, sim23_log_behavior_label: str = "UNDEFINED", logging_file_path: pathlib.Path = None, quality_check_records: list = None):
     """check if windows security events occur in specific security event order (based on implemented simulation behavior) & the count of specific events machtes the sim23 log timestamps => for encrypt delete behavior sim23
 
     Args:
-        wal_dataframe (pd.DataFrame): dataframe which contains windows security events
+        wal_dataframe (pd.DataFrame): windows security events of the behavior window (only events between start & end time of the behavior, see wal_general_quality_check_handler_sim23_log_based)
         start_time_encrypt_delete (datetime.datetime): start timestamp of sim23 behavior of interest
         end_time_encrypt_delete (datetime.datetime): end timestamp of sim23 behavior of interest
         encrypt_delete_object_name (str): name of object being accessed during encrypt delete files (.dat-files in folder) step of encrypt delete behavior (all files are deleted over cmd by one command execution)
@@ -672,16 +658,15 @@ def quality_check_encrypt_delete(wal_dataframe: pd.DataFrame, start_time_encrypt
         log_wal_quality_evaluation (bool, optional): log quality check results in log file if True, else no logging will be applied
         sim23_log_behavior_label (str): name of the sim23 log behavior which is quality checked
         logging_file_path (pathlib.Path): path to log the quality evaluation results. Defaults to None (take path out of config file in same folder)
+        quality_check_records (list, optional): structured result record of the quality check is appended (see build_quality_check_record). Defaults to None (no record).
 
     Returns:
         list: returns list with two bool values -> first value is true if windows security events occur in pre-defined order and second value is true if windows security events occur in pre-defined count, otherwise return false for specific values
     """
+    quality_check_start_time = time.perf_counter()
     if(log_wal_quality_evaluation):
-        if(logging_file_path == None):
-            logging.basicConfig(filename=pathlib.Path(load_config_asset("LOGGING", "system_path_to_write_logs")), level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s', datefmt="%d/%m/%Y %H:%M:%S")
-        else:
-            logging.basicConfig(filename=logging_file_path, level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s', datefmt="%d/%m/%Y %H:%M:%S")
-        logging.info('|%s|%s', sim23_log_behavior_label, 'method wal_quality_evaluation.quality_check_encrypt_delete started')
+        quality_check_logger = get_quality_check_logger(logging_file_path)
+        quality_check_logger.info('|%s|%s', sim23_log_behavior_label, 'method wal_quality_evaluation.quality_check_encrypt_delete started')
 
     
     # to keep it similiar both quality check values will be used at this point in code as well
@@ -692,57 +677,39 @@ def quality_check_encrypt_delete(wal_dataframe: pd.DataFrame, start_time_encrypt
     single_security_access_type_sequence_to_expect = [encrypt_delete_access_type]
 
     if(not wal_dataframe.empty):
-        dataframe_copy = wal_dataframe[(wal_dataframe['SYSTEM_TimeCreated'] >= start_time_encrypt_delete) & (wal_dataframe['SYSTEM_TimeCreated'] <= end_time_encrypt_delete)].copy()
-
-        encrypt_delete_sub_dataframe = dataframe_copy[(dataframe_copy['EVENTDATA_ProcessName'] == encrypt_delete_process_name) & \
-                                                (dataframe_copy['SYSTEM_EventID'] == encrypt_delete_event_id) & \
-                                                (dataframe_copy['EVENTDATA_ObjectName'] == encrypt_delete_object_name) & \
-                                                (dataframe_copy['EVENTDATA_AccessList'].str.contains(encrypt_delete_access_type))]
-        
-        wal_pattern_encrypt_attack_sub_behavior = encrypt_delete_sub_dataframe.sort_values(by='SYSTEM_TimeCreated', ignore_index=True)
-        #wal_pattern_encrypt_attack_sub_behavior_without_duplicates = wal_pattern_encrypt_attack_sub_behavior.drop_duplicates(ignore_index=True)
-
-        security_event_seuqence_to_check = wal_pattern_encrypt_attack_sub_behavior[['EVENTDATA_ProcessName', 'SYSTEM_EventID', 'EVENTDATA_ObjectName']].values.tolist()
-        security_access_type_sequence_to_check = wal_pattern_encrypt_attack_sub_behavior[['EVENTDATA_AccessList']].values.flatten().tolist()
-        
-        if((len(security_event_seuqence_to_check) == len(single_windows_security_log_event_sequence_to_expect)) and (len(security_access_type_sequence_to_check) == len(single_security_access_type_sequence_to_expect))):
-            for idx, event_row in enumerate(single_windows_security_log_event_sequence_to_expect):
-                # explicitly check every element because object file names vary while copying different files
-                if((single_windows_security_log_event_sequence_to_expect[idx][0] != security_event_seuqence_to_check[idx][0]) or (single_windows_security_log_event_sequence_to_expect[idx][1] != security_event_seuqence_to_check[idx][1]) or (not(single_windows_security_log_event_sequence_to_expect[idx][2] in security_event_seuqence_to_check[idx][2]))):
-                    quality_evaluation_results[0] = False
-            # explicitly check because security event can contain more than one specific access type in access list
-            for idx, access_list_elemet in enumerate(single_security_access_type_sequence_to_expect):
-                if(not(single_security_access_type_sequence_to_expect[idx] in security_access_type_sequence_to_check[idx])):
-                    quality_evaluation_results[0] = False
-        else:
-            quality_evaluation_results = [False, False]
+        quality_check_rules = [build_quality_check_rule(encrypt_delete_process_name, encrypt_delete_event_id, encrypt_delete_object_name, encrypt_delete_access_type)]
+        rule_match_counts, wal_pattern_encrypt_attack_sub_behavior = evaluate_quality_check_rules(wal_dataframe, quality_check_rules)
+        quality_evaluation_results = check_quality_check_event_sequence(wal_pattern_encrypt_attack_sub_behavior, single_windows_security_log_event_sequence_to_expect, single_security_access_type_sequence_to_expect, object_name_match = "contains")
     else:
         wal_pattern_encrypt_attack_sub_behavior = wal_dataframe
         quality_evaluation_results = [False, False]
 
     if(log_wal_quality_evaluation):
         if(not wal_pattern_encrypt_attack_sub_behavior.empty):
-            logging.debug('|%s|%s|%s %s',  'detailed quality check info', 'encrypt delete count of filtered row entries' , encrypt_delete_sub_dataframe.shape[0], "out of 1 entry/entries expected")
+            quality_check_logger.debug('|%s|%s|%s %s',  'detailed quality check info', 'encrypt delete count of filtered row entries' , rule_match_counts[0], "out of 1 entry/entries expected")
             
             # final log entry to sum up results
             if((quality_evaluation_results[0] == True) and (quality_evaluation_results[1] == True)):
-                logging.info('|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s', 'security event sequence order check was successful', str(quality_evaluation_results[0]), 'security event sequence occured in pre-defined count', str(quality_evaluation_results[1]), 'first event timestamp of complete wal sequence' , str(wal_pattern_encrypt_attack_sub_behavior['SYSTEM_TimeCreated'].iloc[0]), 'last event timestamp of complete wal sequence' , str(wal_pattern_encrypt_attack_sub_behavior['SYSTEM_TimeCreated'].iloc[-1]), 'sim23 log start time', start_time_encrypt_delete.strftime("%d/%m/%Y %H:%M:%S:%f"), 'sim23 log end time', end_time_encrypt_delete.strftime("%d/%m/%Y %H:%M:%S:%f"))
+                quality_check_logger.info('|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s', 'security event sequence order check was successful', str(quality_evaluation_results[0]), 'security event sequence occured in pre-defined count', str(quality_evaluation_results[1]), 'first event timestamp of complete wal sequence' , str(wal_pattern_encrypt_attack_sub_behavior['SYSTEM_TimeCreated'].iloc[0]), 'last event timestamp of complete wal sequence' , str(wal_pattern_encrypt_attack_sub_behavior['SYSTEM_TimeCreated'].iloc[-1]), 'sim23 log start time', start_time_encrypt_delete.strftime("%d/%m/%Y %H:%M:%S:%f"), 'sim23 log end time', end_time_encrypt_delete.strftime("%d/%m/%Y %H:%M:%S:%f"))
             else:
-                logging.error('|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s', 'security event sequence order check was successful', str(quality_evaluation_results[0]), 'security event sequence occured in pre-defined count', str(quality_evaluation_results[1]), 'first event timestamp of complete wal sequence' , str(wal_pattern_encrypt_attack_sub_behavior['SYSTEM_TimeCreated'].iloc[0]), 'last event timestamp of complete wal sequence' , str(wal_pattern_encrypt_attack_sub_behavior['SYSTEM_TimeCreated'].iloc[-1]), 'sim23 log start time', start_time_encrypt_delete.strftime("%d/%m/%Y %H:%M:%S:%f"), 'sim23 log end time', end_time_encrypt_delete.strftime("%d/%m/%Y %H:%M:%S:%f"))
+                quality_check_logger.error('|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s', 'security event sequence order check was successful', str(quality_evaluation_results[0]), 'security event sequence occured in pre-defined count', str(quality_evaluation_results[1]), 'first event timestamp of complete wal sequence' , str(wal_pattern_encrypt_attack_sub_behavior['SYSTEM_TimeCreated'].iloc[0]), 'last event timestamp of complete wal sequence' , str(wal_pattern_encrypt_attack_sub_behavior['SYSTEM_TimeCreated'].iloc[-1]), 'sim23 log start time', start_time_encrypt_delete.strftime("%d/%m/%Y %H:%M:%S:%f"), 'sim23 log end time', end_time_encrypt_delete.strftime("%d/%m/%Y %H:%M:%S:%f"))
         else:
-             logging.debug('|%s|%s|%s %s',  'detailed quality check info', 'encrypt delete count of filtered row entries' , 0, "out of 1 entry/entries expected")
+             quality_check_logger.debug('|%s|%s|%s %s',  'detailed quality check info', 'encrypt delete count of filtered row entries' , 0, "out of 1 entry/entries expected")
              # final log entry to sum up results
-             logging.error('|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s', 'security event sequence order check was successful', str(quality_evaluation_results[0]), 'security event sequence occured in pre-defined count', str(quality_evaluation_results[1]), 'first event timestamp of complete wal sequence' , "empty dataframe", 'last event timestamp of complete wal sequence' , "empty dataframe", 'sim23 log start time', start_time_encrypt_delete.strftime("%d/%m/%Y %H:%M:%S:%f"), 'sim23 log end time', end_time_encrypt_delete.strftime("%d/%m/%Y %H:%M:%S:%f"))
+             quality_check_logger.error('|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s', 'security event sequence order check was successful', str(quality_evaluation_results[0]), 'security event sequence occured in pre-defined count', str(quality_evaluation_results[1]), 'first event timestamp of complete wal sequence' , "empty dataframe", 'last event timestamp of complete wal sequence' , "empty dataframe", 'sim23 log start time', start_time_encrypt_delete.strftime("%d/%m/%Y %H:%M:%S:%f"), 'sim23 log end time', end_time_encrypt_delete.strftime("%d/%m/%Y %H:%M:%S:%f"))
+
+    if(quality_check_records is not None):
+        quality_check_records.append(build_quality_check_record("quality_check_encrypt_delete", sim23_log_behavior_label, start_time_encrypt_delete, end_time_encrypt_delete, quality_evaluation_results, len(single_windows_security_log_event_sequence_to_expect), len(wal_pattern_encrypt_attack_sub_behavior.index), quality_check_start_time))
 
     return quality_evaluation_results
 
 def quality_check_mailing_with_attachment_and_save(wal_dataframe: pd.DataFrame, start_time_mailing: datetime.datetime, end_time_mailing: datetime.datetime, mailing_with_attachment_and_save_process_name: str ='C:\\Users\\'+SIM_USER_DUMMY_TAG+'\\scoop\\apps\\python\\3.11.3\\python.exe',
                                                    mailing_with_attachment_and_save_event_id: str = '4663', mailing_with_attachment_and_save_object_name: str = 'C:\\localstorage\\attachment', mailing_with_attachment_and_save_access_type: str = '%%4417', log_wal_quality_evaluation: bool = True,
-                                                   sim23_log_behavior_label: str = "UNDEFINED", logging_file_path: pathlib.Path = None, sim_user_of_interest: str = None):
+                                                   sim23_log_behavior_label: str = "UNDEFINED", logging_file_path: pathlib.Path = None, quality_check_records: list = None, sim_user_of_interest: str = None):
     """check if windows security events occur in specific security event order (based on implemented simulation behavior) & the count of specific events machtes the sim23 log timestamps => for encrypt delete behavior sim23
 
     Args:
-        wal_dataframe (pd.DataFrame): dataframe which contains windows security events
+        wal_dataframe (pd.DataFrame): windows security events of the behavior window (only events between start & end time of the behavior, see wal_general_quality_check_handler_sim23_log_based)
         start_time_mailing (datetime.datetime): start timestamp of sim23 behavior of interest
         end_time_mailing (datetime.datetime): end timestamp of sim23 behavior of interest
         mailing_with_attachment_and_save_process_name (_type_, optional): program executable that access the object while downloading the .dat file in mail attachment (.dat-files in folder). Defaults to 'C:\\Users\\SimUser001\\scoop\\apps\\python\\3.11.3\\python.exe'.
@@ -752,17 +719,16 @@ def quality_check_mailing_with_attachment_and_save(wal_dataframe: pd.DataFrame,
         log_wal_quality_evaluation (bool, optional): log quality check results in log file if True, else no logging will be applied. Defaults to True.
         sim23_log_behavior_label (str): name of the sim23 log behavior which is quality checked
         logging_file_path (pathlib.Path): path to log the quality evaluation results. Defaults to None (take path out of config file in same folder)
+        quality_check_records (list, optional): structured result record of the quality check is appended (see build_quality_check_record). Defaults to None (no record).
         sim_user_of_interest (str): name of simulation user which is focused in quality check
 
     Returns:
         list: list: returns list with two bool values -> first value is true if windows security events occur in pre-defined order and second value is true if windows security events occur in pre-defined count, otherwise return false for specific values
     """
+    quality_check_start_time = time.perf_counter()
     if(log_wal_quality_evaluation):
-        if(logging_file_path == None):
-            logging.basicConfig(filename=pathlib.Path(load_config_asset("LOGGING", "system_path_to_write_logs")), level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s', datefmt="%d/%m/%Y %H:%M:%S")
-        else:
-            logging.basicConfig(filename=logging_file_path, level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s', datefmt="%d/%m/%Y %H:%M:%S")
-        logging.info('|%s|%s', sim23_log_behavior_label, 'method wal_quality_evaluation.quality_check_mailing_with_attachment_and_save started')
+        quality_check_logger = get_quality_check_logger(logging_file_path)
+        quality_check_logger.info('|%s|%s', sim23_log_behavior_label, 'method wal_quality_evaluation.quality_check_mailing_with_attachment_and_save started')
 
     mailing_with_attachment_and_save_process_name = mailing_with_attachment_and_save_process_name.replace(SIM_USER_DUMMY_TAG, sim_user_of_interest)
     # to keep it similiar both quality check values will be used at this point in code as well
@@ -773,51 +739,119 @@ def quality_check_mailing_with_attachment_and_save(wal_dataframe: pd.DataFrame,
     single_security_access_type_sequence_to_expect = [mailing_with_attachment_and_save_access_type]
 
     if(not wal_dataframe.empty):
-
-        dataframe_copy = wal_dataframe[(wal_dataframe['SYSTEM_TimeCreated'] >= start_time_mailing) & (wal_dataframe['SYSTEM_TimeCreated'] <= end_time_mailing)].copy()
-
-        mailing_with_attachment_sub_dataframe = dataframe_copy[(dataframe_copy['EVENTDATA_ProcessName'] == mailing_with_attachment_and_save_process_name) & \
-                                                (dataframe_copy['SYSTEM_EventID'] == mailing_with_attachment_and_save_event_id) & \
-                                                ((dataframe_copy['EVENTDATA_ObjectName'].str.contains(mailing_with_attachment_and_save_object_name, regex=False)) & (dataframe_copy['EVENTDATA_ObjectName'].str.contains('.dat'))) & \
-                                                (dataframe_copy['EVENTDATA_AccessList'].str.contains(mailing_with_attachment_and_save_access_type))]
-        
-        wal_pattern_mailing_with_attachment_sub_behavior = mailing_with_attachment_sub_dataframe.sort_values(by='SYSTEM_TimeCreated', ignore_index=True)
-
-        security_event_seuqence_to_check = wal_pattern_mailing_with_attachment_sub_behavior[['EVENTDATA_ProcessName', 'SYSTEM_EventID', 'EVENTDATA_ObjectName']].values.tolist()
-        security_access_type_sequence_to_check = wal_pattern_mailing_with_attachment_sub_behavior[['EVENTDATA_AccessList']].values.flatten().tolist()
-
-        if((len(security_event_seuqence_to_check) == len(single_windows_security_log_event_sequence_to_expect)) and (len(security_access_type_sequence_to_check) == len(single_security_access_type_sequence_to_expect))):
-            for idx, event_row in enumerate(single_windows_security_log_event_sequence_to_expect):
-                # explicitly check every element because object file names vary while copying different files
-                if((single_windows_security_log_event_sequence_to_expect[idx][0] != security_event_seuqence_to_check[idx][0]) or (single_windows_security_log_event_sequence_to_expect[idx][1] != security_event_seuqence_to_check[idx][1]) or (not(single_windows_security_log_event_sequence_to_expect[idx][2] in security_event_seuqence_to_check[idx][2])) or (not('.dat' in security_event_seuqence_to_check[idx][2]))):
-                    quality_evaluation_results[0] = False
-            # explicitly check because security event can contain more than one specific access type in access list
-            for idx, access_list_elemet in enumerate(single_security_access_type_sequence_to_expect):
-                if(not(single_security_access_type_sequence_to_expect[idx] in security_access_type_sequence_to_check[idx])):
-                    quality_evaluation_results[0] = False
-        else:
-            quality_evaluation_results = [False, False]
+        quality_check_rules = [build_quality_check_rule(mailing_with_attachment_and_save_process_name, mailing_with_attachment_and_save_event_id, mailing_with_attachment_and_save_object_name,
+                                                        mailing_with_attachment_and_save_access_type, object_name_match = "contains_dat_file")]
+        rule_match_counts, wal_pattern_mailing_with_attachment_sub_behavior = evaluate_quality_check_rules(wal_dataframe, quality_check_rules)
+        quality_evaluation_results = check_quality_check_event_sequence(wal_pattern_mailing_with_attachment_sub_behavior, single_windows_security_log_event_sequence_to_expect, single_security_access_type_sequence_to_expect, object_name_match = "contains_dat_file")
     else:
         wal_pattern_mailing_with_attachment_sub_behavior = wal_dataframe
         quality_evaluation_results = [False, False]
 
     if(log_wal_quality_evaluation):
         if(not wal_pattern_mailing_with_attachment_sub_behavior.empty):
-            logging.debug('|%s|%s|%s %s',  'detailed quality check info', 'mailing save attachment count of filtered row entries' , mailing_with_attachment_sub_dataframe.shape[0], "out of 1 entry/entries expected")
+            quality_check_logger.debug('|%s|%s|%s %s',  'detailed quality check info', 'mailing save attachment count of filtered row entries' , rule_match_counts[0], "out of 1 entry/entries expected")
             
             # final log entry to sum up results
             if((quality_evaluation_results[0] == True) and (quality_evaluation_results[1] == True)):
-                logging.info('|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s', 'security event sequence order check was successful', str(quality_evaluation_results[0]), 'security event sequence occured in pre-defined count', str(quality_evaluation_results[1]), 'first event timestamp of complete wal sequence' , str(wal_pattern_mailing_with_attachment_sub_behavior['SYSTEM_TimeCreated'].iloc[0]), 'last event timestamp of complete wal sequence' , str(wal_pattern_mailing_with_attachment_sub_behavior['SYSTEM_TimeCreated'].iloc[-1]), 'sim23 log start time', start_time_mailing.strftime("%d/%m/%Y %H:%M:%S:%f"), 'sim23 log end time', end_time_mailing.strftime("%d/%m/%Y %H:%M:%S:%f"))
+                quality_check_logger.info('|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s', 'security event sequence order check was successful', str(quality_evaluation_results[0]), 'security event sequence occured in pre-defined count', str(quality_evaluation_results[1]), 'first event timestamp of complete wal sequence' , str(wal_pattern_mailing_with_attachment_sub_behavior['SYSTEM_TimeCreated'].iloc[0]), 'last event timestamp of complete wal sequence' , str(wal_pattern_mailing_with_attachment_sub_behavior['SYSTEM_TimeCreated'].iloc[-1]), 'sim23 log start time', start_time_mailing.strftime("%d/%m/%Y %H:%M:%S:%f"), 'sim23 log end time', end_time_mailing.strftime("%d/%m/%Y %H:%M:%S:%f"))
             else:
-                logging.error('|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s', 'security event sequence order check was successful', str(quality_evaluation_results[0]), 'security event sequence occured in pre-defined count', str(quality_evaluation_results[1]), 'first event timestamp of complete wal sequence' , str(wal_pattern_mailing_with_attachment_sub_behavior['SYSTEM_TimeCreated'].iloc[0]), 'last event timestamp of complete wal sequence' , str(wal_pattern_mailing_with_attachment_sub_behavior['SYSTEM_TimeCreated'].iloc[-1]), 'sim23 log start time', start_time_mailing.strftime("%d/%m/%Y %H:%M:%S:%f"), 'sim23 log end time', end_time_mailing.strftime("%d/%m/%Y %H:%M:%S:%f"))
+                quality_check_logger.error('|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s', 'security event sequence order check was successful', str(quality_evaluation_results[0]), 'security event sequence occured in pre-defined count', str(quality_evaluation_results[1]), 'first event timestamp of complete wal sequence' , str(wal_pattern_mailing_with_attachment_sub_behavior['SYSTEM_TimeCreated'].iloc[0]), 'last event timestamp of complete wal sequence' , str(wal_pattern_mailing_with_attachment_sub_behavior['SYSTEM_TimeCreated'].iloc[-1]), 'sim23 log start time', start_time_mailing.strftime("%d/%m/%Y %H:%M:%S:%f"), 'sim23 log end time', end_time_mailing.strftime("%d/%m/%Y %H:%M:%S:%f"))
         else:
-            logging.debug('|%s|%s|%s %s',  'detailed quality check info', 'mailing save attachment count of filtered row entries' , 0, "out of 1 entry/entries expected")
+            quality_check_logger.debug('|%s|%s|%s %s',  'detailed quality check info', 'mailing save attachment count of filtered row entries' , 0, "out of 1 entry/entries expected")
             # final log entry to sum up results
-            logging.error('|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s', 'security event sequence order check was successful', str(quality_evaluation_results[0]), 'security event sequence occured in pre-defined count', str(quality_evaluation_results[1]), 'first event timestamp of complete wal sequence' , "empty dataframe", 'last event timestamp of complete wal sequence' , "empty dataframe", 'sim23 log start time', start_time_mailing.strftime("%d/%m/%Y %H:%M:%S:%f"), 'sim23 log end time', end_time_mailing.strftime("%d/%m/%Y %H:%M:%S:%f"))
+            quality_check_logger.error('|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s|%s-%s', 'security event sequence order check was successful', str(quality_evaluation_results[0]), 'security event sequence occured in pre-defined count', str(quality_evaluation_results[1]), 'first event timestamp of complete wal sequence' , "empty dataframe", 'last event timestamp of complete wal sequence' , "empty dataframe", 'sim23 log start time', start_time_mailing.strftime("%d/%m/%Y %H:%M:%S:%f"), 'sim23 log end time', end_time_mailing.strftime("%d/%m/%Y %H:%M:%S:%f"))
+
+    if(quality_check_records is not None):
+        quality_check_records.append(build_quality_check_record("quality_check_mailing_with_attachment_and_save", sim23_log_behavior_label, start_time_mailing, end_time_mailing, quality_evaluation_results, len(single_windows_security_log_event_sequence_to_expect), len(wal_pattern_mailing_with_attachment_sub_behavior.index), quality_check_start_time))
 
     return quality_evaluation_results
 
-def wal_general_quality_check_handler_sim23_log_based(sim23_logs: list, audit_data: pd.DataFrame, logging_path: pathlib.Path=None, sim_user_of_interest: str = None, timezone: str = None):
+def dispatch_quality_check_encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt(sim23_log_entry: tuple, wal_dataframe: pd.DataFrame, logging_path: pathlib.Path, sim_user_of_interest: str, timezone: str, **quality_check_parameters):
+    """dispatch quality check of encrypt copy, encrypt encrypt & encrypt decrypt attack steps (see QUALITY_CHECK_REGISTRY)
+
+    Args:
+        sim23_log_entry (tuple): sim23 log entry (start_time_behavior, end_time_behavior, behavior_label)
+        wal_dataframe (pd.DataFrame): windows security events of the behavior window
+        logging_path (pathlib.Path): path to write the quality check logs
+        sim_user_of_interest (str): simulation user which should be evaluated regarding its behavior logs
+        timezone (str): timezone of simulation recording (different for hardware and software simulation)
+        **quality_check_parameters: forwarded to the quality check (log_wal_quality_evaluation, quality_check_records)
+    """
+    quality_check_encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt(sim_user_of_interest = sim_user_of_interest, sim23_log_behavior_label = sim23_log_entry[-1], encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt_object_name = 'C:\\localstorage\\sim23_encrypt_dest', encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt_access_type = '%%4417', number_of_files_to_copy_or_encrypt_or_decrypt = LABEL_WAL_FEATURE_MAPPING[sim23_log_entry[-1]][1], wal_dataframe = wal_dataframe, start_time_quality_check_encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt = sim23_log_entry[0], end_time_quality_check_encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt = sim23_log_entry[1], encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt_process_name = LABEL_WAL_FEATURE_MAPPING[sim23_log_entry[-1]][0], logging_file_path = logging_path, **quality_check_parameters)
+
+def dispatch_quality_check_encrypt_delete(sim23_log_entry: tuple, wal_dataframe: pd.DataFrame, logging_path: pathlib.Path, sim_user_of_interest: str, timezone: str, **quality_check_parameters):
+    """dispatch quality check of encrypt delete attack step (see QUALITY_CHECK_REGISTRY), arguments see dispatch_quality_check_encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt"""
+    quality_check_encrypt_delete(sim23_log_behavior_label = sim23_log_entry[-1], wal_dataframe = wal_dataframe, start_time_encrypt_delete = sim23_log_entry[0], end_time_encrypt_delete = sim23_log_entry[1], logging_file_path = logging_path, **quality_check_parameters)
+
+def dispatch_quality_check_mailing_with_attachment_and_save(sim23_log_entry: tuple, wal_dataframe: pd.DataFrame, logging_path: pathlib.Path, sim_user_of_interest: str, timezone: str, **quality_check_parameters):
+    """dispatch quality check of mailing behavior with downloaded attachment (see QUALITY_CHECK_REGISTRY), arguments see dispatch_quality_check_encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt"""
+    quality_check_mailing_with_attachment_and_save(sim_user_of_interest = sim_user_of_interest, sim23_log_behavior_label = sim23_log_entry[-1], wal_dataframe = wal_dataframe, start_time_mailing = sim23_log_entry[0], end_time_mailing = sim23_log_entry[1], logging_file_path = logging_path, **quality_check_parameters)
+
+def dispatch_quality_check_programming_behavior_java(sim23_log_entry: tuple, wal_dataframe: pd.DataFrame, logging_path: pathlib.Path, sim_user_of_interest: str, timezone: str, **quality_check_parameters):
+    """dispatch quality check of java programming behavior (see QUALITY_CHECK_REGISTRY), arguments see dispatch_quality_check_encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt"""
+    if((sim_user_of_interest=="SimUser003") and (timezone == "CEST")):
+        # in recording setup SimUser003 has a different java version than the rest of the simulation users by default -> bug in simulation environment
+        quality_check_programming_behavior_java(execute_sim23_class_file_object_name = 'C:\\Users\\'+SIM_USER_DUMMY_TAG+'\\scoop\\apps\\openjdk\\21.0.2-13\\bin\\server\\jvm.dll', execute_sim23_class_file_process_name = 'C:\\Users\\'+SIM_USER_DUMMY_TAG+'\\scoop\\apps\\openjdk\\21.0.2-13\\bin\\java.exe', compile_create_class_file_process_name = 'C:\\Users\\'+SIM_USER_DUMMY_TAG+'\\scoop\\apps\\openjdk\\21.0.2-13\\bin\\javac.exe', sim_user_of_interest = sim_user_of_interest, sim23_log_behavior_label = sim23_log_entry[-1], wal_dataframe = wal_dataframe, start_timestamp_programming_behavior = sim23_log_entry[0], end_timestamp_programming_behavior = sim23_log_entry[1], logging_file_path = logging_path, **quality_check_parameters)
+    else:
+        quality_check_programming_behavior_java(sim_user_of_interest = sim_user_of_interest, sim23_log_behavior_label = sim23_log_entry[-1], wal_dataframe = wal_dataframe, start_timestamp_programming_behavior = sim23_log_entry[0], end_timestamp_programming_behavior = sim23_log_entry[1], logging_file_path = logging_path, **quality_check_parameters)
+
+def dispatch_quality_check_programming_behavior_python(sim23_log_entry: tuple, wal_dataframe: pd.DataFrame, logging_path: pathlib.Path, sim_user_of_interest: str, timezone: str, **quality_check_parameters):
+    """dispatch quality check of python programming behavior (see QUALITY_CHECK_REGISTRY), arguments see dispatch_quality_check_encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt"""
+    quality_check_programming_behavior_python(sim_user_of_interest = sim_user_of_interest, sim23_log_behavior_label = sim23_log_entry[-1], wal_dataframe = wal_dataframe, start_timestamp_programming_behavior = sim23_log_entry[0], end_timestamp_programming_behavior = sim23_log_entry[1], logging_file_path = logging_path, **quality_check_parameters)
+
+def dispatch_quality_check_copy_local_to_local_and_net_to_local(sim23_log_entry: tuple, wal_dataframe: pd.DataFrame, logging_path: pathlib.Path, sim_user_of_interest: str, timezone: str, **quality_check_parameters):
+    """dispatch quality check of copy behaviors (see QUALITY_CHECK_REGISTRY), arguments see dispatch_quality_check_encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt"""
+    quality_check_copy_local_to_local_and_net_to_local(sim_user_of_interest = sim_user_of_interest, sim23_log_behavior_label = sim23_log_entry[-1], complete_copy_behavior_object_name = LABEL_WAL_FEATURE_MAPPING[sim23_log_entry[-1]][0], number_of_files_to_copy = LABEL_WAL_FEATURE_MAPPING[sim23_log_entry[-1]][1], wal_dataframe = wal_dataframe, start_time_copy_behavior = sim23_log_entry[0], end_time_copy_behavior = sim23_log_entry[1], logging_file_path = logging_path, **quality_check_parameters)
+
+# ordered registry of quality checks: (behavior group substring, [(sub behavior substring, dispatch function)])
+# the first behavior group contained in the sim23 log label is selected, inside of this group the first contained sub behavior substring ("" matches every label)
+# behavior labels without a matching entry are not quality checked
+QUALITY_CHECK_REGISTRY = [("encrypt", [("copy", dispatch_quality_check_encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt),
+                                       ("decrypt", dispatch_quality_check_encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt),
+                                       ("delete", dispatch_quality_check_encrypt_delete),
+                                       ("encrypt_encrypt", dispatch_quality_check_encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt)]),
+                          # only if attachment gets downloaded while simulating mailing behavior
+                          ("mailing", [("and_save", dispatch_quality_check_mailing_with_attachment_and_save)]),
+                          ("programming", [("java", dispatch_quality_check_programming_behavior_java),
+                                           ("python", dispatch_quality_check_programming_behavior_python)]),
+                          ("copy", [("", dispatch_quality_check_copy_local_to_local_and_net_to_local)])]
+
+def get_quality_check_dispatch_function(sim23_log_behavior_label: str, quality_check_registry: list = QUALITY_CHECK_REGISTRY):
+    """look up the quality check of a sim23 log behavior label in the quality check registry
+
+    Args:
+        sim23_log_behavior_label (str): behavior label of sim23 log entry
+        quality_check_registry (list): ordered registry of quality checks. Defaults to QUALITY_CHECK_REGISTRY.
+
+    Returns:
+        function: dispatch function of the quality check, None if behavior is not quality checked
+    """
+    for behavior_group_substring, sub_behaviors in quality_check_registry:
+        if(behavior_group_substring in sim23_log_behavior_label):
+            for sub_behavior_substring, dispatch_function in sub_behaviors:
+                if(sub_behavior_substring in sim23_log_behavior_label):
+                    return dispatch_function
+            return None
+
+    return None
+
+def get_sim23_behavior_windows(sim23_logs: list, sorted_timestamps: pd.Series):
+    """compute row ranges of all sim23 behavior windows at once (binary search on sorted timestamps)
+
+    Args:
+        sim23_logs (list): behavior description of cidds-framework behavior (start_time_behavior, end_time_behavior, behavior_label)
+        sorted_timestamps (pd.Series): ascending sorted timestamps of windows security events
+
+    Returns:
+        tuple: (first row per behavior window (np.ndarray), last row exclusive per behavior window (np.ndarray)) -> rows with start_time_behavior <= timestamp <= end_time_behavior
+    """
+    first_rows = sorted_timestamps.searchsorted(pd.to_datetime([log_entry[0] for log_entry in sim23_logs]), side = "left")
+    last_rows = sorted_timestamps.searchsorted(pd.to_datetime([log_entry[1] for log_entry in sim23_logs]), side = "right")
+
+    return first_rows, np.maximum(first_rows, last_rows)
+
+def wal_general_quality_check_handler_sim23_log_based(sim23_logs: list, audit_data: pd.DataFrame, logging_path: pathlib.Path=None, sim_user_of_interest: str = None, timezone: str = None,
+                                                      quality_check_records: list = None, log_wal_quality_evaluation: bool = True):
     """automated quality evaluation processing based on collected windows audit log files (converted) & sim 23 logs for each iteration
 
     Args:
@@ -826,46 +860,24 @@ def wal_general_quality_check_handler_sim23_log_based(sim23_logs: list, audit_da
         logging_path (pathlib.Path): path to write the quality check logs
         sim_user_of_interest (str): simulation user which should be evaluated regarding  its behavior logs
         timezone (str): timezone of simulation recording (different for hardware and software simulation)
+        quality_check_records (list, optional): structured result records of all done quality checks are appended (see build_quality_check_record). Defaults to None (no records).
+        log_wal_quality_evaluation (bool): write quality check results into the quality check report. Defaults to True.
 
     Returns:
         int: returns the count of done quality checks for Windows security audit logs
     """
     done_quality_checks = 0
     if(sim23_logs):
+        if(not audit_data['SYSTEM_TimeCreated'].is_monotonic_increasing):
+            # stable sort keeps the order of windows security events with the same timestamp
+            audit_data = audit_data.sort_values(by = 'SYSTEM_TimeCreated', kind = "stable")
+        # all behavior windows are computed at once, quality checks get slices of audit_data (no copy per sim23 log entry)
+        first_rows, last_rows = get_sim23_behavior_windows(sim23_logs, audit_data['SYSTEM_TimeCreated'])
         for idx, log_entry in enumerate(sim23_logs):
-            data = audit_data[(audit_data['SYSTEM_TimeCreated'] >= log_entry[0]) & (audit_data['SYSTEM_TimeCreated'] <= log_entry[1])].copy()
-            if('encrypt' in log_entry[-1]):
-                # differentiate between encrypt copy, encrypt, decrypt, delete attack steps
-                if('copy' in log_entry[-1]):
-                    quality_check_encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt(sim_user_of_interest = sim_user_of_interest, sim23_log_behavior_label = log_entry[-1], encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt_object_name = 'C:\\localstorage\\sim23_encrypt_dest', encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt_access_type = '%%4417', number_of_files_to_copy_or_encrypt_or_decrypt = LABEL_WAL_FEATURE_MAPPING[log_entry[-1]][1],wal_dataframe = data, start_time_quality_check_encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt = log_entry[0], end_time_quality_check_encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt = log_entry[1], encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt_process_name = LABEL_WAL_FEATURE_MAPPING[log_entry[-1]][0], logging_file_path = logging_path)
-                    done_quality_checks = done_quality_checks + 1
-                elif('decrypt' in log_entry[-1]):
-                    quality_check_encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt(sim_user_of_interest = sim_user_of_interest, sim23_log_behavior_label = log_entry[-1], encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt_object_name = 'C:\\localstorage\\sim23_encrypt_dest', encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt_access_type = '%%4417', number_of_files_to_copy_or_encrypt_or_decrypt = LABEL_WAL_FEATURE_MAPPING[log_entry[-1]][1], wal_dataframe = data, start_time_quality_check_encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt= log_entry[0], end_time_quality_check_encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt= log_entry[1], encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt_process_name = LABEL_WAL_FEATURE_MAPPING[log_entry[-1]][0], logging_file_path = logging_path)
-                    done_quality_checks = done_quality_checks + 1
-                elif('delete' in log_entry[-1]):
-                    quality_check_encrypt_delete(sim23_log_behavior_label = log_entry[-1], wal_dataframe = data, start_time_encrypt_delete = log_entry[0], end_time_encrypt_delete = log_entry[1], logging_file_path = logging_path)
-                    done_quality_checks = done_quality_checks + 1
-                elif('encrypt_encrypt' in log_entry[-1]):
-                    quality_check_encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt(sim_user_of_interest = sim_user_of_interest, sim23_log_behavior_label = log_entry[-1], encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt_object_name = 'C:\\localstorage\\sim23_encrypt_dest', encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt_access_type = '%%4417', number_of_files_to_copy_or_encrypt_or_decrypt = LABEL_WAL_FEATURE_MAPPING[log_entry[-1]][1], wal_dataframe = data, start_time_quality_check_encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt = log_entry[0], end_time_quality_check_encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt = log_entry[1], encrypt_copy_or_encrypt_encrypt_or_encrypt_decrypt_process_name = LABEL_WAL_FEATURE_MAPPING[log_entry[-1]][0], logging_file_path = logging_path)
-                    done_quality_checks = done_quality_checks + 1
-            elif('mailing' in log_entry[-1]):
-                # if attachment gets downloaded while simulating mailing behavior
-                if('and_save'in log_entry[-1]):
-                    quality_check_mailing_with_attachment_and_save(sim_user_of_interest = sim_user_of_interest, sim23_log_behavior_label = log_entry[-1], wal_dataframe = data, start_time_mailing = log_entry[0], end_time_mailing = log_entry[1], logging_file_path = logging_path)
-                    done_quality_checks = done_quality_checks + 1
-            elif('programming' in log_entry[-1]):
-                if('java' in log_entry[-1]):
-                    if((sim_user_of_interest=="SimUser003") and (timezone == "CEST")):
-                        # in recording setup SimUser003 has a different java version than the rest of the simulation users by default -> bug in simulation environment
-                        quality_check_programming_behavior_java(execute_sim23_class_file_object_name = 'C:\\Users\\'+SIM_USER_DUMMY_TAG+'\\scoop\\apps\\openjdk\\21.0.2-13\\bin\\server\\jvm.dll', execute_sim23_class_file_process_name = 'C:\\Users\\'+SIM_USER_DUMMY_TAG+'\\scoop\\apps\\openjdk\\21.0.2-13\\bin\\java.exe', compile_create_class_file_process_name = 'C:\\Users\\'+SIM_USER_DUMMY_TAG+'\\scoop\\apps\\openjdk\\21.0.2-13\\bin\\javac.exe', sim_user_of_interest = sim_user_of_interest, sim23_log_behavior_label = log_entry[-1], wal_dataframe = data, start_timestamp_programming_behavior = log_entry[0], end_timestamp_programming_behavior = log_entry[1], logging_file_path = logging_path)
-                    else:
-                        quality_check_programming_behavior_java(sim_user_of_interest = sim_user_of_interest, sim23_log_behavior_label = log_entry[-1], wal_dataframe = data, start_timestamp_programming_behavior = log_entry[0], end_timestamp_programming_behavior = log_entry[1], logging_file_path = logging_path)
-                    done_quality_checks = done_quality_checks + 1
-                elif('python' in log_entry[-1]):
-                    quality_check_programming_behavior_python(sim_user_of_interest = sim_user_of_interest, sim23_log_behavior_label = log_entry[-1], wal_dataframe = data, start_timestamp_programming_behavior = log_entry[0], end_timestamp_programming_behavior = log_entry[1], logging_file_path = logging_path)
-                    done_quality_checks = done_quality_checks + 1
-            elif('copy' in log_entry[-1]):
-                quality_check_copy_local_to_local_and_net_to_local(sim_user_of_interest = sim_user_of_interest, sim23_log_behavior_label = log_entry[-1], complete_copy_behavior_object_name = LABEL_WAL_FEATURE_MAPPING[log_entry[-1]][0], number_of_files_to_copy = LABEL_WAL_FEATURE_MAPPING[log_entry[-1]][1], wal_dataframe = data, start_time_copy_behavior = log_entry[0], end_time_copy_behavior = log_entry[1], logging_file_path = logging_path)
+            dispatch_function = get_quality_check_dispatch_function(log_entry[-1])
+            if(dispatch_function is not None):
+                dispatch_function(log_entry, audit_data.iloc[first_rows[idx]:last_rows[idx]], logging_path, sim_user_of_interest, timezone, quality_check_records = quality_check_records,
+                                  log_wal_quality_evaluation = log_wal_quality_evaluation)
                 done_quality_checks = done_quality_checks + 1
 
     return done_quality_checks
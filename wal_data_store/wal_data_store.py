@@ -0,0 +1,331 @@
+import argparse
+import textwrap
+import pathlib
+import os
+import re
+import json
+import pandas as pd
+import pyarrow.parquet as pq
+
+NAME = "Windows Audit Logs Data Store Script"
+VERSION = "1.4"
+CMD_MODE_ENABLED = True
+
+DATA_STORE_FILE_SUFFIX = ".parquet"
+# sub data sets of a partitioned data store (see build_data_set_partition_path), other parquet files below the root folder are ignored
+DATA_STORE_PARTITION_FILE_PATTERN = "simulation_type=*/simulation_run=*/iteration=*/sim_user=*/*" + DATA_STORE_FILE_SUFFIX
+CSV_DATA_SET_FILE_SUBSTRING = ".gz"
+DATA_STORE_DEFAULT_ROW_GROUP_SIZE = 100000
+# string columns with less unique values than this ratio (unique values / rows) are stored as categorical columns
+DATA_STORE_CATEGORICAL_MAX_UNIQUE_RATIO = 0.5
+# statistics of a sub data set are stored next to it (e.g., ..._data.gz -> ..._data_statistics.json)
+DATA_SET_STATISTICS_FILE_SUFFIX = "_statistics.json"
+# increase if the content of the statistics changes -> all existing statistics become stale
+DATA_SET_STATISTICS_VERSION = "1"
+
+def get_simulation_type_of_simulation_run(system_path_simulation_run: pathlib.Path):
+    """get simulation type (hardware or software) of a simulation run based on its system path
+
+    Args:
+        system_path_simulation_run (pathlib.Path): simulation run folder (e.g., /home/path/to/data/Hardware Sim 23 Run 9 [41-45])
+
+    Returns:
+        str: "hardware_simulation", "software_simulation" or "unknown_simulation"
+    """
+    lowercase_system_path_simulation_run = str(system_path_simulation_run).lower()
+    if("hardware" in lowercase_system_path_simulation_run):
+        return "hardware_simulation"
+    elif("software" in lowercase_system_path_simulation_run):
+        return "software_simulation"
+    else:
+        return "unknown_simulation"
+
+def build_data_set_partition_path(data_store_folder: pathlib.Path, system_path_simulation_run: pathlib.Path, iteration_index: int, sim_user_of_interest: str, data_set_file_stem: str):
+    """build system path of a single sub data set (simulation run iteration of a specific simulation user) inside of the partitioned data store
+
+    Args:
+        data_store_folder (pathlib.Path): root folder of the partitioned data store
+        system_path_simulation_run (pathlib.Path): simulation run folder the sub data set belongs to
+        iteration_index (int): index of the iteration in the simulation run
+        sim_user_of_interest (str): simulation user of the sub data set (e.g., SimUser001)
+        data_set_file_stem (str): file name of the sub data set without suffix (same as the file name of the gzip compressed CSV file)
+
+    Returns:
+        pathlib.Path: data_store_folder/simulation_type=.../simulation_run=.../iteration=.../sim_user=.../data_set_file_stem.parquet
+    """
+    simulation_run_name = re.sub(r"[^A-Za-z0-9_\-]+", "_", pathlib.Path(system_path_simulation_run).name).strip("_")
+
+    return pathlib.Path(data_store_folder, "simulation_type=" + get_simulation_type_of_simulation_run(system_path_simulation_run), "simulation_run=" + simulation_run_name,
+                        "iteration=" + str(iteration_index), "sim_user=" + sim_user_of_interest, data_set_file_stem + DATA_STORE_FILE_SUFFIX)
+
+def convert_data_set_column_types(data_set: pd.DataFrame, categorical_max_unique_ratio: float = DATA_STORE_CATEGORICAL_MAX_UNIQUE_RATIO):
+    """convert columns of a parsed and labeled sub data set into typed columns (timestamps, numerical event ids and categorical string columns)
+
+    Args:
+        data_set (pd.DataFrame): parsed and labeled Windows 10 security audit logs
+        categorical_max_unique_ratio (float): string columns with a ratio of unique values to rows below this value are converted to categorical columns. Defaults to DATA_STORE_CATEGORICAL_MAX_UNIQUE_RATIO.
+
+    Returns:
+        pd.DataFrame: sub data set with typed columns
+    """
+    typed_data_set = data_set.copy()
+    if("SYSTEM_TimeCreated" in typed_data_set.columns):
+        typed_data_set["SYSTEM_TimeCreated"] = pd.to_datetime(typed_data_set["SYSTEM_TimeCreated"])
+    if("SYSTEM_EventID" in typed_data_set.columns):
+        # event ids are numerical like in the gzip compressed CSV files
+        typed_data_set["SYSTEM_EventID"] = pd.to_numeric(typed_data_set["SYSTEM_EventID"]).astype("category")
+    for column_name in typed_data_set.columns:
+        if((typed_data_set[column_name].dtype == object) or isinstance(typed_data_set[column_name].dtype, pd.StringDtype)):
+            if((column_name == "Labels") or (typed_data_set[column_name].nunique() <= (categorical_max_unique_ratio * len(typed_data_set.index)))):
+                typed_data_set[column_name] = typed_data_set[column_name].astype("category")
+
+    return typed_data_set
+
+def write_data_set_partition(data_set: pd.DataFrame, data_set_partition_path: pathlib.Path, row_group_size: int = DATA_STORE_DEFAULT_ROW_GROUP_SIZE):
+    """write typed sub data set into the partitioned data store (columnar parquet format)
+
+    Args:
+        data_set (pd.DataFrame): parsed and labeled Windows 10 security audit logs
+        data_set_partition_path (pathlib.Path): system path of the sub data set (see build_data_set_partition_path)
+        row_group_size (int): number of rows per row group (smallest unit read by row range selections). Defaults to DATA_STORE_DEFAULT_ROW_GROUP_SIZE.
+    """
+    data_set_partition_path = pathlib.Path(data_set_partition_path)
+    data_set_partition_path.parent.mkdir(parents = True, exist_ok = True)
+    # write to temporary file first -> readers never see partially written sub data sets
+    temporary_data_set_partition_path = data_set_partition_path.with_name(data_set_partition_path.name + "." + str(os.getpid()) + ".tmp")
+    convert_data_set_column_types(data_set).to_parquet(temporary_data_set_partition_path, index = False, row_group_size = row_group_size)
+    os.replace(temporary_data_set_partition_path, data_set_partition_path)
+
+def read_data_set_partition(data_set_partition_path: pathlib.Path, columns: list = None, row_range: tuple = None):
+    """read sub data set from the partitioned data store, only the selected columns and row groups overlapping the row range are read
+
+    Args:
+        data_set_partition_path (pathlib.Path): system path of the sub data set
+        columns (list, optional): columns to read. Defaults to None (all columns).
+        row_range (tuple, optional): (first row, last row exclusive) to read. Defaults to None (all rows).
+
+    Returns:
+        pd.DataFrame: sub data set with typed columns
+    """
+    parquet_file = pq.ParquetFile(data_set_partition_path)
+    if(row_range is None):
+        data_set = parquet_file.read(columns = columns, use_pandas_metadata = True).to_pandas()
+    else:
+        first_row = max(0, row_range[0])
+        last_row = min(parquet_file.metadata.num_rows, row_range[1])
+        row_groups_to_read = []
+        first_row_of_first_row_group = None
+        row_group_start = 0
+        for row_group_index in range(parquet_file.metadata.num_row_groups):
+            row_group_end = row_group_start + parquet_file.metadata.row_group(row_group_index).num_rows
+            if((row_group_end > first_row) and (row_group_start < last_row)):
+                row_groups_to_read.append(row_group_index)
+                if(first_row_of_first_row_group is None):
+                    first_row_of_first_row_group = row_group_start
+            row_group_start = row_group_end
+        data_set = parquet_file.read_row_groups(row_groups_to_read, columns = columns, use_pandas_metadata = True).to_pandas()
+        if(first_row_of_first_row_group is not None):
+            data_set = data_set.iloc[(first_row - first_row_of_first_row_group):(last_row - first_row_of_first_row_group)].reset_index(drop = True)
+        # categories of rows outside of the row range are not part of the result
+        for column_name in data_set.columns:
+            if(isinstance(data_set[column_name].dtype, pd.CategoricalDtype)):
+                data_set[column_name] = data_set[column_name].cat.remove_unused_categories()
+
+    return data_set
+
+def load_data_set(data_set_system_path: pathlib.Path, columns: list = None, row_range: tuple = None, column_types: dict = None):
+    """load sub data set either from the partitioned data store (parquet format) or from a gzip compressed CSV file
+
+    Args:
+        data_set_system_path (pathlib.Path): system path of the sub data set (*.parquet or *.gz)
+        columns (list, optional): columns to load. Defaults to None (all columns).
+        row_range (tuple, optional): (first row, last row exclusive) to load. Defaults to None (all rows).
+        column_types (dict, optional): column name -> dtype of the loaded columns (e.g., {"SYSTEM_EventID": "int64", "Labels": "category"}), CSV columns are parsed directly into these types. Defaults to None (inferred types).
+
+    Returns:
+        pd.DataFrame: loaded sub data set
+    """
+    data_set_system_path = pathlib.Path(data_set_system_path)
+    if(data_set_system_path.suffix == DATA_STORE_FILE_SUFFIX):
+        data_set = read_data_set_partition(data_set_system_path, columns = columns, row_range = row_range)
+        if(column_types is not None):
+            data_set = data_set.astype({column_name: column_type for column_name, column_type in column_types.items() if(column_name in data_set.columns)})
+        return data_set
+    if(row_range is None):
+        return pd.read_csv(data_set_system_path, compression = "gzip", usecols = columns, dtype = column_types)
+    # keep header row, skip rows in front of the row range
+    return pd.read_csv(data_set_system_path, compression = "gzip", usecols = columns, dtype = column_types, skiprows = range(1, max(0, row_range[0]) + 1), nrows = max(0, row_range[1] - max(0, row_range[0])))
+
+def get_data_set_statistics_path(data_set_system_path: pathlib.Path):
+    """get system path of the statistics file of a sub data set
+
+    Args:
+        data_set_system_path (pathlib.Path): system path of the sub data set (*.parquet or *.gz)
+
+    Returns:
+        pathlib.Path: system path of the statistics file (same folder, e.g., ..._data.gz -> ..._data_statistics.json)
+    """
+    data_set_system_path = pathlib.Path(data_set_system_path)
+
+    return data_set_system_path.with_name(data_set_system_path.stem + DATA_SET_STATISTICS_FILE_SUFFIX)
+
+def build_data_set_statistics(data_set: pd.DataFrame):
+    """build statistics of a sub data set (number of rows, time bounds, event id histogram & label counts)
+
+    Args:
+        data_set (pd.DataFrame): parsed and labeled Windows 10 security audit logs (only the columns SYSTEM_TimeCreated, SYSTEM_EventID & Labels are used)
+
+    Returns:
+        dict: statistics (JSON serializable)
+    """
+    statistics = {"statistics_version": DATA_SET_STATISTICS_VERSION, "number_of_rows": int(len(data_set.index)), "first_time_created": None, "last_time_created": None, "event_id_counts": {}, "label_counts": {}}
+    if(("SYSTEM_TimeCreated" in data_set.columns) and (not data_set.empty)):
+        time_created = pd.to_datetime(data_set["SYSTEM_TimeCreated"])
+        statistics["first_time_created"] = time_created.min().isoformat()
+        statistics["last_time_created"] = time_created.max().isoformat()
+    if("SYSTEM_EventID" in data_set.columns):
+        event_id_counts = pd.to_numeric(data_set["SYSTEM_EventID"].dropna().astype(str)).value_counts()
+        statistics["event_id_counts"] = {str(int(event_id)): int(count) for event_id, count in event_id_counts.items() if(count > 0)}
+    if("Labels" in data_set.columns):
+        label_counts = data_set["Labels"].value_counts()
+        statistics["label_counts"] = {str(label): int(count) for label, count in label_counts.items() if(count > 0)}
+
+    return statistics
+
+def merge_data_set_statistics(first_statistics: dict, second_statistics: dict):
+    """merge statistics of two parts of a sub data set (e.g., consecutive blocks of a sub data set processed block-wise)
+
+    Args:
+        first_statistics (dict): statistics of the first part (see build_data_set_statistics)
+        second_statistics (dict): statistics of the second part
+
+    Returns:
+        dict: statistics of both parts
+    """
+    statistics = {"statistics_version": DATA_SET_STATISTICS_VERSION, "number_of_rows": first_statistics["number_of_rows"] + second_statistics["number_of_rows"]}
+    first_times_created = [pd.Timestamp(part_statistics["first_time_created"]) for part_statistics in [first_statistics, second_statistics] if(part_statistics["first_time_created"] is not None)]
+    last_times_created = [pd.Timestamp(part_statistics["last_time_created"]) for part_statistics in [first_statistics, second_statistics] if(part_statistics["last_time_created"] is not None)]
+    statistics["first_time_created"] = min(first_times_created).isoformat() if(first_times_created) else None
+    statistics["last_time_created"] = max(last_times_created).isoformat() if(last_times_created) else None
+    for counts_name in ["event_id_counts", "label_counts"]:
+        counts = dict(first_statistics[counts_name])
+        for value, count in second_statistics[counts_name].items():
+            counts[value] = counts.get(value, 0) + count
+        # same order as value_counts (most frequent value first)
+        statistics[counts_name] = dict(sorted(counts.items(), key = lambda item: item[1], reverse = True))
+
+    return statistics
+
+def store_data_set_statistics(statistics: dict, data_set_system_path: pathlib.Path):
+    """store statistics of a sub data set next to it, must be called after the sub data set is written (size & modification time of the sub data set are stored to detect stale statistics)
+
+    Args:
+        statistics (dict): statistics of the sub data set stored at data_set_system_path (see build_data_set_statistics & merge_data_set_statistics)
+        data_set_system_path (pathlib.Path): system path of the sub data set (*.parquet or *.gz)
+
+    Returns:
+        pathlib.Path: system path of the statistics file
+    """
+    data_set_system_path = pathlib.Path(data_set_system_path)
+    statistics = dict(statistics)
+    data_set_file_stat = data_set_system_path.stat()
+    statistics["data_set_file_name"] = data_set_system_path.name
+    statistics["data_set_file_size"] = data_set_file_stat.st_size
+    statistics["data_set_file_mtime_ns"] = data_set_file_stat.st_mtime_ns
+    statistics_path = get_data_set_statistics_path(data_set_system_path)
+    # write to temporary file first -> readers never see partially written statistics
+    temporary_statistics_path = statistics_path.with_name(statistics_path.name + "." + str(os.getpid()) + ".tmp")
+    temporary_statistics_path.write_text(json.dumps(statistics, indent = 2))
+    os.replace(temporary_statistics_path, statistics_path)
+
+    return statistics_path
+
+def write_data_set_statistics(data_set: pd.DataFrame, data_set_system_path: pathlib.Path):
+    """write statistics of a sub data set next to it, must be called after the sub data set is written
+
+    Args:
+        data_set (pd.DataFrame): sub data set stored at data_set_system_path
+        data_set_system_path (pathlib.Path): system path of the sub data set (*.parquet or *.gz)
+
+    Returns:
+        pathlib.Path: system path of the statistics file
+    """
+    return store_data_set_statistics(build_data_set_statistics(data_set), data_set_system_path)
+
+def load_data_set_statistics(data_set_system_path: pathlib.Path):
+    """load statistics of a sub data set without loading the sub data set itself
+
+    Args:
+        data_set_system_path (pathlib.Path): system path of the sub data set (*.parquet or *.gz)
+
+    Returns:
+        dict: statistics (see build_data_set_statistics) or None if no statistics exist or the sub data set changed after the statistics were written
+    """
+    data_set_system_path = pathlib.Path(data_set_system_path)
+    statistics_path = get_data_set_statistics_path(data_set_system_path)
+    if((not statistics_path.is_file()) or (not data_set_system_path.is_file())):
+        return None
+    try:
+        statistics = json.loads(statistics_path.read_text())
+    except ValueError:
+        return None
+    data_set_file_stat = data_set_system_path.stat()
+    if((statistics.get("statistics_version") != DATA_SET_STATISTICS_VERSION) or (statistics.get("data_set_file_size") != data_set_file_stat.st_size) or (statistics.get("data_set_file_mtime_ns") != data_set_file_stat.st_mtime_ns)):
+        return None
+
+    return statistics
+
+def load_data_set_event_id_histogram(data_set_system_path: pathlib.Path):
+    """load event id histogram of a sub data set from its statistics, the event ids are counted from the sub data set if no valid statistics exist
+
+    Args:
+        data_set_system_path (pathlib.Path): system path of the sub data set (*.parquet or *.gz)
+
+    Returns:
+        pd.Series: number of occurrences (values) per event id (int64 index)
+    """
+    statistics = load_data_set_statistics(data_set_system_path)
+    if(statistics is not None):
+        event_id_counts = statistics["event_id_counts"]
+        return pd.Series(list(event_id_counts.values()), index = pd.Index([int(event_id) for event_id in event_id_counts.keys()], dtype = "int64", name = "SYSTEM_EventID"), dtype = "int64", name = "count")
+    event_id_counts = load_data_set(data_set_system_path, columns = ["SYSTEM_EventID"])["SYSTEM_EventID"].value_counts()
+    # categorical event ids of the data store -> unused categories have a count of 0
+    event_id_counts = event_id_counts[event_id_counts > 0]
+    event_id_counts.index = event_id_counts.index.astype("int64")
+
+    return event_id_counts
+
+def list_data_set_file_names(folder_path: pathlib.Path):
+    """list sub data sets of a folder, gzip compressed CSV files are listed with their file names, sub data sets of a partitioned data store with their path relative to folder_path
+
+    Args:
+        folder_path (pathlib.Path): folder containing gzip compressed CSV files or the root folder of a partitioned data store
+
+    Returns:
+        list: file names (or relative paths) usable with pathlib.Path.joinpath(folder_path, file_name)
+    """
+    folder_path = pathlib.Path(folder_path)
+    csv_data_set_file_names = [entry[2] for entry in os.walk(folder_path)][0]
+    csv_data_set_file_names = [file_name for file_name in csv_data_set_file_names if(CSV_DATA_SET_FILE_SUBSTRING in file_name)]
+    data_store_file_names = sorted([str(data_set_partition_path.relative_to(folder_path)) for data_set_partition_path in folder_path.glob(DATA_STORE_PARTITION_FILE_PATTERN)])
+
+    return csv_data_set_file_names + data_store_file_names
+
+def main():
+    return 0
+
+if __name__ == "__main__":
+    if(CMD_MODE_ENABLED):
+        parser = argparse.ArgumentParser(prog = NAME, formatter_class = argparse.RawDescriptionHelpFormatter, description = textwrap.dedent(('''
+        This script is called by main experiment scripts (starting with 'wsal_') on highest hierachy of this repository structure.
+        ---------------------------------------------------------------
+        Name: %s
+        Version: %s
+        ---------------------------------------------------------------
+        Usage:
+        ''')%(NAME, VERSION)))
+
+        return_code = main()
+        quit(return_code)
+    else:
+        main()
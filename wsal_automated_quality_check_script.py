@@ -6,15 +6,24 @@ import datetime
 import configparser
 import os
 import logging
+import concurrent.futures
+import progressbar
 
+import wsal_preprocess_sim_run_into_csv_file
 from process_wal import process_wal
 from parsing_sim23_logs import parse_sim23_logs
 from quality_evaluation import wal_quality_evaluation
 
 NAME = "WSAL AUTOMATED QUALITY CHECK SCRIPT"
-VERSION = "1.8"
+VERSION = "2.4"
 CMD_MODE_ENABLED = True
 
+EXPECTED_NUMBER_OF_QUALITY_CHECKS = 54
+# own file name -> the per behavior error counts in wal_quality_evaluation_results.csv (";" separated) are never overwritten
+QUALITY_EVALUATION_JOB_SUMMARIES_FILE_NAME = "wal_quality_evaluation_job_summaries.csv"
+QUALITY_EVALUATION_CHECK_RESULTS_FILE_NAME = "wal_quality_evaluation_check_results.csv"
+QUALITY_EVALUATION_RESULTS_KEY_COLUMNS = ["simulation_run", "sim_user", "iteration_index"]
+
 def load_config_asset(config_section: str, config_key: str, config_system_path: pathlib.Path = pathlib.Path(__file__).with_name('config.ini')):
     """load configuration content from config file
 
@@ -37,7 +46,9 @@ def load_config_asset(config_section: str, config_key: str, config_system_path:
     return config_key_value
 
 def automated_quality_check_windows_security_audit_logs(simulation_run_system_folder_path: pathlib.Path, folder_path_to_log_quality_evaluation_results: pathlib.Path = None, archived_wal_substring: str = "Archive-Security",
-                                                        next_simulation_run_system_folder_path: pathlib.Path = None, sim23_logs_file_name: str = "sim23.log", sim_user_of_interest: str = None, timezone_of_simulation_run: str = "CET"):
+                                                        next_simulation_run_system_folder_path: pathlib.Path = None, sim23_logs_file_name: str = "sim23.log", sim_user_of_interest: str = None, timezone_of_simulation_run: str = "CET",
+                                                        number_of_parsing_workers: int = 1, parsed_archive_cache_folder: pathlib.Path = None,
+                                                        parsed_archive_cache_max_size_bytes: int = process_wal.PARSED_ARCHIVE_CACHE_DEFAULT_MAX_SIZE_BYTES):
     """automated quality check for specific simulation run (hardware or software data) for specified Windows 10 user client
 
     Args:
@@ -48,6 +59,9 @@ def automated_quality_check_windows_security_audit_logs(simulation_run_system_fo
         sim23_logs_file_name (str): name of sim 23 log file.
         sim_user_of_interest (str): simulation user of interest.
         timezone_of_simulation_run (str): timezone of simulation run (next and current simulation run have always the same timezone). Defaults to "CET".
+        number_of_parsing_workers (int): number of processes parsing the XML files of an iteration folder concurrently. Defaults to 1.
+        parsed_archive_cache_folder (pathlib.Path, optional): folder of the on-disk cache of already parsed XML files (reused by later runs). Defaults to None (no caching).
+        parsed_archive_cache_max_size_bytes (int): max. size of the parsed archive cache in bytes (least recently used files are evicted). Defaults to process_wal.PARSED_ARCHIVE_CACHE_DEFAULT_MAX_SIZE_BYTES.
 
     Returns: 
         -, creates log file with evaluation results included.
@@ -57,6 +71,7 @@ def automated_quality_check_windows_security_audit_logs(simulation_run_system_fo
     archived_wals_system_paths = sorted([entry for entry in complete_system_path_structure if (any(archived_wal_substring in file for file in entry[2])) & (sim_user_of_interest in entry[0]) & ("convertet_wal" in entry[0])])
     info_to_log = None
     file_path_name_wal_logging = None
+    quality_check_logger = logging.getLogger(NAME)
 
     try:
         if(sim23_log_system_paths):
@@ -72,9 +87,9 @@ def automated_quality_check_windows_security_audit_logs(simulation_run_system_fo
         if(os.path.isdir(folder_path_to_log_quality_evaluation_results)):
             # clears content of existing file first
             open(file_path_name_wal_logging, 'w').close()
-            logging.basicConfig(filename=file_path_name_wal_logging, format='%(asctime)s - %(levelname)s - %(message)s', datefmt="%d/%m/%Y %H:%M:%S", level=logging.DEBUG)
-            logging.info('|%s|%s', NAME, VERSION)
-            logging.info('|%s|%s', info_to_log, 'complete automated windows security audit logs quality evaluation started')
+            quality_check_logger = wal_quality_evaluation.get_quality_check_logger(file_path_name_wal_logging)
+            quality_check_logger.info('|%s|%s', NAME, VERSION)
+            quality_check_logger.info('|%s|%s', info_to_log, 'complete automated windows security audit logs quality evaluation started')
         else:
             raise ValueError("logging path for quality evaluation does not exist")
         
@@ -84,72 +99,250 @@ def automated_quality_check_windows_security_audit_logs(simulation_run_system_fo
     except ValueError as err:
         print(err, "error while loading data")
 
+    # get complete structure of next run for the same sim user (first archived security file of the next run belongs to the last iteration of this run)
+    next_run_complete_system_path_structure = [entry for entry in os.walk(next_simulation_run_system_folder_path)]
+    next_run_archived_wals_system_paths = sorted([entry for entry in next_run_complete_system_path_structure if (any(archived_wal_substring in file for file in entry[2])) & (sim_user_of_interest in entry[0]) & ("convertet_wal" in entry[0])])
+    # single traversal through the iterations -> the first archived security file of the next iteration is parsed once and reused for the next iteration
+    iteration_audit_logs = process_wal.iterate_windows_audit_logs_of_consecutive_iterations([pathlib.Path(entry[0]) for entry in archived_wals_system_paths[:len(sim23_log_system_paths)]],
+                                                                                            next_run_first_iteration_folder_path = pathlib.Path(next_run_archived_wals_system_paths[0][0]) if next_run_archived_wals_system_paths else None,
+                                                                                            archived_wal_substring = archived_wal_substring, timezone_of_simulation_run = timezone_of_simulation_run, quality_check_fast_mode_enabled = True,
+                                                                                            number_of_workers = number_of_parsing_workers, parsed_archive_cache_folder = parsed_archive_cache_folder,
+                                                                                            parsed_archive_cache_max_size_bytes = parsed_archive_cache_max_size_bytes)
+
     # enumerate through simulation iterations of interest by starting with earliest to latest iteration
     for idx, sim23_log in enumerate(sim23_log_system_paths):
-        current_sim23_log_entries = parse_sim23_logs.load_sim23_log_data_without_using_predefined_labels(pathlib.Path.joinpath(pathlib.Path(sim23_log), sim23_logs_file_name))        
-        current_iteration_time_start_end_timestamps = pathlib.Path.joinpath(pathlib.Path(sim23_log), "iteration.time").read_text().split("#") # index of list: 0 == start, 1 == end
-        parsed_current_iteration_time_start_end_timestamps = (datetime.datetime.strptime(current_iteration_time_start_end_timestamps[0], '%Y-%m-%d %H:%M:%S'), datetime.datetime.strptime(current_iteration_time_start_end_timestamps[1], '%Y-%m-%d %H:%M:%S'))
-        current_sim23_logs_based_on_iteration_time = []
+        _, wal_logs, additional_wal_logs = next(iteration_audit_logs)
+        quality_check_simulation_run_iteration(sim23_log, idx, len(sim23_log_system_paths), wal_logs, additional_wal_logs, quality_check_logger, info_to_log = info_to_log, logging_path = file_path_name_wal_logging,
+                                               sim23_logs_file_name = sim23_logs_file_name, sim_user_of_interest = sim_user_of_interest, timezone_of_simulation_run = timezone_of_simulation_run)
 
-        for entry in current_sim23_log_entries:
-            # first index of sim 23 log entry start time behavior | second index of sim 23 log entry end time behavior
-            if((entry[0] >= parsed_current_iteration_time_start_end_timestamps[0]) & (entry[1] <= parsed_current_iteration_time_start_end_timestamps[1])):
-                current_sim23_logs_based_on_iteration_time.append(entry)
+    quality_check_logger.info('|%s|%s', info_to_log, 'complete automated windows security audit logs quality evaluation done')
+    if(file_path_name_wal_logging is not None):
+        wal_quality_evaluation.close_quality_check_logger(file_path_name_wal_logging)
 
-        wal_logs = process_wal.load_windows_audit_logs_from_system_folder(pathlib.Path(archived_wals_system_paths[idx][0]), remove_linux_wal_converter_artefacts = False, timezone_of_simulation_run = timezone_of_simulation_run, quality_check_fast_mode_enabled = True)
-        
-        # last iteration in run for specific user -> access archived xml file from next run
-        if(idx == (len(sim23_log_system_paths)-1)):
-            # get complete structure of next run for the same sim user  
-            next_run_complete_system_path_structure = [entry for entry in os.walk(next_simulation_run_system_folder_path)]
-            next_run_archived_wals_system_paths = sorted([entry for entry in next_run_complete_system_path_structure if (any(archived_wal_substring in file for file in entry[2])) & (sim_user_of_interest in entry[0]) & ("convertet_wal" in entry[0])])
-            # get the first archived security file based on file name export timestamps
-            file_to_get = None
-            for file in sorted(next_run_archived_wals_system_paths[0][2]):
-                if(archived_wal_substring in file):
-                    file_to_get = file
-                    # stop if first archived security file is found
-                    break
-            if(file_to_get != None):
-                additional_wal_logs = process_wal.load_windows_audit_logs_from_system_file(pathlib.Path.joinpath(pathlib.Path(next_run_archived_wals_system_paths[0][0]), file_to_get), remove_linux_wal_converter_artefacts = False, timezone_of_simulation_run = timezone_of_simulation_run, quality_check_fast_mode_enabled = True)
-            if(not additional_wal_logs.empty):
-                wal_logs = pd.concat([wal_logs, additional_wal_logs], axis=0).sort_values(by = "SYSTEM_TimeCreated", ignore_index = True)
-            else:
-                logging.warning('|%s', 'last iteration of the run the next run file could not be found')
-        
-        # isn't last iteration in run for specific user -> access archived xml file from next iteration in same run
-        else:
-            # get the first archived security file based on file name export timestamps (for specific user in the next iteration of the simulation run)
-            file_to_get = None
-            for file in sorted(archived_wals_system_paths[idx+1][2]):
-                if(archived_wal_substring in file):
-                    file_to_get = file
-                    # stop if first archived security file is found
-                    break
-            if(file_to_get != None):
-                additional_wal_logs = process_wal.load_windows_audit_logs_from_system_file(pathlib.Path.joinpath(pathlib.Path(archived_wals_system_paths[idx+1][0]), file_to_get), remove_linux_wal_converter_artefacts = False, timezone_of_simulation_run = timezone_of_simulation_run, quality_check_fast_mode_enabled = True)
-            if(not additional_wal_logs.empty):
-                wal_logs = pd.concat([wal_logs, additional_wal_logs], axis = 0).sort_values(by = "SYSTEM_TimeCreated", ignore_index = True)
-            else:
-                logging.warning('|%s|%s|%s', 'iteration index', str(idx), 'next iteration of the current run could not be found')
-       
-        wal_logs = wal_logs[wal_logs['EVENTDATA_SubjectUserName'] == sim_user_of_interest]
-        
-        count_done_checks = wal_quality_evaluation.wal_general_quality_check_handler_sim23_log_based(sim23_logs = current_sim23_logs_based_on_iteration_time, audit_data = wal_logs, logging_path = file_path_name_wal_logging, sim_user_of_interest = sim_user_of_interest, timezone = timezone_of_simulation_run)
-        logging.info('|%s|%s', info_to_log, 'automated windows security audit logs quality evaluation for iteration done')
+def quality_check_simulation_run_iteration(sim23_log_system_path: str, iteration_index: int, number_of_iterations: int, wal_logs: pd.DataFrame, additional_wal_logs: pd.DataFrame, quality_check_logger: logging.Logger,
+                                           info_to_log: str = None, logging_path: pathlib.Path = None, sim23_logs_file_name: str = "sim23.log", sim_user_of_interest: str = None, timezone_of_simulation_run: str = "CET",
+                                           quality_check_records: list = None, log_wal_quality_evaluation: bool = True):
+    """automated quality check of a single simulation run iteration for specified Windows 10 user client
+
+    Args:
+        sim23_log_system_path (str): folder of the sim23 log file of the iteration
+        iteration_index (int): index of the iteration in the simulation run
+        number_of_iterations (int): number of iterations of the simulation run for the simulation user
+        wal_logs (pd.DataFrame): Windows 10 security audit logs of the iteration folder
+        additional_wal_logs (pd.DataFrame): Windows 10 security audit logs of the first archive of the next iteration (empty if not available)
+        quality_check_logger (logging.Logger): logger of the quality check report (see wal_quality_evaluation.get_quality_check_logger)
+        info_to_log (str, optional): run, simulation user and iteration info written into the quality check report. Defaults to None.
+        logging_path (pathlib.Path, optional): path of the quality check report. Defaults to None.
+        sim23_logs_file_name (str): name of sim 23 log file. Defaults to "sim23.log".
+        sim_user_of_interest (str): simulation user of interest. Defaults to None.
+        timezone_of_simulation_run (str): timezone of simulation run. Defaults to "CET".
+        quality_check_records (list, optional): structured result records of the quality checks are appended (see wal_quality_evaluation.build_quality_check_record). Defaults to None (no records).
+        log_wal_quality_evaluation (bool): write results of the single quality checks into the quality check report. Defaults to True.
+
+    Returns:
+        int: count of done quality checks for the iteration
+    """
+    current_sim23_log_entries = parse_sim23_logs.load_sim23_log_data_without_using_predefined_labels(pathlib.Path.joinpath(pathlib.Path(sim23_log_system_path), sim23_logs_file_name))        
+    current_iteration_time_start_end_timestamps = pathlib.Path.joinpath(pathlib.Path(sim23_log_system_path), "iteration.time").read_text().split("#") # index of list: 0 == start, 1 == end
+    parsed_current_iteration_time_start_end_timestamps = (datetime.datetime.strptime(current_iteration_time_start_end_timestamps[0], '%Y-%m-%d %H:%M:%S'), datetime.datetime.strptime(current_iteration_time_start_end_timestamps[1], '%Y-%m-%d %H:%M:%S'))
+    current_sim23_logs_based_on_iteration_time = []
+
+    for entry in current_sim23_log_entries:
+        # first index of sim 23 log entry start time behavior | second index of sim 23 log entry end time behavior
+        if((entry[0] >= parsed_current_iteration_time_start_end_timestamps[0]) & (entry[1] <= parsed_current_iteration_time_start_end_timestamps[1])):
+            current_sim23_logs_based_on_iteration_time.append(entry)
+
+    if(not additional_wal_logs.empty):
+        wal_logs = pd.concat([wal_logs, additional_wal_logs], axis = 0).sort_values(by = "SYSTEM_TimeCreated", ignore_index = True)
+    # last iteration in run for specific user -> archived xml file from next run
+    elif(iteration_index == (number_of_iterations-1)):
+        quality_check_logger.warning('|%s', 'last iteration of the run the next run file could not be found')
+    # isn't last iteration in run for specific user -> archived xml file from next iteration in same run
+    else:
+        quality_check_logger.warning('|%s|%s|%s', 'iteration index', str(iteration_index), 'next iteration of the current run could not be found')
+   
+    wal_logs = wal_logs[wal_logs['EVENTDATA_SubjectUserName'] == sim_user_of_interest]
     
-        # check if all quality checks are done as expected based on count of checks done
-        if(count_done_checks == 54):
-            logging.info('|%s|%s', info_to_log, 'number of done quality checks is equal 54 as expected')
+    count_done_checks = wal_quality_evaluation.wal_general_quality_check_handler_sim23_log_based(sim23_logs = current_sim23_logs_based_on_iteration_time, audit_data = wal_logs, logging_path = logging_path, sim_user_of_interest = sim_user_of_interest, timezone = timezone_of_simulation_run,
+                                                                                                 quality_check_records = quality_check_records, log_wal_quality_evaluation = log_wal_quality_evaluation)
+    quality_check_logger.info('|%s|%s', info_to_log, 'automated windows security audit logs quality evaluation for iteration done')
+
+    # check if all quality checks are done as expected based on count of checks done
+    if(count_done_checks == EXPECTED_NUMBER_OF_QUALITY_CHECKS):
+        quality_check_logger.info('|%s|%s', info_to_log, 'number of done quality checks is equal 54 as expected')
+    else:
+        quality_check_logger.warning('|%s|%s %s', info_to_log, 'number of done quality checks is unequal 54', str(count_done_checks))
+
+    return count_done_checks
+
+def automated_quality_check_simulation_run_iteration(simuser_run_index: dict, iteration_index: int, sim_user_of_interest: str, folder_path_to_log_quality_evaluation_results: pathlib.Path, archived_wal_substring: str = "Archive-Security",
+                                                     sim23_logs_file_name: str = "sim23.log", timezone_of_simulation_run: str = "CET", number_of_parsing_workers: int = 1, parsed_archive_cache_folder: pathlib.Path = None,
+                                                     parsed_archive_cache_max_size_bytes: int = process_wal.PARSED_ARCHIVE_CACHE_DEFAULT_MAX_SIZE_BYTES, write_quality_check_reports: bool = True):
+    """quality check job of a single (simulation run, simulation user, iteration) -> the job has its own logger and quality check report, jobs can run concurrently
+
+    Args:
+        simuser_run_index (dict): index of archive folders and sim23.log folders of the simulation user (see wsal_preprocess_sim_run_into_csv_file.build_simulation_run_index)
+        iteration_index (int): index of the iteration in the simulation run
+        sim_user_of_interest (str): simulation user of interest
+        folder_path_to_log_quality_evaluation_results (pathlib.Path): folder path to save the quality check report of the iteration
+        archived_wal_substring (str): substring always contained in converted Windows 10 security audit logs xml file names. Defaults to "Archive-Security".
+        sim23_logs_file_name (str): name of sim 23 log file. Defaults to "sim23.log".
+        timezone_of_simulation_run (str): timezone of simulation run. Defaults to "CET".
+        number_of_parsing_workers (int): number of processes parsing the XML files of the iteration folder concurrently. Defaults to 1.
+        parsed_archive_cache_folder (pathlib.Path, optional): folder of the on-disk cache of already parsed XML files. Defaults to None (no caching).
+        parsed_archive_cache_max_size_bytes (int): max. size of the parsed archive cache in bytes. Defaults to process_wal.PARSED_ARCHIVE_CACHE_DEFAULT_MAX_SIZE_BYTES.
+        write_quality_check_reports (bool): write the quality check report of the iteration, otherwise only structured result records are returned. Defaults to True.
+
+    Returns:
+        tuple: (summary of the quality check job (dict, row of QUALITY_EVALUATION_JOB_SUMMARIES_FILE_NAME), result records of the single quality checks (list, rows of QUALITY_EVALUATION_CHECK_RESULTS_FILE_NAME))
+    """
+    sim23_log_system_paths = simuser_run_index["sim23_log_system_paths"]
+    next_run_archived_wals_system_paths = simuser_run_index["next_run_archived_wals_system_paths"]
+    # report name: simulation run, simulation user & iteration folder (e.g., Hardware Sim 23 Run 9 [41-45]_SimUser001_iteration_0)
+    info_to_log = "_".join(pathlib.Path(sim23_log_system_paths[iteration_index]).parts[-4:-1])
+    file_path_name_wal_logging = None
+    # without report only warnings are logged (to stderr)
+    quality_check_logger = logging.getLogger(NAME)
+    if(write_quality_check_reports):
+        file_path_name_wal_logging = pathlib.Path.joinpath(pathlib.Path(folder_path_to_log_quality_evaluation_results), (info_to_log + ".log"))
+        # clears content of existing file first
+        open(file_path_name_wal_logging, 'w').close()
+        quality_check_logger = wal_quality_evaluation.get_quality_check_logger(file_path_name_wal_logging)
+        quality_check_logger.info('|%s|%s', NAME, VERSION)
+        quality_check_logger.info('|%s|%s', info_to_log, 'automated windows security audit logs quality evaluation of iteration started')
+    quality_check_records = []
+
+    iteration_audit_logs = process_wal.iterate_windows_audit_logs_of_consecutive_iterations([pathlib.Path(entry[0]) for entry in simuser_run_index["archived_wals_system_paths"][:len(sim23_log_system_paths)]],
+                                                                                            next_run_first_iteration_folder_path = pathlib.Path(next_run_archived_wals_system_paths[0][0]) if next_run_archived_wals_system_paths else None,
+                                                                                            iteration_indices = [iteration_index], archived_wal_substring = archived_wal_substring, timezone_of_simulation_run = timezone_of_simulation_run,
+                                                                                            quality_check_fast_mode_enabled = True, number_of_workers = number_of_parsing_workers, parsed_archive_cache_folder = parsed_archive_cache_folder,
+                                                                                            parsed_archive_cache_max_size_bytes = parsed_archive_cache_max_size_bytes)
+    _, wal_logs, additional_wal_logs = next(iteration_audit_logs)
+    count_done_checks = quality_check_simulation_run_iteration(sim23_log_system_paths[iteration_index], iteration_index, len(sim23_log_system_paths), wal_logs, additional_wal_logs, quality_check_logger, info_to_log = info_to_log,
+                                                               logging_path = file_path_name_wal_logging, sim23_logs_file_name = sim23_logs_file_name, sim_user_of_interest = sim_user_of_interest,
+                                                               timezone_of_simulation_run = timezone_of_simulation_run, quality_check_records = quality_check_records,
+                                                               log_wal_quality_evaluation = write_quality_check_reports)
+    if(write_quality_check_reports):
+        wal_quality_evaluation.close_quality_check_logger(file_path_name_wal_logging)
+
+    quality_evaluation_job_key = {"simulation_run": pathlib.Path(sim23_log_system_paths[iteration_index]).parts[-4], "sim_user": sim_user_of_interest, "iteration_index": iteration_index}
+    quality_check_records = [dict(quality_evaluation_job_key, **quality_check_record) for quality_check_record in quality_check_records]
+    passed_quality_checks = sum([(quality_check_record["order_check"] and quality_check_record["count_check"]) for quality_check_record in quality_check_records])
+
+    return dict(quality_evaluation_job_key, done_quality_checks = count_done_checks, passed_quality_checks = passed_quality_checks, expected_quality_checks = EXPECTED_NUMBER_OF_QUALITY_CHECKS,
+                quality_evaluation_report = "" if file_path_name_wal_logging is None else str(file_path_name_wal_logging)), quality_check_records
+
+def store_quality_evaluation_results(folder_path_to_log_quality_evaluation_results: pathlib.Path, quality_evaluation_results: list, results_file_name: str = QUALITY_EVALUATION_JOB_SUMMARIES_FILE_NAME):
+    """merge summaries (or result records) of quality check jobs into a results file of the report folder (rows of former jobs with the same run, simulation user & iteration are replaced)
+
+    Args:
+        folder_path_to_log_quality_evaluation_results (pathlib.Path): folder path of the quality check reports
+        quality_evaluation_results (list): summaries or result records of quality check jobs (see automated_quality_check_simulation_run_iteration)
+        results_file_name (str): QUALITY_EVALUATION_JOB_SUMMARIES_FILE_NAME (job summaries) or QUALITY_EVALUATION_CHECK_RESULTS_FILE_NAME (result records of the single quality checks). Defaults to QUALITY_EVALUATION_JOB_SUMMARIES_FILE_NAME.
+
+    Returns:
+        pathlib.Path: system path of the results file
+    """
+    quality_evaluation_results_path = pathlib.Path.joinpath(pathlib.Path(folder_path_to_log_quality_evaluation_results), results_file_name)
+    quality_evaluation_results = pd.DataFrame(quality_evaluation_results)
+    if(quality_evaluation_results.empty):
+        return quality_evaluation_results_path
+    if(quality_evaluation_results_path.is_file()):
+        former_quality_evaluation_results = pd.read_csv(quality_evaluation_results_path)
+        replaced_jobs = former_quality_evaluation_results.set_index(QUALITY_EVALUATION_RESULTS_KEY_COLUMNS).index.isin(pd.MultiIndex.from_frame(quality_evaluation_results[QUALITY_EVALUATION_RESULTS_KEY_COLUMNS]))
+        quality_evaluation_results = pd.concat([former_quality_evaluation_results[~replaced_jobs], quality_evaluation_results], axis = 0)
+    # write to temporary file first -> results file is never partially written
+    temporary_quality_evaluation_results_path = quality_evaluation_results_path.with_name(quality_evaluation_results_path.name + "." + str(os.getpid()) + ".tmp")
+    # stable sort keeps the order of the result records of a job
+    quality_evaluation_results.sort_values(by = QUALITY_EVALUATION_RESULTS_KEY_COLUMNS, kind = "stable").to_csv(temporary_quality_evaluation_results_path, index = False)
+    os.replace(temporary_quality_evaluation_results_path, quality_evaluation_results_path)
+
+    return quality_evaluation_results_path
+
+def automated_quality_check_simulation_runs(simulation_run_system_folder_paths: list, folder_path_to_log_quality_evaluation_results: pathlib.Path, next_simulation_run_system_folder_path: pathlib.Path = None,
+                                            sim_users_of_interest: list = None, archived_wal_substring: str = "Archive-Security", sim23_logs_file_name: str = "sim23.log", timezone_of_simulation_run: str = "CET",
+                                            number_of_quality_check_workers: int = 1, number_of_parsing_workers: int = 1, parsed_archive_cache_folder: pathlib.Path = None,
+                                            parsed_archive_cache_max_size_bytes: int = process_wal.PARSED_ARCHIVE_CACHE_DEFAULT_MAX_SIZE_BYTES, write_quality_check_reports: bool = True):
+    """quality check driver: fan out (simulation run, simulation user, iteration) jobs on a pool of worker processes and merge their summaries into QUALITY_EVALUATION_JOB_SUMMARIES_FILE_NAME
+    and the result records of the single quality checks into QUALITY_EVALUATION_CHECK_RESULTS_FILE_NAME
+
+    every job writes its own quality check report, at most number_of_quality_check_workers iterations are held in memory at the same time
+
+    Args:
+        simulation_run_system_folder_paths (list): simulation run folders in recording order (the next simulation run of a run is the following list entry)
+        folder_path_to_log_quality_evaluation_results (pathlib.Path): folder path to save the quality check reports and the results file
+        next_simulation_run_system_folder_path (pathlib.Path, optional): simulation run recorded directly after the last simulation run of simulation_run_system_folder_paths. Defaults to None.
+        sim_users_of_interest (list, optional): simulation users to evaluate. Defaults to None (all simulation users found in the simulation runs).
+        archived_wal_substring (str): substring always contained in converted Windows 10 security audit logs xml file names. Defaults to "Archive-Security".
+        sim23_logs_file_name (str): name of sim 23 log file. Defaults to "sim23.log".
+        timezone_of_simulation_run (str): timezone of the simulation runs. Defaults to "CET".
+        number_of_quality_check_workers (int): number of processes running quality check jobs concurrently (1 -> sequential quality checks). Defaults to 1.
+        number_of_parsing_workers (int): number of processes parsing the XML files of an iteration folder concurrently (per job). Defaults to 1.
+        parsed_archive_cache_folder (pathlib.Path, optional): folder of the on-disk cache of already parsed XML files. Defaults to None (no caching).
+        parsed_archive_cache_max_size_bytes (int): max. size of the parsed archive cache in bytes. Defaults to process_wal.PARSED_ARCHIVE_CACHE_DEFAULT_MAX_SIZE_BYTES.
+        write_quality_check_reports (bool): every job writes a quality check report (text log), otherwise only the results files are written. Defaults to True.
+
+    Returns:
+        pathlib.Path: system path of the results file
+    """
+    quality_check_jobs = []
+    for run_index, simulation_run_system_folder_path in enumerate(simulation_run_system_folder_paths):
+        if(run_index < (len(simulation_run_system_folder_paths) - 1)):
+            next_simulation_run = simulation_run_system_folder_paths[run_index+1]
         else:
-            logging.warning('|%s|%s %s', info_to_log, 'number of done quality checks is unequal 54', str(count_done_checks))
+            next_simulation_run = next_simulation_run_system_folder_path
+        simulation_run_index = wsal_preprocess_sim_run_into_csv_file.build_simulation_run_index(simulation_run_system_folder_path, next_simulation_run, sim_users_of_interest, archived_wal_substring, sim23_logs_file_name)
+        for sim_user in simulation_run_index:
+            for iteration_index in range(len(simulation_run_index[sim_user]["sim23_log_system_paths"])):
+                quality_check_jobs.append((simulation_run_index[sim_user], iteration_index, sim_user))
+    quality_check_parameters = {"folder_path_to_log_quality_evaluation_results": folder_path_to_log_quality_evaluation_results, "archived_wal_substring": archived_wal_substring, "sim23_logs_file_name": sim23_logs_file_name,
+                                "timezone_of_simulation_run": timezone_of_simulation_run, "number_of_parsing_workers": number_of_parsing_workers, "parsed_archive_cache_folder": parsed_archive_cache_folder,
+                                "parsed_archive_cache_max_size_bytes": parsed_archive_cache_max_size_bytes, "write_quality_check_reports": write_quality_check_reports}
+    quality_evaluation_results_path = pathlib.Path.joinpath(pathlib.Path(folder_path_to_log_quality_evaluation_results), QUALITY_EVALUATION_JOB_SUMMARIES_FILE_NAME)
+    number_of_done_jobs = 0
+
+    with progressbar.ProgressBar(max_value=len(quality_check_jobs)) as bar:
+        bar.update(0)
+        if(number_of_quality_check_workers > 1):
+            with concurrent.futures.ProcessPoolExecutor(max_workers = number_of_quality_check_workers) as executor:
+                futures = [executor.submit(automated_quality_check_simulation_run_iteration, simuser_run_index, iteration_index, sim_user, **quality_check_parameters) for simuser_run_index, iteration_index, sim_user in quality_check_jobs]
+                for future in concurrent.futures.as_completed(futures):
+                    # results files are only written by this process, after every job -> results of done jobs are kept if the driver is interrupted
+                    quality_evaluation_job_summary, quality_check_records = future.result()
+                    store_quality_evaluation_results(folder_path_to_log_quality_evaluation_results, quality_check_records, results_file_name = QUALITY_EVALUATION_CHECK_RESULTS_FILE_NAME)
+                    quality_evaluation_results_path = store_quality_evaluation_results(folder_path_to_log_quality_evaluation_results, [quality_evaluation_job_summary])
+                    number_of_done_jobs = number_of_done_jobs + 1
+                    bar.update(number_of_done_jobs)
+        else:
+            for simuser_run_index, iteration_index, sim_user in quality_check_jobs:
+                quality_evaluation_job_summary, quality_check_records = automated_quality_check_simulation_run_iteration(simuser_run_index, iteration_index, sim_user, **quality_check_parameters)
+                store_quality_evaluation_results(folder_path_to_log_quality_evaluation_results, quality_check_records, results_file_name = QUALITY_EVALUATION_CHECK_RESULTS_FILE_NAME)
+                quality_evaluation_results_path = store_quality_evaluation_results(folder_path_to_log_quality_evaluation_results, [quality_evaluation_job_summary])
+                number_of_done_jobs = number_of_done_jobs + 1
+                bar.update(number_of_done_jobs)
+
+    return quality_evaluation_results_path
 
-    logging.info('|%s|%s', info_to_log, 'complete automated windows security audit logs quality evaluation done')
+def main(path_run_to_evaluate:str, path_to_next_run: str, sim_user_of_interest: str, folder_path_quality_evaluation: str, timezone: str, number_of_parsing_workers: int = 1,
+         parsed_archive_cache_folder: str = None, parsed_archive_cache_max_size_bytes: int = process_wal.PARSED_ARCHIVE_CACHE_DEFAULT_MAX_SIZE_BYTES, number_of_quality_check_workers: int = 1,
+         further_runs_to_evaluate: list = None, write_quality_check_reports: bool = True):  
 
-def main(path_run_to_evaluate:str, path_to_next_run: str, sim_user_of_interest: str, folder_path_quality_evaluation: str, timezone: str):  
+    # 'all', several workers or several runs -> quality check driver with a job (and quality check report) per run, simulation user & iteration
+    if((sim_user_of_interest == "all") or (number_of_quality_check_workers > 1) or further_runs_to_evaluate or (not write_quality_check_reports)):
+        # path_to_next_run and all further runs except the last one are evaluated as well
+        simulation_run_system_folder_paths = [pathlib.Path(path_run_to_evaluate)] + ([pathlib.Path(path) for path in [path_to_next_run] + further_runs_to_evaluate[:-1]] if further_runs_to_evaluate else [])
+        automated_quality_check_simulation_runs(simulation_run_system_folder_paths, pathlib.Path(folder_path_quality_evaluation),
+                                                next_simulation_run_system_folder_path = pathlib.Path(further_runs_to_evaluate[-1] if further_runs_to_evaluate else path_to_next_run),
+                                                sim_users_of_interest = None if sim_user_of_interest == "all" else [sim_user_of_interest], timezone_of_simulation_run = timezone,
+                                                number_of_quality_check_workers = number_of_quality_check_workers, number_of_parsing_workers = number_of_parsing_workers,
+                                                parsed_archive_cache_folder = None if parsed_archive_cache_folder is None else pathlib.Path(parsed_archive_cache_folder),
+                                                parsed_archive_cache_max_size_bytes = parsed_archive_cache_max_size_bytes, write_quality_check_reports = write_quality_check_reports)
+        return 0
 
     automated_quality_check_windows_security_audit_logs(simulation_run_system_folder_path = pathlib.Path(path_run_to_evaluate), next_simulation_run_system_folder_path = pathlib.Path(path_to_next_run), 
-                                                        sim_user_of_interest = sim_user_of_interest, folder_path_to_log_quality_evaluation_results = pathlib.Path(folder_path_quality_evaluation), timezone_of_simulation_run = timezone)
+                                                        sim_user_of_interest = sim_user_of_interest, folder_path_to_log_quality_evaluation_results = pathlib.Path(folder_path_quality_evaluation), timezone_of_simulation_run = timezone,
+                                                        number_of_parsing_workers = number_of_parsing_workers, parsed_archive_cache_folder = None if parsed_archive_cache_folder is None else pathlib.Path(parsed_archive_cache_folder),
+                                                        parsed_archive_cache_max_size_bytes = parsed_archive_cache_max_size_bytes)
     return 0
 
 if __name__ == "__main__":
@@ -162,21 +355,36 @@ if __name__ == "__main__":
         Name: %s
         Version: %s
         ---------------------------------------------------------------
-        Usage: python wsal_automated_quality_check_script.py /home/path/to/data/hardware_sim23/"Hardware Sim 23 Run 9 [41-45]" /home/path/to/data/hardware_sim23/"Hardware Sim 23 Run 10 [46-50]" SimUser001 /home/path/to/computation/results/quality_evaluation_logs
+        Usage:  python wsal_automated_quality_check_script.py /home/path/to/data/hardware_sim23/"Hardware Sim 23 Run 9 [41-45]" /home/path/to/data/hardware_sim23/"Hardware Sim 23 Run 10 [46-50]" SimUser001 /home/path/to/computation/results/quality_evaluation_logs CET
+                python wsal_automated_quality_check_script.py /home/path/to/data/hardware_sim23/"Hardware Sim 23 Run 9 [41-45]" /home/path/to/data/hardware_sim23/"Hardware Sim 23 Run 10 [46-50]" all /home/path/to/computation/results/quality_evaluation_logs CET --further_runs_to_evaluate /home/path/to/data/hardware_sim23/"Hardware Sim 23 Run 11 [51-55]" --number_of_quality_check_workers 8
         ''')%(NAME, VERSION)))
 
         parser.add_argument('path_run_to_evaluate', type = str, help = "system path to simulation run to evaluate (type:str) (e.g., /home/path/to/data/Hardware Sim 23 Run 9 [41-45])")
         parser.add_argument('path_to_next_run', type = str, help = "system path to simulation run directly recorded after the run evaluated with this script (type:str) (e.g., /home/path/to/data/Hardware Sim 23 Run 10 [46-50])")
-        parser.add_argument('sim_user', type = str, help = "simulation user of interest (type:str) (e.g., SimUser001)")
+        parser.add_argument('sim_user', type = str, help = "simulation user of interest or 'all' to evaluate all simulation users of the run(s) (type:str) (e.g., SimUser001)")
         parser.add_argument('folder_path_quality_evaluation', type = str, help = "folder path to create quality check reports in (type:str) (e.g., /home/path/to/computation/results/quality_evaluation_logs/)")
         parser.add_argument('timezone_of_simulation_run', type = str, help = "timezone in which the simulation run of interest was recorded (type:str) (CET or CEST)")
+        parser.add_argument('--number_of_parsing_workers', type = int, default = 1, help = "number of processes parsing the XML files of an iteration folder concurrently (type:int) (default: 1)")
+        parser.add_argument('--parsed_archive_cache_folder', type = str, default = None, help = "folder path of the on-disk cache of already parsed XML files (type:str) (default: None -> no caching)")
+        parser.add_argument('--parsed_archive_cache_max_size_bytes', type = int, default = process_wal.PARSED_ARCHIVE_CACHE_DEFAULT_MAX_SIZE_BYTES, help = "max. size of the parsed archive cache in bytes (type:int) (default: %d)"%(process_wal.PARSED_ARCHIVE_CACHE_DEFAULT_MAX_SIZE_BYTES))
+        parser.add_argument('--number_of_quality_check_workers', type = int, default = 1, help = "number of processes running quality check jobs (run, simulation user, iteration) concurrently, every job writes its own quality check report and the job summaries are merged into %s (type:int) (default: 1)"%(QUALITY_EVALUATION_JOB_SUMMARIES_FILE_NAME))
+        parser.add_argument('--further_runs_to_evaluate', type = str, nargs = '+', default = None, help = "further simulation runs recorded directly after path_to_next_run in recording order, path_to_next_run and all further runs except the last one are evaluated as well (type:str)")
+        parser.add_argument('--disable_quality_check_reports', action = 'store_true', help = "do not write quality check reports (text logs), results are only written into %s and %s"%(QUALITY_EVALUATION_JOB_SUMMARIES_FILE_NAME, QUALITY_EVALUATION_CHECK_RESULTS_FILE_NAME))
         args = parser.parse_args()
         path_run_to_evaluate_cmd = args.path_run_to_evaluate
         path_to_next_run_cmd = args.path_to_next_run
         sim_user_cmd = args.sim_user
         folder_path_quality_evaluation_cmd = args.folder_path_quality_evaluation
         timezone_of_simulation_run_cmd = args.timezone_of_simulation_run
-        return_code = main(path_run_to_evaluate_cmd, path_to_next_run_cmd, sim_user_cmd, folder_path_quality_evaluation_cmd, timezone_of_simulation_run_cmd)
+        number_of_parsing_workers_cmd = args.number_of_parsing_workers
+        parsed_archive_cache_folder_cmd = args.parsed_archive_cache_folder
+        parsed_archive_cache_max_size_bytes_cmd = args.parsed_archive_cache_max_size_bytes
+        number_of_quality_check_workers_cmd = args.number_of_quality_check_workers
+        further_runs_to_evaluate_cmd = args.further_runs_to_evaluate
+        write_quality_check_reports_cmd = not args.disable_quality_check_reports
+        return_code = main(path_run_to_evaluate_cmd, path_to_next_run_cmd, sim_user_cmd, folder_path_quality_evaluation_cmd, timezone_of_simulation_run_cmd, number_of_parsing_workers_cmd,
+                           parsed_archive_cache_folder_cmd, parsed_archive_cache_max_size_bytes_cmd, number_of_quality_check_workers_cmd, further_runs_to_evaluate_cmd,
+                           write_quality_check_reports_cmd)
         quit(return_code)
     else:
         main()
\ No newline at end of file
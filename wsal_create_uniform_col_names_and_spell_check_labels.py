@@ -2,16 +2,19 @@ import os
 import pathlib
 import pandas as pd 
 import progressbar
-import numpy as np
 import argparse
 import sys
 import textwrap
 import logging
+import gzip
+import concurrent.futures
 from rich.logging import RichHandler        
 
+from wal_data_store import wal_data_store
+
 
 NAME = "Create Uniform Column Names for All Sub Data Set Samples Script"
-VERSION = "1.0.0"
+VERSION = "1.3.0"
 
 DEFAULT_LOG_FILE = None
 DEFAULT_DATE_LOG_FORMAT = "%Y-%m-%d %H:%M:%S"
@@ -22,6 +25,9 @@ DEFAULT_LOG_FILE_FORMAT:str = '[%(asctime)s.%(msecs)6d][%(levelname)s] %(message
 DEFAULT_LOG_CONSOLE_LEVEL:int = logging.DEBUG
 DEFAULT_LOG_CONSOLE_FORMAT:int = '[%(asctime)s.%(msecs)6d][%(levelname)s] %(message)s'
 LOGGER:logging.Logger = None
+DEFAULT_NUMBER_OF_WORKERS:int = 1
+# None -> sub data sets are loaded completely, otherwise number of rows per block of the streaming rewrite
+DEFAULT_STREAMING_BLOCK_SIZE_ROWS:int = None
 
 LogLevel:dict = {
     "DEBUG":logging.DEBUG,
@@ -55,7 +61,10 @@ def create_logger(log_console_level:int=DEFAULT_LOG_CONSOLE_LEVEL, log_console_f
 
 def load_windows_security_auditing_logs_for_simuser_iteration(os_path_simuser_iteration: pathlib.Path, limited_rows: bool = False):
     
-    if(limited_rows):
+    if(pathlib.Path(os_path_simuser_iteration).suffix == wal_data_store.DATA_STORE_FILE_SUFFIX):
+        # partitioned data store -> only the row groups of the first 1000 rows are read in limited mode
+        wsal_df = wal_data_store.load_data_set(pathlib.Path(os_path_simuser_iteration), row_range=(0, 1000) if limited_rows else None).astype("string")
+    elif(limited_rows):
         wsal_df = pd.read_csv(pathlib.Path(os_path_simuser_iteration), dtype="string", nrows=1000, compression='gzip')
     else:
         wsal_df = pd.read_csv(pathlib.Path(os_path_simuser_iteration), dtype="string", compression='gzip')
@@ -68,10 +77,10 @@ def load_windows_security_auditing_logs_for_simuser_iteration(os_path_simuser_it
     return wsal_df
 
 def get_uniform_column_values_and_event_ids_for_parsed_windows_security_audit_log_sub_data_sets(folder_path: pathlib.Path):
-    """get uniform column names and event ids from all sub data sets in a folder path containing multiple sub data sets in gzip format
+    """get uniform column names and event ids from all sub data sets in a folder path containing multiple sub data sets in gzip format (or a partitioned data store)
 
     Args:
-        folder_path: (pathilib.Path): folder path containing multiple sub data sets in gzip format
+        folder_path: (pathilib.Path): folder path containing multiple sub data sets in gzip format (or root folder of a partitioned data store)
 
     Returns:
         tuple:  list of event ids, list of uniform column names
@@ -80,14 +89,14 @@ def get_uniform_column_values_and_event_ids_for_parsed_windows_security_audit_lo
     column_names = []
     event_ids = []
 
-    folder_content = os.listdir(folder_path)
-    length = len([file_name for file_name in folder_content if ((".gz" in file_name))])
+    folder_content = wal_data_store.list_data_set_file_names(folder_path)
+    length = len(folder_content)
     counter = 0
 
     with progressbar.ProgressBar(max_value=length) as bar:
         bar.update(counter)
-        for sub_path in folder_path.iterdir():
-            if((sub_path.is_file()) & (".gz" in str(sub_path))):
+        for sub_path in [pathlib.Path.joinpath(folder_path, file_name) for file_name in folder_content]:
+            if(sub_path.is_file()):
 
                 loaded_wsal_sub_data_set = load_windows_security_auditing_logs_for_simuser_iteration(os_path_simuser_iteration = sub_path, limited_rows= True)
                 column_names_sub_data_set = list(loaded_wsal_sub_data_set.columns.values)
@@ -102,69 +111,165 @@ def get_uniform_column_values_and_event_ids_for_parsed_windows_security_audit_lo
     
     return event_ids, column_names
 
-def apply_uniform_column_names_to_sub_data_set_samples_and_save_data_in_gzip_format(folder_path_to_load_processed_sub_data_sets: pathlib.Path, uniform_column_names: list, folder_path_to_save_sub_data_sets_with_uniform_column_names: pathlib.Path):
-    """apply uniform column names to all sub data set samples and save back the processed sub data sets in gzip format
+def apply_uniform_column_names_to_sub_data_set_block(wsal_sub_data_set: pd.DataFrame, uniform_column_names: list):
+    """add missing uniform columns (NaN values), reorder columns & correct spelling of labels of a sub data set (or a block of its rows)
 
     Args:
-        folder_path_to_load_processed_sub_data_sets (pathilib.Path): folder path containing multiple sub data sets in gzip format
-        uniform_column_names (list): list of uniform column names to apply to all sub data set samples
-        folder_path_to_save_sub_data_sets_with_uniform_column_names (pathilib.Path): folder path to save back the processed sub data sets with uniform column names in gzip format
+        wsal_sub_data_set (pd.DataFrame): loaded sub data set or block of rows of a sub data set
+        uniform_column_names (list): list of uniform column names to apply
 
     Returns:
-        -
+        pd.DataFrame: sub data set (block) with uniform columns sorted by name
     """
+    # add missing columns with NaN values and reorder columns to match uniform column names
+    wsal_sub_data_set = wsal_sub_data_set.reindex(columns=sorted(set(wsal_sub_data_set.columns.values) | set(uniform_column_names)))
 
-    folder_content = os.listdir(folder_path_to_load_processed_sub_data_sets)
-    length = len([file_name for file_name in folder_content if ((".gz" in file_name))])
-    counter = 0
-    with progressbar.ProgressBar(max_value=length) as bar:
-        bar.update(counter)
-        for sub_path in folder_path_to_load_processed_sub_data_sets.iterdir():
-            if((sub_path.is_file()) & (".gz" in str(sub_path))):
-                loaded_wsal_sub_data_set = load_windows_security_auditing_logs_for_simuser_iteration(os_path_simuser_iteration = sub_path)
+    # add spelling check for column names here if needed
+    wsal_sub_data_set['Labels'] = wsal_sub_data_set['Labels'].str.replace("recieve", "receive")
 
-                column_names_sub_data_set = list(loaded_wsal_sub_data_set.columns.values)
-                
-                # check which uniform columns are missing in sub data set 
-                missing_columns = list(set(uniform_column_names) - set(column_names_sub_data_set))
+    return wsal_sub_data_set
 
-                # add missing columns with NaN values
-                for missing_col in missing_columns:
-                    loaded_wsal_sub_data_set[missing_col] = np.nan
+def rewrite_sub_data_set_with_uniform_column_names_in_blocks(sub_path: pathlib.Path, save_path: pathlib.Path, uniform_column_names: list, streaming_block_size_rows: int):
+    """apply uniform column names to a gzip compressed sub data set block by block (at most streaming_block_size_rows rows in memory), statistics are gathered block-wise
 
-                # reorder columns to match uniform column names
-                loaded_wsal_sub_data_set.sort_index(axis=1, inplace=True)
+    Args:
+        sub_path (pathlib.Path): system path of the sub data set (gzip compressed CSV file)
+        save_path (pathlib.Path): system path to save the processed sub data set
+        uniform_column_names (list): list of uniform column names to apply
+        streaming_block_size_rows (int): number of rows per block
 
-                # get final column names after processing
-                column_names_sub_data_set = list(loaded_wsal_sub_data_set.columns.values)
+    Returns:
+        tuple: (column names, statistics (see wal_data_store.build_data_set_statistics)) or None if the rows are not sorted by SYSTEM_TimeCreated (sorting requires the complete sub data set)
+    """
+    column_names = None
+    statistics = None
+    last_time_created = None
+    # write to temporary file first -> the sub data set can be rewritten in place and is never left partially written
+    temporary_save_path = save_path.with_name(save_path.stem + "." + str(os.getpid()) + ".tmp")
+    with gzip.open(temporary_save_path, "wt", newline="") as output_file:
+        for wsal_block in pd.read_csv(sub_path, dtype="string", compression='gzip', chunksize=streaming_block_size_rows):
+            wsal_block["SYSTEM_TimeCreated"] = pd.to_datetime(wsal_block["SYSTEM_TimeCreated"]).dt.tz_localize(None)
+            if((not wsal_block["SYSTEM_TimeCreated"].is_monotonic_increasing) or ((last_time_created is not None) and (not wsal_block.empty) and (wsal_block["SYSTEM_TimeCreated"].iloc[0] < last_time_created))):
+                statistics = None
+                break
+            wsal_block = apply_uniform_column_names_to_sub_data_set_block(wsal_block, uniform_column_names)
+            wsal_block.to_csv(output_file, index=False, header=(column_names is None))
+            block_statistics = wal_data_store.build_data_set_statistics(wsal_block)
+            statistics = block_statistics if(statistics is None) else wal_data_store.merge_data_set_statistics(statistics, block_statistics)
+            column_names = list(wsal_block.columns.values)
+            if(not wsal_block.empty):
+                last_time_created = wsal_block["SYSTEM_TimeCreated"].iloc[-1]
+    if(statistics is None):
+        temporary_save_path.unlink()
+        return None
+    os.replace(temporary_save_path, save_path)
+    wal_data_store.store_data_set_statistics(statistics, save_path)
+
+    return column_names, statistics
+
+def rewrite_sub_data_set_with_uniform_column_names(sub_path: pathlib.Path, save_path: pathlib.Path, uniform_column_names: list, streaming_block_size_rows: int = DEFAULT_STREAMING_BLOCK_SIZE_ROWS):
+    """apply uniform column names to a sub data set and save it (gzip compressed CSV file or partition of the data store) together with its statistics
+
+    gzip compressed sub data sets are streamed block by block if streaming_block_size_rows is set and the rows are already sorted by SYSTEM_TimeCreated (e.g., converted by wsal_preprocess_sim_run_into_csv_file.py), otherwise the complete sub data set is loaded
+
+    Args:
+        sub_path (pathlib.Path): system path of the sub data set
+        save_path (pathlib.Path): system path to save the processed sub data set
+        uniform_column_names (list): list of uniform column names to apply
+        streaming_block_size_rows (int, optional): number of rows per block of the streaming rewrite. Defaults to DEFAULT_STREAMING_BLOCK_SIZE_ROWS (no streaming).
+
+    Returns:
+        dict: sub data set name, column names, statistics & streamed (True if the sub data set was rewritten block by block)
+    """
+    if((streaming_block_size_rows is not None) and (sub_path.suffix != wal_data_store.DATA_STORE_FILE_SUFFIX)):
+        streaming_result = rewrite_sub_data_set_with_uniform_column_names_in_blocks(sub_path, save_path, uniform_column_names, streaming_block_size_rows)
+        if(streaming_result is not None):
+            return {"sub_data_set_name": sub_path.name, "column_names": streaming_result[0], "statistics": streaming_result[1], "streamed": True}
+
+    loaded_wsal_sub_data_set = apply_uniform_column_names_to_sub_data_set_block(load_windows_security_auditing_logs_for_simuser_iteration(os_path_simuser_iteration = sub_path), uniform_column_names)
+    # save back the processed sub data set
+    if(sub_path.suffix == wal_data_store.DATA_STORE_FILE_SUFFIX):
+        wal_data_store.write_data_set_partition(loaded_wsal_sub_data_set, save_path)
+    else:
+        loaded_wsal_sub_data_set.to_csv(save_path, index=False, compression='gzip')
+    # labels are changed by the spelling check -> refresh statistics of the saved sub data set
+    statistics = wal_data_store.build_data_set_statistics(loaded_wsal_sub_data_set)
+    wal_data_store.store_data_set_statistics(statistics, save_path)
 
-                # verify if columns match
-                not_matching_columns = list(set(uniform_column_names) - set(column_names_sub_data_set)) + list(set(column_names_sub_data_set) - set(uniform_column_names))
+    return {"sub_data_set_name": sub_path.name, "column_names": list(loaded_wsal_sub_data_set.columns.values), "statistics": statistics, "streamed": False}
 
-                LOGGER.info("After processing %s , uniform column values not in sub data set remaining:  %s"%(sub_path.name, str(not_matching_columns)))
+def log_rewritten_sub_data_set(rewrite_result: dict, uniform_column_names: list, streaming_block_size_rows: int = DEFAULT_STREAMING_BLOCK_SIZE_ROWS):
+    """log columns, event ids, labels & shape of a rewritten sub data set (based on its statistics)
 
-                LOGGER.info("%s included event ids:  %s"%(sub_path.name, str(loaded_wsal_sub_data_set["SYSTEM_EventID"].unique().tolist())))
+    Args:
+        rewrite_result (dict): return value of rewrite_sub_data_set_with_uniform_column_names
+        uniform_column_names (list): list of uniform column names applied
+        streaming_block_size_rows (int, optional): number of rows per block of the streaming rewrite. Defaults to DEFAULT_STREAMING_BLOCK_SIZE_ROWS (no streaming).
+    """
+    sub_data_set_name = rewrite_result["sub_data_set_name"]
+    column_names_sub_data_set = rewrite_result["column_names"]
+    statistics = rewrite_result["statistics"]
+
+    if((streaming_block_size_rows is not None) and (not rewrite_result["streamed"]) and (not sub_data_set_name.endswith(wal_data_store.DATA_STORE_FILE_SUFFIX))):
+        LOGGER.warning("%s is not sorted by SYSTEM_TimeCreated, sub data set was loaded completely instead of streaming it"%(sub_data_set_name))
+
+    # verify if columns match
+    not_matching_columns = list(set(uniform_column_names) - set(column_names_sub_data_set)) + list(set(column_names_sub_data_set) - set(uniform_column_names))
+
+    LOGGER.info("After processing %s , uniform column values not in sub data set remaining:  %s"%(sub_data_set_name, str(not_matching_columns)))
 
-                LOGGER.info("%s value count included event ids (%s unique event ids included):  %s"%(sub_path.name,str(len(loaded_wsal_sub_data_set["SYSTEM_EventID"].unique().tolist())), str(loaded_wsal_sub_data_set["SYSTEM_EventID"].value_counts().to_string().replace("\n", "; "))))
+    LOGGER.info("%s included event ids:  %s"%(sub_data_set_name, str(list(statistics["event_id_counts"].keys()))))
 
-                # add spelling check for column names here if needed
-                loaded_wsal_sub_data_set['Labels'] = loaded_wsal_sub_data_set['Labels'].str.replace("recieve", "receive")
+    event_id_counts = pd.Series(statistics["event_id_counts"], dtype="int64", name="count").rename_axis("SYSTEM_EventID")
+    LOGGER.info("%s value count included event ids (%s unique event ids included):  %s"%(sub_data_set_name, str(len(event_id_counts.index)), str(event_id_counts.to_string().replace("\n", "; "))))
 
-                LOGGER.info("%s included behavior 'Labels' (total %s labels):  %s"%(sub_path.name, str(len(loaded_wsal_sub_data_set["Labels"].unique().tolist())), str(loaded_wsal_sub_data_set["Labels"].unique().tolist())))
+    LOGGER.info("%s included behavior 'Labels' (total %s labels):  %s"%(sub_data_set_name, str(len(statistics["label_counts"])), str(list(statistics["label_counts"].keys()))))
 
-                LOGGER.info("%s DataFrame shape:  %s"%(sub_path.name, str(loaded_wsal_sub_data_set.shape)))
-                # save back the processed sub data set
-                loaded_wsal_sub_data_set.to_csv(pathlib.Path.joinpath(folder_path_to_save_sub_data_sets_with_uniform_column_names, sub_path.name), index=False, compression='gzip')
+    LOGGER.info("%s DataFrame shape:  %s"%(sub_data_set_name, str((statistics["number_of_rows"], len(column_names_sub_data_set)))))
+
+def apply_uniform_column_names_to_sub_data_set_samples_and_save_data_in_gzip_format(folder_path_to_load_processed_sub_data_sets: pathlib.Path, uniform_column_names: list, folder_path_to_save_sub_data_sets_with_uniform_column_names: pathlib.Path,
+                                                                                    number_of_workers: int = DEFAULT_NUMBER_OF_WORKERS, streaming_block_size_rows: int = DEFAULT_STREAMING_BLOCK_SIZE_ROWS):
+    """apply uniform column names to all sub data set samples and save back the processed sub data sets in gzip format (sub data sets of a partitioned data store are saved back in the same partitioned format)
+
+    Args:
+        folder_path_to_load_processed_sub_data_sets (pathilib.Path): folder path containing multiple sub data sets in gzip format (or root folder of a partitioned data store)
+        uniform_column_names (list): list of uniform column names to apply to all sub data set samples
+        folder_path_to_save_sub_data_sets_with_uniform_column_names (pathilib.Path): folder path to save back the processed sub data sets with uniform column names in gzip format (or partitioned format)
+        number_of_workers (int): number of processes rewriting sub data sets concurrently (1 -> sequential rewrite). Defaults to DEFAULT_NUMBER_OF_WORKERS.
+        streaming_block_size_rows (int, optional): number of rows per block, gzip compressed sub data sets are read and written block by block (bounded memory usage). Defaults to DEFAULT_STREAMING_BLOCK_SIZE_ROWS (sub data sets are loaded completely).
 
+    Returns:
+        -
+    """
+
+    folder_content = wal_data_store.list_data_set_file_names(folder_path_to_load_processed_sub_data_sets)
+    length = len(folder_content)
+    counter = 0
+    sub_paths_to_rewrite = [(pathlib.Path.joinpath(folder_path_to_load_processed_sub_data_sets, file_name), pathlib.Path.joinpath(folder_path_to_save_sub_data_sets_with_uniform_column_names, file_name)) for file_name in folder_content]
+    sub_paths_to_rewrite = [(sub_path, save_path) for sub_path, save_path in sub_paths_to_rewrite if(sub_path.is_file())]
+    with progressbar.ProgressBar(max_value=length) as bar:
+        bar.update(counter)
+        if(number_of_workers > 1):
+            with concurrent.futures.ProcessPoolExecutor(max_workers = number_of_workers) as executor:
+                futures = [executor.submit(rewrite_sub_data_set_with_uniform_column_names, sub_path, save_path, uniform_column_names, streaming_block_size_rows) for sub_path, save_path in sub_paths_to_rewrite]
+                for future in concurrent.futures.as_completed(futures):
+                    log_rewritten_sub_data_set(future.result(), uniform_column_names, streaming_block_size_rows)
+                    counter = counter + 1
+                    bar.update(counter)
+        else:
+            for sub_path, save_path in sub_paths_to_rewrite:
+                log_rewritten_sub_data_set(rewrite_sub_data_set_with_uniform_column_names(sub_path, save_path, uniform_column_names, streaming_block_size_rows), uniform_column_names, streaming_block_size_rows)
                 counter = counter + 1
-            bar.update(counter)
+                bar.update(counter)
 
 
 def main(hardware_sim_os_path_folder_to_load_all_processed_sub_data_sets_with_non_uniform_columns: str,
         hardware_sim_os_path_folder_to_save_all_processed_sub_data_sets_with_uniform_columns: str,
         software_sim_os_path_folder_to_load_all_processed_sub_data_sets_with_non_uniform_columns: str,
         software_sim_os_path_folder_to_save_all_processed_sub_data_sets_with_uniform_columns: str,
-        simulation_run_data_to_process: str = "hardware_simulation"):
+        simulation_run_data_to_process: str = "hardware_simulation",
+        number_of_workers: int = DEFAULT_NUMBER_OF_WORKERS,
+        streaming_block_size_rows: int = DEFAULT_STREAMING_BLOCK_SIZE_ROWS):
 
     try:
         LOGGER.info("Start %s v%s"%(NAME, VERSION))
@@ -178,13 +283,15 @@ def main(hardware_sim_os_path_folder_to_load_all_processed_sub_data_sets_with_no
             LOGGER.info("Hardware simulation extracted uniformn column values from all sub data sets (total %s column values):  %s"%(str(len(hardware_sim_column_names)), str(hardware_sim_column_names)))
             apply_uniform_column_names_to_sub_data_set_samples_and_save_data_in_gzip_format(folder_path_to_load_processed_sub_data_sets = pathlib.Path(hardware_sim_os_path_folder_to_load_all_processed_sub_data_sets_with_non_uniform_columns), 
                                                                                             uniform_column_names = combined_column_names,
-                                                                                            folder_path_to_save_sub_data_sets_with_uniform_column_names = pathlib.Path(hardware_sim_os_path_folder_to_save_all_processed_sub_data_sets_with_uniform_columns))
+                                                                                            folder_path_to_save_sub_data_sets_with_uniform_column_names = pathlib.Path(hardware_sim_os_path_folder_to_save_all_processed_sub_data_sets_with_uniform_columns),
+                                                                                            number_of_workers = number_of_workers, streaming_block_size_rows = streaming_block_size_rows)
         
         elif(simulation_run_data_to_process == "software_simulation"):
             LOGGER.info("Software simulation extracted uniformn column values from all sub data sets (total %s column values):  %s"%(str(len(software_sim_column_names)), str(software_sim_column_names)))
             apply_uniform_column_names_to_sub_data_set_samples_and_save_data_in_gzip_format(folder_path_to_load_processed_sub_data_sets = pathlib.Path(software_sim_os_path_folder_to_load_all_processed_sub_data_sets_with_non_uniform_columns), 
                                                                                             uniform_column_names = combined_column_names,
-                                                                                            folder_path_to_save_sub_data_sets_with_uniform_column_names = pathlib.Path(software_sim_os_path_folder_to_save_all_processed_sub_data_sets_with_uniform_columns))
+                                                                                            folder_path_to_save_sub_data_sets_with_uniform_column_names = pathlib.Path(software_sim_os_path_folder_to_save_all_processed_sub_data_sets_with_uniform_columns),
+                                                                                            number_of_workers = number_of_workers, streaming_block_size_rows = streaming_block_size_rows)
         LOGGER.info("Completed %s v%s"%(NAME, VERSION))
 
     except Exception as e:
@@ -200,6 +307,7 @@ if __name__ == "__main__":
     Version: %s
     ---------------------------------------------------------------
     Usage: python wsal_create_uniform_col_names_and_spell_check_labels.py /home/hardware_sim_data_non_uniform_cols/  /home/hardware_sim_data_uniform_cols/ /home/software_sim_data_non_uniform_cols/  /home/software_sim_data_uniform_cols/ hardware_simulation
+           python wsal_create_uniform_col_names_and_spell_check_labels.py /home/hardware_sim_data_non_uniform_cols/  /home/hardware_sim_data_uniform_cols/ /home/software_sim_data_non_uniform_cols/  /home/software_sim_data_uniform_cols/ hardware_simulation --number_of_workers 4 --streaming_block_size_rows 500000
     ''')%(NAME, VERSION)))
     
     parser.add_argument('hardware_sim_os_path_folder_to_load_all_processed_sub_data_sets_with_non_uniform_columns', type = str, help = "system path which includes compressed (gzip) Windows 10 security audit log files for hardware simulation (type:str) (e.g., /home/hardware_sim_data_non_uniform_cols/)")
@@ -209,6 +317,8 @@ if __name__ == "__main__":
     parser.add_argument('software_sim_os_path_folder_to_save_all_processed_sub_data_sets_with_uniform_columns', type = str, help = "system path, to store Windows 10 security audit log files with uniform columns for software simulation (type:str) (e.g., /home/software_sim_data_uniform_cols/)")
 
     parser.add_argument('simulation_run_data_to_process', type = str, help = "'hardware_simulation' or 'software_simulation' to data folder to create uniform column values for", default="hardware_simulation")
+    parser.add_argument('--number_of_workers', type = int, default = DEFAULT_NUMBER_OF_WORKERS, help = "number of processes rewriting sub data sets concurrently (type:int) (default: %s)"%(str(DEFAULT_NUMBER_OF_WORKERS)))
+    parser.add_argument('--streaming_block_size_rows', type = int, default = DEFAULT_STREAMING_BLOCK_SIZE_ROWS, help = "number of rows per block, gzip compressed sub data sets sorted by SYSTEM_TimeCreated are read and written block by block to bound memory usage (type:int) (default: None -> sub data sets are loaded completely)")
     
     args = parser.parse_args()
     
@@ -218,6 +328,8 @@ if __name__ == "__main__":
     software_sim_os_path_folder_to_load_all_processed_sub_data_sets_with_non_uniform_columns_cmd = args.software_sim_os_path_folder_to_load_all_processed_sub_data_sets_with_non_uniform_columns
     software_sim_os_path_folder_to_save_all_processed_sub_data_sets_with_uniform_columns_cmd = args.software_sim_os_path_folder_to_save_all_processed_sub_data_sets_with_uniform_columns
     simulation_run_data_to_process_cmd = args.simulation_run_data_to_process
+    number_of_workers_cmd = args.number_of_workers
+    streaming_block_size_rows_cmd = args.streaming_block_size_rows
     
     if(simulation_run_data_to_process_cmd == "hardware_simulation"):
         DEFAULT_LOG_FILE = HARDWARE_SIM_DEFAULT_LOG_FILE
@@ -231,6 +343,8 @@ if __name__ == "__main__":
                        hardware_sim_os_path_folder_to_save_all_processed_sub_data_sets_with_uniform_columns = hardware_sim_os_path_folder_to_save_all_processed_sub_data_sets_with_uniform_columns_cmd,
                        software_sim_os_path_folder_to_load_all_processed_sub_data_sets_with_non_uniform_columns = software_sim_os_path_folder_to_load_all_processed_sub_data_sets_with_non_uniform_columns_cmd,
                        software_sim_os_path_folder_to_save_all_processed_sub_data_sets_with_uniform_columns = software_sim_os_path_folder_to_save_all_processed_sub_data_sets_with_uniform_columns_cmd,
-                       simulation_run_data_to_process = simulation_run_data_to_process_cmd)
+                       simulation_run_data_to_process = simulation_run_data_to_process_cmd,
+                       number_of_workers = number_of_workers_cmd,
+                       streaming_block_size_rows = streaming_block_size_rows_cmd)
     
     quit(return_code)
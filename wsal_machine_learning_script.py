@@ -1,23 +1,54 @@
 import argparse
 import textwrap
 import pandas as pd
+import numpy as np
 import pathlib
-import os
 import logging
 import resource
+import os
+import concurrent.futures
+import tempfile
 
 from machine_learning import classification_ml_wsal
 from machine_learning import encodings_wsal
-from sklearn.preprocessing import LabelEncoder, MinMaxScaler
+from machine_learning import encoded_feature_store_wsal
+from wal_data_store import wal_data_store
+from pandas.api.types import union_categoricals
+from sklearn.preprocessing import LabelEncoder
 from sklearn.model_selection import train_test_split
 
 NAME = "WSAL MAIN MACHINE LEARNING SCRIPT"
-VERSION = "1.11"
+VERSION = "1.19"
 CMD_MODE_ENABLED = True
 
 # NOTICE: software run has one more file _rerun_09_ which is excluded at this point to train each model with equal amount of data set for each simulation (hardware or software)
 VALID_HARDWARE_RUNS = ["_Run_2_", "_Run_8_", "_Run_9_", "_Run_10_", "_Run_11_", "_Run_12_"]
 VALID_SOFTWARE_RUNS = ["_rerun_01_", "_rerun_02_", "_rerun_03_", "_rerun_04_", "_rerun_06_", "_rerun_07_"]
+SOFTWARE_SIM_PATH_TAG = "valid_software_sim23"
+HARDWARE_SIM_PATH_TAG = "valid_hardware_sim23"
+# only these columns are needed for the encoding -> all other (event data) columns are never parsed
+RAW_DATA_SET_COLUMN_TYPES = {"SYSTEM_TimeCreated": "object", "SYSTEM_EventID": "int64", "Labels": "category"}
+DEFAULT_NUMBER_OF_DATA_SET_LOADING_WORKERS = min(8, os.cpu_count() or 1)
+# granular label substring -> general label, checked in this order (first matching entry wins, e.g. encrypt copy -> copy, encrypt decrypt -> encrypt)
+GENERAL_WSAL_LABELS = ["copy", "peertube", "programming", "chatting", "mailing", "mutillidae", "encrypt"]
+NO_BEHAVIOR_LABEL = "no_label"
+DEFAULT_ENCODED_FEATURE_STORE_PATH = pathlib.Path.joinpath(pathlib.Path(__file__).with_name('machine_learning'), "encoded_feature_store")
+
+def get_general_wsal_label(label):
+    """map a single granular behavior label to its general behavior label (e.g. encrypt decrypt -> encrypt, encrypt copy -> copy)
+
+    Args:
+        label (str): granular behavior label
+
+    Returns:
+        str: general behavior label (unchanged label if no general label matches)
+    """
+    general_label = label
+    for general_wsal_label in GENERAL_WSAL_LABELS:
+        if(general_wsal_label in general_label):
+            general_label = general_wsal_label
+
+    return general_label
 
 def apply_general_wsal_labels(dataframe: pd.DataFrame):
     """apply general labeling on loaded windows security audit logs (e.g. [encrypt copy, encrypt decrypt, encrypt copy] -> [encrypt, encrypt, encrypt])
@@ -28,14 +59,38 @@ def apply_general_wsal_labels(dataframe: pd.DataFrame):
     Returns:
         pd.DataFrame: general labeled windows security audit logs
     """
-    data = dataframe.copy()
-    data.loc[data['Labels'].str.contains('copy', regex = False, na = False), 'Labels'] = 'copy'
-    data.loc[data['Labels'].str.contains('peertube', regex = False, na = False), 'Labels'] = 'peertube'
-    data.loc[data['Labels'].str.contains('programming', regex = False, na = False), 'Labels'] = 'programming'
-    data.loc[data['Labels'].str.contains('chatting', regex = False, na = False), 'Labels'] = 'chatting'
-    data.loc[data['Labels'].str.contains('mailing', regex = False, na = False), 'Labels'] = 'mailing'
-    data.loc[data['Labels'].str.contains('mutillidae', regex = False, na = False), 'Labels'] = 'mutillidae'
-    data.loc[data['Labels'].str.contains('encrypt', regex = False, na = False), 'Labels'] = 'encrypt'
+    data = dataframe.copy(deep = False)
+    labels = data['Labels'].astype("category")
+    # mapping is computed once per unique label -> rows are only remapped by their category codes
+    general_labels = [get_general_wsal_label(label) for label in labels.cat.categories]
+    general_label_categories, general_label_codes = np.unique(np.array(general_labels, dtype = object), return_inverse = True)
+    codes = labels.cat.codes.to_numpy()
+    # missing labels keep code -1
+    codes = np.where(codes >= 0, general_label_codes[np.maximum(codes, 0)], -1)
+    data['Labels'] = pd.Categorical.from_codes(codes, categories = general_label_categories)
+
+    return data
+
+def remove_no_behavior_labels_and_duplicates(dataframe: pd.DataFrame):
+    """remove events without behavior label (no_label or missing label) and duplicated events, both steps work on the categorical label codes
+
+    Args:
+        dataframe (pd.DataFrame): loaded windows security audit logs (columns SYSTEM_TimeCreated, SYSTEM_EventID & Labels)
+
+    Returns:
+        pd.DataFrame: windows security audit logs with behavior labels only & without duplicates
+    """
+    labels = dataframe['Labels'].astype("category")
+    codes = labels.cat.codes.to_numpy()
+    no_behavior_label_categories = labels.cat.categories.astype(str).str.contains(NO_BEHAVIOR_LABEL, regex = False)
+    no_behavior_label_codes = np.flatnonzero(no_behavior_label_categories)
+    behavior_label_rows = (codes >= 0) & ~np.isin(codes, no_behavior_label_codes)
+    # duplicates based on integer columns only (timestamps as int64, event ids, label codes)
+    duplicated_rows = pd.DataFrame({"SYSTEM_TimeCreated": dataframe['SYSTEM_TimeCreated'].to_numpy(dtype = "datetime64[ns]").view(np.int64), "SYSTEM_EventID": dataframe['SYSTEM_EventID'].to_numpy(),
+                                    "Labels": codes})[behavior_label_rows].duplicated().to_numpy()
+    rows_to_keep = np.flatnonzero(behavior_label_rows)[~duplicated_rows]
+    data = dataframe.iloc[rows_to_keep].copy()
+    data['Labels'] = labels.iloc[rows_to_keep].cat.remove_unused_categories()
 
     return data
 
@@ -44,7 +99,7 @@ def load_simuser_specific_data_set_all_runs_of_a_complete_simulation(system_path
     """load complete hardware or software simulation run of a specific simulation user based on compressed csv file format
 
     Args:
-        system_path_with_csv_wsal_files (pathlib.Path): system path to load specifc pre-parsed (csv files compressed with gzip) Windows 10 security audit log files from
+        system_path_with_csv_wsal_files (pathlib.Path): system path to load specifc pre-parsed (csv files compressed with gzip or partitioned data store) Windows 10 security audit log files from
         sim_user_of_interest (str): simulation user of interest
         label_mode (str): define granularity of behavior labels (two modes possible: general_label_mode, granular_label_mode) -> general label mode includes only high level labels without differentiating between subbehavior patterns (e.g. encrypt -> no differentiation between encrypt copy, decrpyt encrypt and delete)
         time_window_event_grouping (str): size of time windows to group events based on seconds (max. value for time windows 55s)
@@ -53,43 +108,202 @@ def load_simuser_specific_data_set_all_runs_of_a_complete_simulation(system_path
     Returns:
         pd.DataFrame: loaded and preprocessed windows audit logs
     """
-    software_sim_path_tag = "valid_software_sim23"
-    hardware_sim_path_tag = "valid_hardware_sim23"
+    loaded_wsal_from_csv_files = load_simuser_specific_raw_data_set_all_runs_of_a_complete_simulation(system_path_with_csv_wsal_files, sim_user_of_interest, label_mode)
+    loaded_wsal_from_csv_files = encodings_wsal.encode_wsal_data_container_time_window_based_event_ids_only(loaded_wsal_from_csv_files, time_window_event_grouping)
+
+    return label_encode_time_window_encoded_data_set(loaded_wsal_from_csv_files, system_path_with_csv_wsal_files, sim_user_of_interest, system_path_to_store_label_encoding)
+
+def load_simuser_specific_data_set_all_runs_of_a_complete_simulation_from_feature_store(system_path_with_csv_wsal_files: pathlib.Path, sim_user_of_interest: str, label_mode: str, time_window_event_grouping: str,
+                                                                                        system_path_to_store_label_encoding: pathlib.Path, encoded_feature_store_path: pathlib.Path = DEFAULT_ENCODED_FEATURE_STORE_PATH):
+    """load time window encoded hardware or software simulation run of a specific simulation user from the encoded feature store,
+    the data set is only loaded & encoded (and stored in the feature store) if no entry with the same key & source files exists
+
+    Args:
+        system_path_with_csv_wsal_files (pathlib.Path): system path to load specifc pre-parsed Windows 10 security audit log files from
+        sim_user_of_interest (str): simulation user of interest
+        label_mode (str): define granularity of behavior labels (two modes possible: general_label_mode, granular_label_mode)
+        time_window_event_grouping (str): size of time windows to group events based on seconds
+        system_path_to_store_label_encoding (pathlib.Path): system path to store label encoding
+        encoded_feature_store_path (pathlib.Path, optional): root folder of the encoded feature store, None loads & encodes without feature store. Defaults to DEFAULT_ENCODED_FEATURE_STORE_PATH.
+
+    Returns:
+        pd.DataFrame: loaded and preprocessed windows audit logs
+    """
+    if(encoded_feature_store_path is None):
+        return load_simuser_specific_data_set_all_runs_of_a_complete_simulation(system_path_with_csv_wsal_files, sim_user_of_interest, label_mode, time_window_event_grouping, system_path_to_store_label_encoding)
+
+    entry_name = encoded_feature_store_wsal.build_encoded_feature_store_entry_name(get_simulation_type(system_path_with_csv_wsal_files), sim_user_of_interest, build_encoding_name(time_window_event_grouping, label_mode))
+    fingerprint = compute_simuser_specific_source_data_set_fingerprint(system_path_with_csv_wsal_files, sim_user_of_interest)
+    encoded_feature_store_entry = encoded_feature_store_wsal.load_encoded_feature_store_entry(encoded_feature_store_path, entry_name, fingerprint)
+    if(encoded_feature_store_entry is not None):
+        logging.debug('%s|%s|%s',"Loaded encoded data set from feature store", encoded_feature_store_path, entry_name)
+        loaded_wsal_from_csv_files, metadata = encoded_feature_store_entry
+        store_label_encoding(metadata["label_encoding"], system_path_with_csv_wsal_files, sim_user_of_interest, system_path_to_store_label_encoding)
+        return loaded_wsal_from_csv_files
+
+    loaded_wsal_from_csv_files = load_simuser_specific_raw_data_set_all_runs_of_a_complete_simulation(system_path_with_csv_wsal_files, sim_user_of_interest, label_mode)
+    loaded_wsal_from_csv_files = encodings_wsal.encode_wsal_data_container_time_window_based_event_ids_only(loaded_wsal_from_csv_files, time_window_event_grouping)
+    label_encoding_name_mapping = build_label_encoding(loaded_wsal_from_csv_files['Labels'])
+    loaded_wsal_from_csv_files = label_encode_time_window_encoded_data_set(loaded_wsal_from_csv_files, system_path_with_csv_wsal_files, sim_user_of_interest, system_path_to_store_label_encoding)
+    store_encoded_data_set_in_feature_store(loaded_wsal_from_csv_files, label_encoding_name_mapping, system_path_with_csv_wsal_files, sim_user_of_interest, label_mode, time_window_event_grouping, encoded_feature_store_path, fingerprint)
+
+    return loaded_wsal_from_csv_files
+
+def store_encoded_data_set_in_feature_store(encoded_data: pd.DataFrame, label_encoding_name_mapping: dict, system_path_with_csv_wsal_files: pathlib.Path, sim_user_of_interest: str, label_mode: str, time_window_event_grouping: str,
+                                            encoded_feature_store_path: pathlib.Path, fingerprint: str = None):
+    """store time window & label encoded data set of a specific simulation user in the encoded feature store
+
+    Args:
+        encoded_data (pd.DataFrame): time window & label encoded windows audit logs
+        label_encoding_name_mapping (dict): label encoding of the data set (see build_label_encoding)
+        system_path_with_csv_wsal_files (pathlib.Path): system path the windows audit logs are loaded from
+        sim_user_of_interest (str): simulation user of interest
+        label_mode (str): data labeling model (general_label_mode, granular_label_mode)
+        time_window_event_grouping (str): size of time windows to group events
+        encoded_feature_store_path (pathlib.Path): root folder of the encoded feature store
+        fingerprint (str, optional): fingerprint of the source files. Defaults to None (computed).
+
+    Returns:
+        pathlib.Path: system path of the stored encoded data
+    """
+    if(fingerprint is None):
+        fingerprint = compute_simuser_specific_source_data_set_fingerprint(system_path_with_csv_wsal_files, sim_user_of_interest)
+    entry_name = encoded_feature_store_wsal.build_encoded_feature_store_entry_name(get_simulation_type(system_path_with_csv_wsal_files), sim_user_of_interest, build_encoding_name(time_window_event_grouping, label_mode))
+    metadata = {"simulation_type": get_simulation_type(system_path_with_csv_wsal_files), "sim_user_of_interest": sim_user_of_interest, "label_mode": label_mode, "time_window_event_grouping": time_window_event_grouping,
+                "source_path": str(system_path_with_csv_wsal_files), "label_encoding": {str(label): int(code) for label, code in label_encoding_name_mapping.items()}}
+
+    return encoded_feature_store_wsal.store_encoded_feature_store_entry(encoded_feature_store_path, entry_name, fingerprint, encoded_data, metadata)
+
+def get_simulation_type(system_path_with_csv_wsal_files: pathlib.Path):
+    """get simulation type of a system path with Windows 10 security audit log files based on its path tag
+
+    Args:
+        system_path_with_csv_wsal_files (pathlib.Path): system path with Windows 10 security audit log files (includes SOFTWARE_SIM_PATH_TAG or HARDWARE_SIM_PATH_TAG)
+
+    Returns:
+        str: software_simulation or hardware_simulation
+    """
+    return "software_simulation" if SOFTWARE_SIM_PATH_TAG in str(system_path_with_csv_wsal_files) else "hardware_simulation"
+
+def list_simuser_specific_wsal_files(system_path_with_csv_wsal_files: pathlib.Path, sim_user_of_interest: str):
+    """list Windows 10 security audit log files of the valid simulation runs of a specific simulation user
+
+    Args:
+        system_path_with_csv_wsal_files (pathlib.Path): system path with pre-parsed (csv files compressed with gzip or partitioned data store) Windows 10 security audit log files
+        sim_user_of_interest (str): simulation user of interest
+
+    Returns:
+        list: file names (or paths relative to system_path_with_csv_wsal_files)
+    """
+    software_sim_path_tag = SOFTWARE_SIM_PATH_TAG
+    hardware_sim_path_tag = HARDWARE_SIM_PATH_TAG
 
-    wsal_files = [entry[2] for entry in os.walk(system_path_with_csv_wsal_files)]
+    wsal_files = wal_data_store.list_data_set_file_names(system_path_with_csv_wsal_files)
     wsal_files_sim_user_specific = []
     # software sim path
     if(software_sim_path_tag in str(system_path_with_csv_wsal_files)):
-        wsal_files_sim_user_specific = [entry for entry in wsal_files[0] if((sim_user_of_interest in entry) and (any(True for substring in VALID_SOFTWARE_RUNS if(substring in entry))))]
+        wsal_files_sim_user_specific = [entry for entry in wsal_files if((sim_user_of_interest in entry) and (any(True for substring in VALID_SOFTWARE_RUNS if(substring in entry))))]
         
     # hardware sim path
     elif(hardware_sim_path_tag in str(system_path_with_csv_wsal_files)):
-        wsal_files_sim_user_specific = [entry for entry in wsal_files[0] if((sim_user_of_interest in entry) and (any(True for substring in VALID_HARDWARE_RUNS if(substring in entry))))]
-        
-    loaded_wsal_from_csv_files = pd.DataFrame()
-    
-    for idx, file in enumerate(wsal_files_sim_user_specific):
-        print(idx)
-        data = pd.read_csv(pathlib.Path.joinpath(pathlib.Path(system_path_with_csv_wsal_files), file), compression = "gzip")[['SYSTEM_TimeCreated', 'SYSTEM_EventID', 'Labels']]
-        loaded_wsal_from_csv_files = pd.concat([loaded_wsal_from_csv_files, data], copy = False, ignore_index = True, axis = 0)
-        loaded_wsal_from_csv_files["SYSTEM_TimeCreated"] = pd.to_datetime(loaded_wsal_from_csv_files["SYSTEM_TimeCreated"]).dt.tz_localize(None)
-        loaded_wsal_from_csv_files = loaded_wsal_from_csv_files.sort_values(by = "SYSTEM_TimeCreated", ignore_index = True)
+        wsal_files_sim_user_specific = [entry for entry in wsal_files if((sim_user_of_interest in entry) and (any(True for substring in VALID_HARDWARE_RUNS if(substring in entry))))]
+
+    return wsal_files_sim_user_specific
+
+def compute_simuser_specific_source_data_set_fingerprint(system_path_with_csv_wsal_files: pathlib.Path, sim_user_of_interest: str):
+    """compute fingerprint of the source files an encoding of a specific simulation user is based on (see encoded_feature_store_wsal.compute_source_data_set_fingerprint)
+
+    Args:
+        system_path_with_csv_wsal_files (pathlib.Path): system path with pre-parsed Windows 10 security audit log files
+        sim_user_of_interest (str): simulation user of interest
+
+    Returns:
+        str: fingerprint of the source files, encoding & labeling code
+    """
+    return encoded_feature_store_wsal.compute_source_data_set_fingerprint([pathlib.Path.joinpath(pathlib.Path(system_path_with_csv_wsal_files), file) for file in list_simuser_specific_wsal_files(system_path_with_csv_wsal_files, sim_user_of_interest)],
+                                                                          code_versions = [encodings_wsal.VERSION, ",".join(GENERAL_WSAL_LABELS), NO_BEHAVIOR_LABEL])
+
+def load_raw_data_set_file(wsal_file_system_path: pathlib.Path):
+    """load typed columns SYSTEM_TimeCreated (datetime without timezone), SYSTEM_EventID (int64) & Labels (categorical) of a single sub data set
+
+    Args:
+        wsal_file_system_path (pathlib.Path): system path of the sub data set (csv file compressed with gzip or partition of the data store)
+
+    Returns:
+        pd.DataFrame: loaded sub data set
+    """
+    data = wal_data_store.load_data_set(wsal_file_system_path, columns = list(RAW_DATA_SET_COLUMN_TYPES.keys()), column_types = RAW_DATA_SET_COLUMN_TYPES)[list(RAW_DATA_SET_COLUMN_TYPES.keys())]
+    data["SYSTEM_TimeCreated"] = pd.to_datetime(data["SYSTEM_TimeCreated"]).dt.tz_localize(None)
+
+    return data
+
+def concat_raw_data_sets(data_sets: list):
+    """concatenate loaded sub data sets at once, categorical labels of all sub data sets are unified (no fallback to object columns)
+
+    Args:
+        data_sets (list): sub data sets loaded with load_raw_data_set_file
+
+    Returns:
+        pd.DataFrame: concatenated sub data sets (columns SYSTEM_TimeCreated, SYSTEM_EventID & Labels)
+    """
+    if(len(data_sets) == 0):
+        return pd.DataFrame({column_name: pd.Series(dtype = ("datetime64[ns]" if(column_name == "SYSTEM_TimeCreated") else column_type)) for column_name, column_type in RAW_DATA_SET_COLUMN_TYPES.items()})
+    labels = union_categoricals([data["Labels"] for data in data_sets])
+    concatenated_data_sets = pd.concat([data.drop(columns = ["Labels"]) for data in data_sets], copy = False, ignore_index = True, axis = 0)
+    concatenated_data_sets["Labels"] = labels
+
+    return concatenated_data_sets
+
+def load_simuser_specific_raw_data_set_all_runs_of_a_complete_simulation(system_path_with_csv_wsal_files: pathlib.Path, sim_user_of_interest: str, label_mode: str,
+                                                                         number_of_loading_workers: int = DEFAULT_NUMBER_OF_DATA_SET_LOADING_WORKERS):
+    """load complete hardware or software simulation run of a specific simulation user without encoding (raw events, labeled & without duplicates)
+
+    Args:
+        system_path_with_csv_wsal_files (pathlib.Path): system path to load specifc pre-parsed (csv files compressed with gzip or partitioned data store) Windows 10 security audit log files from
+        sim_user_of_interest (str): simulation user of interest
+        label_mode (str): define granularity of behavior labels (two modes possible: general_label_mode, granular_label_mode)
+        number_of_loading_workers (int, optional): number of files loaded concurrently. Defaults to DEFAULT_NUMBER_OF_DATA_SET_LOADING_WORKERS.
+
+    Returns:
+        pd.DataFrame: loaded windows audit logs (columns SYSTEM_TimeCreated, SYSTEM_EventID & Labels)
+    """
+    wsal_files_sim_user_specific = list_simuser_specific_wsal_files(system_path_with_csv_wsal_files, sim_user_of_interest)
+
+    # load files concurrently (decompression & parsing release the GIL) -> single concatenation & sort afterwards
+    with concurrent.futures.ThreadPoolExecutor(max_workers = max(1, number_of_loading_workers)) as executor:
+        loaded_data_sets = list(executor.map(load_raw_data_set_file, [pathlib.Path.joinpath(pathlib.Path(system_path_with_csv_wsal_files), file) for file in wsal_files_sim_user_specific]))
+    logging.debug('%s|%s|%s|%s',"Number of loaded files", system_path_with_csv_wsal_files, sim_user_of_interest, len(loaded_data_sets))
+    loaded_wsal_from_csv_files = concat_raw_data_sets(loaded_data_sets)
+    del loaded_data_sets
+    loaded_wsal_from_csv_files = loaded_wsal_from_csv_files.sort_values(by = "SYSTEM_TimeCreated", kind = "stable", ignore_index = True)
 
     # optional labeling
     if(label_mode == "general_label_mode"):
         loaded_wsal_from_csv_files = apply_general_wsal_labels(dataframe = loaded_wsal_from_csv_files)
     # 82 per client -> total for all machines 91 labels
-    # remove default label which indicates no bot behavior incldued
-    loaded_wsal_from_csv_files = loaded_wsal_from_csv_files[loaded_wsal_from_csv_files["Labels"].str.contains('no_label', regex = False) == False]
+    # remove default label which indicates no bot behavior incldued & drop duplicates from initial file loading
+    logging.debug('%s|%s|%s|%s',"Shape before removing events without behavior label and dropping duplicate entries from data set", system_path_with_csv_wsal_files, sim_user_of_interest, loaded_wsal_from_csv_files.shape)
 
-    logging.debug('%s|%s|%s|%s',"Shape before dropping duplicate entries from data set", system_path_with_csv_wsal_files, sim_user_of_interest, loaded_wsal_from_csv_files.shape)
-
-    # drop duplicates from initial file loading
-    loaded_wsal_from_csv_files = loaded_wsal_from_csv_files.drop_duplicates()
+    loaded_wsal_from_csv_files = remove_no_behavior_labels_and_duplicates(loaded_wsal_from_csv_files)
     
     logging.debug('%s|%s|%s|%s',"Shape after dropping duplicate entries from data set", system_path_with_csv_wsal_files, sim_user_of_interest, loaded_wsal_from_csv_files.shape)
 
-    loaded_wsal_from_csv_files = encodings_wsal.encode_wsal_data_container_time_window_based_event_ids_only(loaded_wsal_from_csv_files, time_window_event_grouping)
+    return loaded_wsal_from_csv_files
+
+def label_encode_time_window_encoded_data_set(loaded_wsal_from_csv_files: pd.DataFrame, system_path_with_csv_wsal_files: pathlib.Path, sim_user_of_interest: str, system_path_to_store_label_encoding: pathlib.Path,
+                                              label_encoding_file_suffix: str = ""):
+    """generate nummerical data labels of time window encoded windows audit logs and store the label encoding
+
+    Args:
+        loaded_wsal_from_csv_files (pd.DataFrame): time window encoded windows audit logs (see encodings_wsal.encode_wsal_data_container_time_window_based_event_ids_only)
+        system_path_with_csv_wsal_files (pathlib.Path): system path the windows audit logs are loaded from (hardware or software simulation)
+        sim_user_of_interest (str): simulation user of interest
+        system_path_to_store_label_encoding (pathlib.Path): system path to store label encoding 
+        label_encoding_file_suffix (str): suffix of the label encoding file name (e.g., to store label encodings of several time window sizes). Defaults to "".
+
+    Returns:
+        pd.DataFrame: encoded windows audit logs with nummerical labels
+    """
     # drop timestamp
     loaded_wsal_from_csv_files.drop('SYSTEM_TimeCreated', inplace=True, axis=1) 
     # generate nummerical data labels
@@ -98,10 +312,7 @@ def load_simuser_specific_data_set_all_runs_of_a_complete_simulation(system_path
 
     # store labeling encoding schema for later ml preprocessing
     label_encoding_name_mapping = dict(zip(label_encoder.classes_, label_encoder.transform(label_encoder.classes_)))
-    if(software_sim_path_tag in str(system_path_with_csv_wsal_files)):
-        pd.DataFrame([label_encoding_name_mapping]).to_csv(pathlib.Path.joinpath(system_path_to_store_label_encoding, software_sim_path_tag + "_" + sim_user_of_interest + "_" + "label_encoding" + ".csv"))
-    elif(hardware_sim_path_tag in str(system_path_with_csv_wsal_files)):
-        pd.DataFrame([label_encoding_name_mapping]).to_csv(pathlib.Path.joinpath(system_path_to_store_label_encoding, hardware_sim_path_tag + "_" + sim_user_of_interest + "_" + "label_encoding" + ".csv"))
+    store_label_encoding(label_encoding_name_mapping, system_path_with_csv_wsal_files, sim_user_of_interest, system_path_to_store_label_encoding, label_encoding_file_suffix)
 
     y_data_software_sim = pd.Series(data=encoded_labels, name = 'Labels')
     loaded_wsal_from_csv_files.drop('Labels', axis=1, inplace=True)
@@ -110,6 +321,37 @@ def load_simuser_specific_data_set_all_runs_of_a_complete_simulation(system_path
 
     return loaded_wsal_from_csv_files 
 
+def build_label_encoding(labels: pd.Series):
+    """build label encoding of time window encoded windows audit logs (same encoding as label_encode_time_window_encoded_data_set)
+
+    Args:
+        labels (pd.Series): labels of the time windows
+
+    Returns:
+        dict: label -> nummerical label
+    """
+    label_encoder = LabelEncoder()
+    label_encoder.fit(labels)
+
+    return dict(zip(label_encoder.classes_, label_encoder.transform(label_encoder.classes_)))
+
+def store_label_encoding(label_encoding_name_mapping: dict, system_path_with_csv_wsal_files: pathlib.Path, sim_user_of_interest: str, system_path_to_store_label_encoding: pathlib.Path, label_encoding_file_suffix: str = ""):
+    """store label encoding schema for later ml preprocessing
+
+    Args:
+        label_encoding_name_mapping (dict): label -> nummerical label
+        system_path_with_csv_wsal_files (pathlib.Path): system path the windows audit logs are loaded from (hardware or software simulation)
+        sim_user_of_interest (str): simulation user of interest
+        system_path_to_store_label_encoding (pathlib.Path): system path to store label encoding
+        label_encoding_file_suffix (str): suffix of the label encoding file name. Defaults to "".
+    """
+    software_sim_path_tag = SOFTWARE_SIM_PATH_TAG
+    hardware_sim_path_tag = HARDWARE_SIM_PATH_TAG
+    if(software_sim_path_tag in str(system_path_with_csv_wsal_files)):
+        pd.DataFrame([label_encoding_name_mapping]).to_csv(pathlib.Path.joinpath(system_path_to_store_label_encoding, software_sim_path_tag + "_" + sim_user_of_interest + "_" + "label_encoding" + label_encoding_file_suffix + ".csv"))
+    elif(hardware_sim_path_tag in str(system_path_with_csv_wsal_files)):
+        pd.DataFrame([label_encoding_name_mapping]).to_csv(pathlib.Path.joinpath(system_path_to_store_label_encoding, hardware_sim_path_tag + "_" + sim_user_of_interest + "_" + "label_encoding" + label_encoding_file_suffix + ".csv"))
+
 def save_non_zero_count_columns_dataframe(dataframe: pd.DataFrame, file_to_write_results: pathlib.Path):
     """write number of dataframe non-zero column values to text file 
 
@@ -122,6 +364,97 @@ def save_non_zero_count_columns_dataframe(dataframe: pd.DataFrame, file_to_write
     file_to_write_results.touch()
     file_to_write_results.write_text(info_as_string_value)
 
+def build_encoding_name(time_windows_event_grouping: str, label_mode: str):
+    """build name of an encoding (used in file names of pre-encoded data)
+
+    Args:
+        time_windows_event_grouping (str): size of time windows for event grouping (e.g., s, 15s)
+        label_mode (str): data labeling model (general_label_mode, granular_label_mode)
+
+    Returns:
+        str: encoding name (e.g., 1s_time_windows_size_general_label_mode)
+    """
+    encoding_name = time_windows_event_grouping + "_time_windows_size_" + label_mode 
+
+    if(time_windows_event_grouping == "s"):
+        # only replace first occurance of 's' in encoding name
+        encoding_name = encoding_name.replace("s_", "1s_", 1)
+
+    return encoding_name
+
+def save_multi_resolution_encodings(system_path_with_csv_wsal_files: pathlib.Path, sim_user_of_interest: str, label_mode: str, time_windows_event_groupings: list,
+                                    system_path_to_store_label_encoding: pathlib.Path, system_path_to_save_encoded_data: pathlib.Path, encoded_feature_store_path: pathlib.Path = None):
+    """encode and save a complete hardware or software simulation run of a specific simulation user for several time window sizes with a single data load
+    (finest time windows are encoded once, coarser time windows are aggregated from the finest event id counts)
+
+    Args:
+        system_path_with_csv_wsal_files (pathlib.Path): system path to load specifc pre-parsed Windows 10 security audit log files from
+        sim_user_of_interest (str): simulation user of interest
+        label_mode (str): data labeling model (general_label_mode, granular_label_mode)
+        time_windows_event_groupings (list): sizes of time windows for event grouping (e.g., ["s", "15s", "30s"]), every size has to be a multiple of the smallest size
+        system_path_to_store_label_encoding (pathlib.Path): system path to store label encodings (one file per time window size)
+        system_path_to_save_encoded_data (pathlib.Path): system path to store the encoded data (same file names as the pre-encoded data)
+        encoded_feature_store_path (pathlib.Path, optional): root folder of the encoded feature store the encodings are stored in as well. Defaults to None (not stored).
+
+    Returns:
+        list: system paths of the stored encoded data
+    """
+    simulation_name = get_simulation_type(system_path_with_csv_wsal_files)
+    loaded_wsal_from_csv_files = load_simuser_specific_raw_data_set_all_runs_of_a_complete_simulation(system_path_with_csv_wsal_files, sim_user_of_interest, label_mode)
+    encoded_data = encodings_wsal.encode_wsal_data_container_time_window_based_event_ids_only_multi_resolution(loaded_wsal_from_csv_files, time_windows_event_groupings)
+    loaded_wsal_from_csv_files = None
+
+    stored_encoded_data = []
+    for time_windows_event_grouping in time_windows_event_groupings:
+        encoding_name = build_encoding_name(time_windows_event_grouping, label_mode)
+        sim_data = encoded_data.pop(time_windows_event_grouping)
+        label_encoding_name_mapping = build_label_encoding(sim_data['Labels'])
+        sim_data = label_encode_time_window_encoded_data_set(sim_data, system_path_with_csv_wsal_files, sim_user_of_interest, system_path_to_store_label_encoding,
+                                                             label_encoding_file_suffix = "_" + encoding_name)
+        if(encoded_feature_store_path is not None):
+            store_encoded_data_set_in_feature_store(sim_data, label_encoding_name_mapping, system_path_with_csv_wsal_files, sim_user_of_interest, label_mode, time_windows_event_grouping, encoded_feature_store_path)
+        file_name_save_encoded_data = "pre_encoded_data_" + simulation_name + "_" + sim_user_of_interest + "_" + encoding_name + ".gz"
+        sim_data.to_csv(pathlib.Path.joinpath(pathlib.Path(system_path_to_save_encoded_data), file_name_save_encoded_data), index = False, compression = "gzip")
+        stored_encoded_data.append(pathlib.Path.joinpath(pathlib.Path(system_path_to_save_encoded_data), file_name_save_encoded_data))
+
+    return stored_encoded_data
+
+def build_model_evaluation_configuration(feature_matrix_path: pathlib.Path, columns: np.ndarray, train_rows: np.ndarray, test_rows: np.ndarray, y_train: np.ndarray, y_test: np.ndarray, scaler, encoding_name: str, data_set_name: str):
+    """build data set configuration which references the shared feature matrix (see classification_ml_wsal.load_model_evaluation_data)
+
+    Args:
+        feature_matrix_path (pathlib.Path): system path of the shared feature matrix
+        columns (np.ndarray): feature columns of the data set
+        train_rows (np.ndarray): rows of the training data
+        test_rows (np.ndarray): rows of the test data
+        y_train (np.ndarray): labels of the training data
+        y_test (np.ndarray): labels of the test data
+        scaler: fitted min-max scaler or None (no scaling)
+        encoding_name (str): name of data encoding
+        data_set_name (str): name of data set
+
+    Returns:
+        dict: data set configuration
+    """
+    return {"feature_matrix_path": feature_matrix_path, "columns": columns, "train_rows": train_rows, "test_rows": test_rows, "scaler": scaler,
+            "y_train": y_train, "y_test": y_test, "encoding_name": encoding_name, "data_set_name": data_set_name}
+
+def print_model_evaluation_configuration(evaluation_description: str, train_simulation: str, test_simulation: str, model_evaluation_configuration: dict):
+    """print train & test data information of a data set configuration
+
+    Args:
+        evaluation_description (str): description of the evaluation (e.g., inter evaluation software and hardware simulation)
+        train_simulation (str): simulation of the training data (hardware or software)
+        test_simulation (str): simulation of the test data (hardware or software)
+        model_evaluation_configuration (dict): data set configuration (see build_model_evaluation_configuration)
+    """
+    print(evaluation_description + " -> train data: " + train_simulation + " simulation data")
+    print(evaluation_description + " -> test data: " + test_simulation + " simulation data")
+    print(evaluation_description + " -> train data (" + train_simulation + " simulation data) -> unique labels: " + str(set(model_evaluation_configuration["y_train"])))
+    print(evaluation_description + " -> test data (" + test_simulation + " simulation data) -> unique labels: " + str(set(model_evaluation_configuration["y_test"])))
+    print(evaluation_description + " -> train data (" + train_simulation + " simulation data) -> shape: " + str((len(model_evaluation_configuration["train_rows"]), len(model_evaluation_configuration["columns"]))))
+    print(evaluation_description + " -> test data (" + test_simulation + " simulation data) -> shape: " + str((len(model_evaluation_configuration["test_rows"]), len(model_evaluation_configuration["columns"]))))
+
 def limit_memory_usage(maxsize: int): 
     """set limit of RAM to use (works only with Linux)
 
@@ -132,7 +465,8 @@ def limit_memory_usage(maxsize: int):
     resource.setrlimit(resource.RLIMIT_AS, (maxsize, hard))
 
 def main(system_path_gzip_folder_hardware_sim: str = None, system_path_gzip_folder_software_sim: str = None, system_path_to_store_ml_results: str = None, sim_user_of_interest: str = None, label_mode: str = "general_label_mode", time_windows_event_grouping: str = "s",
-         max_ram_usage: int = 0, system_path_to_save_encoded_data: str = "skip_saving_encoding", load_pre_encoded_dummy_data: str = "dont_load_dummy_data"):
+         max_ram_usage: int = 0, system_path_to_save_encoded_data: str = "skip_saving_encoding", load_pre_encoded_dummy_data: str = "dont_load_dummy_data",
+         number_of_model_evaluation_workers: int = classification_ml_wsal.DEFAULT_NUMBER_OF_MODEL_EVALUATION_WORKERS, encoded_feature_store_path: str = str(DEFAULT_ENCODED_FEATURE_STORE_PATH)):
     
     logging.basicConfig(filename=pathlib.Path(__file__).with_name('warnings.log'), level = logging.DEBUG, format = '%(asctime)s - %(levelname)s - %(message)s', datefmt = "%d/%m/%Y %H:%M:%S")
     logging.captureWarnings(True)
@@ -142,12 +476,19 @@ def main(system_path_gzip_folder_hardware_sim: str = None, system_path_gzip_fold
     # create result sub fold if it does not exist (separated by simulation user)
     if(not system_path_to_store_results_with_sub_folder.is_dir()):
         pathlib.Path.mkdir(system_path_to_store_results_with_sub_folder)
+    # skip_feature_store -> always load & encode the data sets
+    encoded_feature_store_path = None if(encoded_feature_store_path == "skip_feature_store") else pathlib.Path(encoded_feature_store_path)
 
-    encoding_name = time_windows_event_grouping + "_time_windows_size_" + label_mode 
+    # several time window sizes (e.g., s,15s,30s) -> only encode & save all time window sizes with a single data load per simulation
+    if("," in time_windows_event_grouping):
+        if(system_path_to_save_encoded_data == "skip_saving_encoding"):
+            raise ValueError("multi-resolution encoding requires a system path to save the encoded data")
+        for system_path_with_csv_wsal_files in [system_path_gzip_folder_software_sim, system_path_gzip_folder_hardware_sim]:
+            save_multi_resolution_encodings(pathlib.Path(system_path_with_csv_wsal_files), sim_user_of_interest, label_mode, time_windows_event_grouping.split(","),
+                                            system_path_to_store_results_with_sub_folder, pathlib.Path(system_path_to_save_encoded_data), encoded_feature_store_path)
+        return 0
 
-    if(time_windows_event_grouping == "s"):
-        # only replace first occurance of 's' in encoding name
-        encoding_name = encoding_name.replace("s_", "1s_", 1)
+    encoding_name = build_encoding_name(time_windows_event_grouping, label_mode)
 
     ####################################
     #                                  #
@@ -155,8 +496,9 @@ def main(system_path_gzip_folder_hardware_sim: str = None, system_path_gzip_fold
     #                                  #
     ####################################
     if(load_pre_encoded_dummy_data == "dont_load_dummy_data"):
-        software_sim_data = load_simuser_specific_data_set_all_runs_of_a_complete_simulation(system_path_with_csv_wsal_files = pathlib.Path(system_path_gzip_folder_software_sim), sim_user_of_interest = sim_user_of_interest, label_mode = label_mode, 
-                                                                                             time_window_event_grouping = time_windows_event_grouping, system_path_to_store_label_encoding = system_path_to_store_results_with_sub_folder)
+        software_sim_data = load_simuser_specific_data_set_all_runs_of_a_complete_simulation_from_feature_store(system_path_with_csv_wsal_files = pathlib.Path(system_path_gzip_folder_software_sim), sim_user_of_interest = sim_user_of_interest, label_mode = label_mode, 
+                                                                                                                time_window_event_grouping = time_windows_event_grouping, system_path_to_store_label_encoding = system_path_to_store_results_with_sub_folder,
+                                                                                                                encoded_feature_store_path = encoded_feature_store_path)
         # save encoded data for multiple test runs to save system runtime
         if(system_path_to_save_encoded_data != "skip_saving_encoding"):
             file_name_save_encoded_data = "pre_encoded_data_software_simulation" + "_" + sim_user_of_interest + "_" + encoding_name + ".gz"
@@ -164,8 +506,9 @@ def main(system_path_gzip_folder_hardware_sim: str = None, system_path_gzip_fold
         
         save_non_zero_count_columns_dataframe(software_sim_data, pathlib.Path.joinpath(system_path_to_store_results_with_sub_folder, "software_dataframe_" + sim_user_of_interest + "non_zero_column_value_count" + ".txt"))
     
-        hardware_sim_data = load_simuser_specific_data_set_all_runs_of_a_complete_simulation(system_path_with_csv_wsal_files = pathlib.Path(system_path_gzip_folder_hardware_sim), sim_user_of_interest = sim_user_of_interest, label_mode = label_mode,
-                                                                                             time_window_event_grouping = time_windows_event_grouping, system_path_to_store_label_encoding = system_path_to_store_results_with_sub_folder)
+        hardware_sim_data = load_simuser_specific_data_set_all_runs_of_a_complete_simulation_from_feature_store(system_path_with_csv_wsal_files = pathlib.Path(system_path_gzip_folder_hardware_sim), sim_user_of_interest = sim_user_of_interest, label_mode = label_mode,
+                                                                                                                time_window_event_grouping = time_windows_event_grouping, system_path_to_store_label_encoding = system_path_to_store_results_with_sub_folder,
+                                                                                                                encoded_feature_store_path = encoded_feature_store_path)
         
         save_non_zero_count_columns_dataframe(hardware_sim_data, pathlib.Path.joinpath(system_path_to_store_results_with_sub_folder, "hardware_dataframe_" + sim_user_of_interest + "non_zero_column_value_count" + ".txt"))
 
@@ -177,240 +520,104 @@ def main(system_path_gzip_folder_hardware_sim: str = None, system_path_gzip_fold
     elif(load_pre_encoded_dummy_data == "load_dummy_data"):
         pre_encoded_data_path_hardware_software_data_containing_all_files = pathlib.Path.joinpath(pathlib.Path(pathlib.Path(__file__).with_name('machine_learning')), "pre_encoded_data")
 
-        # specific time window for encoding
-        time_windows_size = time_windows_event_grouping
-        if(time_windows_event_grouping == "s"):
-            time_windows_size = "1s"
-
-        hardware_pre_encoded_data_file_path = [file_name for file_name in pre_encoded_data_path_hardware_software_data_containing_all_files.iterdir() if((sim_user_of_interest in str(file_name)) and ("hardware_simulation" in str(file_name)) and (time_windows_size in str(file_name)))][0]
-        software_pre_encoded_data_file_path = [file_name for file_name in pre_encoded_data_path_hardware_software_data_containing_all_files.iterdir() if((sim_user_of_interest in str(file_name)) and ("software_simulation" in str(file_name)) and (time_windows_size in str(file_name)))][0]
+        # exact file names (substring matching of the time window size mixes up e.g. 1s & 15s)
+        hardware_pre_encoded_data_file_path = pathlib.Path.joinpath(pre_encoded_data_path_hardware_software_data_containing_all_files, "pre_encoded_data_hardware_simulation" + "_" + sim_user_of_interest + "_" + encoding_name + ".gz")
+        software_pre_encoded_data_file_path = pathlib.Path.joinpath(pre_encoded_data_path_hardware_software_data_containing_all_files, "pre_encoded_data_software_simulation" + "_" + sim_user_of_interest + "_" + encoding_name + ".gz")
         
         hardware_sim_data = pd.read_csv(filepath_or_buffer = hardware_pre_encoded_data_file_path, compression = "gzip")
         software_sim_data = pd.read_csv(filepath_or_buffer = software_pre_encoded_data_file_path, compression = "gzip")
     
+    ##############################################################
+    #                                                            #
+    # shared feature matrix & train/test splits of all data sets #
+    #                                                            #
+    ##############################################################
+    # hardware & software data are stored once (memory-mapped, hardware rows first, columns of both simulations, missing event ids -> 0)
+    # -> every evaluation only references rows (train/test split) & columns of this matrix, min-max scaling is applied when the workers load their data
+    shared_feature_matrix_folder = tempfile.TemporaryDirectory(dir = system_path_to_store_results_with_sub_folder)
+    shared_feature_matrix_path = pathlib.Path.joinpath(pathlib.Path(shared_feature_matrix_folder.name), "shared_feature_matrix_" + sim_user_of_interest + "_" + encoding_name + ".npy")
+    # same column order as concatenating hardware & software data
+    combined_feature_column_names = [column_name for column_name in list(hardware_sim_data.columns) + [column_name for column_name in software_sim_data.columns if(column_name not in hardware_sim_data.columns)] if(column_name != "Labels")]
+    combined_feature_columns = np.arange(len(combined_feature_column_names), dtype = np.int64)
+    hardware_feature_columns = np.array([combined_feature_column_names.index(column_name) for column_name in hardware_sim_data.columns if(column_name != "Labels")], dtype = np.int64)
+    software_feature_columns = np.array([combined_feature_column_names.index(column_name) for column_name in software_sim_data.columns if(column_name != "Labels")], dtype = np.int64)
+    hardware_row_range = (0, len(hardware_sim_data.index))
+    software_row_range = (len(hardware_sim_data.index), len(hardware_sim_data.index) + len(software_sim_data.index))
+    hardware_labels = hardware_sim_data["Labels"].values
+    software_labels = software_sim_data["Labels"].values
+
+    shared_feature_matrix = classification_ml_wsal.store_shared_feature_matrix([hardware_sim_data, software_sim_data], combined_feature_column_names, shared_feature_matrix_path)
+    del hardware_sim_data, software_sim_data
+
+    # train/test splits as row indices -> same split for all evaluations of a simulation (split only depends on the labels)
+    hardware_train_rows, hardware_test_rows, y_train_hardware_sim, y_test_hardware_sim = train_test_split(np.arange(*hardware_row_range), hardware_labels, test_size = 0.5, random_state = 42, stratify = hardware_labels)
+    software_train_rows, software_test_rows, y_train_software_sim, y_test_software_sim = train_test_split(np.arange(*software_row_range), software_labels, test_size = 0.5, random_state = 42, stratify = software_labels)
+
+    # train & test data of all evaluations -> all models are evaluated at once after preparing the data
+    model_evaluation_configurations = []
+
     ###########################################################
     #                                                         #
     # non-scaled inter evaluation of hardware & software data #
     #                                                         #
     ###########################################################
-    # if necessary add zero value column to of the the dataframes
-    software_sim_data_no_scaling = software_sim_data.copy()
-    hardware_sim_data_no_scaling = hardware_sim_data.copy()
-    software_sim_data_no_scaling['Hardware_or_Software'] = "Software"
-    hardware_sim_data_no_scaling['Hardware_or_Software'] = "Hardware"
-
-    combined_data_set = pd.concat([hardware_sim_data_no_scaling, software_sim_data_no_scaling], ignore_index = True, copy = False, axis = 0)
-    combined_data_set.fillna(0, inplace = True)
-
-    hardware_sim_data_no_scaling = combined_data_set.loc[combined_data_set["Hardware_or_Software"] == "Hardware"].copy()
-    software_sim_data_no_scaling = combined_data_set.loc[combined_data_set["Hardware_or_Software"] == "Software"].copy()
-    hardware_sim_data_no_scaling.drop("Hardware_or_Software", inplace = True, axis = 1)
-    software_sim_data_no_scaling.drop("Hardware_or_Software", inplace = True, axis = 1)
-
-    X_train_software_sim_data_no_scaling, X_test_software_sim_data_no_scaling, y_train_software_sim_data_no_scaling, y_test_software_sim_data_no_scaling = train_test_split(software_sim_data_no_scaling.loc[:, software_sim_data_no_scaling.columns != "Labels"].values, software_sim_data_no_scaling["Labels"].values, test_size = 0.5, random_state = 42, stratify = software_sim_data_no_scaling["Labels"].values)
-
-    X_train_hardware_sim_data_no_scaling, X_test_hardware_sim_data_no_scaling, y_train_hardware_sim_data_no_scaling, y_test_hardware_sim_data_no_scaling = train_test_split(hardware_sim_data_no_scaling.loc[:, hardware_sim_data_no_scaling.columns != "Labels"].values, hardware_sim_data_no_scaling["Labels"].values, test_size = 0.5, random_state = 42, stratify = hardware_sim_data_no_scaling["Labels"].values)
-
     data_set_name = "hardware_test_data_software_train_data_sim_23_all_simulation_runs_" + sim_user_of_interest
-    
-    classification_ml_wsal.evaluate_model(X_train = X_train_software_sim_data_no_scaling,
-                                          X_test = X_test_hardware_sim_data_no_scaling,
-                                          y_train = y_train_software_sim_data_no_scaling,
-                                          y_test = y_test_hardware_sim_data_no_scaling,
-                                          encoding_name = encoding_name,
-                                          data_set_name = data_set_name,
-                                          path_to_store_results = system_path_to_store_results_with_sub_folder)
-    
-    print("inter evaluation software and hardware simulation -> train data: software simulation data")
-    print("inter evaluation software and hardware simulation -> test data: hardware simulation data")
-    print("inter evaluation software and hardware simulation -> train data (software simulation data) -> unique labels: " + str(set(y_train_software_sim_data_no_scaling)))
-    print("inter evaluation software and hardware simulation -> test data (hardware simulation data) -> unique labels: " + str(set(y_test_hardware_sim_data_no_scaling)))
-    print("inter evaluation software and hardware simulation -> train data (software simulation data) -> shape: " + str(X_train_software_sim_data_no_scaling.shape))
-    print("inter evaluation software and hardware simulation -> test data (hardware simulation data) -> shape: " + str(X_test_hardware_sim_data_no_scaling.shape))
-    
-    data_set_name = "software_test_data_hardware_train_data_sim_23_all_simulation_runs_" + sim_user_of_interest
-    classification_ml_wsal.evaluate_model(X_train = X_train_hardware_sim_data_no_scaling,
-                                          X_test = X_test_software_sim_data_no_scaling,
-                                          y_train = y_train_hardware_sim_data_no_scaling,
-                                          y_test = y_test_software_sim_data_no_scaling,
-                                          encoding_name = encoding_name,
-                                          data_set_name = data_set_name,
-                                          path_to_store_results = system_path_to_store_results_with_sub_folder)
-    
-    print("inter evaluation software and hardware simulation -> train data: hardware simulation data")
-    print("inter evaluation software and hardware simulation -> test data: software simulation data")
-    print("inter evaluation software and hardware simulation -> train data (hardware simulation data) -> unique labels: " + str(set(y_train_hardware_sim_data_no_scaling)))
-    print("inter evaluation software and hardware simulation -> test data (software simulation data) -> unique labels: " + str(set(y_test_software_sim_data_no_scaling)))
-    print("inter evaluation software and hardware simulation -> train data (hardware simulation data) -> shape: " + str(X_train_hardware_sim_data_no_scaling.shape))
-    print("inter evaluation software and hardware simulation -> test data (software simulation data) -> shape: " + str(X_test_software_sim_data_no_scaling.shape))
-
-    ##################################################################
-    #                                                                #
-    # prepare min-max-scaled evaluations of hardware & software data #
-    #                                                                #
-    ##################################################################
-    # min-max normalization
-    scaler_min_max = MinMaxScaler()
-
-    # hardware sim standalone evaluation
-    min_max_scaled_hardware_sim_data = hardware_sim_data.copy()
-    data_set_name = "min_max_scaled_hardware_sim_23_all_simulation_runs_" + sim_user_of_interest
-
-    col_of_interest_min_max_scaled_hardware_sim_data = [idx for idx, value in enumerate(min_max_scaled_hardware_sim_data.columns) if(value != "Labels")]
-
-    # scaled data will be in float format instead of int -> due to scaling
-    min_max_scaled_hardware_sim_data.iloc[:,col_of_interest_min_max_scaled_hardware_sim_data] = min_max_scaled_hardware_sim_data.iloc[:,col_of_interest_min_max_scaled_hardware_sim_data].astype(float)
+    model_evaluation_configurations.append(build_model_evaluation_configuration(shared_feature_matrix_path, combined_feature_columns, software_train_rows, hardware_test_rows, y_train_software_sim, y_test_hardware_sim, None, encoding_name, data_set_name))
+    print_model_evaluation_configuration("inter evaluation software and hardware simulation", "software", "hardware", model_evaluation_configurations[-1])
 
-    min_max_scaled_hardware_sim_data.iloc[:,col_of_interest_min_max_scaled_hardware_sim_data] = scaler_min_max.fit_transform(min_max_scaled_hardware_sim_data.iloc[:,col_of_interest_min_max_scaled_hardware_sim_data].values)
-    
-    # software simulation data set standalone evaluation
-    min_max_scaled_software_sim_data = software_sim_data.copy()
-    data_set_name = "min_max_scaled_software_sim_23_all_simulation_runs_" + sim_user_of_interest
-
-    col_of_interest_min_max_scaled_software_sim_data = [idx for idx, value in enumerate(min_max_scaled_software_sim_data.columns) if(value != "Labels")]
-
-    # scaled data will be in float format instead of int
-    min_max_scaled_software_sim_data.iloc[:,col_of_interest_min_max_scaled_software_sim_data] = min_max_scaled_software_sim_data.iloc[:,col_of_interest_min_max_scaled_software_sim_data].astype(float)
-
-    min_max_scaled_software_sim_data.iloc[:,col_of_interest_min_max_scaled_software_sim_data] = scaler_min_max.fit_transform(min_max_scaled_software_sim_data.iloc[:,col_of_interest_min_max_scaled_software_sim_data].values)
+    data_set_name = "software_test_data_hardware_train_data_sim_23_all_simulation_runs_" + sim_user_of_interest
+    model_evaluation_configurations.append(build_model_evaluation_configuration(shared_feature_matrix_path, combined_feature_columns, hardware_train_rows, software_test_rows, y_train_hardware_sim, y_test_software_sim, None, encoding_name, data_set_name))
+    print_model_evaluation_configuration("inter evaluation software and hardware simulation", "hardware", "software", model_evaluation_configurations[-1])
 
     ###############################################################
     #                                                             #
     # min-max-scaled inter evaluation of hardware & software data #
     #                                                             #
     ###############################################################
-    # prepare data for combine (hardware sim data & software sim data ml evaluation with scaled data values)
-    combined_data_set_min_max_scaled = combined_data_set.copy()
-    # label and hardware_or_software cols excluded
-    col_of_interest_min_max_scaled = [idx for idx, value in enumerate(combined_data_set_min_max_scaled.columns) if((value != "Labels") and (value != "Hardware_or_Software"))]
-
-    # scaled data will be in float format instead of int
-    combined_data_set_min_max_scaled.iloc[:,col_of_interest_min_max_scaled] = combined_data_set_min_max_scaled.iloc[:,col_of_interest_min_max_scaled].astype(float)
-
-    combined_data_set_min_max_scaled.iloc[:,col_of_interest_min_max_scaled] = scaler_min_max.fit_transform(combined_data_set_min_max_scaled.iloc[:,col_of_interest_min_max_scaled].values)
-
-    hardware_sim_combined_min_max_scaled = combined_data_set_min_max_scaled.loc[combined_data_set_min_max_scaled["Hardware_or_Software"] == "Hardware"]
-    software_sim_combined_min_max_scaled = combined_data_set_min_max_scaled.loc[combined_data_set_min_max_scaled["Hardware_or_Software"] == "Software"]
-    hardware_sim_combined_min_max_scaled.drop("Hardware_or_Software", inplace = True, axis = 1)
-    software_sim_combined_min_max_scaled.drop("Hardware_or_Software", inplace = True, axis = 1)
-
-    X_train_software_sim_combined_min_max_scaled, X_test_software_sim_combined_min_max_scaled, y_train_software_sim_combined_min_max_scaled, y_test_software_sim_combined_min_max_scaled = train_test_split(software_sim_combined_min_max_scaled.loc[:, software_sim_combined_min_max_scaled.columns != "Labels"].values, software_sim_combined_min_max_scaled["Labels"].values, test_size = 0.5, random_state = 42, stratify = software_sim_combined_min_max_scaled["Labels"].values)
-
-    X_train_hardware_sim_combined_min_max_scaled, X_test_hardware_sim_combined_min_max_scaled, y_train_hardware_sim_combined_min_max_scaled, y_test_hardware_sim_combined_min_max_scaled = train_test_split(hardware_sim_combined_min_max_scaled.loc[:, hardware_sim_combined_min_max_scaled.columns != "Labels"].values, hardware_sim_combined_min_max_scaled["Labels"].values, test_size = 0.5, random_state = 42, stratify = hardware_sim_combined_min_max_scaled["Labels"].values)
+    # scaler fitted on hardware & software data (all columns)
+    scaler_min_max_combined = classification_ml_wsal.fit_min_max_scaler_on_shared_feature_matrix(shared_feature_matrix, (hardware_row_range[0], software_row_range[1]), combined_feature_columns)
 
     data_set_name = "min_max_scaled_hardware_test_data_software_train_data_sim_23_all_simulation_runs_" + sim_user_of_interest
-    classification_ml_wsal.evaluate_model(X_train = X_train_software_sim_combined_min_max_scaled,
-                                          X_test = X_test_hardware_sim_combined_min_max_scaled ,
-                                          y_train = y_train_software_sim_combined_min_max_scaled,
-                                          y_test = y_test_hardware_sim_combined_min_max_scaled,
-                                          encoding_name = encoding_name,
-                                          data_set_name = data_set_name,
-                                          path_to_store_results = system_path_to_store_results_with_sub_folder)
-    
-    print("inter evaluation software and hardware simulation min-max-scaled -> train data: software simulation data")
-    print("inter evaluation software and hardware simulation min-max-scaled -> test data: hardware simulation data")
-    print("inter evaluation software and hardware simulation min-max-scaled -> train data (software simulation data) -> unique labels: " + str(set(y_train_software_sim_combined_min_max_scaled)))
-    print("inter evaluation software and hardware simulation min-max-scaled -> test data (hardware simulation data) -> unique labels: " + str(set(y_test_hardware_sim_combined_min_max_scaled)))
-    print("inter evaluation software and hardware simulation min-max-scaled -> train data (software simulation data) -> shape: " + str(X_train_software_sim_combined_min_max_scaled.shape))
-    print("inter evaluation software and hardware simulation min-max-scaled -> test data (hardware simulation data) -> shape: " + str(X_test_hardware_sim_combined_min_max_scaled.shape))
-    
+    model_evaluation_configurations.append(build_model_evaluation_configuration(shared_feature_matrix_path, combined_feature_columns, software_train_rows, hardware_test_rows, y_train_software_sim, y_test_hardware_sim, scaler_min_max_combined, encoding_name, data_set_name))
+    print_model_evaluation_configuration("inter evaluation software and hardware simulation min-max-scaled", "software", "hardware", model_evaluation_configurations[-1])
+
     data_set_name = "min_max_scaled_software_test_data_hardware_train_data_sim_23_all_simulation_runs_" + sim_user_of_interest
-    classification_ml_wsal.evaluate_model(X_train = X_train_hardware_sim_combined_min_max_scaled,
-                                          X_test = X_test_software_sim_combined_min_max_scaled,
-                                          y_train = y_train_hardware_sim_combined_min_max_scaled,
-                                          y_test = y_test_software_sim_combined_min_max_scaled,
-                                          encoding_name = encoding_name,
-                                          data_set_name = data_set_name,
-                                          path_to_store_results = system_path_to_store_results_with_sub_folder)
-    
-    print("inter evaluation software and hardware simulation min-max-scaled -> train data: hardware simulation data")
-    print("inter evaluation software and hardware simulation min-max-scaled -> test data: software simulation data")
-    print("inter evaluation software and hardware simulation min-max-scaled -> train data (hardware simulation data) -> unique labels: " + str(set(y_train_hardware_sim_combined_min_max_scaled)))
-    print("inter evaluation software and hardware simulation min-max-scaled -> test data (software simulation data) -> unique labels: " + str(set(y_test_software_sim_combined_min_max_scaled)))
-    print("inter evaluation software and hardware simulation min-max-scaled -> train data (hardware simulation data) -> shape: " + str(X_train_hardware_sim_combined_min_max_scaled.shape))
-    print("inter evaluation software and hardware simulation min-max-scaled -> test data (software simulation data) -> shape: " + str(X_test_software_sim_combined_min_max_scaled.shape))
+    model_evaluation_configurations.append(build_model_evaluation_configuration(shared_feature_matrix_path, combined_feature_columns, hardware_train_rows, software_test_rows, y_train_hardware_sim, y_test_software_sim, scaler_min_max_combined, encoding_name, data_set_name))
+    print_model_evaluation_configuration("inter evaluation software and hardware simulation min-max-scaled", "hardware", "software", model_evaluation_configurations[-1])
 
     ###########################################################
     #                                                         #
     # non-scaled intra evaluation of hardware & software data #
     #                                                         #
     ###########################################################
-    # software simulation data not scaled
-    X_train_software_sim_not_scaled, X_test_software_sim_not_scaled, y_train_software_sim_not_scaled, y_test_software_sim_not_scaled = train_test_split(software_sim_data.loc[:, software_sim_data.columns != "Labels"].values, software_sim_data["Labels"].values, test_size = 0.5, random_state = 42, stratify = software_sim_data["Labels"].values)
+    # only the columns of the simulation itself
     data_set_name = "software_sim_23_all_simulation_runs_" + sim_user_of_interest
-    classification_ml_wsal.evaluate_model(X_train = X_train_software_sim_not_scaled,
-                                          X_test = X_test_software_sim_not_scaled,
-                                          y_train = y_train_software_sim_not_scaled,
-                                          y_test = y_test_software_sim_not_scaled,
-                                          encoding_name = encoding_name,
-                                          data_set_name = data_set_name,
-                                          path_to_store_results = system_path_to_store_results_with_sub_folder)
-    
-    print("intra evaluation software simulation not scaled -> train data: software simulation data")
-    print("intra evaluation software simulation not scaled -> test data: software simulation data")
-    print("intra evaluation software simulation not scaled -> train data (software simulation data) -> unique labels: " + str(set(y_train_software_sim_not_scaled)))
-    print("intra evaluation software simulation not scaled -> test data (software simulation data) -> unique labels: " + str(set(y_test_software_sim_not_scaled)))
-    print("intra evaluation software simulation not scaled -> train data (software simulation data) -> shape: " + str(X_train_software_sim_not_scaled.shape))
-    print("intra evaluation software simulation not scaled -> test data (software simulation data) -> shape: " + str(X_test_software_sim_not_scaled.shape))
-    
-    # hardware simulation data not scaled
-    X_train_hardware_sim_not_scaled, X_test_hardware_sim_not_scaled, y_train_hardware_sim_not_scaled, y_test_hardware_sim_not_scaled = train_test_split(hardware_sim_data.loc[:, hardware_sim_data.columns != "Labels"].values, hardware_sim_data["Labels"].values, test_size = 0.5, random_state = 42, stratify = hardware_sim_data["Labels"].values)
+    model_evaluation_configurations.append(build_model_evaluation_configuration(shared_feature_matrix_path, software_feature_columns, software_train_rows, software_test_rows, y_train_software_sim, y_test_software_sim, None, encoding_name, data_set_name))
+    print_model_evaluation_configuration("intra evaluation software simulation not scaled", "software", "software", model_evaluation_configurations[-1])
+
     data_set_name = "hardware_sim_23_all_simulation_runs_" + sim_user_of_interest
-    classification_ml_wsal.evaluate_model(X_train = X_train_hardware_sim_not_scaled,
-                                          X_test = X_test_hardware_sim_not_scaled,
-                                          y_train = y_train_hardware_sim_not_scaled,
-                                          y_test = y_test_hardware_sim_not_scaled,
-                                          encoding_name = encoding_name,
-                                          data_set_name = data_set_name,
-                                          path_to_store_results = system_path_to_store_results_with_sub_folder)
-    
-    print("intra evaluation hardware simulation not scaled -> train data: hardware simulation data")
-    print("intra evaluation hardware simulation not scaled -> test data: hardware simulation data")
-    print("intra evaluation hardware simulation not scaled -> train data (hardware simulation data) -> unique labels: " + str(set(y_train_hardware_sim_not_scaled)))
-    print("intra evaluation hardware simulation not scaled -> test data (hardware simulation data) -> unique labels: " + str(set(y_test_hardware_sim_not_scaled)))
-    print("intra evaluation hardware simulation not scaled -> train data (hardware simulation data) -> shape: " + str(X_train_hardware_sim_not_scaled.shape))
-    print("intra evaluation hardware simulation not scaled -> test data (hardware simulation data) -> shape: " + str(X_test_hardware_sim_not_scaled.shape))
+    model_evaluation_configurations.append(build_model_evaluation_configuration(shared_feature_matrix_path, hardware_feature_columns, hardware_train_rows, hardware_test_rows, y_train_hardware_sim, y_test_hardware_sim, None, encoding_name, data_set_name))
+    print_model_evaluation_configuration("intra evaluation hardware simulation not scaled", "hardware", "hardware", model_evaluation_configurations[-1])
 
     ###############################################################
     #                                                             #
     # min-max-scaled intra evaluation of hardware & software data #
     #                                                             #
     ###############################################################
-    # software simulation data min-max-scaled
-    X_train_software_sim_min_max_scaled, X_test_software_sim_min_max_scaled, y_train_software_sim_min_max_scaled, y_test_software_sim_min_max_scaled = train_test_split(min_max_scaled_software_sim_data.loc[:, min_max_scaled_software_sim_data.columns != "Labels"].values, min_max_scaled_software_sim_data["Labels"].values, test_size = 0.5, random_state = 42, stratify = min_max_scaled_software_sim_data["Labels"].values)
+    # scaler fitted on the rows & columns of the simulation itself
+    scaler_min_max_software = classification_ml_wsal.fit_min_max_scaler_on_shared_feature_matrix(shared_feature_matrix, software_row_range, software_feature_columns)
     data_set_name = "min_max_scaled_software_sim_23_all_simulation_runs_" + sim_user_of_interest
-    classification_ml_wsal.evaluate_model(X_train = X_train_software_sim_min_max_scaled,
-                                          X_test = X_test_software_sim_min_max_scaled,
-                                          y_train = y_train_software_sim_min_max_scaled,
-                                          y_test = y_test_software_sim_min_max_scaled,
-                                          encoding_name = encoding_name,
-                                          data_set_name = data_set_name,
-                                          path_to_store_results = system_path_to_store_results_with_sub_folder)
-    
-    print("intra evaluation software simulation min-max-scaled -> train data: software simulation data")
-    print("intra evaluation software simulation min-max-scaled -> test data: software simulation data")
-    print("intra evaluation software simulation min-max-scaled -> train data (software simulation data) -> unique labels: " + str(set(y_train_software_sim_min_max_scaled)))
-    print("intra evaluation software simulation min-max-scaled -> test data (software simulation data) -> unique labels: " + str(set(y_test_software_sim_min_max_scaled)))
-    print("intra evaluation software simulation min-max-scaled -> train data (software simulation data) -> shape: " + str(X_train_software_sim_min_max_scaled.shape))
-    print("intra evaluation software simulation min-max-scaled -> test data (software simulation data) -> shape: " + str(X_test_software_sim_min_max_scaled.shape))
-    
-    # hardware simulation data min-max-scaled
-    X_train_hardware_sim_min_max_scaled, X_test_hardware_sim_min_max_scaled, y_train_hardware_sim_min_max_scaled, y_test_hardware_sim_min_max_scaled = train_test_split(min_max_scaled_hardware_sim_data.loc[:, min_max_scaled_hardware_sim_data.columns != "Labels"].values, min_max_scaled_hardware_sim_data["Labels"].values, test_size = 0.5, random_state = 42, stratify = min_max_scaled_hardware_sim_data["Labels"].values)
+    model_evaluation_configurations.append(build_model_evaluation_configuration(shared_feature_matrix_path, software_feature_columns, software_train_rows, software_test_rows, y_train_software_sim, y_test_software_sim, scaler_min_max_software, encoding_name, data_set_name))
+    print_model_evaluation_configuration("intra evaluation software simulation min-max-scaled", "software", "software", model_evaluation_configurations[-1])
+
+    scaler_min_max_hardware = classification_ml_wsal.fit_min_max_scaler_on_shared_feature_matrix(shared_feature_matrix, hardware_row_range, hardware_feature_columns)
     data_set_name = "min_max_scaled_hardware_sim_23_all_simulation_runs_" + sim_user_of_interest
-    classification_ml_wsal.evaluate_model(X_train = X_train_hardware_sim_min_max_scaled,
-                                          X_test = X_test_hardware_sim_min_max_scaled,
-                                          y_train = y_train_hardware_sim_min_max_scaled,
-                                          y_test = y_test_hardware_sim_min_max_scaled,
-                                          encoding_name = encoding_name,
-                                          data_set_name = data_set_name,
-                                          path_to_store_results = system_path_to_store_results_with_sub_folder)
-    
-    print("intra evaluation software hardware min-max-scaled -> train data: hardware simulation data")
-    print("intra evaluation software hardware min-max-scaled -> test data: hardware simulation data")
-    print("intra evaluation software hardware min-max-scaled -> train data (hardware simulation data) -> unique labels: " + str(set(y_train_hardware_sim_min_max_scaled)))
-    print("intra evaluation software hardware min-max-scaled -> test data (hardware simulation data) -> unique labels: " + str(set(y_test_hardware_sim_min_max_scaled)))
-    print("intra evaluation software hardware min-max-scaled -> train data (hardware simulation data) -> shape: " + str(X_train_hardware_sim_min_max_scaled.shape))
-    print("intra evaluation software hardware min-max-scaled -> test data (hardware simulation data) -> shape: " + str(X_test_hardware_sim_min_max_scaled.shape))
+    model_evaluation_configurations.append(build_model_evaluation_configuration(shared_feature_matrix_path, hardware_feature_columns, hardware_train_rows, hardware_test_rows, y_train_hardware_sim, y_test_hardware_sim, scaler_min_max_hardware, encoding_name, data_set_name))
+    print_model_evaluation_configuration("intra evaluation software hardware min-max-scaled", "hardware", "hardware", model_evaluation_configurations[-1])
+    del shared_feature_matrix
+
+    classification_ml_wsal.evaluate_models_concurrently(model_evaluation_configurations, system_path_to_store_results_with_sub_folder, number_of_workers = number_of_model_evaluation_workers)
+    shared_feature_matrix_folder.cleanup()
 
     return 0
 
@@ -423,6 +630,8 @@ if __name__ == "__main__":
         ---------------------------------------------------------------
         Usage: python wsal_machine_learning_script.py /home//hardware_data/ /home/software_data/ /home/ml_results/ SimUser001 general_label_mode s 253403070464 /home/encoded_data/ load_dummy_data; 
                python wsal_machine_learning_script.py /home//hardware_data/ /home/software_data/ /home/ml_results/ SimUser001 general_label_mode s 253403070464 /home/encoded_data/ dont_load_dummy_data;
+               python wsal_machine_learning_script.py /home//hardware_data/ /home/software_data/ /home/ml_results/ SimUser001 general_label_mode s 253403070464 /home/encoded_data/ dont_load_dummy_data --number_of_model_evaluation_workers 8;
+               python wsal_machine_learning_script.py /home//hardware_data/ /home/software_data/ /home/ml_results/ SimUser001 general_label_mode s,15s,30s 253403070464 /home/encoded_data/ dont_load_dummy_data;
         ''')%(NAME, VERSION)))
         
         parser.add_argument('system_path_gzip_folder_hardware_sim', type = str, help = "system path which includes compressed (gzip) Windows 10 security audit log files for hardware simulation (type:str) (e.g., /home/path/to/hardware_data)")
@@ -430,10 +639,12 @@ if __name__ == "__main__":
         parser.add_argument('path_to_store_ml_results', type = str, help = "system path which includes machine learning results (type:str) (e.g., /home/user/ml_results)")
         parser.add_argument('sim_user_of_interest', type = str, help = "simulation user of interest (type:str) (e.g., SimUser001)")
         parser.add_argument('label_mode', type = str, help = "data labeling model (type:str) (choose between: general_label_mode, granular_label_mode)")
-        parser.add_argument('time_window_size_event_grouping', type = str, help = "size of time windows for event grouping in seconds (type:str) (e.g., s, 2s, 3s)")
+        parser.add_argument('time_window_size_event_grouping', type = str, help = "size of time windows for event grouping in seconds (type:str) (e.g., s, 2s, 3s) or comma separated sizes (e.g., s,15s,30s) to only encode and save all sizes with a single data load (requires system_path_to_save_encoded_data)")
         parser.add_argument('max_ram_usage', type = int, help = "define max ram usage of this script in bytes")
         parser.add_argument('system_path_to_save_encoded_data', type = str, help = "save  values: system path, to store encoded data | skip_saving_encoding, to not save encoded data")
         parser.add_argument('load_pre_encoded_dummy_data', type = str, help = "load pre-encoded dummy data prepared by paper authors | start loading if value is: load_dummy_data ; skip loading if value is: dont_load_dummy_data (type:str)")
+        parser.add_argument('--encoded_feature_store_path', type = str, default = str(DEFAULT_ENCODED_FEATURE_STORE_PATH), help = "root folder of the encoded feature store, encoded data sets are reused as long as their source files do not change (type:str) (default: machine_learning/encoded_feature_store) | skip_feature_store, to always load & encode the data sets")
+        parser.add_argument('--number_of_model_evaluation_workers', type = int, default = classification_ml_wsal.DEFAULT_NUMBER_OF_MODEL_EVALUATION_WORKERS, help = "number of machine learning models trained at once, cores are split between the models, every model holds its own copy of its train & test data -> memory grows with the number of workers (type:int) (default: 1, sequential evaluation)")
         args = parser.parse_args()
         system_path_gzip_folder_hardware_sim_cmd = args.system_path_gzip_folder_hardware_sim
         system_path_gzip_folder_software_sim_cmd = args.system_path_gzip_folder_software_sim
@@ -444,8 +655,10 @@ if __name__ == "__main__":
         time_window_size_event_grouping_cmd = args.time_window_size_event_grouping
         system_path_to_save_encoded_data_cmd = args.system_path_to_save_encoded_data
         load_pre_encoded_dummy_data_cmd = args.load_pre_encoded_dummy_data
+        number_of_model_evaluation_workers_cmd = args.number_of_model_evaluation_workers
+        encoded_feature_store_path_cmd = args.encoded_feature_store_path
 
-        return_code = main(system_path_gzip_folder_hardware_sim_cmd, system_path_gzip_folder_software_sim_cmd, path_to_store_ml_results_cmd, sim_user_of_interest_cmd, label_mode_cmd, time_window_size_event_grouping_cmd, max_ram_usage_cmd, system_path_to_save_encoded_data_cmd, load_pre_encoded_dummy_data_cmd)
+        return_code = main(system_path_gzip_folder_hardware_sim_cmd, system_path_gzip_folder_software_sim_cmd, path_to_store_ml_results_cmd, sim_user_of_interest_cmd, label_mode_cmd, time_window_size_event_grouping_cmd, max_ram_usage_cmd, system_path_to_save_encoded_data_cmd, load_pre_encoded_dummy_data_cmd, number_of_model_evaluation_workers_cmd, encoded_feature_store_path_cmd)
         quit(return_code)
     else:
         main()
\ No newline at end of file
@@ -5,14 +5,24 @@ import pathlib
 import configparser
 import os
 import datetime
+import re
+import json
+import concurrent.futures
+import multiprocessing
+import queue
+import fcntl
+import progressbar
 
 from process_wal import process_wal
+from wal_data_store import wal_data_store
 from parsing_sim23_logs import parse_sim23_logs
 
 NAME = "WSAL PREPROCESSING DATA INTO GZIP COMPRESSED CSVs"
-VERSION = "1.3"
+VERSION = "1.10"
 CMD_MODE_ENABLED = True
 
+PREPROCESSING_MANIFEST_FILE_NAME = "preprocessing_manifest.json"
+
 def load_config_asset(config_section: str, config_key: str, config_system_path: pathlib.Path = pathlib.Path(__file__).with_name('config.ini')):
     """load configuration content from config file
 
@@ -34,82 +44,421 @@ def load_config_asset(config_section: str, config_key: str, config_system_path:
 
     return config_key_value
 
-def load_complete_simulation_rum_for_specific_simuser(system_path_simulation_run: pathlib.Path, archived_wal_substring: str = "Archive-Security", system_path_next_simulation_run: pathlib.Path = None, 
-                                                      sim_user_of_interest: str = "SimUser001", sim23_logs_file_name: str = "sim23.log", timezone_of_simulation_run: str = "CET", system_path_to_store_iteration: pathlib.Path = None):
-    """load a complete simulation run (hardware of software data) into compressed (gzip) CSV file for specific Windows 10 user client (001|002|003|004)
+def find_sim_users_in_simulation_run_structure(complete_system_path_structure: list, sim_user_pattern: str = r"SimUser\d+"):
+    """find all simulation users (Windows 10 clients) included in the folder structure of a simulation run
+
+    Args:
+        complete_system_path_structure (list): return value of os.walk for the simulation run folder
+        sim_user_pattern (str): regular expression of simulation user names. Defaults to r"SimUser\d+".
+
+    Returns:
+        list: sorted simulation user names (e.g., ["SimUser001", "SimUser002"])
+    """
+    sim_users = set()
+    for entry in complete_system_path_structure:
+        sim_users.update(re.findall(sim_user_pattern, entry[0]))
+
+    return sorted(sim_users)
+
+def build_simulation_run_index(system_path_simulation_run: pathlib.Path, system_path_next_simulation_run: pathlib.Path = None, sim_users_of_interest: list = None,
+                               archived_wal_substring: str = "Archive-Security", sim23_logs_file_name: str = "sim23.log"):
+    """walk through the simulation run (and next simulation run) once and index archive folders and sim23.log folders of all simulation users
 
     Args:
         system_path_simulation_run (pathlib.Path): simulation run folder containing all the simulation data in XML format
+        system_path_next_simulation_run (pathlib.Path, optional): next simulation run folder (first archive of the next run belongs to the last iteration). Defaults to None.
+        sim_users_of_interest (list, optional): simulation users to index. Defaults to None (all simulation users found in the simulation run).
         archived_wal_substring (str): substring included in every Windows security audit log file. Defaults to "Archive-Security".
-        system_path_next_simulation_run (pathlib.Path, optional): edge case -> load data of current simulation run which is extracted in the next simulation run. Defaults to None.
+        sim23_logs_file_name (str): name of sim 23 log file to parse data labels. Defaults to "sim23.log".
+
+    Returns:
+        dict: simulation user -> {"archived_wals_system_paths": sorted archive folders [(folder, [files])], "sim23_log_system_paths": sorted sim23.log folders, "next_run_archived_wals_system_paths": sorted archive folders of next run}
+    """
+    complete_system_path_structure = [entry for entry in os.walk(system_path_simulation_run)] # return structure of os.walk: (current system  path in folder, [included sub folder], [included files])
+    next_run_complete_system_path_structure = []
+    if(system_path_next_simulation_run is not None):
+        next_run_complete_system_path_structure = [entry for entry in os.walk(system_path_next_simulation_run)]
+    if(sim_users_of_interest is None):
+        sim_users_of_interest = find_sim_users_in_simulation_run_structure(complete_system_path_structure)
+
+    # folders are assigned to simulation users based on the same path filters as used for a single simulation user
+    archived_wals_folders = [(entry[0], entry[2]) for entry in complete_system_path_structure if (any(archived_wal_substring in file for file in entry[2])) & ("convertet_wal" in entry[0])]
+    sim23_log_folders = [entry[0] for entry in complete_system_path_structure if (sim23_logs_file_name in entry[2]) & ("Postrun" not in entry[0]) & ("Prerun" not in entry[0]) & ("Invalid" not in entry[0])]
+    next_run_archived_wals_folders = [(entry[0], entry[2]) for entry in next_run_complete_system_path_structure if (any(archived_wal_substring in file for file in entry[2])) & ("convertet_wal" in entry[0])]
+
+    simulation_run_index = {}
+    for sim_user in sim_users_of_interest:
+        simulation_run_index[sim_user] = {"archived_wals_system_paths": sorted([entry for entry in archived_wals_folders if sim_user in entry[0]]),
+                                          "sim23_log_system_paths": sorted([entry for entry in sim23_log_folders if sim_user in entry]),
+                                          "next_run_archived_wals_system_paths": sorted([entry for entry in next_run_archived_wals_folders if sim_user in entry[0]])}
+
+    return simulation_run_index
+
+def get_first_archived_wal_file(archived_wal_folder: tuple, archived_wal_substring: str = "Archive-Security"):
+    """get the first archived security file of an archive folder based on file name export timestamps
+
+    Args:
+        archived_wal_folder (tuple): (folder, [files]) of an archive folder
+        archived_wal_substring (str): substring included in every Windows security audit log file. Defaults to "Archive-Security".
+
+    Returns:
+        pathlib.Path: system path of the first archived security file or None if the folder does not contain an archived security file
+    """
+    for file in sorted(archived_wal_folder[1]):
+        if(archived_wal_substring in file):
+            # stop if first archived security file is found
+            return pathlib.Path.joinpath(pathlib.Path(archived_wal_folder[0]), file)
+
+    return None
+
+def build_iteration_output_path(system_path_simulation_run: pathlib.Path, iteration_index: int, sim_user_of_interest: str, system_path_to_store_iteration: pathlib.Path, output_format: str = "csv"):
+    """build system path of a converted simulation run iteration for specific Windows 10 user client
+
+    Args:
+        system_path_simulation_run (pathlib.Path): simulation run folder containing all the simulation data in XML format
+        iteration_index (int): index of the iteration in the simulation run
+        sim_user_of_interest (str): simulation user of interest
+        system_path_to_store_iteration (pathlib.Path): system path to store converted simulation iteration in compressed format
+        output_format (str): "csv" or "parquet". Defaults to "csv".
+
+    Returns:
+        pathlib.Path: system path of the converted iteration
+    """
+    file_stem_to_store_iteration = str(system_path_simulation_run).replace("/", "_").replace(" ", "_").replace("_home_kevin_mnt_nas_", "") + "_iteration_" + str(iteration_index) + "_" + sim_user_of_interest + "_converted_and_labeled_data"
+    if(output_format == "parquet"):
+        return wal_data_store.build_data_set_partition_path(system_path_to_store_iteration, system_path_simulation_run, iteration_index, sim_user_of_interest, file_stem_to_store_iteration)
+
+    return pathlib.Path.joinpath(pathlib.Path(system_path_to_store_iteration), file_stem_to_store_iteration + ".gz")
+
+def build_iteration_manifest_entry(simuser_run_index: dict, iteration_index: int, archived_wal_substring: str = "Archive-Security", sim23_logs_file_name: str = "sim23.log",
+                                   timezone_of_simulation_run: str = "CET", output_format: str = "csv", former_iteration_manifest_entry: dict = None):
+    """build manifest entry of a simulation run iteration (fingerprints of all input files and parameters which change the converted iteration)
+
+    Args:
+        simuser_run_index (dict): index of the simulation user (see build_simulation_run_index)
+        iteration_index (int): index of the iteration in the simulation run
+        archived_wal_substring (str): substring included in every Windows security audit log file. Defaults to "Archive-Security".
+        sim23_logs_file_name (str): name of sim 23 log file to parse data labels. Defaults to "sim23.log".
+        timezone_of_simulation_run (str): timezone of simulation run. Defaults to "CET".
+        output_format (str): "csv" or "parquet". Defaults to "csv".
+        former_iteration_manifest_entry (dict, optional): stored manifest entry of the iteration, content hashes of files with unchanged size and modification time are reused instead of reading the files again. Defaults to None.
+
+    Returns:
+        dict: manifest entry
+    """
+    archived_wals_system_paths = simuser_run_index["archived_wals_system_paths"]
+    sim23_log_system_path = pathlib.Path(simuser_run_index["sim23_log_system_paths"][iteration_index])
+    archived_wal_files = sorted([pathlib.Path.joinpath(pathlib.Path(archived_wals_system_paths[iteration_index][0]), file) for file in archived_wals_system_paths[iteration_index][1] if(archived_wal_substring in file)])
+    if(iteration_index == (len(archived_wals_system_paths)-1)):
+        next_run_archived_wals_system_paths = simuser_run_index["next_run_archived_wals_system_paths"]
+        # last simulation run or next simulation run without archives -> no spill-over boundary
+        next_archived_wal_file = get_first_archived_wal_file(next_run_archived_wals_system_paths[0], archived_wal_substring) if next_run_archived_wals_system_paths else None
+    else:
+        next_archived_wal_file = get_first_archived_wal_file(archived_wals_system_paths[iteration_index+1], archived_wal_substring)
+    # former fingerprints by file path -> multi-GB archives are only hashed again if their size or modification time changed
+    former_file_fingerprints = {}
+    if(former_iteration_manifest_entry is not None):
+        for file_fingerprint in former_iteration_manifest_entry.get("archived_wal_files", []) + [former_iteration_manifest_entry.get(file_key) for file_key in ["next_archived_wal_file", "sim23_log_file", "iteration_time_file"]]:
+            if(isinstance(file_fingerprint, dict) and ("path" in file_fingerprint)):
+                former_file_fingerprints[file_fingerprint["path"]] = file_fingerprint
+    compute_file_fingerprint = lambda file_path: process_wal.compute_windows_audit_log_file_fingerprint(file_path, former_file_fingerprint = former_file_fingerprints.get(str(pathlib.Path(file_path).resolve())))
+
+    return {"archived_wal_files": [compute_file_fingerprint(file) for file in archived_wal_files],
+            "next_archived_wal_file": None if next_archived_wal_file is None else compute_file_fingerprint(next_archived_wal_file),
+            "sim23_log_file": compute_file_fingerprint(pathlib.Path.joinpath(sim23_log_system_path, sim23_logs_file_name)),
+            "iteration_time_file": compute_file_fingerprint(pathlib.Path.joinpath(sim23_log_system_path, "iteration.time")),
+            "timezone_of_simulation_run": timezone_of_simulation_run, "output_format": output_format, "preprocessing_version": VERSION, "process_wal_version": process_wal.VERSION}
+
+def load_preprocessing_manifest(system_path_to_store_iteration: pathlib.Path):
+    """load manifest of already converted iterations
+
+    Args:
+        system_path_to_store_iteration (pathlib.Path): system path the converted iterations are stored in
+
+    Returns:
+        dict: system path of converted iteration (relative to system_path_to_store_iteration) -> manifest entry (empty if no valid manifest exists)
+    """
+    manifest_path = pathlib.Path.joinpath(pathlib.Path(system_path_to_store_iteration), PREPROCESSING_MANIFEST_FILE_NAME)
+    try:
+        return json.loads(manifest_path.read_text())
+    except (FileNotFoundError, ValueError):
+        return {}
+
+def store_preprocessing_manifest(system_path_to_store_iteration: pathlib.Path, preprocessing_manifest: dict):
+    """store manifest of already converted iterations (written to temporary file first -> manifest is never partially written)
+
+    Args:
+        system_path_to_store_iteration (pathlib.Path): system path the converted iterations are stored in
+        preprocessing_manifest (dict): system path of converted iteration (relative to system_path_to_store_iteration) -> manifest entry
+    """
+    manifest_path = pathlib.Path.joinpath(pathlib.Path(system_path_to_store_iteration), PREPROCESSING_MANIFEST_FILE_NAME)
+    temporary_manifest_path = manifest_path.with_name(manifest_path.name + "." + str(os.getpid()) + ".tmp")
+    temporary_manifest_path.write_text(json.dumps(preprocessing_manifest, indent = 2, sort_keys = True))
+    os.replace(temporary_manifest_path, manifest_path)
+
+def update_preprocessing_manifest(system_path_to_store_iteration: pathlib.Path, iteration_manifest_entries: dict):
+    """merge manifest entries of converted iterations into the stored manifest, the manifest is locked, re-read and merged -> runs storing iterations in the same folder concurrently keep each other's entries
+
+    Args:
+        system_path_to_store_iteration (pathlib.Path): system path the converted iterations are stored in
+        iteration_manifest_entries (dict): system path of converted iteration (relative to system_path_to_store_iteration) -> manifest entry
+
+    Returns:
+        dict: merged manifest
+    """
+    manifest_lock_path = pathlib.Path.joinpath(pathlib.Path(system_path_to_store_iteration), PREPROCESSING_MANIFEST_FILE_NAME + ".lock")
+    with open(manifest_lock_path, "w") as manifest_lock_file:
+        # lock is released when the lock file is closed
+        fcntl.flock(manifest_lock_file, fcntl.LOCK_EX)
+        preprocessing_manifest = load_preprocessing_manifest(system_path_to_store_iteration)
+        preprocessing_manifest.update(iteration_manifest_entries)
+        store_preprocessing_manifest(system_path_to_store_iteration, preprocessing_manifest)
+
+    return preprocessing_manifest
+
+def get_iteration_manifest_key(path_to_store_iteration: pathlib.Path, system_path_to_store_iteration: pathlib.Path):
+    """get manifest key of a converted iteration
+
+    Args:
+        path_to_store_iteration (pathlib.Path): system path of the converted iteration
+        system_path_to_store_iteration (pathlib.Path): system path the converted iterations are stored in
+
+    Returns:
+        str: path of the converted iteration relative to system_path_to_store_iteration
+    """
+    return pathlib.Path(path_to_store_iteration).relative_to(pathlib.Path(system_path_to_store_iteration)).as_posix()
+
+def iterate_converted_simulation_run_iterations_for_specific_simuser(system_path_simulation_run: pathlib.Path, simuser_run_index: dict, sim_user_of_interest: str = "SimUser001", iteration_indices: list = None,
+                                                                    archived_wal_substring: str = "Archive-Security", sim23_logs_file_name: str = "sim23.log", timezone_of_simulation_run: str = "CET",
+                                                                    system_path_to_store_iteration: pathlib.Path = None, number_of_parsing_workers: int = 1, parsed_archive_cache_folder: pathlib.Path = None,
+                                                                    parsed_archive_cache_max_size_bytes: int = process_wal.PARSED_ARCHIVE_CACHE_DEFAULT_MAX_SIZE_BYTES, output_format: str = "csv", preprocessing_manifest: dict = None):
+    """convert consecutive iterations of a simulation run for specific Windows 10 user client into compressed (gzip) CSV files (or partitioned data store)
+
+    a statistics file is stored next to every iteration (see wal_data_store.write_data_set_statistics)
+
+    every archive is parsed once per traversal, the first archive of the next iteration feeds the spill-over of the current iteration and is reused for the next iteration
+
+    Args:
+        system_path_simulation_run (pathlib.Path): simulation run folder containing all the simulation data in XML format
+        simuser_run_index (dict): index of the simulation user (see build_simulation_run_index)
         sim_user_of_interest (str): simulation user of interest. Defaults to "SimUser001".
+        iteration_indices (list, optional): ascending indices of the iterations to convert. Defaults to None (all iterations).
+        archived_wal_substring (str): substring included in every Windows security audit log file. Defaults to "Archive-Security".
         sim23_logs_file_name (str): name of sim 23 log file to parse data labels. Defaults to "sim23.log".
         timezone_of_simulation_run (str): timezone of simulation run (next and current simulation run have always the same timezone). Defaults to "CET".
         system_path_to_store_iteration (pathlib.Path): system path to store converted simulation iteration in compressed format. Defaults to "None".
+        number_of_parsing_workers (int): number of processes parsing the XML files of an iteration folder concurrently. Defaults to 1.
+        parsed_archive_cache_folder (pathlib.Path, optional): folder of the on-disk cache of already parsed XML files (reused by later runs). Defaults to None (no caching).
+        parsed_archive_cache_max_size_bytes (int): max. size of the parsed archive cache in bytes (least recently used files are evicted). Defaults to process_wal.PARSED_ARCHIVE_CACHE_DEFAULT_MAX_SIZE_BYTES.
+        output_format (str): "csv" (gzip compressed CSV file per iteration) or "parquet" (partitioned columnar data store with typed columns in system_path_to_store_iteration). Defaults to "csv".
+        preprocessing_manifest (dict, optional): manifest of already converted iterations, iteration is skipped if its manifest entry is unchanged and the converted iteration exists. Defaults to None (always convert).
 
-    Returns:
-        -, stores CSV files with user behavior in system_path_to_store_iteration
+    Yields:
+        tuple: (system path of the stored iteration (pathlib.Path), manifest entry of the iteration (dict)) in iteration order
     """
-    complete_system_path_structure = [entry for entry in os.walk(system_path_simulation_run)] # return structure of os.walk: (current system  path in folder, [included sub folder], [included files])
-    archived_wals_system_paths = sorted([entry for entry in complete_system_path_structure if (any(archived_wal_substring in file for file in entry[2])) & (sim_user_of_interest in entry[0]) & ("convertet_wal" in entry[0])])
-    sim23_log_system_paths = sorted([entry[0] for entry in complete_system_path_structure if (sim23_logs_file_name in entry[2]) & (sim_user_of_interest in entry[0]) & ("Postrun" not in entry[0]) & ("Prerun" not in entry[0]) & ("Invalid" not in entry[0])])
-    # for iteration in simulation user specific run
-    for idx, entry in enumerate(archived_wals_system_paths):
-        wal_logs = process_wal.load_windows_audit_logs_from_system_folder(pathlib.Path(entry[0]), remove_linux_wal_converter_artefacts = False, timezone_of_simulation_run = timezone_of_simulation_run)
-        sim23_logs = parse_sim23_logs.load_sim23_log_data_without_using_predefined_labels(sim23_log_system_path = pathlib.Path.joinpath(pathlib.Path(sim23_log_system_paths[idx]), sim23_logs_file_name))
-
-        # last iteration in run for specific user -> access archived xml file from next run
-        if(idx == (len(archived_wals_system_paths)-1)): 
-            next_run_complete_system_path_structure = [entry for entry in os.walk(system_path_next_simulation_run)]
-            next_run_archived_wals_system_paths = sorted([entry for entry in next_run_complete_system_path_structure if (any(archived_wal_substring in file for file in entry[2])) & (sim_user_of_interest in entry[0]) & ("convertet_wal" in entry[0])])
-            # get the first archived security file based on file name export timestamps
-            file_to_get = None
-            for file in sorted(next_run_archived_wals_system_paths[0][2]):
-                if(archived_wal_substring in file):
-                    file_to_get = file
-                    # stop if first archived security file is found
-                    break
-            if(file_to_get != None):
-                additional_wal_logs = process_wal.load_windows_audit_logs_from_system_file(pathlib.Path.joinpath(pathlib.Path(next_run_archived_wals_system_paths[0][0]), file_to_get),
-                                                                                           remove_linux_wal_converter_artefacts=False, timezone_of_simulation_run = timezone_of_simulation_run)
-            if(not additional_wal_logs.empty):
-                frames = [wal_logs, additional_wal_logs]
-                wal_logs = pd.concat(frames, copy = False, ignore_index = True, axis = 0)
-                wal_logs = wal_logs.sort_values(by = "SYSTEM_TimeCreated", ignore_index = True) 
-                additional_wal_logs = pd.DataFrame()
-                
-        # isn't last iteration in run for specific user -> access archived xml file from next iteration in same run
-        else:
-            # get the first archived security file based on file name export timestamps (for specific user in the next iteration of the simulation run)
-            file_to_get = None
-            for file in sorted(archived_wals_system_paths[idx+1][2]):
-                if(archived_wal_substring in file):
-                    file_to_get = file
-                    # stop if first archived security file is found
-                    break
-            if(file_to_get != None):
-                additional_wal_logs = process_wal.load_windows_audit_logs_from_system_file(pathlib.Path.joinpath(pathlib.Path(archived_wals_system_paths[idx+1][0]), file_to_get), 
-                                                                                           remove_linux_wal_converter_artefacts = False, timezone_of_simulation_run = timezone_of_simulation_run)
-            if(not additional_wal_logs.empty):
-                frames = [wal_logs, additional_wal_logs]
-                wal_logs = pd.concat(frames, ignore_index = True, copy = False, axis = 0)
-                wal_logs = wal_logs.sort_values(by = "SYSTEM_TimeCreated", ignore_index = True)
-                additional_wal_logs = pd.DataFrame()
-        
-        current_iteration_time_start_end_timestamps = pathlib.Path.joinpath(pathlib.Path(sim23_log_system_paths[idx]), "iteration.time").read_text().split("#")
+    archived_wals_system_paths = simuser_run_index["archived_wals_system_paths"]
+    sim23_log_system_paths = simuser_run_index["sim23_log_system_paths"]
+    if(iteration_indices is None):
+        iteration_indices = range(len(archived_wals_system_paths))
+    iterations = []
+    for iteration_index in iteration_indices:
+        path_to_store_iteration = build_iteration_output_path(system_path_simulation_run, iteration_index, sim_user_of_interest, system_path_to_store_iteration, output_format)
+        former_iteration_manifest_entry = None if preprocessing_manifest is None else preprocessing_manifest.get(get_iteration_manifest_key(path_to_store_iteration, system_path_to_store_iteration))
+        iteration_manifest_entry = build_iteration_manifest_entry(simuser_run_index, iteration_index, archived_wal_substring, sim23_logs_file_name, timezone_of_simulation_run, output_format,
+                                                                  former_iteration_manifest_entry = former_iteration_manifest_entry)
+        # inputs and parameters unchanged since the last conversion -> skip iteration
+        iteration_is_up_to_date = ((former_iteration_manifest_entry is not None) and (path_to_store_iteration.is_file()) and (former_iteration_manifest_entry == iteration_manifest_entry))
+        iterations.append((iteration_index, path_to_store_iteration, iteration_manifest_entry, iteration_is_up_to_date))
+
+    next_run_archived_wals_system_paths = simuser_run_index["next_run_archived_wals_system_paths"]
+    iteration_audit_logs = process_wal.iterate_windows_audit_logs_of_consecutive_iterations([pathlib.Path(entry[0]) for entry in archived_wals_system_paths],
+                                                                                            next_run_first_iteration_folder_path = pathlib.Path(next_run_archived_wals_system_paths[0][0]) if next_run_archived_wals_system_paths else None,
+                                                                                            iteration_indices = [iteration[0] for iteration in iterations if(not iteration[3])], archived_wal_substring = archived_wal_substring,
+                                                                                            timezone_of_simulation_run = timezone_of_simulation_run, number_of_workers = number_of_parsing_workers,
+                                                                                            parsed_archive_cache_folder = parsed_archive_cache_folder, parsed_archive_cache_max_size_bytes = parsed_archive_cache_max_size_bytes)
+    for iteration_index, path_to_store_iteration, iteration_manifest_entry, iteration_is_up_to_date in iterations:
+        if(iteration_is_up_to_date):
+            # iterations converted before statistics were written -> statistics are built once from the stored iteration
+            if(wal_data_store.load_data_set_statistics(path_to_store_iteration) is None):
+                wal_data_store.write_data_set_statistics(wal_data_store.load_data_set(path_to_store_iteration, columns = ["SYSTEM_TimeCreated", "SYSTEM_EventID", "Labels"]), path_to_store_iteration)
+            yield path_to_store_iteration, iteration_manifest_entry
+            continue
+
+        _, wal_logs, additional_wal_logs = next(iteration_audit_logs)
+        sim23_logs = parse_sim23_logs.load_sim23_log_data_without_using_predefined_labels(sim23_log_system_path = pathlib.Path.joinpath(pathlib.Path(sim23_log_system_paths[iteration_index]), sim23_logs_file_name))
+        if(not additional_wal_logs.empty):
+            frames = [wal_logs, additional_wal_logs]
+            wal_logs = pd.concat(frames, ignore_index = True, copy = False, axis = 0)
+            wal_logs = wal_logs.sort_values(by = "SYSTEM_TimeCreated", ignore_index = True)
+            additional_wal_logs = pd.DataFrame()
+
+        current_iteration_time_start_end_timestamps = pathlib.Path.joinpath(pathlib.Path(sim23_log_system_paths[iteration_index]), "iteration.time").read_text().split("#")
         parsed_current_iteration_time_start_end_timestamps = (datetime.datetime.strptime(current_iteration_time_start_end_timestamps[0], '%Y-%m-%d %H:%M:%S'),
                                                               datetime.datetime.strptime(current_iteration_time_start_end_timestamps[1], '%Y-%m-%d %H:%M:%S'))
         wal_logs = wal_logs.loc[(wal_logs["SYSTEM_TimeCreated"] >= parsed_current_iteration_time_start_end_timestamps[0]) & (wal_logs["SYSTEM_TimeCreated"] <= parsed_current_iteration_time_start_end_timestamps[1])]
         wal_logs = wal_logs.sort_values(by = "SYSTEM_TimeCreated", ignore_index = True)
         # label windows security audit logs
         wal_logs = process_wal.attach_sim_23_logs_labels_col_windows_audit_logs(wal_logs, sim23_logs=sim23_logs)
-        path_to_store_iteration = pathlib.Path.joinpath(system_path_to_store_iteration, str(system_path_simulation_run).replace("/", "_").replace(" ", "_").replace("_home_kevin_mnt_nas_", "") + "_iteration_" + str(idx) + "_" + sim_user_of_interest + "_converted_and_labeled_data.gz")
-        wal_logs.to_csv(path_to_store_iteration, index = False, compression = "gzip")
+        if(output_format == "parquet"):
+            wal_data_store.write_data_set_partition(wal_logs, path_to_store_iteration)
+        else:
+            # write to temporary file first -> a crash never leaves a partially written iteration behind
+            temporary_path_to_store_iteration = path_to_store_iteration.with_name(path_to_store_iteration.stem + "." + str(os.getpid()) + ".tmp")
+            wal_logs.to_csv(temporary_path_to_store_iteration, index = False, compression = "gzip")
+            os.replace(temporary_path_to_store_iteration, path_to_store_iteration)
+        # event id histogram, label counts, number of rows & time bounds next to the iteration -> analyses without loading the iteration
+        wal_data_store.write_data_set_statistics(wal_logs, path_to_store_iteration)
+        wal_logs = None
+
+        yield path_to_store_iteration, iteration_manifest_entry
+
+def convert_simulation_run_iterations_for_specific_simuser(system_path_simulation_run: pathlib.Path, simuser_run_index: dict, sim_user_of_interest: str = "SimUser001", stored_iterations_queue = None, **conversion_parameters):
+    """convert all iterations of a simulation run for specific Windows 10 user client within a single traversal (used by the worker processes of the run orchestrator)
+
+    Args:
+        system_path_simulation_run (pathlib.Path): simulation run folder containing all the simulation data in XML format
+        simuser_run_index (dict): index of the simulation user (see build_simulation_run_index)
+        sim_user_of_interest (str): simulation user of interest. Defaults to "SimUser001".
+        stored_iterations_queue (multiprocessing.Queue, optional): queue every stored iteration is sent to as soon as it is stored (parent process updates the manifest). Defaults to None.
+        **conversion_parameters: see iterate_converted_simulation_run_iterations_for_specific_simuser
+
+    Returns:
+        list: (system path of the stored iteration (pathlib.Path), manifest entry of the iteration (dict)) per iteration
+    """
+    stored_iterations = []
+    for stored_iteration in iterate_converted_simulation_run_iterations_for_specific_simuser(system_path_simulation_run, simuser_run_index, sim_user_of_interest = sim_user_of_interest, **conversion_parameters):
+        stored_iterations.append(stored_iteration)
+        if(stored_iterations_queue is not None):
+            stored_iterations_queue.put(stored_iteration)
+
+    return stored_iterations
 
-def main(path_run_to_evaluate: str = None, path_to_next_run: str = None, sim_user_of_interest: str = None, timezone: str = "CET", system_path_to_save_converted_file: str = None):  
+def load_complete_simulation_rum_for_specific_simuser(system_path_simulation_run: pathlib.Path, archived_wal_substring: str = "Archive-Security", system_path_next_simulation_run: pathlib.Path = None, 
+                                                      sim_user_of_interest: str = "SimUser001", sim23_logs_file_name: str = "sim23.log", timezone_of_simulation_run: str = "CET", system_path_to_store_iteration: pathlib.Path = None,
+                                                      number_of_parsing_workers: int = 1, parsed_archive_cache_folder: pathlib.Path = None,
+                                                      parsed_archive_cache_max_size_bytes: int = process_wal.PARSED_ARCHIVE_CACHE_DEFAULT_MAX_SIZE_BYTES, output_format: str = "csv", simulation_run_index: dict = None,
+                                                      skip_up_to_date_iterations: bool = True):
+    """load a complete simulation run (hardware of software data) into compressed (gzip) CSV file for specific Windows 10 user client (001|002|003|004)
+
+    Args:
+        system_path_simulation_run (pathlib.Path): simulation run folder containing all the simulation data in XML format
+        archived_wal_substring (str): substring included in every Windows security audit log file. Defaults to "Archive-Security".
+        system_path_next_simulation_run (pathlib.Path, optional): edge case -> load data of current simulation run which is extracted in the next simulation run. Defaults to None.
+        sim_user_of_interest (str): simulation user of interest. Defaults to "SimUser001".
+        sim23_logs_file_name (str): name of sim 23 log file to parse data labels. Defaults to "sim23.log".
+        timezone_of_simulation_run (str): timezone of simulation run (next and current simulation run have always the same timezone). Defaults to "CET".
+        system_path_to_store_iteration (pathlib.Path): system path to store converted simulation iteration in compressed format. Defaults to "None".
+        number_of_parsing_workers (int): number of processes parsing the XML files of an iteration folder concurrently. Defaults to 1.
+        parsed_archive_cache_folder (pathlib.Path, optional): folder of the on-disk cache of already parsed XML files (reused by later runs). Defaults to None (no caching).
+        parsed_archive_cache_max_size_bytes (int): max. size of the parsed archive cache in bytes (least recently used files are evicted). Defaults to process_wal.PARSED_ARCHIVE_CACHE_DEFAULT_MAX_SIZE_BYTES.
+        output_format (str): "csv" (gzip compressed CSV file per iteration) or "parquet" (partitioned columnar data store with typed columns in system_path_to_store_iteration). Defaults to "csv".
+        simulation_run_index (dict, optional): already built index of the simulation run (see build_simulation_run_index). Defaults to None (simulation run is walked through).
+        skip_up_to_date_iterations (bool): skip iterations whose inputs and parameters are unchanged according to the preprocessing manifest in system_path_to_store_iteration. Defaults to True.
+
+    Returns:
+        -, stores CSV files (or partitioned data store) with user behavior in system_path_to_store_iteration
+    """
+    if(simulation_run_index is None):
+        simulation_run_index = build_simulation_run_index(system_path_simulation_run, system_path_next_simulation_run, [sim_user_of_interest], archived_wal_substring, sim23_logs_file_name)
+    preprocessing_manifest = load_preprocessing_manifest(system_path_to_store_iteration)
+    # for iteration in simulation user specific run (single traversal -> every archive is parsed once)
+    for path_to_store_iteration, iteration_manifest_entry in iterate_converted_simulation_run_iterations_for_specific_simuser(system_path_simulation_run, simulation_run_index[sim_user_of_interest], sim_user_of_interest = sim_user_of_interest,
+                                                              archived_wal_substring = archived_wal_substring, sim23_logs_file_name = sim23_logs_file_name, timezone_of_simulation_run = timezone_of_simulation_run,
+                                                              system_path_to_store_iteration = system_path_to_store_iteration, number_of_parsing_workers = number_of_parsing_workers,
+                                                              parsed_archive_cache_folder = parsed_archive_cache_folder, parsed_archive_cache_max_size_bytes = parsed_archive_cache_max_size_bytes, output_format = output_format,
+                                                              preprocessing_manifest = preprocessing_manifest if skip_up_to_date_iterations else None):
+        # update manifest after every iteration -> an interrupted run resumes with the first iteration not converted yet
+        update_preprocessing_manifest(system_path_to_store_iteration, {get_iteration_manifest_key(path_to_store_iteration, system_path_to_store_iteration): iteration_manifest_entry})
+
+def convert_complete_simulation_run_for_all_simusers(system_path_simulation_run: pathlib.Path, system_path_next_simulation_run: pathlib.Path = None, sim_users_of_interest: list = None,
+                                                     archived_wal_substring: str = "Archive-Security", sim23_logs_file_name: str = "sim23.log", timezone_of_simulation_run: str = "CET",
+                                                     system_path_to_store_iteration: pathlib.Path = None, number_of_conversion_workers: int = 1, number_of_parsing_workers: int = 1,
+                                                     parsed_archive_cache_folder: pathlib.Path = None, parsed_archive_cache_max_size_bytes: int = process_wal.PARSED_ARCHIVE_CACHE_DEFAULT_MAX_SIZE_BYTES,
+                                                     output_format: str = "csv", skip_up_to_date_iterations: bool = True):
+    """run orchestrator: walk through the simulation run once and convert all iterations of all simulation users on a pool of worker processes
+
+    every worker traverses the iterations of a single simulation user in order (every archive is parsed once per traversal), at most number_of_conversion_workers iterations are held in memory at the same time,
+    every worker uses number_of_parsing_workers processes for parsing
+
+    Args:
+        system_path_simulation_run (pathlib.Path): simulation run folder containing all the simulation data in XML format
+        system_path_next_simulation_run (pathlib.Path, optional): edge case -> load data of current simulation run which is extracted in the next simulation run. Defaults to None.
+        sim_users_of_interest (list, optional): simulation users to convert. Defaults to None (all simulation users found in the simulation run).
+        archived_wal_substring (str): substring included in every Windows security audit log file. Defaults to "Archive-Security".
+        sim23_logs_file_name (str): name of sim 23 log file to parse data labels. Defaults to "sim23.log".
+        timezone_of_simulation_run (str): timezone of simulation run (next and current simulation run have always the same timezone). Defaults to "CET".
+        system_path_to_store_iteration (pathlib.Path): system path to store converted simulation iterations in compressed format. Defaults to "None".
+        number_of_conversion_workers (int): number of processes converting simulation users concurrently (1 -> sequential conversion). Defaults to 1.
+        number_of_parsing_workers (int): number of processes parsing the XML files of an iteration folder concurrently. Defaults to 1.
+        parsed_archive_cache_folder (pathlib.Path, optional): folder of the on-disk cache of already parsed XML files (reused by later runs). Defaults to None (no caching).
+        parsed_archive_cache_max_size_bytes (int): max. size of the parsed archive cache in bytes (least recently used files are evicted). Defaults to process_wal.PARSED_ARCHIVE_CACHE_DEFAULT_MAX_SIZE_BYTES.
+        output_format (str): "csv" (gzip compressed CSV file per iteration) or "parquet" (partitioned columnar data store with typed columns in system_path_to_store_iteration). Defaults to "csv".
+        skip_up_to_date_iterations (bool): skip iterations whose inputs and parameters are unchanged according to the preprocessing manifest in system_path_to_store_iteration. Defaults to True.
+
+    Returns:
+        list: system paths of all stored iterations
+    """
+    simulation_run_index = build_simulation_run_index(system_path_simulation_run, system_path_next_simulation_run, sim_users_of_interest, archived_wal_substring, sim23_logs_file_name)
+    number_of_iterations = sum([len(simulation_run_index[sim_user]["archived_wals_system_paths"]) for sim_user in simulation_run_index])
+    conversion_parameters = {"archived_wal_substring": archived_wal_substring, "sim23_logs_file_name": sim23_logs_file_name, "timezone_of_simulation_run": timezone_of_simulation_run,
+                             "system_path_to_store_iteration": system_path_to_store_iteration, "number_of_parsing_workers": number_of_parsing_workers, "parsed_archive_cache_folder": parsed_archive_cache_folder,
+                             "parsed_archive_cache_max_size_bytes": parsed_archive_cache_max_size_bytes, "output_format": output_format}
+    # manifest is only written by this process, workers send the manifest entries of their iterations
+    preprocessing_manifest = load_preprocessing_manifest(system_path_to_store_iteration)
+    if(skip_up_to_date_iterations):
+        conversion_parameters["preprocessing_manifest"] = preprocessing_manifest
+    stored_iterations = []
+
+    with progressbar.ProgressBar(max_value=number_of_iterations) as bar:
+        bar.update(0)
+        if(number_of_conversion_workers > 1):
+            with multiprocessing.Manager() as manager, concurrent.futures.ProcessPoolExecutor(max_workers = number_of_conversion_workers) as executor:
+                # workers send every stored iteration as soon as it is stored -> manifest is updated after every iteration
+                stored_iterations_queue = manager.Queue()
+                futures = [executor.submit(convert_simulation_run_iterations_for_specific_simuser, system_path_simulation_run, simulation_run_index[sim_user], sim_user_of_interest = sim_user,
+                                           stored_iterations_queue = stored_iterations_queue, **conversion_parameters)
+                           for sim_user in simulation_run_index]
+                while(True):
+                    workers_done = all(future.done() for future in futures)
+                    try:
+                        path_to_store_iteration, iteration_manifest_entry = stored_iterations_queue.get(timeout = 1)
+                    except queue.Empty:
+                        if(workers_done):
+                            break
+                        continue
+                    stored_iterations.append(path_to_store_iteration)
+                    update_preprocessing_manifest(system_path_to_store_iteration, {get_iteration_manifest_key(path_to_store_iteration, system_path_to_store_iteration): iteration_manifest_entry})
+                    bar.update(len(stored_iterations))
+                # raise exceptions of failed workers (iterations stored before the failure are part of the manifest)
+                for future in futures:
+                    future.result()
+        else:
+            for sim_user in simulation_run_index:
+                for path_to_store_iteration, iteration_manifest_entry in iterate_converted_simulation_run_iterations_for_specific_simuser(system_path_simulation_run, simulation_run_index[sim_user], sim_user_of_interest = sim_user, **conversion_parameters):
+                    stored_iterations.append(path_to_store_iteration)
+                    # update manifest after every iteration -> an interrupted run resumes with the first iteration not converted yet
+                    update_preprocessing_manifest(system_path_to_store_iteration, {get_iteration_manifest_key(path_to_store_iteration, system_path_to_store_iteration): iteration_manifest_entry})
+                    bar.update(len(stored_iterations))
+
+    return sorted(stored_iterations)
+
+def main(path_run_to_evaluate: str = None, path_to_next_run: str = None, sim_user_of_interest: str = None, timezone: str = "CET", system_path_to_save_converted_file: str = None, number_of_parsing_workers: int = 1,
+         parsed_archive_cache_folder: str = None, parsed_archive_cache_max_size_bytes: int = process_wal.PARSED_ARCHIVE_CACHE_DEFAULT_MAX_SIZE_BYTES, output_format: str = "csv", number_of_conversion_workers: int = 1,
+         force_reconversion: bool = False):  
     
-    load_complete_simulation_rum_for_specific_simuser(system_path_simulation_run = pathlib.Path(path_run_to_evaluate), system_path_next_simulation_run = pathlib.Path(path_to_next_run),
-                                                      sim_user_of_interest = sim_user_of_interest, timezone_of_simulation_run = timezone, system_path_to_store_iteration = pathlib.Path(system_path_to_save_converted_file))
+    parsed_archive_cache_folder = None if parsed_archive_cache_folder is None else pathlib.Path(parsed_archive_cache_folder)
+    # 'all' -> convert all simulation users of the run with a single walk through the run folders
+    if((sim_user_of_interest == "all") or (number_of_conversion_workers > 1)):
+        convert_complete_simulation_run_for_all_simusers(system_path_simulation_run = pathlib.Path(path_run_to_evaluate), system_path_next_simulation_run = pathlib.Path(path_to_next_run),
+                                                         sim_users_of_interest = None if sim_user_of_interest == "all" else [sim_user_of_interest], timezone_of_simulation_run = timezone,
+                                                         system_path_to_store_iteration = pathlib.Path(system_path_to_save_converted_file), number_of_conversion_workers = number_of_conversion_workers,
+                                                         number_of_parsing_workers = number_of_parsing_workers, parsed_archive_cache_folder = parsed_archive_cache_folder,
+                                                         parsed_archive_cache_max_size_bytes = parsed_archive_cache_max_size_bytes, output_format = output_format, skip_up_to_date_iterations = not force_reconversion)
+    else:
+        load_complete_simulation_rum_for_specific_simuser(system_path_simulation_run = pathlib.Path(path_run_to_evaluate), system_path_next_simulation_run = pathlib.Path(path_to_next_run),
+                                                          sim_user_of_interest = sim_user_of_interest, timezone_of_simulation_run = timezone, system_path_to_store_iteration = pathlib.Path(system_path_to_save_converted_file),
+                                                          number_of_parsing_workers = number_of_parsing_workers, parsed_archive_cache_folder = parsed_archive_cache_folder,
+                                                          parsed_archive_cache_max_size_bytes = parsed_archive_cache_max_size_bytes, output_format = output_format, skip_up_to_date_iterations = not force_reconversion)
     return 0    
 
 if __name__ == "__main__":
@@ -123,21 +472,36 @@ if __name__ == "__main__":
         Version: %s
         ---------------------------------------------------------------
         Usage:  python wsal_preprocess_sim_run_into_csv_file.py /home/path/to/data/"Hardware Sim 23 Run 12 [56-60]" /home/path/to/data/"Hardware Sim 23 Run 13 [inofficial]" SimUser001 CET /home/path/to/save/converted/data
+                python wsal_preprocess_sim_run_into_csv_file.py /home/path/to/data/"Hardware Sim 23 Run 12 [56-60]" /home/path/to/data/"Hardware Sim 23 Run 13 [inofficial]" all CET /home/path/to/save/converted/data --number_of_conversion_workers 4
         ''')%(NAME, VERSION)))
 
         parser.add_argument('system_path_simulation_run_folder', type = str, help = "simulation run system path of folder containing XML files to convert into CSV file (type:str) (e.g., /home/path/to/data/Hardware Sim 23 Run 9 [41-45])")
         parser.add_argument('system_path_next_simulation_run_folder', type = str, help = "next simulation system path of folder which contains simulation run after the focused run in the previous parameter system_path_simulation_run_folder. The first WSAL XML file (based on timestamps) will be convertet to a CSV file as well (type:str) (e.g., /home/path/to/data/[INVALID] Hardware Sim 23 Run 10 [46-50])")
-        parser.add_argument('sim_user', type = str, help = "simulation user of interest (type:str) (e.g., SimUser001)")
+        parser.add_argument('sim_user', type = str, help = "simulation user of interest or 'all' to convert all simulation users of the run with a single walk through the run folders (type:str) (e.g., SimUser001)")
         parser.add_argument('timezone_of_simulation_run', type = str, help = "timezone in which the simulation run of interest is recorded (type:str) (CET or CEST)")
         parser.add_argument('path_to_save_convertet_csv_files_of_simulation_run_for_specific_simuser', type = str, help = "system path to store the compressed CSV file (type:str) (e.g., /home/path/to/data/csv_format")
+        parser.add_argument('--number_of_parsing_workers', type = int, default = 1, help = "number of processes parsing the XML files of an iteration folder concurrently (type:int) (default: 1)")
+        parser.add_argument('--parsed_archive_cache_folder', type = str, default = None, help = "folder path of the on-disk cache of already parsed XML files (type:str) (default: None -> no caching)")
+        parser.add_argument('--parsed_archive_cache_max_size_bytes', type = int, default = process_wal.PARSED_ARCHIVE_CACHE_DEFAULT_MAX_SIZE_BYTES, help = "max. size of the parsed archive cache in bytes (type:int) (default: %d)"%(process_wal.PARSED_ARCHIVE_CACHE_DEFAULT_MAX_SIZE_BYTES))
+        parser.add_argument('--output_format', type = str, default = "csv", choices = ["csv", "parquet"], help = "format of the converted data: gzip compressed CSV files or partitioned columnar data store (parquet) with typed columns (type:str) (default: csv)")
+        parser.add_argument('--number_of_conversion_workers', type = int, default = 1, help = "number of processes converting simulation users concurrently, each process traverses the iterations of a single simulation user and holds a single iteration in memory (type:int) (default: 1)")
+        parser.add_argument('--force_reconversion', action = 'store_true', help = "convert all iterations even if inputs and parameters are unchanged according to the preprocessing manifest (%s) in the output folder"%(PREPROCESSING_MANIFEST_FILE_NAME))
         args = parser.parse_args()
         system_path_simulation_run_folder_cmd = args.system_path_simulation_run_folder
         system_path_next_simulation_run_cmd = args.system_path_next_simulation_run_folder
         sim_user_cmd = args.sim_user
         timezone_of_simulation_run_cmd = args.timezone_of_simulation_run
         path_to_save_convertet_csv_files_of_simulation_run_for_specific_simuser_cmd = args.path_to_save_convertet_csv_files_of_simulation_run_for_specific_simuser
+        number_of_parsing_workers_cmd = args.number_of_parsing_workers
+        parsed_archive_cache_folder_cmd = args.parsed_archive_cache_folder
+        parsed_archive_cache_max_size_bytes_cmd = args.parsed_archive_cache_max_size_bytes
+        output_format_cmd = args.output_format
+        number_of_conversion_workers_cmd = args.number_of_conversion_workers
+        force_reconversion_cmd = args.force_reconversion
         return_code = main(system_path_simulation_run_folder_cmd, system_path_next_simulation_run_cmd, sim_user_cmd,
-                           timezone_of_simulation_run_cmd, path_to_save_convertet_csv_files_of_simulation_run_for_specific_simuser_cmd)
+                           timezone_of_simulation_run_cmd, path_to_save_convertet_csv_files_of_simulation_run_for_specific_simuser_cmd, number_of_parsing_workers_cmd,
+                           parsed_archive_cache_folder_cmd, parsed_archive_cache_max_size_bytes_cmd, output_format_cmd, number_of_conversion_workers_cmd,
+                           force_reconversion_cmd)
         quit(return_code)
     else:
         main()
\ No newline at end of file
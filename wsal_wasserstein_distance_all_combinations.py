@@ -0,0 +1,189 @@
+import pathlib
+import pandas as pd
+import argparse
+import textwrap
+import concurrent.futures
+
+import wsal_wasserstein_distance_event_ids
+from wal_data_store import wal_data_store
+
+CMD_MODE_ENABLED = True
+NAME = "WASSERSTEIN DISTANCE COMPUTATION ITERATION-WISE FOR ALL COMBINATIONS"
+VERSION = "1.1"
+DEFAULT_NUMBER_OF_WORKERS = 1
+WASSERSTEIN_DISTANCE_MATRIX_FILE_NAME = "wasserstein_distance_matrix.csv"
+
+def get_result_file_name_part_of_data_set(system_path_to_data_set: pathlib.Path):
+    """get part of the result file names describing a data set (file name of the first sub data set in front of 'sim23', e.g., simdata_hardware_)
+
+    Args:
+        system_path_to_data_set (pathlib.Path): system path containing Windows 10 security audit logs in GZIP compressed CSV format or partitioned data store (parquet)
+
+    Returns:
+        str: part of the result file names (same as in wsal_wasserstein_distance_event_ids.py)
+    """
+    data_set_file_names = wal_data_store.list_data_set_file_names(system_path_to_data_set)
+    if(len(data_set_file_names) == 0):
+        raise ValueError("data set folder contains no Windows 10 security audit log files: %s"%(str(system_path_to_data_set)))
+    return pathlib.Path(data_set_file_names[0]).name.split('sim23')[0]
+
+def list_sim_user_iterations_file_names(system_path_to_data_set: pathlib.Path, sim_user_of_interest: str):
+    """list Windows 10 client user specific iteration files of a data set
+
+    Args:
+        system_path_to_data_set (pathlib.Path): system path containing Windows 10 security audit logs in GZIP compressed CSV format or partitioned data store (parquet)
+        sim_user_of_interest (str): Windows 10 simulation client of interest (e.g., SimUser001)
+
+    Returns:
+        list: file names (or relative paths) of the iterations
+    """
+    return [file for file in wal_data_store.list_data_set_file_names(system_path_to_data_set) if(sim_user_of_interest in file)]
+
+def build_data_set_combinations(system_paths_to_data_sets: list, first_sim_users_of_interest: list, second_sim_users_of_interest: list):
+    """build all combinations of (first data set, first simulation user) and (second data set, second simulation user)
+
+    Args:
+        system_paths_to_data_sets (list): system paths of the data sets (pathlib.Path)
+        first_sim_users_of_interest (list): simulation users of the first data set of a combination (e.g., [SimUser001, SimUser002])
+        second_sim_users_of_interest (list): simulation users of the second data set of a combination (e.g., [SimUser003, SimUser004])
+
+    Returns:
+        list: combinations ((system path to first data set, first simulation user), (system path to second data set, second simulation user)) in result file order
+    """
+    first_data_set_groups = [(system_path_to_data_set, sim_user) for system_path_to_data_set in system_paths_to_data_sets for sim_user in first_sim_users_of_interest]
+    second_data_set_groups = [(system_path_to_data_set, sim_user) for system_path_to_data_set in system_paths_to_data_sets for sim_user in second_sim_users_of_interest]
+
+    return [(first_data_set_group, second_data_set_group) for first_data_set_group in first_data_set_groups for second_data_set_group in second_data_set_groups]
+
+def load_event_id_histogram_cache(data_set_groups: list, number_of_workers: int = DEFAULT_NUMBER_OF_WORKERS):
+    """load event id histograms of all iterations of the data set groups, every iteration is loaded exactly once (even if it is part of several combinations)
+
+    Args:
+        data_set_groups (list): (system path to data set, simulation user) tuples
+        number_of_workers (int): number of threads loading event id histograms concurrently. Defaults to DEFAULT_NUMBER_OF_WORKERS.
+
+    Returns:
+        dict: (system path to data set, simulation user) -> (iteration file names (list), event id histograms (list, see wsal_wasserstein_distance_event_ids.load_event_id_histogram))
+    """
+    iterations_file_names = {data_set_group: list_sim_user_iterations_file_names(data_set_group[0], data_set_group[1]) for data_set_group in dict.fromkeys(data_set_groups)}
+    iteration_system_paths = list(dict.fromkeys(pathlib.Path.joinpath(data_set_group[0], file_name) for data_set_group, file_names in iterations_file_names.items() for file_name in file_names))
+    with concurrent.futures.ThreadPoolExecutor(max_workers = max(1, number_of_workers)) as executor:
+        event_id_histograms = dict(zip(iteration_system_paths, executor.map(wsal_wasserstein_distance_event_ids.load_event_id_histogram, iteration_system_paths)))
+
+    return {data_set_group: (file_names, [event_id_histograms[pathlib.Path.joinpath(data_set_group[0], file_name)] for file_name in file_names]) for data_set_group, file_names in iterations_file_names.items()}
+
+def build_normalized_event_id_histogram_matrices(event_id_histogram_cache: dict):
+    """align event id histograms of all cached iterations on a single shared event id axis (event ids not included in a pair of iterations do not change its Wasserstein distance)
+
+    Args:
+        event_id_histogram_cache (dict): cached event id histograms (see load_event_id_histogram_cache)
+
+    Returns:
+        dict: (system path to data set, simulation user) -> (normalized frequency counts (np.ndarray), frequency counts (np.ndarray)), one row per iteration
+    """
+    data_set_groups = list(event_id_histogram_cache.keys())
+    event_id_histogram_matrix, _ = wsal_wasserstein_distance_event_ids.build_event_id_histogram_matrix([event_id_histogram for data_set_group in data_set_groups for event_id_histogram in event_id_histogram_cache[data_set_group][1]])
+    normalized_event_id_histogram_matrix = wsal_wasserstein_distance_event_ids.normalize_event_id_histogram_matrix(event_id_histogram_matrix)
+    event_id_histogram_matrices = {}
+    first_row = 0
+    for data_set_group in data_set_groups:
+        last_row = first_row + len(event_id_histogram_cache[data_set_group][1])
+        event_id_histogram_matrices[data_set_group] = (normalized_event_id_histogram_matrix[first_row:last_row], event_id_histogram_matrix[first_row:last_row])
+        first_row = last_row
+
+    return event_id_histogram_matrices
+
+def compute_wasserstein_distance_results_of_combination(combination: tuple, event_id_histogram_cache: dict, event_id_histogram_matrices: dict):
+    """compute normalized & not normalized Wasserstein distances for all pairs of iterations of a combination
+
+    Args:
+        combination (tuple): ((system path to first data set, first simulation user), (system path to second data set, second simulation user))
+        event_id_histogram_cache (dict): cached event id histograms (see load_event_id_histogram_cache)
+        event_id_histogram_matrices (dict): aligned event id histograms (see build_normalized_event_id_histogram_matrices)
+
+    Returns:
+        pd.DataFrame: results of the combination (see wsal_wasserstein_distance_event_ids.build_wasserstein_distance_results)
+    """
+    first_data_set_group, second_data_set_group = combination
+    first_normalized_matrix, first_matrix = event_id_histogram_matrices[first_data_set_group]
+    second_normalized_matrix, second_matrix = event_id_histogram_matrices[second_data_set_group]
+
+    return wsal_wasserstein_distance_event_ids.build_wasserstein_distance_results(event_id_histogram_cache[first_data_set_group][0], event_id_histogram_cache[second_data_set_group][0],
+                                                                                  wsal_wasserstein_distance_event_ids.compute_pairwise_wasserstein_distances(first_normalized_matrix, second_normalized_matrix),
+                                                                                  wsal_wasserstein_distance_event_ids.compute_pairwise_wasserstein_distances(first_matrix, second_matrix))
+
+def build_wasserstein_distance_matrix(combination_names: list, combination_results: list):
+    """build consolidated matrix of all combinations (mean Wasserstein distances over all pairs of iterations of a combination)
+
+    Args:
+        combination_names (list): (first data set name, second data set name) tuples (e.g., (simdata_hardware_SimUser001, simdata_software_SimUser003))
+        combination_results (list): results of the combinations (see compute_wasserstein_distance_results_of_combination)
+
+    Returns:
+        pd.DataFrame: columns First_Data_Set_Name, Second_Data_Set_Name, Number_Of_Iteration_Pairs and mean, median & std of Wasserstein_Distance_Normalized & Wasserstein_Distance_Not_Normalized
+    """
+    rows = []
+    for (first_data_set_name, second_data_set_name), df in zip(combination_names, combination_results):
+        row = {'First_Data_Set_Name': first_data_set_name, 'Second_Data_Set_Name': second_data_set_name, 'Number_Of_Iteration_Pairs': len(df.index)}
+        for column_name in ['Wasserstein_Distance_Normalized', 'Wasserstein_Distance_Not_Normalized']:
+            row[column_name + '_Mean'] = df[column_name].mean()
+            row[column_name + '_Median'] = df[column_name].median()
+            row[column_name + '_Std'] = df[column_name].std()
+        rows.append(row)
+
+    return pd.DataFrame(rows)
+
+def main(system_paths_to_data_sets: list, first_sim_users_of_interest: list, second_sim_users_of_interest: list, max_ram_usage_bytes: int, system_path_to_store_results: str, number_of_workers: int = DEFAULT_NUMBER_OF_WORKERS):
+
+    wsal_wasserstein_distance_event_ids.limit_memory(max_ram_usage_bytes)
+
+    system_paths_to_data_sets = [pathlib.Path(system_path_to_data_set) for system_path_to_data_set in system_paths_to_data_sets]
+    system_path_to_store_results = pathlib.Path(system_path_to_store_results)
+    result_file_name_parts = {system_path_to_data_set: get_result_file_name_part_of_data_set(system_path_to_data_set) for system_path_to_data_set in system_paths_to_data_sets}
+
+    # each iteration is loaded exactly once and shared by all combinations it is part of
+    combinations = build_data_set_combinations(system_paths_to_data_sets, first_sim_users_of_interest, second_sim_users_of_interest)
+    event_id_histogram_cache = load_event_id_histogram_cache([data_set_group for combination in combinations for data_set_group in combination], number_of_workers = number_of_workers)
+    event_id_histogram_matrices = build_normalized_event_id_histogram_matrices(event_id_histogram_cache)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers = max(1, number_of_workers)) as executor:
+        combination_results = list(executor.map(lambda combination: compute_wasserstein_distance_results_of_combination(combination, event_id_histogram_cache, event_id_histogram_matrices), combinations))
+
+    combination_names = []
+    for ((first_system_path, first_sim_user), (second_system_path, second_sim_user)), df in zip(combinations, combination_results):
+        combination_names.append((result_file_name_parts[first_system_path] + first_sim_user, result_file_name_parts[second_system_path] + second_sim_user))
+        df.to_csv(pathlib.Path.joinpath(system_path_to_store_results, combination_names[-1][0] + "_" + combination_names[-1][1] + ".csv"), index=False)
+
+    build_wasserstein_distance_matrix(combination_names, combination_results).to_csv(pathlib.Path.joinpath(system_path_to_store_results, WASSERSTEIN_DISTANCE_MATRIX_FILE_NAME), index=False)
+
+    return 0
+
+if __name__ == "__main__":
+    if(CMD_MODE_ENABLED):
+        parser = argparse.ArgumentParser(prog = NAME, formatter_class = argparse.RawDescriptionHelpFormatter, description = textwrap.dedent(('''
+        This script is used to compare Wassterstein Distances iteration-wise for all
+        combinations of (data set, first Windows 10 simulation user client) and
+        (data set, second Windows 10 simulation user client) with a single run
+        (same result files as wsal_wasserstein_distance_event_ids.py per combination
+        and a consolidated matrix of all combinations).
+        ---------------------------------------------------------------
+        Name: %s
+        Version: %s
+        ---------------------------------------------------------------
+        Usage: python wsal_wasserstein_distance_all_combinations.py /home/path/to/data_files/hardware/ /home/path/to/data_files/software/ --first_sim_users SimUser001 SimUser002 --second_sim_users SimUser003 SimUser004 --max_ram_usage_bytes 53687091200 --system_path_to_store_results /home/results/wasserstein_distances/experiment/ --number_of_workers 4;
+        ''')%(NAME, VERSION)))
+
+        parser.add_argument('system_paths_to_data_sets', type = str, nargs = '+', help = "system paths containing Windows 10 security audit logs in GZIP compressed CSV format or partitioned data store (parquet)")
+        parser.add_argument('--first_sim_users', type = str, nargs = '+', required = True, help = "Windows 10 simulation clients of the first data set of a combination (e.g., SimUser001 SimUser002)")
+        parser.add_argument('--second_sim_users', type = str, nargs = '+', required = True, help = "Windows 10 simulation clients of the second data set of a combination (e.g., SimUser003 SimUser004)")
+        parser.add_argument('--max_ram_usage_bytes', type = int, required = True, help = "define max ram usage of this script in bytes")
+        parser.add_argument('--system_path_to_store_results', type = str, required = True, help = "system path used to store Wasserstein distance computation results (e.g., /home/results/wasserstein_distances/)")
+        parser.add_argument('--number_of_workers', type = int, default = DEFAULT_NUMBER_OF_WORKERS, help = "number of threads loading event id histograms and computing combinations concurrently (type:int) (default: %s)"%(str(DEFAULT_NUMBER_OF_WORKERS)))
+
+        args = parser.parse_args()
+
+        return_code = main(system_paths_to_data_sets = args.system_paths_to_data_sets, first_sim_users_of_interest = args.first_sim_users, second_sim_users_of_interest = args.second_sim_users,
+                           max_ram_usage_bytes = args.max_ram_usage_bytes, system_path_to_store_results = args.system_path_to_store_results, number_of_workers = args.number_of_workers)
+        quit(return_code)
+    else:
+        main(None, None, None, None, None)
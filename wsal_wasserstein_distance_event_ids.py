@@ -1,15 +1,19 @@
 import pathlib
 import pandas as pd
-import os
+import numpy as np
 import scipy
 import scipy.stats
 import argparse
 import textwrap
 import resource
 
+from wal_data_store import wal_data_store
+
 CMD_MODE_ENABLED = True
 NAME = "WASSERSTEIN DISTANCE COMPUTATION ITERATION-WISE"
-VERSION = "1.0"
+VERSION = "1.3"
+# max. number of (first iteration, second iteration, event id) elements computed at once
+PAIRWISE_WASSERSTEIN_DISTANCE_BLOCK_ELEMENTS = 2 ** 22
 
 def compute_wasserstein_distance(data_set_one: pd.DataFrame, data_set_two: pd.DataFrame, normalization: bool = True):
     """ compute 1-dimensional wasserstein distance for two sub data sets
@@ -33,6 +37,112 @@ def compute_wasserstein_distance(data_set_one: pd.DataFrame, data_set_two: pd.Da
 
     return ws_distance
 
+def load_event_id_histogram(data_set_system_path: pathlib.Path):
+    """load SYSTEM_EventID frequency counts of a single iteration recording (from the statistics file written during preprocessing, only the event id column is read if no valid statistics file exists)
+
+    Args:
+        data_set_system_path (pathlib.Path): system path of the sub data set (gzip compressed CSV file or partition of the data store)
+
+    Returns:
+        pd.Series: event id -> frequency count (event ids without events are excluded)
+    """
+    return wal_data_store.load_data_set_event_id_histogram(data_set_system_path)
+
+def build_event_id_histogram_matrix(event_id_histograms: list):
+    """align event id histograms of several iterations on a shared event id axis
+
+    Args:
+        event_id_histograms (list): event id histograms (see load_event_id_histogram)
+
+    Returns:
+        tuple: (frequency counts (np.ndarray, one row per histogram, 0 for event ids not included in an iteration), event ids of the columns (np.ndarray))
+    """
+    event_ids = np.unique(np.concatenate([event_id_histogram.index.to_numpy(dtype='int64') for event_id_histogram in event_id_histograms] + [np.array([], dtype='int64')]))
+    event_id_histogram_matrix = np.zeros((len(event_id_histograms), len(event_ids)), dtype='float64')
+    for row, event_id_histogram in enumerate(event_id_histograms):
+        event_id_histogram_matrix[row, np.searchsorted(event_ids, event_id_histogram.index.to_numpy(dtype='int64'))] = event_id_histogram.to_numpy(dtype='float64')
+
+    return event_id_histogram_matrix, event_ids
+
+def normalize_event_id_histogram_matrix(event_id_histogram_matrix: np.ndarray):
+    """normalize frequency counts of each iteration (proportion of all events of the iteration, same as value_counts(normalize=True))
+
+    Args:
+        event_id_histogram_matrix (np.ndarray): frequency counts (see build_event_id_histogram_matrix)
+
+    Returns:
+        np.ndarray: normalized frequency counts
+    """
+    number_of_events = event_id_histogram_matrix.sum(axis=1, keepdims=True)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(number_of_events > 0, event_id_histogram_matrix / number_of_events, 0.0)
+
+def compute_pairwise_wasserstein_distances(first_event_id_histogram_matrix: np.ndarray, second_event_id_histogram_matrix: np.ndarray, block_elements: int = PAIRWISE_WASSERSTEIN_DISTANCE_BLOCK_ELEMENTS):
+    """compute 1-dimensional wasserstein distance for all pairs of iterations (same distance as compute_wasserstein_distance: frequency counts of the event ids included in both iterations)
+
+    Args:
+        first_event_id_histogram_matrix (np.ndarray): frequency counts of the first iterations (see build_event_id_histogram_matrix)
+        second_event_id_histogram_matrix (np.ndarray): frequency counts of the second iterations (same event id axis)
+        block_elements (int): max. number of (first iteration, second iteration, event id) elements computed at once. Defaults to PAIRWISE_WASSERSTEIN_DISTANCE_BLOCK_ELEMENTS.
+
+    Returns:
+        np.ndarray: Wasserstein distances (rows: first iterations, columns: second iterations), NaN if two iterations have no event id in common
+    """
+    number_of_event_ids = first_event_id_histogram_matrix.shape[1]
+    wasserstein_distances = np.full((first_event_id_histogram_matrix.shape[0], second_event_id_histogram_matrix.shape[0]), np.nan)
+    first_rows_per_block = max(1, block_elements // max(1, second_event_id_histogram_matrix.shape[0] * number_of_event_ids))
+    for block_start in range(0, first_event_id_histogram_matrix.shape[0], first_rows_per_block):
+        first_block = first_event_id_histogram_matrix[block_start:(block_start + first_rows_per_block), None, :]
+        second_block = second_event_id_histogram_matrix[None, :, :]
+        common_event_ids = (first_block > 0) & (second_block > 0)
+        number_of_common_event_ids = common_event_ids.sum(axis=2)
+        # event ids not included in both iterations are moved to the end by sorting -> first number_of_common_event_ids values are the sorted frequency counts of the pair
+        first_values = np.sort(np.where(common_event_ids, first_block, np.inf), axis=2)
+        second_values = np.sort(np.where(common_event_ids, second_block, np.inf), axis=2)
+        common_values = np.arange(number_of_event_ids)[None, None, :] < number_of_common_event_ids[:, :, None]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            # wasserstein distance of two samples of equal size -> mean absolute difference of the sorted samples
+            distance_sums = np.where(common_values, np.abs(first_values - second_values), 0.0).sum(axis=2)
+            wasserstein_distances[block_start:(block_start + first_rows_per_block)] = np.where(number_of_common_event_ids > 0, distance_sums / number_of_common_event_ids, np.nan)
+
+    return wasserstein_distances
+
+def compute_pairwise_wasserstein_distances_of_iterations(first_event_id_histograms: list, second_event_id_histograms: list):
+    """compute normalized & not normalized wasserstein distances for all pairs of first & second iterations
+
+    Args:
+        first_event_id_histograms (list): event id histograms of the first iterations (see load_event_id_histogram)
+        second_event_id_histograms (list): event id histograms of the second iterations
+
+    Returns:
+        tuple: (normalized Wasserstein distances, not normalized Wasserstein distances), np.ndarray with rows: first iterations, columns: second iterations
+    """
+    event_id_histogram_matrix, event_ids = build_event_id_histogram_matrix(list(first_event_id_histograms) + list(second_event_id_histograms))
+    normalized_event_id_histogram_matrix = normalize_event_id_histogram_matrix(event_id_histogram_matrix)
+    number_of_first_iterations = len(first_event_id_histograms)
+
+    return (compute_pairwise_wasserstein_distances(normalized_event_id_histogram_matrix[:number_of_first_iterations], normalized_event_id_histogram_matrix[number_of_first_iterations:]),
+            compute_pairwise_wasserstein_distances(event_id_histogram_matrix[:number_of_first_iterations], event_id_histogram_matrix[number_of_first_iterations:]))
+
+def build_wasserstein_distance_results(first_data_set_file_names: list, second_data_set_file_names: list, wasserstein_distances_normalized: np.ndarray, wasserstein_distances_not_normalized: np.ndarray):
+    """build result table of all pairs of first & second iterations (pairs ordered by first iteration, then second iteration)
+
+    Args:
+        first_data_set_file_names (list): file names of the first iterations
+        second_data_set_file_names (list): file names of the second iterations
+        wasserstein_distances_normalized (np.ndarray): normalized Wasserstein distances (rows: first iterations, columns: second iterations)
+        wasserstein_distances_not_normalized (np.ndarray): not normalized Wasserstein distances
+
+    Returns:
+        pd.DataFrame: columns First_Data_Set_Name, Second_Data_Set_Name, Wasserstein_Distance_Normalized & Wasserstein_Distance_Not_Normalized
+    """
+    df = pd.DataFrame({'First_Data_Set_Name': np.repeat(np.array([pathlib.Path(file_name).name for file_name in first_data_set_file_names], dtype=object), len(second_data_set_file_names)),
+                       'Second_Data_Set_Name': np.tile(np.array([pathlib.Path(file_name).name for file_name in second_data_set_file_names], dtype=object), len(first_data_set_file_names)),
+                       'Wasserstein_Distance_Normalized': np.asarray(wasserstein_distances_normalized, dtype='float').reshape(-1),
+                       'Wasserstein_Distance_Not_Normalized': np.asarray(wasserstein_distances_not_normalized, dtype='float').reshape(-1)})
+
+    return df
+
 def limit_memory(maxsize: int): 
     """set limit of RAM to use (works only with Linux)
 
@@ -50,40 +160,24 @@ def main(sim_user_of_interest_first_data_set: str, system_path_to_first_data_set
     system_path_to_second_data_set = pathlib.Path(system_path_to_second_data_set)
     system_path_to_store_results = pathlib.Path(system_path_to_store_results)
 
-    # all iterations for hardware and software simulation, each 120 iterations
-    first_data_set_file_names = [entry[2] for entry in os.walk(system_path_to_first_data_set)][0]
-    second_data_set_file_names = [entry[2] for entry in os.walk(system_path_to_second_data_set)][0]
+    # all iterations for hardware and software simulation, each 120 iterations (gzip compressed CSV files or partitioned data store)
+    first_data_set_file_names = wal_data_store.list_data_set_file_names(system_path_to_first_data_set)
+    second_data_set_file_names = wal_data_store.list_data_set_file_names(system_path_to_second_data_set)
 
     # get Windows 10 client user specific 30 iteration files
     first_data_set_sim_user_iterations_file_names = [file for file in first_data_set_file_names if(sim_user_of_interest_first_data_set in file)]
     second_data_set_sim_user_iterations_file_names = [file for file in second_data_set_file_names if(sim_user_of_interest_second_data_set in file)]
 
-    results = []
+    # each iteration is loaded exactly once -> event id histograms of all iterations aligned on a shared event id axis
+    first_event_id_histograms = [load_event_id_histogram(pathlib.Path.joinpath(system_path_to_first_data_set, file_name)) for file_name in first_data_set_sim_user_iterations_file_names]
+    second_event_id_histograms = [load_event_id_histogram(pathlib.Path.joinpath(system_path_to_second_data_set, file_name)) for file_name in second_data_set_sim_user_iterations_file_names]
 
-    for idx_first_data_set, first_data_set_file_name in enumerate(first_data_set_sim_user_iterations_file_names):
+    wasserstein_distances_normalized, wasserstein_distances_not_normalized = compute_pairwise_wasserstein_distances_of_iterations(first_event_id_histograms, second_event_id_histograms)
 
-        current_iteration_first_data_set_system_path = pathlib.Path.joinpath(system_path_to_first_data_set, first_data_set_file_name)
-
-        for idx_second_data_set, second_data_set_file_name in enumerate(second_data_set_sim_user_iterations_file_names):
-
-            current_iteration_second_data_set_system_path = pathlib.Path.joinpath(system_path_to_second_data_set, second_data_set_file_name)
-   
-            first_data_set = pd.read_csv(current_iteration_first_data_set_system_path, compression="gzip", usecols=["SYSTEM_EventID"])
-            second_data_set = pd.read_csv(current_iteration_second_data_set_system_path, compression="gzip", usecols=["SYSTEM_EventID"])
-
-            wsd_normalized = compute_wasserstein_distance(first_data_set, second_data_set, True)
-            wsd_not_normalized = compute_wasserstein_distance(first_data_set, second_data_set, False)
-            
-            results.append([first_data_set_file_name, second_data_set_file_name, wsd_normalized, wsd_not_normalized])
-            
-    
-    df = pd.DataFrame(results, columns=['First_Data_Set_Name', 'Second_Data_Set_Name', 'Wasserstein_Distance_Normalized', 'Wasserstein_Distance_Not_Normalized'])
-    
-    df["Wasserstein_Distance_Normalized"] = df["Wasserstein_Distance_Normalized"].astype('float')
-    df["Wasserstein_Distance_Not_Normalized"] = df["Wasserstein_Distance_Not_Normalized"].astype('float')
+    df = build_wasserstein_distance_results(first_data_set_sim_user_iterations_file_names, second_data_set_sim_user_iterations_file_names, wasserstein_distances_normalized, wasserstein_distances_not_normalized)
 
-    first_part_result_file_name = first_data_set_file_names[0].split('sim23')[0]
-    second_part_result_file_name= second_data_set_file_names[0].split('sim23')[0]
+    first_part_result_file_name = pathlib.Path(first_data_set_file_names[0]).name.split('sim23')[0]
+    second_part_result_file_name= pathlib.Path(second_data_set_file_names[0]).name.split('sim23')[0]
 
     df.to_csv(pathlib.Path.joinpath(system_path_to_store_results, first_part_result_file_name + sim_user_of_interest_first_data_set + "_" + second_part_result_file_name + sim_user_of_interest_second_data_set + ".csv"), index=False)
 
@@ -102,9 +196,9 @@ if __name__ == "__main__":
         ''')%(NAME, VERSION)))
 
         parser.add_argument('sim_user_of_interest_first_data_set', type = str, help = "first Windows 10 simulation client of interest (e.g., SimUser001)")
-        parser.add_argument('system_path_to_first_data_set', type = str, help = "system path containing Windows 10 security audit logs in GZIP compressed CSV format")
+        parser.add_argument('system_path_to_first_data_set', type = str, help = "system path containing Windows 10 security audit logs in GZIP compressed CSV format or partitioned data store (parquet)")
         parser.add_argument('sim_user_of_interest_second_data_set', type = str, help = "second Windows 10 simulation client of interest (e.g., SimUser004)")
-        parser.add_argument('system_path_to_second_data_set', type = str, help = "system path containing Windows 10 security audit logs in GZIP compressed CSV format")
+        parser.add_argument('system_path_to_second_data_set', type = str, help = "system path containing Windows 10 security audit logs in GZIP compressed CSV format or partitioned data store (parquet)")
         parser.add_argument('max_ram_usage_bytes', type = int, help = "define max ram usage of this script in bytes")
         parser.add_argument('system_path_to_store_results', type = str, help = "system path used to store Wasserstein distance computation results (e.g., /home/results/wasserstein_distances/)")
 